@@ -1,6 +1,7 @@
-import requests
 from django.conf import settings
 
+import utils.http
+
 
 def send(title: str, body: str, click_url: str, user_id: str) -> None:
     headers = {
@@ -18,7 +19,7 @@ def send(title: str, body: str, click_url: str, user_id: str) -> None:
         }
     }
 
-    response = requests.post(
+    response = utils.http.post(
         "https://api.magicbell.com/notifications", headers=headers, json=data
     )
     response.raise_for_status()
@@ -26,7 +27,7 @@ def send(title: str, body: str, click_url: str, user_id: str) -> None:
 
 def notify_slack_payout(msg):
     if settings.PAYOUT_NOTIFICATION_WEBHOOK:
-        requests.post(
+        utils.http.post(
             url=settings.PAYOUT_NOTIFICATION_WEBHOOK,
             headers={"Content-Type": "application/json"},
             json={"text": msg},
@@ -35,7 +36,7 @@ def notify_slack_payout(msg):
 
 def notify_slack_user_signup(msg):
     if settings.USER_SIGNUP_NOTIFICATION_WEBHOOK:
-        r = requests.post(
+        r = utils.http.post(
             url=settings.USER_SIGNUP_NOTIFICATION_WEBHOOK,
             headers={"Content-Type": "application/json"},
             json={"text": msg},
@@ -19,8 +19,12 @@ from eth_account import Account
 from moto import mock_s3
 
 import game.models
+import game.participation
+import game.standings
 import game.utils
 import simulator.client
+import simulator.ingestion
+import simulator.loaders
 import simulator.models
 
 # NOTE:
@@ -106,9 +110,18 @@ def mock_player_stats(mocker):
         return_value=player_stats,
     )
 
-    mocker.patch(
-        "game.serializers.simulator.model_views.AllTimePlayerStatsViewProxy",
-        return_value=player_stats,
+    load_stats = simulator.loaders.PlayerStatsLoader.stats
+
+    def mock_current_season_stats(loader, view, player):
+        if view == "current_season":
+            return player_stats
+        return load_stats(loader, view, player)
+
+    mocker.patch.object(
+        simulator.loaders.PlayerStatsLoader,
+        "stats",
+        autospec=True,
+        side_effect=mock_current_season_stats,
     )
 
 
@@ -325,6 +338,42 @@ def create_box_score():
     return ddf.G("simulator.BoxScore")
 
 
+def build_game_result(simulation, pts_1, pts_2):
+    """A minimal simulator result payload for the lineups of a simulation"""
+
+    def box_score(pts, **extra):
+        return {stat: 1.0 for stat in simulator.ingestion.GAME_STATS} | {
+            "pts": pts,
+            **extra,
+        }
+
+    lineups = {
+        "Challengers": (simulation.lineup_1_uuids, pts_1),
+        "Challenged": (simulation.lineup_2_uuids, pts_2),
+    }
+    return {
+        "players": {
+            str(player_uuid): {"uuid": str(player_uuid)}
+            for player_uuids, _ in lineups.values()
+            for player_uuid in player_uuids
+        },
+        "totals": [box_score(pts, Team=team) for team, (_, pts) in lineups.items()],
+        **{
+            f"{team.lower()}_boxscore": [
+                box_score(pts / 5, canonical=str(player_uuid))
+                for player_uuid in player_uuids
+            ]
+            for team, (player_uuids, pts) in lineups.items()
+        },
+        "combined_boxscore": [
+            box_score(pts / 5, Team=team, canonical=str(player_uuid))
+            for team, (player_uuids, pts) in lineups.items()
+            for player_uuid in player_uuids
+        ],
+        "pbp": [{"quarter": 1, "Possession": 1, "pbp_string": "Tip off"}],
+    }
+
+
 def build_results(game_obj):
     game_obj.contest.status = game.models.Contest.Status.COMPLETE
     game_obj.contest.save()
@@ -347,6 +396,7 @@ def build_results(game_obj):
     )
 
     game_obj.simulation.save()
+    game.participation.record_games([game_obj.id])
     return game_obj.simulation.result
 
 
@@ -673,6 +723,7 @@ def build_full_tournament_bracket(
                 round=round,
             )
 
+    game.standings.rebuild([tournament.id])
     return tournament
 
 
@@ -1,11 +1,12 @@
 import math
 from decimal import Decimal
 
-import requests
 from django.conf import settings
 from etherscan import Etherscan
 from web3 import Web3
 
+import utils.http
+
 
 class InsufficentFundsException(Exception):
     pass
@@ -35,10 +36,9 @@ def _etherscan_gas_oracle_strategy(spend_more_process_faster=False):
 
 
 def _owlacle_gas_oracle_strategy(spend_more_process_faster=False):
-    res = requests.get(
-        "https://api.owlracle.info/v4/{}/gas?apikey={}&reportwei=true".format(
-            "goerli", settings.GAS_ORACLE_API_KEY
-        )
+    res = utils.http.get(
+        "https://api.owlracle.info/v4/{}/gas".format("goerli"),
+        params={"apikey": settings.GAS_ORACLE_API_KEY, "reportwei": "true"},
     )
     res.raise_for_status()
     gas_fees = res.json()
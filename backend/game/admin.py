@@ -4,6 +4,7 @@ import json
 from django import urls
 from django.conf import settings
 from django.contrib import admin, messages
+from django.db import transaction
 from django.db.models import F, Q
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
@@ -11,14 +12,18 @@ from django.urls import path
 from django.utils import timezone
 from django.utils.html import mark_safe
 
+import game.brackets
 import game.forms
+import game.game_cache
+import game.leaderboard
 import game.models
+import game.participation
 import game.tasks
 import game.utils
+import simulator.aggregates
 import simulator.client
 import simulator.models
 import simulator.utils
-from utils.db import load_data_from_sql
 
 MAX_PLAYERS_PER_TEAM = 5
 
@@ -103,7 +108,7 @@ def copy_tournament(modeladmin, request, queryset):
         copy_tournament.meta = tournament.meta
         copy_tournament.save()
 
-        game.utils.build_tournament_structure(copy_tournament)
+        game.brackets.build_tournament_structure(copy_tournament)
 
 
 class TournamentAdmin(admin.ModelAdmin):
@@ -210,7 +215,7 @@ class TournamentAdmin(admin.ModelAdmin):
             tournament.contest = contest
             tournament.save()
 
-            game.utils.build_tournament_structure(tournament)
+            game.brackets.build_tournament_structure(tournament)
 
         else:
             tournament.contest.tokens_required = form.cleaned_data.get(
@@ -435,7 +440,16 @@ class TournamentAdmin(admin.ModelAdmin):
 
     def staff_publish_series(self, request, tournament_id, round_id, series_id):
         series = game.models.Series.objects.get(id=series_id)
-        series.games.update(visibility=game.models.Game.Visibility.STAFF)
+        with simulator.aggregates.recount(
+            series.games.values_list("simulation__uuid", flat=True)
+        ):
+            series.games.update(visibility=game.models.Game.Visibility.STAFF)
+        game_ids = list(series.games.values_list("id", flat=True))
+        transaction.on_commit(
+            lambda: [game.game_cache.invalidate(game_id) for game_id in game_ids]
+        )
+        game.leaderboard.record_games(series.games.values_list("id", flat=True))
+        game.participation.record_games(series.games.values_list("id", flat=True))
         return redirect(
             urls.reverse("admin:game_tournament_change", args=(tournament_id,))
         )
@@ -479,8 +493,11 @@ class TournamentAdmin(admin.ModelAdmin):
             else:
                 seed = 0
 
-            team_leaderboard = load_data_from_sql("game/sql/leaderboard_team_query.sql")
-            team_ids = [team["team_id"] for team in team_leaderboard[: tournament.size]]
+            team_ids = list(
+                game.models.TeamLeaderboard.objects.ranked().values_list(
+                    "team_id", flat=True
+                )[: tournament.size]
+            )
             for index, team in enumerate(
                 game.models.Team.objects.filter(id__in=team_ids).order_by(
                     "-wins", "losses"
@@ -533,7 +550,7 @@ class TournamentAdmin(admin.ModelAdmin):
             )
 
             if current_round.stage == 0:
-                game.utils.matchup_tournament_entries(tournament)
+                game.brackets.matchup_tournament_entries(tournament)
 
             return redirect(
                 urls.reverse("admin:game_tournament_change", args=(tournament.id,))
@@ -0,0 +1,122 @@
+"""Tournament brackets.
+
+A tournament of size 2^n is played over n rounds. The first round has size / 2
+series, and each later round half the series of the one before it. The ranked
+entries are matched up in the first round the usual way: the best entry against
+the worst, the second best against the second worst and so on. Each series is
+given the order it has in the bracket, so that the best two entries can only
+meet in the final, the best four in the semifinals, and so on. The winners of
+the series with orders 2k - 1 and 2k then meet in the next round.
+
+The seeding and the orders are computed for any power-of-two size. A bracket is
+built in memory and saved with a bulk insert per model, and its first round is
+matched up with a bulk update.
+"""
+import logging
+
+import pgbulk
+from django.utils import timezone
+
+import game.models
+import game.utils
+
+LOGGER = logging.getLogger(__name__)
+
+
+def seed_order(size):
+    """The seeds of a bracket of size entries, from its top to its bottom, e.g.
+    [1, 8, 4, 5, 2, 7, 3, 6] for 8 entries"""
+    if size < 2 or size & (size - 1):
+        raise ValueError(f"Bracket size {size} is not a power of two.")
+
+    seeds = [1]
+    while len(seeds) < size:
+        # Each seed is matched up with the seed that sums with it to the
+        # number of seeds of the next round plus one
+        opponent_sum = len(seeds) * 2 + 1
+        seeds = [
+            next_seed for seed in seeds for next_seed in (seed, opponent_sum - seed)
+        ]
+    return seeds
+
+
+def series_orders(size):
+    """The orders of the first round series of a bracket of size entries, by
+    the seed of their best entry minus one, e.g. [1, 3, 4, 2] for 8 entries"""
+    top_seeds = seed_order(size)[::2]
+    orders = [0] * len(top_seeds)
+    for order, seed in enumerate(top_seeds, 1):
+        orders[seed - 1] = order
+    return orders
+
+
+def build_tournament_structure(tournament):
+    """Creates the rounds of a tournament, the first of them started, and their
+    series"""
+    rounds = game.models.Round.objects.bulk_create(
+        [
+            game.models.Round(
+                tournament=tournament,
+                stage=stage,
+                status=(
+                    game.models.Round.Status.STARTED
+                    if stage == 0
+                    else game.models.Round.Status.NOT_STARTED
+                ),
+            )
+            for stage in range(game.utils.calculate_round_count(tournament.size))
+        ]
+    )
+    game.models.Series.objects.bulk_create(
+        [
+            game.models.Series(round=my_round)
+            for my_round in rounds
+            for _ in range(
+                game.utils.calculate_series_count(tournament.size, my_round.stage)
+            )
+        ]
+    )
+    return rounds
+
+
+def matchup_tournament_entries(tournament):
+    """Matches up the entries of a tournament, by rank, in the series of its
+    started round"""
+    try:
+        current_round = game.models.Round.objects.get(
+            **{"status": game.models.Round.Status.STARTED, "tournament": tournament}
+        )
+    except game.models.Round.DoesNotExist:
+        tournament.contest.status = game.models.Contest.Status.ERROR
+        tournament.contest.save()
+
+        LOGGER.exception(
+            f"Error retrieving current round within tournament {tournament.id}",
+        )
+        return
+
+    tournament_entries = list(
+        game.models.TournamentEntry.objects.filter(tournament=tournament).order_by(
+            "rank"
+        )
+    )
+    my_series = list(
+        game.models.Series.objects.filter(round=current_round).order_by(
+            "created_at", "id"
+        )
+    )
+    orders = series_orders(tournament.size)
+
+    now = timezone.now()
+    for bracket_index, series in enumerate(my_series):
+        # entry_1 and entry_2 are selected from the first and last entry
+        # within the next iteration the second and second to last entry
+        # and so on .... until the center is met
+        series.entry_1 = tournament_entries[bracket_index]
+        series.entry_2 = tournament_entries[-1 - bracket_index]
+        series.order = orders[bracket_index]
+        series.updated_at = now
+
+    pgbulk.update(
+        game.models.Series, my_series, ["entry_1", "entry_2", "order", "updated_at"]
+    )
@@ -0,0 +1,75 @@
+"""Cache of the responses of completed games.
+
+The box score and play-by-play of a public, completed game only change when the
+game is re-simulated, so their rendered responses are cached by game id and
+served with a content hash ETag without touching the database. Each game has a
+version key that is bumped by invalidate() when it is simulated, saved or
+published, which leaves every response cached at an older version stale.
+
+Game details tell participants whether they revealed the game, so they are only
+served from the cache to users who did not play in it.
+"""
+import collections
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+DETAIL = "detail"
+PLAY_BY_PLAY = "play-by-play"
+
+CachedResponse = collections.namedtuple(
+    "CachedResponse", ["etag", "body", "participant_ids"]
+)
+
+
+def _version_key(game_id):
+    return f"game:{game_id}:version"
+
+
+def invalidate(game_id):
+    """Marks the cached responses of a game as stale"""
+    try:
+        cache.incr(_version_key(game_id))
+    except ValueError:
+        cache.add(_version_key(game_id), 1, timeout=None)
+
+
+def lookup(game_id, resource, variant=""):
+    """Returns the key of a response of a game at its current version and the
+    CachedResponse stored under it, if any"""
+    version = cache.get(_version_key(game_id), 0)
+    key = f"game:{game_id}:{version}:{resource}:{variant}"
+    return key, cache.get(key)
+
+
+def response_of(body, participant_ids=()):
+    """A CachedResponse of the rendered body of a response"""
+    return CachedResponse(
+        '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest(),
+        body,
+        frozenset(participant_ids),
+    )
+
+
+def store(key, cached):
+    """Caches a CachedResponse under a key returned by lookup()"""
+    cache.set(key, cached, timeout=settings.COMPLETED_GAME_CACHE_TIMEOUT)
+    return cached
+
+
+def respond(request, cached, *, max_age=None, public=False):
+    """Returns the JSON response of a CachedResponse with its ETag, or a 304 if
+    the request already has it. Clients may keep the response for max_age
+    seconds, shared caches too if it is public, and revalidate it on every
+    request without a max_age."""
+    response = HttpResponse(cached.body, content_type="application/json")
+    response["ETag"] = cached.etag
+    if max_age is None:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        visibility = "public" if public else "private"
+        patch_cache_control(response, **{visibility: True}, max_age=max_age)
+    return get_conditional_response(request, etag=cached.etag, response=response)
@@ -0,0 +1,499 @@
+"""The season team leaderboard and Swooper Points (SP).
+
+Every public, completed game of the season is recorded as one
+TeamLeaderboardGame row per team as it finalizes. The rows of the affected
+teams are then rolled up into TeamLeaderboardWeek (wins, entries and the SP
+earned each week), TeamLeaderboardTournament (tournament ranks and SP) and
+finally TeamLeaderboard, the precomputed season totals the leaderboard views
+and TeamLeaderboard.objects.ranked() read from.
+
+Weekly rollups are generated by iterating over the weeks of the season, so
+adding a week or a weekly challenge only means editing the rules below.
+rebuild() recomputes everything from scratch.
+"""
+import collections
+import datetime as dt
+import itertools
+import logging
+import operator
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+
+import game.leaderboard_cache
+import game.models
+
+LOGGER = logging.getLogger(__name__)
+
+# Games are bucketed by the local date they were simulated on
+LOCAL_TIMEZONE = dt.timezone(-dt.timedelta(hours=4))
+SEASON_STARTS_AT = dt.datetime(2023, 8, 21, 13, 5, tzinfo=LOCAL_TIMEZONE)
+SEASON_ENDS_AT = dt.datetime(2023, 11, 5, 23, 59, tzinfo=LOCAL_TIMEZONE)
+
+# SP for playing at least DAILY_SP_GAMES games in a day
+DAILY_SP = 150
+DAILY_SP_GAMES = 5
+# SP for winning at least WEEKLY_WINS games in a week
+WEEKLY_WINS_SP = 300
+WEEKLY_WINS = 25
+# SP for entering at least WEEKLY_MM_ENTRIES matchmade games in a week
+WEEKLY_MM_SP = 150
+WEEKLY_MM_ENTRIES = 35
+
+# SP for reaching the threshold of the challenge of the week. The progress of a
+# team challenge is the team's total of stat over the week, where the "entries"
+# stat counts games. The progress of a player challenge is the best total of
+# any one player playing for the team.
+CHALLENGE_SP = 100
+Challenge = collections.namedtuple(
+    "Challenge", ["name", "per_player", "stat", "threshold"]
+)
+WEEKLY_CHALLENGES = {
+    1: Challenge("team_games", False, "entries", 70),
+    2: Challenge("player_points", True, "pts", 1000),
+    3: Challenge("team_blocks", False, "blk", 250),
+    4: Challenge("player_rebounds", True, "trb", 350),
+    5: Challenge("team_assists", False, "ast", 1750),
+    6: Challenge("player_blocks", True, "blk", 150),
+    7: Challenge("team_games", False, "entries", 100),
+    8: Challenge("player_assists", True, "ast", 650),
+    9: Challenge("team_steals", False, "stl", 500),
+    10: Challenge("player_three_p", True, "three_p", 350),
+    11: Challenge("team_points", False, "pts", 7500),
+}
+
+# Tournament SP of the top 64 teams of a tournament by the tokens required to
+# enter it, as (lowest rank, SP) brackets
+TOURNAMENT_SP = {
+    1: [(1, 125), (2, 100), (4, 75), (8, 40), (16, 20), (32, 10), (64, 5)],
+    3: [(1, 250), (2, 200), (4, 150), (8, 75), (16, 40), (32, 20), (64, 10)],
+    5: [(1, 500), (2, 400), (4, 300), (8, 150), (16, 80), (32, 40), (64, 20)],
+}
+# Five token tournaments with their own brackets, matched by name
+MAJOR_TOURNAMENTS = ("Global Open", "SOA Cup")
+MAJOR_TOURNAMENT_SP = [
+    (1, 1000),
+    (2, 800),
+    (4, 600),
+    (8, 300),
+    (16, 150),
+    (32, 80),
+    (64, 40),
+]
+EXHIBITION_TOURNAMENTS = ("All-Star", "Rookie Fest", "Swooper Bowl", "Bronze Jug")
+TOURNAMENT_SP_RANKS = 64
+
+Week = collections.namedtuple("Week", ["number", "starts_on", "ends_on"])
+
+
+def season_weeks():
+    """The weeks of the season, the first one starting on the first day"""
+    starts_on = SEASON_STARTS_AT.date()
+    for number in itertools.count(1):
+        if starts_on > SEASON_ENDS_AT.date():
+            return
+        yield Week(number, starts_on, starts_on + dt.timedelta(days=6))
+        starts_on += dt.timedelta(weeks=1)
+
+
+def week_of(played_on):
+    return (played_on - SEASON_STARTS_AT.date()).days // 7 + 1
+
+
+def tournament_sp(tournament, rank):
+    tokens_required = tournament.contest.tokens_required
+    brackets = TOURNAMENT_SP.get(tokens_required, [])
+    if tokens_required == 5:
+        if any(name in tournament.name for name in EXHIBITION_TOURNAMENTS):
+            brackets = []
+        elif any(name in tournament.name for name in MAJOR_TOURNAMENTS):
+            brackets = MAJOR_TOURNAMENT_SP
+
+    for lowest_rank, sp in brackets:
+        if rank <= lowest_rank:
+            return sp
+    return 0
+
+
+GAMES_SQL = """
+INSERT INTO game_teamleaderboardgame (
+    team_id, game_id, side, kind, tournament_id, played_at, played_on, points,
+    opponent_points, ast, blk, pts, stl, three_p, trb
+)
+SELECT l.team_id,
+       g.id,
+       side.side,
+       c.kind,
+       t.id,
+       s.created_at,
+       (s.created_at AT TIME ZONE 'UTC' + %(utc_offset)s)::DATE,
+       side.points,
+       side.opponent_points,
+       b.ast,
+       b.blk,
+       b.pts,
+       b.stl,
+       b.three_p,
+       b.trb
+FROM game_game g
+         JOIN game_contest c ON c.id = g.contest_id
+         JOIN simulator_simulation s ON s.id = g.simulation_id
+         JOIN simulator_result r ON r.id = s.result_id
+         LEFT JOIN game_tournament t ON t.contest_id = c.id
+         CROSS JOIN LATERAL (
+             VALUES (1, g.lineup_1_id, r.lineup_1_score, r.lineup_2_score,
+                     r.lineup_1_box_score_id),
+                    (2, g.lineup_2_id, r.lineup_2_score, r.lineup_1_score,
+                     r.lineup_2_box_score_id)
+         ) AS side (side, lineup_id, points, opponent_points, box_score_id)
+         JOIN game_lineup l ON l.id = side.lineup_id
+         JOIN simulator_boxscore b ON b.id = side.box_score_id
+WHERE g.visibility = 'PUBLIC'
+  AND c.status = 'COMPLETE'
+  AND s.created_at BETWEEN %(season_starts_at)s AND %(season_ends_at)s
+  {where}
+RETURNING team_id, played_on, tournament_id
+"""
+
+TEAM_PROGRESS_SQL = """
+SELECT g.team_id, {progress} AS progress
+FROM games g
+GROUP BY g.team_id
+"""
+
+PLAYER_PROGRESS_SQL = """
+SELECT totals.team_id, MAX(totals.total) AS progress
+FROM (
+    SELECT g.team_id, p.player_id, SUM(b.{stat}) AS total
+    FROM games g
+             JOIN game_game gg ON gg.id = g.game_id
+             JOIN simulator_simulation s ON s.id = gg.simulation_id
+             JOIN simulator_result r ON r.id = s.result_id
+             CROSS JOIN LATERAL UNNEST(
+                 CASE WHEN g.side = 1 THEN s.lineup_1_uuids ELSE s.lineup_2_uuids END,
+                 CASE
+                     WHEN g.side = 1 THEN ARRAY [
+                         r.lineup_1_player_1_box_score_id,
+                         r.lineup_1_player_2_box_score_id,
+                         r.lineup_1_player_3_box_score_id,
+                         r.lineup_1_player_4_box_score_id,
+                         r.lineup_1_player_5_box_score_id
+                         ]
+                     ELSE ARRAY [
+                         r.lineup_2_player_1_box_score_id,
+                         r.lineup_2_player_2_box_score_id,
+                         r.lineup_2_player_3_box_score_id,
+                         r.lineup_2_player_4_box_score_id,
+                         r.lineup_2_player_5_box_score_id
+                         ]
+                     END
+             ) AS p (player_id, box_score_id)
+             JOIN simulator_boxscore b ON b.id = p.box_score_id
+    GROUP BY g.team_id, p.player_id
+) AS totals
+GROUP BY totals.team_id
+"""
+
+NO_PROGRESS_SQL = """
+SELECT g.team_id, 0 AS progress
+FROM games g
+WHERE FALSE
+"""
+
+WEEK_SQL = """
+WITH games AS (
+    SELECT g.*
+    FROM game_teamleaderboardgame g
+    WHERE g.played_on BETWEEN %(starts_on)s AND %(ends_on)s
+      {team_filter}
+),
+days AS (
+    SELECT g.team_id,
+           CASE
+               WHEN COUNT(*) FILTER (WHERE g.points <> g.opponent_points)
+                   >= %(daily_sp_games)s THEN %(daily_sp)s
+               ELSE 0
+               END AS sp
+    FROM games g
+    GROUP BY g.team_id, g.played_on
+),
+progress AS ({progress_sql}),
+weeks AS (
+    SELECT g.team_id,
+           COUNT(*) FILTER (WHERE g.points > g.opponent_points) AS wins,
+           COUNT(*) FILTER (WHERE g.points < g.opponent_points) AS losses,
+           COUNT(*) AS entries,
+           COUNT(*) FILTER (WHERE g.kind = 'HEAD_TO_HEAD_MATCH_MAKE') AS mm_entries
+    FROM games g
+    GROUP BY g.team_id
+)
+INSERT INTO game_teamleaderboardweek (
+    team_id, week, wins, losses, entries, mm_entries, challenge,
+    challenge_progress, daily_sp, weekly_sp, challenge_sp
+)
+SELECT w.team_id,
+       %(week)s,
+       w.wins,
+       w.losses,
+       w.entries,
+       w.mm_entries,
+       %(challenge)s,
+       COALESCE(p.progress, 0),
+       (SELECT SUM(d.sp) FROM days d WHERE d.team_id = w.team_id),
+       CASE WHEN w.wins >= %(weekly_wins)s THEN %(weekly_wins_sp)s ELSE 0 END
+           + CASE
+                 WHEN w.mm_entries >= %(weekly_mm_entries)s THEN %(weekly_mm_sp)s
+                 ELSE 0
+             END,
+       CASE WHEN p.progress >= %(challenge_threshold)s THEN %(challenge_sp)s ELSE 0 END
+FROM weeks w
+         LEFT JOIN progress p ON p.team_id = w.team_id
+"""
+
+TOTALS_SQL = """
+WITH ordered AS (
+    SELECT g.team_id,
+           g.points,
+           g.opponent_points,
+           g.points > g.opponent_points AS won,
+           ROW_NUMBER() OVER (
+               PARTITION BY g.team_id ORDER BY g.played_at DESC, g.game_id DESC
+           ) AS n
+    FROM game_teamleaderboardgame g
+    WHERE TRUE {team_filter}
+),
+totals AS (
+    SELECT o.team_id,
+           COUNT(*) FILTER (WHERE o.won) AS wins,
+           COUNT(*) FILTER (WHERE o.points < o.opponent_points) AS losses,
+           COUNT(*) AS played,
+           SUM(o.points) AS points,
+           SUM(o.opponent_points) AS opponent_points,
+           BOOL_OR(o.won) FILTER (WHERE o.n = 1) AS last_won,
+           COUNT(*) FILTER (WHERE o.n <= 10 AND o.won) AS l10_wins,
+           COUNT(*) FILTER (WHERE o.n <= 10 AND NOT o.won) AS l10_losses
+    FROM ordered o
+    GROUP BY o.team_id
+),
+streaks AS (
+    SELECT t.team_id,
+           COALESCE(MIN(o.n) FILTER (WHERE o.won <> t.last_won), t.played + 1) - 1
+               AS streak
+    FROM totals t
+             JOIN ordered o ON o.team_id = t.team_id
+    GROUP BY t.team_id, t.played
+),
+weeks AS (
+    SELECT w.team_id,
+           SUM(w.daily_sp) AS daily_sp,
+           SUM(w.weekly_sp) AS weekly_sp,
+           SUM(w.challenge_sp) AS challenge_sp
+    FROM game_teamleaderboardweek w
+    WHERE TRUE {team_filter}
+    GROUP BY w.team_id
+),
+tournaments AS (
+    SELECT tt.team_id, SUM(tt.sp) AS sp
+    FROM game_teamleaderboardtournament tt
+    WHERE TRUE {team_filter}
+    GROUP BY tt.team_id
+)
+INSERT INTO game_teamleaderboard (
+    team_id, wins, losses, played, points, opponent_points, streak, l10_wins,
+    l10_losses, daily_sp, weekly_sp, challenge_sp, tournament_sp, total_sp,
+    updated_at
+)
+SELECT t.team_id,
+       t.wins,
+       t.losses,
+       t.played,
+       t.points,
+       t.opponent_points,
+       CONCAT(CASE WHEN t.last_won THEN 'W' ELSE 'L' END, s.streak),
+       t.l10_wins,
+       t.l10_losses,
+       COALESCE(w.daily_sp, 0),
+       COALESCE(w.weekly_sp, 0),
+       COALESCE(w.challenge_sp, 0),
+       COALESCE(tt.sp, 0),
+       COALESCE(w.daily_sp, 0) + COALESCE(w.weekly_sp, 0)
+           + COALESCE(w.challenge_sp, 0) + COALESCE(tt.sp, 0),
+       NOW()
+FROM totals t
+         JOIN streaks s ON s.team_id = t.team_id
+         LEFT JOIN weeks w ON w.team_id = t.team_id
+         LEFT JOIN tournaments tt ON tt.team_id = t.team_id
+"""
+
+
+def _team_filter(team_ids, column="team_id"):
+    return f"AND {column} = ANY(%(team_ids)s)" if team_ids is not None else ""
+
+
+def _progress_sql(challenge):
+    if challenge is None:
+        return NO_PROGRESS_SQL
+    elif challenge.per_player:
+        return PLAYER_PROGRESS_SQL.format(stat=challenge.stat)
+    elif challenge.stat == "entries":
+        return TEAM_PROGRESS_SQL.format(progress="COUNT(*)")
+    else:
+        return TEAM_PROGRESS_SQL.format(progress=f"SUM(g.{challenge.stat})")
+
+
+def _record_games(cursor, game_ids=None):
+    """Inserts the leaderboard games of the given games, or of every game"""
+    where = "AND g.id = ANY(%(game_ids)s)" if game_ids is not None else ""
+    cursor.execute(
+        GAMES_SQL.format(where=where),
+        {
+            "utc_offset": LOCAL_TIMEZONE.utcoffset(None),
+            "season_starts_at": SEASON_STARTS_AT,
+            "season_ends_at": SEASON_ENDS_AT,
+            "game_ids": game_ids,
+        },
+    )
+    return cursor.fetchall()
+
+
+def _refresh_weeks(cursor, weeks, team_ids=None):
+    team_filter = _team_filter(team_ids)
+    for week in weeks:
+        challenge = WEEKLY_CHALLENGES.get(week.number)
+        cursor.execute(
+            f"DELETE FROM game_teamleaderboardweek WHERE week = %(week)s {team_filter}",
+            {"week": week.number, "team_ids": team_ids},
+        )
+        cursor.execute(
+            WEEK_SQL.format(
+                team_filter=_team_filter(team_ids, "g.team_id"),
+                progress_sql=_progress_sql(challenge),
+            ),
+            {
+                "week": week.number,
+                "starts_on": week.starts_on,
+                "ends_on": week.ends_on,
+                "team_ids": team_ids,
+                "daily_sp": DAILY_SP,
+                "daily_sp_games": DAILY_SP_GAMES,
+                "weekly_wins": WEEKLY_WINS,
+                "weekly_wins_sp": WEEKLY_WINS_SP,
+                "weekly_mm_entries": WEEKLY_MM_ENTRIES,
+                "weekly_mm_sp": WEEKLY_MM_SP,
+                "challenge": challenge.name if challenge else "",
+                "challenge_threshold": challenge.threshold if challenge else None,
+                "challenge_sp": CHALLENGE_SP,
+            },
+        )
+
+
+def _refresh_tournaments(tournament_ids):
+    """Ranks the teams of the given tournaments and returns the ids of the teams
+    whose tournament SP may have changed"""
+    standings = game.models.TeamLeaderboardTournament.objects.filter(
+        tournament_id__in=tournament_ids
+    )
+    team_ids = set(standings.values_list("team_id", flat=True))
+    standings.delete()
+
+    tournaments = game.models.Tournament.objects.select_related("contest").in_bulk(
+        tournament_ids
+    )
+    results = (
+        game.models.TeamLeaderboardGame.objects.filter(
+            tournament_id__in=tournament_ids,
+            kind=game.models.Contest.Kind.TOURNAMENT,
+        )
+        .values("tournament_id", "team_id")
+        .annotate(
+            wins=Count("id", filter=Q(points__gt=F("opponent_points"))),
+            games=Count("id"),
+        )
+        .order_by("tournament_id", "-wins", "-games", "team_id")
+    )
+    standings = []
+    for tournament_id, rows in itertools.groupby(
+        results, key=operator.itemgetter("tournament_id")
+    ):
+        tournament = tournaments[tournament_id]
+        for rank, row in enumerate(rows, start=1):
+            if rank > TOURNAMENT_SP_RANKS:
+                break
+            standings.append(
+                game.models.TeamLeaderboardTournament(
+                    team_id=row["team_id"],
+                    tournament=tournament,
+                    rank=rank,
+                    sp=tournament_sp(tournament, rank),
+                )
+            )
+    game.models.TeamLeaderboardTournament.objects.bulk_create(standings)
+
+    return team_ids | {standing.team_id for standing in standings}
+
+
+def _refresh_totals(cursor, team_ids=None):
+    team_filter = _team_filter(team_ids)
+    cursor.execute(
+        f"DELETE FROM game_teamleaderboard WHERE TRUE {team_filter}",
+        {"team_ids": team_ids},
+    )
+    cursor.execute(TOTALS_SQL.format(team_filter=team_filter), {"team_ids": team_ids})
+
+
+@transaction.atomic
+def record_games(game_ids):
+    """
+    Records the given games on the leaderboard, or removes them if they no longer
+    count towards it (e.g. they were hidden), and refreshes the weeks, tournaments
+    and totals of the teams that played them
+    """
+    game_ids = list(game_ids)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM game_teamleaderboardgame WHERE game_id = ANY(%s)"
+            " RETURNING team_id, played_on, tournament_id",
+            [game_ids],
+        )
+        changes = cursor.fetchall() + _record_games(cursor, game_ids)
+        if not changes:
+            return
+
+        team_ids = sorted({team_id for team_id, _, _ in changes})
+        weeks = {week_of(played_on) for _, played_on, _ in changes}
+        tournament_ids = {tournament_id for _, _, tournament_id in changes}
+        tournament_ids.discard(None)
+
+        _refresh_weeks(
+            cursor,
+            [week for week in season_weeks() if week.number in weeks],
+            team_ids,
+        )
+        team_ids = sorted(set(team_ids) | _refresh_tournaments(tournament_ids))
+        _refresh_totals(cursor, team_ids)
+
+    transaction.on_commit(
+        lambda: game.leaderboard_cache.invalidate(game.leaderboard_cache.TEAM)
+    )
+
+
+@transaction.atomic
+def rebuild():
+    """Recomputes the whole leaderboard from the games of the season"""
+    game.models.TeamLeaderboard.objects.all().delete()
+    game.models.TeamLeaderboardTournament.objects.all().delete()
+    game.models.TeamLeaderboardWeek.objects.all().delete()
+    game.models.TeamLeaderboardGame.objects.all().delete()
+
+    with connection.cursor() as cursor:
+        changes = _record_games(cursor)
+        _refresh_weeks(cursor, season_weeks())
+        _refresh_tournaments(
+            {tournament_id for _, _, tournament_id in changes if tournament_id}
+        )
+        _refresh_totals(cursor)
+
+    transaction.on_commit(
+        lambda: game.leaderboard_cache.invalidate(game.leaderboard_cache.TEAM)
+    )
+    LOGGER.info("Rebuilt the leaderboard from %s team games", len(changes))
@@ -0,0 +1,82 @@
+"""Versioned cache of the serialized leaderboard payloads.
+
+Each leaderboard has a version key that is bumped by invalidate() whenever its
+data changes, e.g. when a game finalizes. The refresh_leaderboard_cache task
+rebuilds the payload of every leaderboard whose cached payload is older than
+its version, in-process, by running the leaderboard view's queryset through
+its serializer. Requests are served the latest payload, even while a newer one
+is being built, and only build it themselves when nothing is cached at all.
+"""
+import logging
+
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+LOGGER = logging.getLogger(__name__)
+
+TEAM = "team"
+PLAYER = "player"
+
+# Leaderboard -> the list view serving it
+LEADERBOARDS = {
+    TEAM: "game.views.TeamLeaderboard",
+    PLAYER: "game.views.PlayerLeaderboard",
+}
+
+
+def _version_key(name):
+    return f"leaderboard:{name}:version"
+
+
+def _payload_key(name):
+    return f"leaderboard:{name}:payload"
+
+
+def version(name):
+    return cache.get(_version_key(name), 0)
+
+
+def invalidate(*names):
+    """Marks the cached payloads of the given leaderboards as stale"""
+    for name in names or LEADERBOARDS:
+        try:
+            cache.incr(_version_key(name))
+        except ValueError:
+            # The key is missing, so every cached payload is already stale
+            cache.add(_version_key(name), 1, timeout=None)
+
+
+def build(name):
+    """Serializes a leaderboard"""
+    view = import_string(LEADERBOARDS[name])()
+    serializer = view.serializer_class(view.get_queryset(), many=True)
+    return [dict(row) for row in serializer.data]
+
+
+def rebuild(name):
+    """Builds and caches the payload of a leaderboard at its current version"""
+    # Read the version first so changes made while building leave it stale
+    current_version = version(name)
+    payload = build(name)
+    cache.set(_payload_key(name), (current_version, payload), timeout=None)
+    return payload
+
+
+def refresh(force=False):
+    """Rebuilds the leaderboards whose cached payload is stale"""
+    refreshed = []
+    for name in LEADERBOARDS:
+        cached = cache.get(_payload_key(name))
+        if force or cached is None or cached[0] < version(name):
+            rebuild(name)
+            refreshed.append(name)
+    return refreshed
+
+
+def get(name):
+    """Returns the latest cached payload of a leaderboard"""
+    cached = cache.get(_payload_key(name))
+    if cached is None:
+        LOGGER.info("No cached %s leaderboard, building it", name)
+        return rebuild(name)
+    return cached[1]
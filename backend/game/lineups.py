@@ -0,0 +1,143 @@
+"""Validation of lineup submissions.
+
+A lineup submitted to a game, a tournament or the matchmaking queue is checked
+against a chain of rules: the team isn't already in the game and none of its
+players are in the opposing lineup, the team isn't waiting in more open games
+than OPEN_GAME_ENTRY_CAP, it owns the players it submits but no more of them
+than the token gate allows, and the players fit the positions of the lineup.
+
+Rather than each rule fetching what it checks, a submission is loaded with one
+query for the team, annotated with its owner and the counts and reservations
+the rules need, and one for the submitted players. The rules then run in memory
+on those and on the game, whose lineups the game views already load.
+"""
+from django.conf import settings
+from django.db.models import Exists, Func, OuterRef, Q, Subquery
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+import game.models
+import game.serializers
+import simulator.models
+
+PLAYER_SLOTS = [f"player_{slot_number}" for slot_number in range(1, 6)]
+
+
+def _count(queryset):
+    return Subquery(
+        queryset.order_by().annotate(count=Func("id", function="COUNT")).values("count")
+    )
+
+
+def open_game_count():
+    """The number of open games a team is waiting for an opponent in, as an
+    annotation of teams: the public head to head games it is the first entrant
+    in, and the matchmaking games it is still queued for"""
+    games = game.models.Game.objects.filter(
+        Q(lineup_1__team=OuterRef("pk")) | Q(lineup_2__team=OuterRef("pk")),
+        contest__status=game.models.Contest.Status.OPEN,
+        simulation__isnull=True,
+        visibility=game.models.Game.Visibility.PUBLIC,
+    )
+    queued = game.models.HeadToHeadMatchMakeQueue.objects.filter(
+        team=OuterRef("pk"), sent_to_simulator_at=None
+    )
+    return _count(games) + _count(queued)
+
+
+def load_team(user_id, game_obj=None, tournament=None):
+    """The team of a user, with its owner and annotated with what the rules of
+    a submission to the game or the tournament, if given, need"""
+    annotations = {"open_game_count": open_game_count()}
+    if game_obj is not None:
+        annotations["reservation_expires_at"] = Subquery(
+            game.models.Reservation.objects.filter(
+                team=OuterRef("pk"), game=game_obj, deleted=False
+            )
+            .order_by("-expires_at")
+            .values("expires_at")[:1]
+        )
+    if tournament is not None:
+        annotations["has_tournament_lineup"] = Exists(
+            game.models.TournamentEntry.objects.filter(
+                ~Q(lineup=None), tournament=tournament, team=OuterRef("pk")
+            )
+        )
+        if tournament.kind == game.models.Tournament.Kind.PARTNER:
+            annotations["finished_game_count"] = _count(
+                game.models.Game.objects.filter(
+                    Q(lineup_1__team=OuterRef("pk")) | Q(lineup_2__team=OuterRef("pk")),
+                    simulation__status=simulator.models.Simulation.Status.FINISHED,
+                )
+            )
+
+    try:
+        return (
+            game.models.Team.objects.select_related("owner")
+            .annotate(**annotations)
+            .get(owner=user_id)
+        )
+    except game.models.Team.DoesNotExist:
+        raise serializers.ValidationError("Team not found.")
+
+
+def load_players(lineup):
+    """The players of lineup, data of CreateLineup, in the order of its slots"""
+    player_ids = [lineup[slot] for slot in PLAYER_SLOTS]
+    players = game.models.Player.objects.select_related("simulated").in_bulk(player_ids)
+    for player_id in player_ids:
+        if player_id not in players:
+            raise ValidationError(f"Player {player_id} not found.")
+    return [players[player_id] for player_id in player_ids]
+
+
+def validate_game_entry(game_obj, team, player_ids):
+    """Checks that the game has an open lineup for the team, and that the
+    opposing lineup has none of the players submitted"""
+    if game_obj.lineup_1 and game_obj.lineup_2:
+        raise ValidationError("Game lineup is completely filled.")
+
+    opposing_lineup = game_obj.lineup_1 or game_obj.lineup_2
+    if opposing_lineup is None:
+        return
+
+    if team == opposing_lineup.team:
+        raise ValidationError(f"Team {team.id} cannot submit lineup to itself.")
+
+    for slot in PLAYER_SLOTS:
+        player = getattr(opposing_lineup, slot)
+        if player.simulated.token >= 0 and player.id in player_ids:
+            raise ValidationError(
+                f"Player {player.simulated.token} cannot be submitted to opposing team."
+            )
+
+
+# We want to prevent users/teams from spam joining a bunch of open (0/2)
+# games and matchmaking games. We do this by placing a cap on the maximum
+# number of games a team can be waiting in at a time, see open_game_count.
+def validate_open_game_cap(team):
+    if team.open_game_count >= int(settings.OPEN_GAME_ENTRY_CAP):
+        raise ValidationError(
+            f"You have exceeded the open game cap per "
+            f"team of {settings.OPEN_GAME_ENTRY_CAP}"
+        )
+
+
+def count_owned_players(team, players):
+    return sum(player.team_id == team.id for player in players)
+
+
+# This check passes:
+#  - if max_tokens_allowed is None, meaning that this game has no token gating
+#  - or the number of players in lineup matches <= max_tokens_allowed
+def is_pass_token_gate_requirement(max_tokens_allowed, team, players):
+    return (
+        not max_tokens_allowed
+        or count_owned_players(team, players) <= max_tokens_allowed
+    )
+
+
+def create_lineup(team, players):
+    """Checks that the team owns the players that aren't free agents and that
+    they fit the positions of their slots, and creates their lineup"""
+    return game.serializers.create_lineup(team, *players)
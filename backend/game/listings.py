@@ -0,0 +1,131 @@
+"""Slim read paths of the game listings.
+
+Rendering a game listing from Game instances joins the contest, both lineups,
+their teams and the result, and builds a model instance for each, while a
+listing only shows a dozen of their columns. The listing endpoints instead read
+those columns with values() and serialize the resulting dicts. A game's detail
+still renders model instances, but reads the box scores of its result at once.
+"""
+from django.db.models import Case, Count, Exists, F, OuterRef, Subquery, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+import game.models
+import simulator.models
+
+# Key of a listing row -> column it is read from
+LISTING_COLUMNS = {
+    "status": "contest__status",
+    "kind": "contest__kind",
+    "played_at": "contest__played_at",
+    "tokens_required": "contest__tokens_required",
+    "lineup_1_team_id": "lineup_1__team_id",
+    "lineup_1_team_name": "lineup_1__team__name",
+    "lineup_1_owner_id": "lineup_1__team__owner_id",
+    "lineup_2_team_id": "lineup_2__team_id",
+    "lineup_2_team_name": "lineup_2__team__name",
+    "lineup_2_owner_id": "lineup_2__team__owner_id",
+    "result_id": "simulation__result_id",
+    "lineup_1_score": "simulation__result__lineup_1_score",
+    "lineup_2_score": "simulation__result__lineup_2_score",
+}
+
+GAME_FIELDS = (
+    "id",
+    "lineup_1_id",
+    "lineup_2_id",
+    "prize_pool",
+    "revealed_to_user_1",
+    "revealed_to_user_2",
+)
+
+
+def _values(queryset, **expressions):
+    """Projects games onto the listing columns, keeping the annotations of the
+    queryset such as the played_at that game history is paged by"""
+    return queryset.prefetch_related(None).values(
+        *GAME_FIELDS,
+        *queryset.query.annotations,
+        **{key: F(column) for key, column in LISTING_COLUMNS.items()},
+        **expressions,
+    )
+
+
+def _active_reservations():
+    return game.models.Reservation.objects.filter(
+        game=OuterRef("pk"), expires_at__gte=timezone.now(), deleted=False
+    )
+
+
+def game_listings(queryset, user):
+    """Rows of GameListing for the given games as seen by user"""
+    return _values(
+        queryset,
+        number_enrolled_reservation=Coalesce(
+            Subquery(
+                _active_reservations()
+                .values("game")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            0,
+        ),
+        is_current_user_enrolled_with_reservation=Exists(
+            _active_reservations().filter(team__owner_id=user.id)
+        ),
+    )
+
+
+def player_game_listings(queryset):
+    """Rows of PlayerGameListing for games annotated by Game.objects.games_by_player,
+    with the id of the player's box score"""
+    box_scores = [
+        When(
+            player_lineup_number=lineup_number,
+            player_slot_number=slot_number,
+            then=F(
+                f"simulation__result__lineup_{lineup_number}_player_{slot_number}"
+                "_box_score_id"
+            ),
+        )
+        for lineup_number in (1, 2)
+        for slot_number in range(1, 6)
+    ]
+    return _values(queryset, box_score_id=Case(*box_scores))
+
+
+def results_summary(row):
+    """The GameResultListing of a listing row, or an empty dict before the game
+    has a result"""
+    if row["result_id"] is None:
+        return {}
+    return {
+        key: row[key]
+        for key in (
+            "lineup_1_team_id",
+            "lineup_1_team_name",
+            "lineup_1_score",
+            "lineup_2_team_id",
+            "lineup_2_team_name",
+            "lineup_2_score",
+        )
+    }
+
+
+def load_box_scores(result):
+    """Loads the team and player box scores of a result with a single query rather
+    than one per box score as they are serialized"""
+    if result is None:
+        return None
+
+    fields = [
+        field
+        for field in result._meta.concrete_fields
+        if field.related_model is simulator.models.BoxScore
+    ]
+    box_scores = simulator.models.BoxScore.objects.in_bulk(
+        [getattr(result, field.attname) for field in fields]
+    )
+    for field in fields:
+        setattr(result, field.name, box_scores[getattr(result, field.attname)])
+    return result
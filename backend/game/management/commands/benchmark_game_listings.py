@@ -0,0 +1,326 @@
+import time
+import tracemalloc
+import types
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework import serializers
+
+import game.listings
+import game.models
+import game.participation
+import game.serializers
+import simulator.models
+
+# The joins Game.objects.games_by_player used to render the player game history
+# from model instances
+PLAYER_RESULT_JOINS = [
+    "contest",
+    "lineup_1",
+    "lineup_1__team",
+    "lineup_2",
+    "lineup_2__team",
+    "simulation__result",
+    *[
+        f"lineup_{lineup_number}__player_{slot_number}__simulated"
+        for lineup_number in (1, 2)
+        for slot_number in range(1, 6)
+    ],
+    *[
+        f"simulation__result__lineup_{lineup_number}_player_{slot_number}_box_score"
+        for lineup_number in (1, 2)
+        for slot_number in range(1, 6)
+    ],
+]
+
+
+def results_summary(game_obj):
+    if game_obj.simulation and game_obj.simulation.result:
+        return {
+            "lineup_1_team_id": game_obj.lineup_1.team_id,
+            "lineup_1_team_name": game_obj.lineup_1.team.name,
+            "lineup_1_score": game_obj.simulation.result.lineup_1_score,
+            "lineup_2_team_id": game_obj.lineup_2.team_id,
+            "lineup_2_team_name": game_obj.lineup_2.team.name,
+            "lineup_2_score": game_obj.simulation.result.lineup_2_score,
+        }
+    return {}
+
+
+class InstancePlayerGameListing(game.serializers.PlayerGameListing):
+    """The previous PlayerGameListing, which rendered Game instances"""
+
+    class Meta:
+        list_serializer_class = serializers.ListSerializer
+
+    def get_type(self, obj):
+        return obj.contest.kind
+
+    def get_status(self, obj):
+        return obj.contest.status
+
+    def get_played_at(self, obj):
+        return obj.contest.played_at
+
+    def get_results(self, obj):
+        return results_summary(obj)
+
+    def get_box_score(self, obj):
+        box_score = getattr(
+            obj.simulation.result,
+            f"lineup_{obj.player_lineup_number}_player_{obj.player_slot_number}"
+            "_box_score",
+        )
+        return game.serializers.BoxScoreListing(instance=box_score).data
+
+    def get_player_lineup_number(self, obj):
+        return obj.player_lineup_number
+
+    def get_player_slot_number(self, obj):
+        return obj.player_slot_number
+
+
+class InstanceGameListing(game.serializers.GameListing):
+    """The previous GameListing, which rendered Game instances"""
+
+    number_enrolled_reservation = serializers.SerializerMethodField()
+    is_current_user_enrolled_with_reservation = serializers.SerializerMethodField()
+
+    def get_tokens_required(self, obj):
+        return obj.contest.tokens_required
+
+    def get_results(self, obj):
+        return results_summary(obj)
+
+    def get_revealed(self, obj):
+        if obj.lineup_1 and obj.lineup_1.team.owner == self.user:
+            return obj.revealed_to_user_1
+        if obj.lineup_2 and obj.lineup_2.team.owner == self.user:
+            return obj.revealed_to_user_2
+        return True
+
+    def get_status(self, obj):
+        return obj.contest.status
+
+    def get_is_current_user_enrolled_with_lineup(self, obj):
+        return any(
+            lineup.team.owner_id == self.user.id
+            for lineup in (obj.lineup_1, obj.lineup_2)
+            if lineup is not None
+        )
+
+    def get_is_current_user_enrolled_with_reservation(self, obj):
+        return any(
+            reservation.team.owner_id == self.user.id
+            for reservation in obj.reservations.filter(
+                expires_at__gte=timezone.now(), deleted=False, game=obj
+            )
+        )
+
+    def get_number_enrolled_lineup(self, obj):
+        return len([lineup for lineup in (obj.lineup_1, obj.lineup_2) if lineup])
+
+    def get_number_enrolled_reservation(self, obj):
+        return obj.reservations.filter(
+            expires_at__gte=timezone.now(), deleted=False, game=obj
+        ).count()
+
+    def get_played_at(self, obj):
+        return obj.contest.played_at
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency, number of queries and peak memory it takes to render"
+        " the player game history and the completed game listing from model"
+        " instances and from values() rows. Synthetic games are created in a"
+        " transaction that is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--games",
+            type=int,
+            default=100,
+            help="The number of synthetic games rendered per run",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=10,
+            help="The number of times each path is measured",
+        )
+
+    def run(self, name, render, games, runs):
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_queries):
+            start_time = time.monotonic()
+            for _ in range(runs):
+                assert len(render()) == games
+            elapsed = time.monotonic() - start_time
+
+        # Memory is traced in a run of its own as tracing slows rendering down
+        tracemalloc.start()
+        render()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.stdout.write(
+            "%s :: %.1fms, %s QUERIES AND %.0fKB PEAK PER 100 GAMES"
+            % (
+                name,
+                1000 * elapsed / runs * 100 / games,
+                queries // runs,
+                peak / 1024 * 100 / games,
+            )
+        )
+
+    def create_games(self, count):
+        teams = []
+        for _ in range(2):
+            owner = get_user_model().objects.create(
+                wallet_address=f"0x{uuid.uuid4().hex}"[:42]
+            )
+            teams.append(game.models.Team.objects.create(name="Benchmark", owner=owner))
+
+        last_token = simulator.models.Player.objects.aggregate(token=Max("token"))
+        simulated_players = simulator.models.Player.objects.bulk_create(
+            [
+                simulator.models.Player(
+                    uuid=uuid.uuid4(),
+                    token=(last_token["token"] or 0) + i + 1,
+                    age=25,
+                    star_rating=3,
+                )
+                for i in range(10)
+            ]
+        )
+        players = game.models.Player.objects.bulk_create(
+            [
+                game.models.Player(simulated=simulated, team=teams[i // 5])
+                for i, simulated in enumerate(simulated_players)
+            ]
+        )
+        lineups = [
+            game.models.Lineup.objects.create(
+                team=team,
+                **{f"player_{i + 1}": player for i, player in enumerate(team_players)},
+            )
+            for team, team_players in ((teams[0], players[:5]), (teams[1], players[5:]))
+        ]
+
+        box_score = {
+            field.name: 0
+            for field in simulator.models.BoxScore._meta.fields
+            if not field.primary_key
+        }
+        box_scores = iter(
+            simulator.models.BoxScore.objects.bulk_create(
+                [simulator.models.BoxScore(**box_score) for _ in range(12 * count)]
+            )
+        )
+        box_score_fields = [
+            field.name
+            for field in simulator.models.Result._meta.fields
+            if field.related_model is simulator.models.BoxScore
+        ]
+        results = simulator.models.Result.objects.bulk_create(
+            [
+                simulator.models.Result(
+                    lineup_1_score=100,
+                    lineup_2_score=90,
+                    **{field: next(box_scores) for field in box_score_fields},
+                )
+                for _ in range(count)
+            ]
+        )
+        simulations = simulator.models.Simulation.objects.bulk_create(
+            [
+                simulator.models.Simulation(
+                    lineup_1_uuids=[player.uuid for player in simulated_players[:5]],
+                    lineup_2_uuids=[player.uuid for player in simulated_players[5:]],
+                    status=simulator.models.Simulation.Status.FINISHED,
+                    result=result,
+                )
+                for result in results
+            ]
+        )
+        contests = game.models.Contest.objects.bulk_create(
+            [
+                game.models.Contest(
+                    status=game.models.Contest.Status.COMPLETE,
+                    kind=game.models.Contest.Kind.HEAD_TO_HEAD,
+                    played_at=timezone.now(),
+                )
+                for _ in range(count)
+            ]
+        )
+        games = game.models.Game.objects.bulk_create(
+            [
+                game.models.Game(
+                    contest=contest,
+                    simulation=simulation,
+                    lineup_1=lineups[0],
+                    lineup_2=lineups[1],
+                )
+                for contest, simulation in zip(contests, simulations)
+            ]
+        )
+        game.participation.record_games([game_obj.id for game_obj in games])
+        return simulated_players[7].token, games
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        token, games = self.create_games(options["games"])
+        game_ids = [game_obj.id for game_obj in games]
+        context = {"request": types.SimpleNamespace(user=AnonymousUser())}
+
+        def player_games_from_instances():
+            queryset = game.models.Game.objects.games_by_player(token).select_related(
+                *PLAYER_RESULT_JOINS
+            )
+            return InstancePlayerGameListing(queryset, many=True).data
+
+        def player_games_from_values():
+            queryset = game.listings.player_game_listings(
+                game.models.Game.objects.games_by_player(token)
+            )
+            return game.serializers.PlayerGameListing(queryset, many=True).data
+
+        def games_from_instances():
+            queryset = game.models.Game.objects.games_for_status(
+                game.models.Contest.Status.COMPLETE
+            ).filter(id__in=game_ids)
+            return InstanceGameListing(queryset, many=True, context=context).data
+
+        def games_from_values():
+            queryset = game.listings.game_listings(
+                game.models.Game.objects.games_for_status(
+                    game.models.Contest.Status.COMPLETE
+                ).filter(id__in=game_ids),
+                context["request"].user,
+            )
+            return game.serializers.GameListing(
+                queryset, many=True, context=context
+            ).data
+
+        for name, render in (
+            ("PLAYER GAMES FROM INSTANCES", player_games_from_instances),
+            ("PLAYER GAMES FROM VALUES", player_games_from_values),
+            ("GAMES FROM INSTANCES", games_from_instances),
+            ("GAMES FROM VALUES", games_from_values),
+        ):
+            self.run(name, render, len(games), options["runs"])
+
+        transaction.set_rollback(True)
@@ -0,0 +1,142 @@
+import math
+import random
+import time
+import types
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+import game.matchmaking
+
+
+def pair_first_unique_teams(entries, now, unique_queue_size=12):
+    """The previous process_h2h_match_make_queue, which waited for 12 unique
+    teams and paired only the first 12 in the queue, neighbours by score"""
+    uniques = {}
+    for entry in sorted(entries, key=lambda entry: (entry.created_at, entry.id)):
+        uniques.setdefault(entry.team_id, entry)
+        if len(uniques) == unique_queue_size:
+            ordered = sorted(uniques.values(), key=lambda entry: entry.score)
+            return list(zip(ordered[::2], ordered[1::2]))
+    return []
+
+
+def percentile(values, fraction):
+    """The nearest rank percentile of sorted values"""
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate --teams teams entering the head to head queue over"
+        " --arrival-minutes, with the queue processed every --tick seconds, and"
+        " report the wait time percentiles and score gaps of the previous"
+        " matchmaking and of the matchmaking that drains the queue. The queue is"
+        " simulated in memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--teams",
+            type=int,
+            default=10000,
+            help="The number of teams entering the queue",
+        )
+        parser.add_argument(
+            "--arrival-minutes",
+            type=float,
+            default=60,
+            help="The minutes over which the teams enter the queue",
+        )
+        parser.add_argument(
+            "--tick",
+            type=int,
+            default=60,
+            help="The seconds between runs of the queue processing",
+        )
+        parser.add_argument(
+            "--new-teams",
+            type=float,
+            default=0.2,
+            help="The share of teams with fewer than 10 games, scored 0.35",
+        )
+        parser.add_argument(
+            "--max-ticks",
+            type=int,
+            default=2000,
+            help="The number of runs after which the teams still waiting are given up",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="The seed of the random teams"
+        )
+
+    def create_entries(self, options, start):
+        rng = random.Random(options["seed"])
+        entries = []
+        for team_id in range(1, options["teams"] + 1):
+            if rng.random() < options["new_teams"]:
+                score = 0.35
+            else:
+                # A win percentage over the last 50 games
+                score = round(rng.betavariate(4, 4) * 50) / 50
+            entries.append(
+                types.SimpleNamespace(
+                    id=team_id,
+                    team_id=team_id,
+                    score=score,
+                    created_at=start
+                    + timezone.timedelta(
+                        seconds=rng.uniform(0, options["arrival_minutes"] * 60)
+                    ),
+                )
+            )
+        return sorted(entries, key=lambda entry: entry.created_at)
+
+    def run(self, name, pair, options):
+        start = timezone.now()
+        arrivals = self.create_entries(options, start)
+        arrived = 0
+        queue = {}
+        waits = []
+        gaps = []
+        slowest_tick = 0
+        ticks = 0
+
+        while ticks < options["max_ticks"] and (queue or arrived < len(arrivals)):
+            ticks += 1
+            now = start + timezone.timedelta(seconds=ticks * options["tick"])
+            while arrived < len(arrivals) and arrivals[arrived].created_at <= now:
+                queue[arrivals[arrived].id] = arrivals[arrived]
+                arrived += 1
+
+            tick_start = time.monotonic()
+            pairs = pair(list(queue.values()), now)
+            slowest_tick = max(slowest_tick, time.monotonic() - tick_start)
+
+            for pair_entries in pairs:
+                for entry in pair_entries:
+                    del queue[entry.id]
+                    waits.append((now - entry.created_at).total_seconds())
+                gaps.append(abs(pair_entries[0].score - pair_entries[1].score))
+
+        waits.sort()
+        self.stdout.write(
+            "%s :: %s TEAMS, %s PAIRED IN %s TICKS, WAIT P50 %ds P90 %ds P99 %ds"
+            " MAX %ds, MEAN SCORE GAP %.3f, SLOWEST TICK %.1fms"
+            % (
+                name,
+                len(arrivals),
+                len(waits),
+                ticks,
+                percentile(waits, 0.5) if waits else 0,
+                percentile(waits, 0.9) if waits else 0,
+                percentile(waits, 0.99) if waits else 0,
+                waits[-1] if waits else 0,
+                sum(gaps) / len(gaps) if gaps else 0,
+                1000 * slowest_tick,
+            )
+        )
+
+    def handle(self, *args, **options):
+        self.run("FIRST 12", pair_first_unique_teams, options)
+        self.run("DRAIN", game.matchmaking.pair, options)
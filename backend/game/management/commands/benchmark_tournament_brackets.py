@@ -0,0 +1,142 @@
+import json
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+import game.brackets
+import game.models
+import game.utils
+
+
+def build_tournament_structure_per_row(tournament):
+    """The previous build_tournament_structure, which saved every round and
+    series on its own"""
+    for stage in range(game.utils.calculate_round_count(tournament.size)):
+        my_round = game.models.Round()
+        my_round.tournament = tournament
+        my_round.stage = stage
+        if my_round.stage == 0:
+            my_round.status = game.models.Round.Status.STARTED
+        my_round.save()
+
+        for _ in range(game.utils.calculate_series_count(tournament.size, stage)):
+            series = game.models.Series()
+            series.round = my_round
+            series.save()
+
+
+def matchup_tournament_entries_per_row(tournament):
+    """The previous matchup_tournament_entries, which indexed the entries
+    queryset and saved every series on its own. Its series order table stopped
+    at 64 entries, so the computed orders stand in for it"""
+    current_round = game.models.Round.objects.get(
+        status=game.models.Round.Status.STARTED, tournament=tournament
+    )
+    tournament_entries = game.models.TournamentEntry.objects.filter(
+        tournament=tournament
+    ).order_by("rank")
+    tournament_entries_count = tournament_entries.count()
+    orders = game.brackets.series_orders(tournament.size)
+
+    for bracket_index, my_series in enumerate(
+        game.models.Series.objects.filter(round=current_round).order_by("created_at")
+    ):
+        my_series.entry_1 = tournament_entries[bracket_index]
+        my_series.entry_2 = tournament_entries[
+            tournament_entries_count - 1 - bracket_index
+        ]
+        my_series.order = orders[bracket_index]
+        my_series.save()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the wall time and number of queries it takes to build the bracket"
+        " of a tournament and match up its entries one row at a time and in bulk."
+        " Synthetic tournaments are created in a transaction that is rolled back at"
+        " the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[256, 1024],
+            help="The numbers of entries of the tournaments, powers of two",
+        )
+
+    def create_tournament(self, size):
+        owner = get_user_model().objects.create(
+            wallet_address=f"0x{uuid.uuid4().hex}"[:42]
+        )
+        team = game.models.Team.objects.create(name="Benchmark", owner=owner)
+        tournament = game.models.Tournament.objects.create(
+            name="Benchmark",
+            contest=game.models.Contest.objects.create(
+                kind=game.models.Contest.Kind.TOURNAMENT
+            ),
+            size=size,
+            start_date=timezone.now(),
+            end_date=timezone.now() + timezone.timedelta(days=7),
+            meta=json.dumps(
+                {
+                    "payout_breakdown_usd": [100],
+                    "max_games_per_round": [1] * game.utils.calculate_round_count(size),
+                }
+            ),
+        )
+        game.models.TournamentEntry.objects.bulk_create(
+            [
+                game.models.TournamentEntry(
+                    tournament=tournament, team=team, rank=rank, seed=rank
+                )
+                for rank in range(1, size + 1)
+            ]
+        )
+        return tournament
+
+    def run(self, name, build, matchup, size):
+        tournament = self.create_tournament(size)
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_queries):
+            start_time = time.monotonic()
+            build(tournament)
+            matchup(tournament)
+            elapsed = time.monotonic() - start_time
+
+        assert not game.models.Series.objects.filter(
+            round__tournament=tournament, round__stage=0, entry_1=None
+        ).exists()
+        self.stdout.write(
+            "%s :: %s ENTRIES IN %.1fms WITH %s QUERIES"
+            % (name, size, 1000 * elapsed, queries)
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        for size in options["sizes"]:
+            self.run(
+                "PER ROW",
+                build_tournament_structure_per_row,
+                matchup_tournament_entries_per_row,
+                size,
+            )
+            self.run(
+                "BULK",
+                game.brackets.build_tournament_structure,
+                game.brackets.matchup_tournament_entries,
+                size,
+            )
+
+        transaction.set_rollback(True)
@@ -18,11 +18,10 @@ from web3 import Account, Web3
 import eth.models
 import game.models
 import simulator.models
-from game.utils import (
-    build_tournament_structure,
-    calculate_round_count,
-    calculate_series_count,
-)
+import simulator.play_by_play
+from game.brackets import build_tournament_structure
+from game.standings import rebuild as rebuild_standings
+from game.utils import calculate_round_count, calculate_series_count
 
 LOGGER = logging.getLogger(__name__)
 
@@ -217,6 +216,9 @@ class Command(BaseCommand):
                     )
                     series.games.add(game)
 
+        rebuild_standings([tournament.id])
+        return tournament
+
     def generate_player_name(self):
         for _ in range(100):
             name = friendlywords.generate("po")
@@ -4269,17 +4271,12 @@ class Command(BaseCommand):
         g.lineup_2 = lineup2
         g.save()
 
-        play_by_play = simulator.models.PlayByPlay(
-            simulation=g.simulation,
-            feed=json.dumps(self.generate_play_by_play_feed(g.id)),
-        )
         g.simulation.save()
 
-        play_by_play = simulator.models.PlayByPlay(
-            simulation=g.simulation,
-            feed=json.dumps(self.generate_play_by_play_feed(g.id)),
+        simulator.play_by_play.save(
+            simulator.models.PlayByPlay(simulation=g.simulation),
+            self.generate_play_by_play_feed(g.id),
         )
-        play_by_play.save()
         return g
 
     def get_free_agents(self):
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+import game.participation
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the game participation index from all of the completed games."
+        " The index is otherwise kept up to date as games complete, so this is"
+        " only needed to repair it"
+    )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        self.stdout.write("REBUILD GAME PARTICIPATIONS :: STARTED %s" % start_time)
+
+        count = game.participation.rebuild()
+
+        end_time = time.time()
+        self.stdout.write("REBUILT %s PARTICIPATIONS" % count)
+        self.stdout.write("REBUILD GAME PARTICIPATIONS :: FINISHED %s" % end_time)
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
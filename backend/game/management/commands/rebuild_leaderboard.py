@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+import game.leaderboard
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the current season team leaderboard from all of the games of the"
+        " season. The leaderboard is otherwise kept up to date as games finalize,"
+        " so this is only needed to repair it or after changing the SP rules"
+    )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        self.stdout.write("REBUILD LEADERBOARD :: STARTED %s" % start_time)
+
+        game.leaderboard.rebuild()
+
+        end_time = time.time()
+        self.stdout.write("REBUILD LEADERBOARD :: FINISHED %s" % end_time)
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+import game.standings
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the standings of every tournament from their finished series."
+        " The standings are otherwise recorded as series finish, so this is only"
+        " needed to repair them"
+    )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        self.stdout.write("REBUILD TOURNAMENT STANDINGS :: STARTED %s" % start_time)
+
+        count = game.standings.rebuild()
+
+        end_time = time.time()
+        self.stdout.write("REBUILT STANDINGS OF %s SERIES" % count)
+        self.stdout.write("REBUILD TOURNAMENT STANDINGS :: FINISHED %s" % end_time)
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+import game.leaderboard_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the cached payloads of the leaderboards that changed since they"
+        " were last built"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild every leaderboard, stale or not",
+        )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        self.stdout.write("REFRESH LEADERBOARD CACHE :: STARTED %s" % start_time)
+
+        refreshed = game.leaderboard_cache.refresh(force=options["force"])
+
+        end_time = time.time()
+        self.stdout.write("REFRESHED %s" % (", ".join(refreshed) or "nothing"))
+        self.stdout.write("REFRESH LEADERBOARD CACHE :: FINISHED %s" % end_time)
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
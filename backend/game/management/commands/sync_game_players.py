@@ -6,5 +6,15 @@ import game.players
 class Command(BaseCommand):
     help = "Sync game players to the database."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help=(
+                "Re-sync every player instead of only those updated since the last"
+                " sync"
+            ),
+        )
+
     def handle(self, *args, **options):
-        game.players.sync()
+        game.players.sync(full=options["full"])
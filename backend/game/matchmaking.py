@@ -0,0 +1,168 @@
+"""Skill based matchmaking of the head to head queue.
+
+Every run drains the whole queue rather than pairing a fixed batch of its
+oldest teams. A team is paired with the team closest to it in matchmaking score,
+so the teams waiting are indexed by score in a sorted list, and are paired
+longest waiting first, so that no team is passed over for teams that came
+later.
+
+A team accepts an opponent within its skill window: MIN_SKILL_WINDOW around its
+score when it enters the queue, widened by SKILL_WINDOW_GROWTH for every second
+it waits, and two teams are paired when either accepts the other. Teams with
+close scores are paired at once, and a team far from every other is paired as
+soon as its window reaches the closest of them. Teams without an opponent in
+their window wait for the next run. A team with several entries in the queue
+plays one game per run.
+
+The games of the pairs, their contests and simulations are saved with a
+statement per table, created in the simulator concurrently, and the queue
+entries they pair updated with one statement. The entries of a game the
+simulator fails to create stay in the queue for the next run.
+"""
+import bisect
+import logging
+from decimal import Decimal
+
+import pgbulk
+from django.db import transaction
+from django.utils import timezone
+
+import game.models
+import game.utils
+
+LOGGER = logging.getLogger(__name__)
+
+# Matchmaking scores range from 0 to 1
+MIN_SKILL_WINDOW = 0.05
+SKILL_WINDOW_GROWTH = 0.0005
+
+
+def skill_window(entry, now, min_window=MIN_SKILL_WINDOW, growth=SKILL_WINDOW_GROWTH):
+    """How far from its score a queue entry accepts an opponent at now"""
+    return min_window + growth * (now - entry.created_at).total_seconds()
+
+
+def pair(entries, now, min_window=MIN_SKILL_WINDOW, growth=SKILL_WINDOW_GROWTH):
+    """Pairs queue entries with the entry closest in score within their skill
+    windows at now, longest waiting first. Entries only need an id, team_id,
+    score and created_at. Returns the pairs, the longest waiting entry first"""
+    waiting = {}
+    for entry in sorted(entries, key=lambda entry: (entry.created_at, entry.id)):
+        waiting.setdefault(entry.team_id, entry)
+
+    # Entries are removed from the index as they are paired, so the neighbours
+    # of an entry in it are the closest entries in score still waiting
+    index = sorted(
+        waiting.values(), key=lambda entry: (entry.score, entry.created_at, entry.id)
+    )
+    keys = [(entry.score, entry.created_at, entry.id) for entry in index]
+
+    pairs = []
+    for seeker in waiting.values():
+        position = bisect.bisect_left(
+            keys, (seeker.score, seeker.created_at, seeker.id)
+        )
+        if position == len(keys) or index[position] is not seeker:
+            # Already paired
+            continue
+
+        neighbours = [
+            neighbour
+            for neighbour in (position - 1, position + 1)
+            if 0 <= neighbour < len(index)
+        ]
+        if not neighbours:
+            break
+        closest = min(
+            neighbours,
+            key=lambda neighbour: abs(index[neighbour].score - seeker.score),
+        )
+        # Either team accepting the other is enough
+        window = max(
+            skill_window(entry, now, min_window, growth)
+            for entry in (seeker, index[closest])
+        )
+        if abs(index[closest].score - seeker.score) > window:
+            continue
+
+        pairs.append((seeker, index[closest]))
+        for removed in sorted((position, closest), reverse=True):
+            del index[removed]
+            del keys[removed]
+
+    return pairs
+
+
+def match_queue():
+    """Pairs the teams in the head to head queue and creates their games.
+    Returns the pairs whose games were created"""
+    entries = list(
+        game.models.HeadToHeadMatchMakeQueue.objects.select_related(
+            "team__owner",
+            *[
+                f"lineup__player_{slot_number}__simulated"
+                for slot_number in range(1, 6)
+            ],
+        ).filter(sent_to_simulator_at=None)
+    )
+    pairs = pair(entries, timezone.now())
+    LOGGER.info(f"Paired {len(pairs) * 2} of {len(entries)} entries in the queue...")
+    if not pairs:
+        return []
+
+    with transaction.atomic():
+        contests = game.models.Contest.objects.bulk_create(
+            [
+                game.models.Contest(
+                    kind=game.models.Contest.Kind.HEAD_TO_HEAD_MATCH_MAKE,
+                    tokens_required=right_entry.max_tokens_allowed,
+                )
+                for _, right_entry in pairs
+            ]
+        )
+        my_games = game.utils.bulk_create_games(
+            [
+                game.models.Game(
+                    contest=contest,
+                    prize_pool=Decimal(0),
+                    lineup_1=left_entry.lineup,
+                    lineup_2=right_entry.lineup,
+                    revealed_to_user_1=left_entry.team.owner.reveal_games_by_default,
+                    revealed_to_user_2=right_entry.team.owner.reveal_games_by_default,
+                )
+                for contest, (left_entry, right_entry) in zip(contests, pairs)
+            ]
+        )
+
+    failed = game.utils.create_games_in_simulator(my_games)
+    if failed:
+        with transaction.atomic():
+            game.utils.delete_games(failed)
+            game.models.Contest.objects.filter(
+                id__in=[my_game.contest_id for my_game in failed]
+            ).delete()
+
+    now = timezone.now()
+    matched = []
+    paired_entries = []
+    for (left_entry, right_entry), my_game in zip(pairs, my_games):
+        if my_game in failed:
+            continue
+
+        for entry, opponent in ((left_entry, right_entry), (right_entry, left_entry)):
+            entry.sent_to_simulator_at = now
+            entry.paired_with_id = opponent.team_id
+            entry.game = my_game
+            paired_entries.append(entry)
+        matched.append((left_entry, right_entry))
+
+        LOGGER.info(
+            f"{left_entry.team.name} was paired with {right_entry.team.name} for game {my_game.id}"  # noqa: E501
+        )
+
+    pgbulk.update(
+        game.models.HeadToHeadMatchMakeQueue,
+        paired_entries,
+        ["sent_to_simulator_at", "paired_with", "game"],
+    )
+    return matched
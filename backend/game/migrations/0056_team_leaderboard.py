@@ -0,0 +1,218 @@
+# Generated by Django 4.0.5 on 2026-10-18 16:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0055_alter_tournament_kind"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamLeaderboard",
+            fields=[
+                (
+                    "team",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="leaderboard",
+                        serialize=False,
+                        to="game.team",
+                    ),
+                ),
+                ("wins", models.IntegerField(default=0)),
+                ("losses", models.IntegerField(default=0)),
+                ("played", models.IntegerField(default=0)),
+                ("points", models.IntegerField(default=0)),
+                ("opponent_points", models.IntegerField(default=0)),
+                (
+                    "streak",
+                    models.CharField(
+                        blank=True, help_text="e.g. W3 or L1", max_length=8
+                    ),
+                ),
+                ("l10_wins", models.IntegerField(default=0)),
+                ("l10_losses", models.IntegerField(default=0)),
+                ("daily_sp", models.IntegerField(default=0)),
+                ("weekly_sp", models.IntegerField(default=0)),
+                ("challenge_sp", models.IntegerField(default=0)),
+                ("tournament_sp", models.IntegerField(default=0)),
+                ("total_sp", models.IntegerField(db_index=True, default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TeamLeaderboardWeek",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("week", models.PositiveSmallIntegerField()),
+                ("wins", models.IntegerField(default=0)),
+                ("losses", models.IntegerField(default=0)),
+                ("entries", models.IntegerField(default=0)),
+                ("mm_entries", models.IntegerField(default=0)),
+                (
+                    "challenge",
+                    models.CharField(
+                        blank=True,
+                        help_text="The name of the weekly challenge",
+                        max_length=32,
+                    ),
+                ),
+                ("challenge_progress", models.IntegerField(default=0)),
+                ("daily_sp", models.IntegerField(default=0)),
+                ("weekly_sp", models.IntegerField(default=0)),
+                ("challenge_sp", models.IntegerField(default=0)),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.team",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TeamLeaderboardTournament",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveIntegerField()),
+                ("sp", models.IntegerField(default=0)),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.team",
+                    ),
+                ),
+                (
+                    "tournament",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.tournament",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TeamLeaderboardGame",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "side",
+                    models.PositiveSmallIntegerField(
+                        help_text="1 or 2, the lineup of the team"
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("HEAD_TO_HEAD", "Head To Head"),
+                            ("HEAD_TO_HEAD_MATCH_MAKE", "Head To Head Match Make"),
+                            ("TOURNAMENT", "Tournament"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("played_at", models.DateTimeField()),
+                (
+                    "played_on",
+                    models.DateField(help_text="The local date the game was played"),
+                ),
+                ("points", models.IntegerField()),
+                ("opponent_points", models.IntegerField()),
+                ("ast", models.IntegerField()),
+                ("blk", models.IntegerField()),
+                ("pts", models.IntegerField()),
+                ("stl", models.IntegerField()),
+                ("three_p", models.IntegerField()),
+                ("trb", models.IntegerField()),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.game",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.team",
+                    ),
+                ),
+                (
+                    "tournament",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.tournament",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="teamleaderboardweek",
+            constraint=models.UniqueConstraint(
+                fields=("team", "week"), name="unique_team_leaderboard_week"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="teamleaderboardtournament",
+            constraint=models.UniqueConstraint(
+                fields=("team", "tournament"), name="unique_team_leaderboard_tournament"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamleaderboardgame",
+            index=models.Index(
+                fields=["team", "played_at"], name="game_teamle_team_id_553da4_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamleaderboardgame",
+            index=models.Index(
+                fields=["played_on"], name="game_teamle_played__d5cdd7_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="teamleaderboardgame",
+            constraint=models.UniqueConstraint(
+                fields=("team", "game"), name="unique_team_leaderboard_game"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.0.5 on 2026-10-18 16:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0056_team_leaderboard"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contest",
+            index=models.Index(
+                condition=models.Q(("status", "COMPLETE")),
+                fields=["-played_at", "-id"],
+                name="contest_complete_played_at",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["contest", "-id"],
+                include=("lineup_1", "lineup_2", "visibility"),
+                name="game_contest_history",
+            ),
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 4.0.5 on 2026-10-18 16:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0057_game_history_indexes"),
+        ("simulator", "0036_stats_aggregates"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameParticipation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "token",
+                    models.IntegerField(
+                        help_text="The simulated player token.", null=True
+                    ),
+                ),
+                (
+                    "side",
+                    models.PositiveSmallIntegerField(
+                        help_text="The lineup number, 1 or 2."
+                    ),
+                ),
+                (
+                    "slot",
+                    models.PositiveSmallIntegerField(
+                        help_text="The player number, 1 to 5."
+                    ),
+                ),
+                ("played_at", models.DateTimeField(null=True)),
+                ("won", models.BooleanField(null=True)),
+                ("visibility", models.CharField(max_length=12)),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participations",
+                        to="game.game",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.team",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="gameparticipation",
+            index=models.Index(
+                condition=models.Q(("visibility", "PUBLIC")),
+                fields=["token", "-played_at", "-game"],
+                include=("side", "slot", "won"),
+                name="participation_public_history",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="gameparticipation",
+            constraint=models.UniqueConstraint(
+                fields=("game", "side", "slot"), name="unique_game_participation"
+            ),
+        ),
+        # Backfill the participations of the games completed so far
+        migrations.RunSQL(
+            """
+            INSERT INTO game_gameparticipation (
+                token, game_id, team_id, side, slot, played_at, won, visibility
+            )
+            SELECT sp.token,
+                   g.id,
+                   l.team_id,
+                   side.side,
+                   slot.slot,
+                   c.played_at,
+                   CASE
+                       WHEN side.side = 1 THEN r.lineup_1_score > r.lineup_2_score
+                       ELSE r.lineup_2_score > r.lineup_1_score
+                       END,
+                   g.visibility
+            FROM game_game g
+                     JOIN game_contest c ON c.id = g.contest_id
+                     LEFT JOIN simulator_simulation s ON s.id = g.simulation_id
+                     LEFT JOIN simulator_result r ON r.id = s.result_id
+                     CROSS JOIN LATERAL (
+                         VALUES (1, g.lineup_1_id), (2, g.lineup_2_id)
+                     ) AS side (side, lineup_id)
+                     JOIN game_lineup l ON l.id = side.lineup_id
+                     CROSS JOIN LATERAL UNNEST(
+                         ARRAY [l.player_1_id, l.player_2_id, l.player_3_id,
+                             l.player_4_id, l.player_5_id]
+                     ) WITH ORDINALITY AS slot (player_id, slot)
+                     JOIN game_player p ON p.id = slot.player_id
+                     JOIN simulator_player sp ON sp.uuid = p.simulated_id
+            WHERE c.status = 'COMPLETE'
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 4.0.5 on 2026-10-18 18:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0058_game_participation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="series",
+            name="loser",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="series_lost",
+                to="game.tournamententry",
+            ),
+        ),
+        migrations.AddField(
+            model_name="series",
+            name="winner",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="series_won",
+                to="game.tournamententry",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tournamententry",
+            name="place",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="tournamententry",
+            index=models.Index(
+                condition=models.Q(("place__isnull", False)),
+                fields=["tournament", "place"],
+                name="tournament_entry_placement",
+            ),
+        ),
+        # Backfill the standings of the series finished so far
+        migrations.RunSQL(
+            """
+            UPDATE game_series gs
+            SET winner_id = CASE
+                                WHEN counts.entry_1_wins > counts.finished - counts.entry_1_wins
+                                    THEN gs.entry_1_id
+                                ELSE gs.entry_2_id
+                END,
+                loser_id  = CASE
+                                WHEN counts.entry_1_wins > counts.finished - counts.entry_1_wins
+                                    THEN gs.entry_2_id
+                                ELSE gs.entry_1_id
+                    END
+            FROM (SELECT gsg.series_id,
+                         COUNT(*) FILTER (WHERE ss.status = 'FINISHED')                  AS finished,
+                         COUNT(*) FILTER (WHERE sr.lineup_1_score > sr.lineup_2_score) AS entry_1_wins
+                  FROM game_series_games gsg
+                           JOIN game_game gg ON gg.id = gsg.game_id
+                           JOIN simulator_simulation ss ON ss.id = gg.simulation_id
+                           LEFT JOIN simulator_result sr ON sr.id = ss.result_id
+                  GROUP BY gsg.series_id) AS counts
+            WHERE counts.series_id = gs.id
+              AND counts.finished > 0
+              AND gs.status = 'FINISHED';
+
+            UPDATE game_tournamententry te
+            SET place = (gt.size / POWER(2, gr.stage + 1))::integer + 1
+            FROM game_series gs
+                     JOIN game_round gr ON gr.id = gs.round_id
+                     JOIN game_tournament gt ON gt.id = gr.tournament_id
+            WHERE gs.loser_id = te.id;
+
+            UPDATE game_tournamententry te
+            SET place = 1
+            FROM game_series gs
+                     JOIN game_round gr ON gr.id = gs.round_id
+                     JOIN game_tournament gt ON gt.id = gr.tournament_id
+            WHERE gs.winner_id = te.id
+              AND POWER(2, gr.stage + 1) = gt.size;
+            """,  # noqa: E501
+            migrations.RunSQL.noop,
+        ),
+    ]
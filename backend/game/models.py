@@ -1,13 +1,13 @@
 import datetime
 import json
 import math
-from collections import namedtuple
 
 import pgtrigger
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import connection, models, transaction
-from django.db.models import Case, Count, IntegerField, Q, When
+from django.db import models, transaction
+from django.db.models import Case, Count, F, FloatField, IntegerField, Q, When
+from django.db.models.functions import Cast
 from django.utils import timezone
 
 import simulator.models
@@ -130,6 +130,54 @@ class GamePlayer(models.Model):
         raise AssertionError("This model can only be saved by Game triggers.")
 
 
+class GameParticipationManager(models.Manager):
+    def record(self, player_token):
+        """The wins and losses of a player in public games"""
+        return self.filter(
+            token=player_token, visibility=Game.Visibility.PUBLIC
+        ).aggregate(
+            wins=Count("id", filter=Q(won=True)),
+            losses=Count("id", filter=Q(won=False)),
+        )
+
+
+class GameParticipation(models.Model):
+    """
+    A player's part in a completed game, denormalized from the game, its contest
+    and its result so that the games of a player are a range scan of a single
+    index. Written by game.participation as games complete or change visibility
+    and should not be edited directly.
+    """
+
+    token = models.IntegerField(null=True, help_text="The simulated player token.")
+    game = models.ForeignKey(
+        "game.Game", on_delete=models.CASCADE, related_name="participations"
+    )
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="+")
+    side = models.PositiveSmallIntegerField(help_text="The lineup number, 1 or 2.")
+    slot = models.PositiveSmallIntegerField(help_text="The player number, 1 to 5.")
+    played_at = models.DateTimeField(null=True)
+    won = models.BooleanField(null=True)
+    visibility = models.CharField(max_length=12)
+
+    objects = GameParticipationManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "side", "slot"], name="unique_game_participation"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["token", "-played_at", "-game"],
+                include=["side", "slot", "won"],
+                condition=Q(visibility="PUBLIC"),
+                name="participation_public_history",
+            ),
+        ]
+
+
 class Contest(models.Model):
     """
     Groups games into contest types, such as head to heads or tournaments.
@@ -154,6 +202,16 @@ class Contest(models.Model):
     played_at = models.DateTimeField(null=True)
     tokens_required = models.PositiveIntegerField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # Game history is paged through completed contests by played_at
+            models.Index(
+                fields=["-played_at", "-id"],
+                condition=Q(status="COMPLETE"),
+                name="contest_complete_played_at",
+            ),
+        ]
+
     def __str__(self):
         return str(self.id)
 
@@ -223,77 +281,33 @@ class GameManager(models.Manager):
             "simulation__result",
         )
 
-    def _predefined_joins_for_player_result_lookups(self):
-        return self.select_related(
-            "contest",
-            "lineup_1",
-            "lineup_1__team",
-            "lineup_2",
-            "lineup_2__team",
-            "simulation__result",
-            "lineup_1__player_1__simulated",
-            "lineup_1__player_2__simulated",
-            "lineup_1__player_3__simulated",
-            "lineup_1__player_4__simulated",
-            "lineup_1__player_5__simulated",
-            "lineup_2__player_1__simulated",
-            "lineup_2__player_2__simulated",
-            "lineup_2__player_3__simulated",
-            "lineup_2__player_4__simulated",
-            "lineup_2__player_5__simulated",
-            "simulation__result__lineup_1_player_1_box_score",
-            "simulation__result__lineup_1_player_2_box_score",
-            "simulation__result__lineup_1_player_3_box_score",
-            "simulation__result__lineup_1_player_4_box_score",
-            "simulation__result__lineup_1_player_5_box_score",
-            "simulation__result__lineup_2_player_1_box_score",
-            "simulation__result__lineup_2_player_2_box_score",
-            "simulation__result__lineup_2_player_3_box_score",
-            "simulation__result__lineup_2_player_4_box_score",
-            "simulation__result__lineup_2_player_5_box_score",
-        )
-
     def games_by_player(self, player_token):
-        lineup1 = self._predefined_joins_for_player_result_lookups().filter(
-            contest__status=Contest.Status.COMPLETE,
-            visibility=Game.Visibility.PUBLIC,
-        )
-
-        lineup1 = lineup1.filter(
-            Q(lineup_1__player_1__simulated__token=player_token)
-            | Q(lineup_1__player_2__simulated__token=player_token)
-            | Q(lineup_1__player_3__simulated__token=player_token)
-            | Q(lineup_1__player_4__simulated__token=player_token)
-            | Q(lineup_1__player_5__simulated__token=player_token)
-        )
-
-        lineup2 = self._predefined_joins_for_player_result_lookups().filter(
-            contest__status=Contest.Status.COMPLETE,
-            visibility=Game.Visibility.PUBLIC,
-        )
-
-        lineup2 = lineup2.filter(
-            Q(lineup_2__player_1__simulated__token=player_token)
-            | Q(lineup_2__player_2__simulated__token=player_token)
-            | Q(lineup_2__player_3__simulated__token=player_token)
-            | Q(lineup_2__player_4__simulated__token=player_token)
-            | Q(lineup_2__player_5__simulated__token=player_token)
+        return (
+            self.filter(
+                participations__token=player_token,
+                participations__visibility=Game.Visibility.PUBLIC,
+            )
+            .annotate(
+                history_played_at=F("participations__played_at"),
+                player_lineup_number=F("participations__side"),
+                player_slot_number=F("participations__slot"),
+            )
+            .order_by("-history_played_at", "-id")
         )
 
-        return lineup1.union(lineup2).order_by("-contest__played_at")
-
     def games_by_team(self, team_id, status):
-        my_filter = {"visibility": Game.Visibility.PUBLIC, "contest__status": status}
-        lineup1 = self._predefined_joins_for_team_lookups().filter(
-            lineup_1__team_id=team_id, **my_filter
-        )
-
-        lineup2 = self._predefined_joins_for_team_lookups().filter(
-            lineup_2__team_id=team_id, **my_filter
+        lineups = Lineup.objects.filter(team_id=team_id).values("id")
+        return (
+            self._predefined_joins_for_team_lookups()
+            .filter(
+                Q(lineup_1__in=lineups) | Q(lineup_2__in=lineups),
+                visibility=Game.Visibility.PUBLIC,
+                contest__status=status,
+            )
+            .annotate(history_played_at=F("contest__played_at"))
+            .order_by("-history_played_at", "-id")
         )
 
-        return lineup1.union(lineup2).order_by("-contest__played_at")
-
     def games_for_status(self, status):
         return (
             self.filter(contest__status=status, visibility=Game.Visibility.PUBLIC)
@@ -450,6 +464,16 @@ class Game(models.Model):
 
     objects = GameManager()
 
+    class Meta:
+        indexes = [
+            # Covers the game history filters once contests are found by played_at
+            models.Index(
+                fields=["contest", "-id"],
+                include=["lineup_1", "lineup_2", "visibility"],
+                name="game_contest_history",
+            ),
+        ]
+
     @transaction.atomic
     def save(self, *args, **kwargs):
         if not self.simulation_id and self.lineup_1 and self.lineup_2:
@@ -709,82 +733,12 @@ class TournamentEntryManager(models.Manager):
         return True
 
     def for_tournament_in_placement_order(self, tournament_id):
-        sql = """
-            WITH loss_records_by_stage AS (SELECT lrbs.series_id,
-                                                lrbs.stage,
-                                                COUNT(lrbs.losing_entrant) AS number_of_losses,
-                                                lrbs.losing_entrant
-                                        FROM (SELECT CASE
-                                                            WHEN sr.lineup_1_score < sr.lineup_2_score THEN gs.entry_1_id
-                                                            ELSE gs.entry_2_id
-                                                            END  AS losing_entrant,
-                                                        gr.stage AS stage,
-                                                        gs.id    AS series_id
-                                                FROM game_tournament gt
-                                                        JOIN game_round gr ON gt.id = gr.tournament_id
-                                                        JOIN game_series gs ON gs.round_id = gr.id
-                                                        JOIN game_series_games gsg ON gs.id = gsg.series_id
-                                                        JOIN game_game gg ON gsg.game_id = gg.id
-                                                        JOIN simulator_simulation ss ON gg.simulation_id = ss.id
-                                                        JOIN simulator_result sr ON ss.result_id = sr.id
-                                                WHERE gt.id = %s) AS lrbs
-                                        GROUP BY lrbs.series_id, lrbs.stage, lrbs.losing_entrant)
-
-            SELECT results.entrant_id, rank() OVER (ORDER BY results.stage DESC, results.win_or_loss DESC)
-            FROM (SELECT lbrs.series_id, lbrs.stage, lbrs.losing_entrant AS entrant_id, 'LOSS' AS win_or_loss
-                FROM loss_records_by_stage lbrs
-                        JOIN (SELECT counted_losses.series_id, MAX(counted_losses.number_of_losses) AS max_number_of_losses
-                                FROM loss_records_by_stage counted_losses
-                                GROUP by counted_losses.series_id) maxxed_losses
-                                ON maxxed_losses.series_id = lbrs.series_id and
-                                maxxed_losses.max_number_of_losses = lbrs.number_of_losses
-
-                UNION
-                (with win_records_by_stage AS (SELECT lrbs.series_id,
-                                                        lrbs.stage,
-                                                        count(lrbs.winning_entrant) AS number_of_wins,
-                                                        lrbs.winning_entrant
-                                                FROM (SELECT CASE
-                                                                WHEN sr.lineup_1_score > sr.lineup_2_score THEN gs.entry_1_id
-                                                                ELSE gs.entry_2_id
-                                                                END  AS winning_entrant,
-                                                            gr.stage AS stage,
-                                                            gs.id    AS series_id
-                                                    FROM game_tournament gt
-                                                                JOIN game_round gr ON gt.id = gr.tournament_id
-                                                                JOIN game_series gs ON gs.round_id = gr.id
-                                                                JOIN game_series_games gsg ON gs.id = gsg.series_id
-                                                                JOIN game_game gg ON gsg.game_id = gg.id
-                                                                JOIN simulator_simulation ss ON gg.simulation_id = ss.id
-                                                                join simulator_result sr ON ss.result_id = sr.id
-                                                    WHERE gt.id = %s) AS lrbs
-                                                GROUP BY lrbs.series_id, lrbs.stage, lrbs.winning_entrant)
-                SELECT lbrs.series_id, lbrs.stage, lbrs.winning_entrant AS entrant_id, 'WIN' AS win_or_loss
-                FROM win_records_by_stage lbrs
-                            JOIN (SELECT counted_wins.series_id, max(counted_wins.number_of_wins) AS max_number_of_wins
-                                FROM win_records_by_stage counted_wins
-                                GROUP BY counted_wins.series_id) maxxed_wins
-                                ON maxxed_wins.series_id = lbrs.series_id AND maxxed_wins.max_number_of_wins = lbrs.number_of_wins
-                WHERE lbrs.stage = (SELECT MAX(stage)
-                                    FROM game_tournament gt
-                                                JOIN game_round gr ON gt.id = gr.tournament_id
-                                    WHERE gt.id = %s
-                                    GROUP BY gt.id))) AS results;"""  # noqa: E501
-
-        with connection.cursor() as cursor:
-            cursor.execute(sql, [tournament_id, tournament_id, tournament_id])
-
-            Standing = namedtuple("Standing", ["entrant_id", "place"])
-            standings = [Standing(*row) for row in cursor.fetchall()]
-            standings_map = {s.entrant_id: s.place for s in standings}
-
-        entries = TournamentEntry.objects.filter(
-            id__in=map(lambda s: s.entrant_id, standings)
+        """The placed entries of a tournament, best first, see game.standings"""
+        return list(
+            self.filter(tournament_id=tournament_id, place__isnull=False).order_by(
+                "place", "id"
+            )
         )
-        # using `in` doesn't guarantee the order of the results, so we need to sort
-        # them according to the tournament standings
-        entries = sorted(entries, key=lambda e: standings_map[e.id])
-        return entries
 
 
 class TournamentEntry(models.Model):
@@ -800,6 +754,8 @@ class TournamentEntry(models.Model):
 
     rank = models.PositiveIntegerField(default=0)
     seed = models.PositiveIntegerField(default=0)
+    # Recorded by game.standings as the series of the entry finish
+    place = models.PositiveIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -808,6 +764,13 @@ class TournamentEntry(models.Model):
     class Meta:
         ordering = ["created_at"]
         verbose_name_plural = "Tournament Entries"
+        indexes = [
+            models.Index(
+                fields=["tournament", "place"],
+                condition=Q(place__isnull=False),
+                name="tournament_entry_placement",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.team.name} (Rank: {self.rank}, Id: {self.id})"
@@ -872,6 +835,20 @@ class Series(models.Model):
         blank=True,
         null=True,
     )
+    winner = models.ForeignKey(
+        TournamentEntry,
+        on_delete=models.PROTECT,
+        related_name="series_won",
+        blank=True,
+        null=True,
+    )
+    loser = models.ForeignKey(
+        TournamentEntry,
+        on_delete=models.PROTECT,
+        related_name="series_lost",
+        blank=True,
+        null=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -981,3 +958,124 @@ class TournamentPayout(models.Model):
 
     def __str__(self):
         return f"TournamentPayout{{tournament_id={self.tournament.id}, payout_id={self.payout.id}}}"  # noqa: E501
+
+
+class TeamLeaderboardGame(models.Model):
+    """
+    A team's result in a public, completed game of the leaderboard season. Rows are
+    written by game.leaderboard as games finalize and are the source of the
+    weekly rollups and team totals.
+    """
+
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="+")
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="+")
+    side = models.PositiveSmallIntegerField(help_text="1 or 2, the lineup of the team")
+    kind = models.CharField(max_length=32, choices=Contest.Kind.choices)
+    tournament = models.ForeignKey(
+        "game.Tournament", null=True, on_delete=models.CASCADE, related_name="+"
+    )
+    played_at = models.DateTimeField()
+    played_on = models.DateField(help_text="The local date the game was played")
+    points = models.IntegerField()
+    opponent_points = models.IntegerField()
+    ast = models.IntegerField()
+    blk = models.IntegerField()
+    pts = models.IntegerField()
+    stl = models.IntegerField()
+    three_p = models.IntegerField()
+    trb = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "game"], name="unique_team_leaderboard_game"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["team", "played_at"]),
+            models.Index(fields=["played_on"]),
+        ]
+
+
+class TeamLeaderboardWeek(models.Model):
+    """A weekly rollup of a team's games and the SP earned during the week"""
+
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="+")
+    week = models.PositiveSmallIntegerField()
+    wins = models.IntegerField(default=0)
+    losses = models.IntegerField(default=0)
+    entries = models.IntegerField(default=0)
+    mm_entries = models.IntegerField(default=0)
+    challenge = models.CharField(
+        max_length=32, blank=True, help_text="The name of the weekly challenge"
+    )
+    challenge_progress = models.IntegerField(default=0)
+    daily_sp = models.IntegerField(default=0)
+    weekly_sp = models.IntegerField(default=0)
+    challenge_sp = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "week"], name="unique_team_leaderboard_week"
+            )
+        ]
+
+
+class TeamLeaderboardTournament(models.Model):
+    """A team's rank in a tournament of the leaderboard season and the SP earned"""
+
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="+")
+    tournament = models.ForeignKey(
+        "game.Tournament", on_delete=models.CASCADE, related_name="+"
+    )
+    rank = models.PositiveIntegerField()
+    sp = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "tournament"],
+                name="unique_team_leaderboard_tournament",
+            )
+        ]
+
+
+class TeamLeaderboardManager(models.Manager):
+    def ranked(self):
+        """Teams ordered by SP, then win percentage and point differential"""
+        played = Cast("played", FloatField())
+        return (
+            self.select_related("team")
+            .annotate(
+                win_percentage=F("wins") * 100.0 / played,
+                ppg=F("points") / played,
+                opp_ppg=F("opponent_points") / played,
+                diff=(F("points") - F("opponent_points")) / played,
+            )
+            .order_by("-total_sp", "-win_percentage", "-diff")
+        )
+
+
+class TeamLeaderboard(models.Model):
+    """A team's season totals, precomputed from its leaderboard games and weeks"""
+
+    team = models.OneToOneField(
+        Team, primary_key=True, on_delete=models.CASCADE, related_name="leaderboard"
+    )
+    wins = models.IntegerField(default=0)
+    losses = models.IntegerField(default=0)
+    played = models.IntegerField(default=0)
+    points = models.IntegerField(default=0)
+    opponent_points = models.IntegerField(default=0)
+    streak = models.CharField(max_length=8, blank=True, help_text="e.g. W3 or L1")
+    l10_wins = models.IntegerField(default=0)
+    l10_losses = models.IntegerField(default=0)
+    daily_sp = models.IntegerField(default=0)
+    weekly_sp = models.IntegerField(default=0)
+    challenge_sp = models.IntegerField(default=0)
+    tournament_sp = models.IntegerField(default=0)
+    total_sp = models.IntegerField(default=0, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TeamLeaderboardManager()
@@ -0,0 +1,108 @@
+import base64
+import binascii
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework import pagination, response
+from rest_framework.exceptions import NotFound
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class GameHistoryPagination(pagination.BasePagination):
+    """
+    Keyset pagination of games, most recently played first.
+
+    Pages are keyed on (played_at, id) of the last game of the previous page
+    rather than on an offset, so every page is a range scan of the same cost.
+    The queryset must be a values() queryset of games with the played_at they
+    are paged by as history_played_at. Games without one sort first, as they
+    do in a descending Postgres index.
+
+    The game history endpoints page by keyset when asked to with is_requested(),
+    and keep their list or page number responses otherwise.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    paginate_query_param = "paginate"
+    invalid_cursor_message = "Invalid cursor"
+
+    @classmethod
+    def is_requested(cls, request):
+        """Whether a request asks for keyset pages: ?paginate=cursor for the first
+        page and the cursor of the next links for the others"""
+        return (
+            cls.cursor_query_param in request.query_params
+            or request.query_params.get(cls.paginate_query_param)
+            == cls.cursor_query_param
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        queryset = queryset.order_by("-history_played_at", "-id")
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            played_at, game_id = cursor
+            if played_at is None:
+                after = Q(history_played_at__isnull=True, id__lt=game_id) | Q(
+                    history_played_at__isnull=False
+                )
+            else:
+                after = Q(history_played_at__lt=played_at) | Q(
+                    history_played_at=played_at, id__lt=game_id
+                )
+            queryset = queryset.filter(after)
+
+        page = list(queryset[: self.page_size + 1])
+        self.next_cursor = None
+        if len(page) > self.page_size:
+            page = page[: self.page_size]
+            self.next_cursor = (page[-1]["history_played_at"], page[-1]["id"])
+        return page
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            played_at, game_id = (
+                base64.urlsafe_b64decode(encoded.encode()).decode().split("|")
+            )
+            cursor = (parse_datetime(played_at) if played_at else None, int(game_id))
+        except (binascii.Error, TypeError, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if played_at and cursor[0] is None:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, cursor):
+        played_at, game_id = cursor
+        encoded = base64.urlsafe_b64encode(
+            f"{played_at.isoformat() if played_at else ''}|{game_id}".encode()
+        )
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            encoded.decode(),
+        )
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return self.encode_cursor(self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return response.Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
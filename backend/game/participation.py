@@ -0,0 +1,64 @@
+"""The game participation index.
+
+GameParticipation holds a row for each of the ten players of every completed
+game, along with when it was played, whether the player's side won and the
+visibility of the game. The rows of a game are rewritten by record_games()
+whenever one of those changes, i.e. when the game completes and when its series
+is published.
+"""
+from django.db import connection, transaction
+
+PARTICIPATIONS_SQL = """
+INSERT INTO game_gameparticipation (
+    token, game_id, team_id, side, slot, played_at, won, visibility
+)
+SELECT sp.token,
+       g.id,
+       l.team_id,
+       side.side,
+       slot.slot,
+       c.played_at,
+       CASE
+           WHEN side.side = 1 THEN r.lineup_1_score > r.lineup_2_score
+           ELSE r.lineup_2_score > r.lineup_1_score
+           END,
+       g.visibility
+FROM game_game g
+         JOIN game_contest c ON c.id = g.contest_id
+         LEFT JOIN simulator_simulation s ON s.id = g.simulation_id
+         LEFT JOIN simulator_result r ON r.id = s.result_id
+         CROSS JOIN LATERAL (
+             VALUES (1, g.lineup_1_id), (2, g.lineup_2_id)
+         ) AS side (side, lineup_id)
+         JOIN game_lineup l ON l.id = side.lineup_id
+         CROSS JOIN LATERAL UNNEST(
+             ARRAY [l.player_1_id, l.player_2_id, l.player_3_id, l.player_4_id,
+                 l.player_5_id]
+         ) WITH ORDINALITY AS slot (player_id, slot)
+         JOIN game_player p ON p.id = slot.player_id
+         JOIN simulator_player sp ON sp.uuid = p.simulated_id
+WHERE c.status = 'COMPLETE'
+  {where}
+"""
+
+
+@transaction.atomic
+def record_games(game_ids):
+    """Rewrites the participations of the given games"""
+    game_ids = list(game_ids)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM game_gameparticipation WHERE game_id = ANY(%s)", [game_ids]
+        )
+        cursor.execute(
+            PARTICIPATIONS_SQL.format(where="AND g.id = ANY(%s)"), [game_ids]
+        )
+
+
+@transaction.atomic
+def rebuild():
+    """Rewrites the participations of every game"""
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM game_gameparticipation")
+        cursor.execute(PARTICIPATIONS_SQL.format(where=""))
+        return cursor.rowcount
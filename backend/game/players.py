@@ -20,12 +20,13 @@ LOGGER = logging.getLogger(__name__)
 
 @utils.db.mutex
 @transaction.atomic
-def sync():
+def sync(full=False):
     """
     Sync players from the simulator and create new Player objects
-    when necessary
+    when necessary. Only players updated since the last sync are fetched
+    unless full is True
     """
-    simulator.processing.sync_players()
+    simulator.processing.sync_players(full=full)
 
     game.models.Player.objects.bulk_create(
         [
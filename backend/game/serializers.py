@@ -1,20 +1,21 @@
-import json
-
 from django.contrib.auth import get_user_model
 from django.core.validators import RegexValidator
-from django.db import transaction
+from django.db import models, transaction
 from django.utils import timezone
 from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
 from rest_framework.exceptions import ErrorDetail, ValidationError
 from rest_framework.validators import UniqueValidator
 
+import game.listings
 import game.models
 import game.utils
 import moderation.models
 import moderation.service
+import simulator.loaders
 import simulator.model_views
 import simulator.models
+import simulator.play_by_play
 import simulator.serializers
 from game.validation.validator import (
     PlayerNameCompositionValidator,
@@ -249,6 +250,13 @@ class FlattenMixin:
         return representation
 
 
+class PlayerList(serializers.ListSerializer):
+    def to_representation(self, data):
+        players = list(data.all() if isinstance(data, models.Manager) else data)
+        simulator.loaders.PlayerStatsLoader.for_context(self.context).prime(players)
+        return super().to_representation(players)
+
+
 class Player(serializers.ModelSerializer, FlattenMixin):
     simulated = simulator.serializers.Player(read_only=True)
     fields_to_flatten = ["simulated"]
@@ -266,6 +274,7 @@ class Player(serializers.ModelSerializer, FlattenMixin):
 
     class Meta:
         model = game.models.Player
+        list_serializer_class = PlayerList
         fields = [
             "id",
             "team",
@@ -284,97 +293,67 @@ class Player(serializers.ModelSerializer, FlattenMixin):
             "first_named_on",
         ]
 
+    @property
+    def stats_loader(self):
+        return simulator.loaders.PlayerStatsLoader.for_context(self.context)
+
+    def _player_stats(self, player, view):
+        player_stats = self.stats_loader.stats(view, player)
+        if player_stats:
+            return simulator.serializers.PlayerStats(player_stats).data
+        return {}
+
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
     def get_wins(self, player):
-        my_model_view = simulator.model_views.CurrentSeasonPlayerStatsViewProxy
-        player_stats = my_model_view.objects.by_player_token(player.simulated.token)
+        player_stats = self.stats_loader.stats("current_season", player)
 
         if player_stats:
             return player_stats.wins
 
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
     def get_losses(self, player):
-        my_model_view = simulator.model_views.CurrentSeasonPlayerStatsViewProxy
-        player_stats = my_model_view.objects.by_player_token(player.simulated.token)
+        player_stats = self.stats_loader.stats("current_season", player)
         if player_stats:
             return player_stats.losses
 
     @swagger_serializer_method(serializer_or_field=serializers.DictField())
     def get_historical_stats(self, player):
         result = {}
-        player_stats = simulator.models.HistoricalPlayerStats.objects.filter(
-            player_token=player.simulated.token
-        )
-        for item in player_stats:
+        for item in self.stats_loader.historical_stats(player):
             result[item.season] = simulator.serializers.PlayerStats(item).data
         return result
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_career_average(self, player):
-        # return self._get_career_average(player)
-        my_model_view = simulator.model_views.AllTimePlayerStatsViewProxy
-        player_stats = my_model_view.objects.by_player_token(player.simulated.token)
-
-        if player_stats:
-            return simulator.serializers.PlayerStats(player_stats).data
-        return {}
+        return self._player_stats(player, "all_time")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_career_average_one_token(self, player):
-        return self._get_career_average(player, tokens="one")
+        return self._player_stats(player, "all_time_one_token")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_career_average_three_tokens(self, player):
-        return self._get_career_average(player, tokens="three")
+        return self._player_stats(player, "all_time_three_tokens")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_career_average_five_tokens(self, player):
-        return self._get_career_average(player, tokens="five")
-
-    def _get_career_average(self, player, tokens=None):
-        my_model_view = {
-            "one": simulator.model_views.AllTimePlayerStatsViewProxyOneToken,
-            "three": simulator.model_views.AllTimePlayerStatsViewProxyThreeTokens,
-            "five": simulator.model_views.AllTimePlayerStatsViewProxyFiveTokens,
-        }.get(tokens, simulator.model_views.AllTimePlayerStatsViewProxy)
-        player_stats = my_model_view.objects.by_player_token(player.simulated.token)
-
-        if player_stats:
-            return simulator.serializers.PlayerStats(player_stats).data
-        return {}
+        return self._player_stats(player, "all_time_five_tokens")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_current_season_stats(self, player):
-        # return self._get_current_season_stats(player)
-        my_model_view = simulator.model_views.CurrentSeasonPlayerStatsViewProxy
-        player_stats = my_model_view.objects.by_player_token(player.simulated.token)
-        if player_stats:
-            return simulator.serializers.PlayerStats(player_stats).data
-        return {}
+        return self._player_stats(player, "current_season")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_current_season_stats_one_token(self, player):
-        return self._get_current_season_stats(player, "one")
+        return self._player_stats(player, "current_season_one_token")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_current_season_stats_three_tokens(self, player):
-        return self._get_current_season_stats(player, "three")
+        return self._player_stats(player, "current_season_three_tokens")
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.PlayerStats())
     def get_current_season_stats_five_tokens(self, player):
-        return self._get_current_season_stats(player, "five")
-
-    def _get_current_season_stats(self, player, tokens=None):
-        my_model_view = {
-            "one": simulator.model_views.CurrentSeasonPlayerStatsViewProxyOneToken,
-            "three": simulator.model_views.CurrentSeasonPlayerStatsViewProxyThreeTokens,
-            "five": simulator.model_views.CurrentSeasonPlayerStatsViewProxyFiveTokens,
-        }.get(tokens, simulator.model_views.CurrentSeasonPlayerStatsViewProxy)
-        player_stats = my_model_view.objects.by_player_token(player.simulated.token)
-
-        if player_stats:
-            return simulator.serializers.PlayerStats(player_stats).data
-        return {}
+        return self._player_stats(player, "current_season_five_tokens")
 
     def to_representation(self, obj):
         return super().flatten(super().to_representation(obj))
@@ -529,6 +508,16 @@ class PlayerProgression(serializers.ModelSerializer):
         exclude = ["id", "season", "created_at", "updated_at"]
 
 
+def prime_lineup_players(context, *lineups):
+    """Queues the players of lineups for batch loading of their stats"""
+    simulator.loaders.PlayerStatsLoader.for_context(context).prime(
+        getattr(lineup, f"player_{i}")
+        for lineup in lineups
+        if lineup is not None
+        for i in range(1, 6)
+    )
+
+
 class Lineup(serializers.ModelSerializer):
     team = TeamSerializer()
     player_1 = Player()
@@ -549,6 +538,10 @@ class Lineup(serializers.ModelSerializer):
             "player_5",
         ]
 
+    def to_representation(self, lineup):
+        prime_lineup_players(self.context, lineup)
+        return super().to_representation(lineup)
+
 
 class Contest(serializers.ModelSerializer):
     class Meta:
@@ -662,9 +655,31 @@ class Reservation(serializers.ModelSerializer):
 
 class GamePlayByPlay(serializers.Serializer):
     feed = serializers.SerializerMethodField()
+    count = serializers.SerializerMethodField()
 
+    @swagger_serializer_method(
+        serializer_or_field=serializers.ListField(child=serializers.DictField())
+    )
     def get_feed(self, play_by_play):
-        return json.loads(play_by_play.feed)
+        return simulator.play_by_play.read_events(play_by_play)
+
+    @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
+    def get_count(self, play_by_play):
+        return simulator.play_by_play.count_events(play_by_play)
+
+
+class GamePlayByPlayQueryParamSerializer(serializers.Serializer):
+    quarter = serializers.IntegerField(
+        required=False, min_value=1, help_text="Only return the plays of a quarter."
+    )
+    offset = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="The position in the whole feed of the first play to return.",
+    )
+    limit = serializers.IntegerField(
+        required=False, min_value=1, help_text="The maximum number of plays to return."
+    )
 
 
 class GameQuerySerializer(serializers.Serializer):
@@ -846,20 +861,6 @@ class BoxScoreListing(serializers.Serializer):
         return obj.two_pa
 
 
-def game_results_summary(game):
-    if game.simulation and game.simulation.result:
-        results = game.simulation.result
-        return {
-            "lineup_1_team_id": game.lineup_1.team_id,
-            "lineup_1_team_name": game.lineup_1.team.name,
-            "lineup_1_score": results.lineup_1_score,
-            "lineup_2_team_id": game.lineup_2.team_id,
-            "lineup_2_team_name": game.lineup_2.team.name,
-            "lineup_2_score": results.lineup_2_score,
-        }
-    return {}
-
-
 class TournamentTeamModelSerializer(serializers.ModelSerializer):
     class Meta:
         model = game.models.Team
@@ -922,6 +923,10 @@ class TournamentLineupModelSerializer(serializers.ModelSerializer):
             "player_5",
         ]
 
+    def to_representation(self, lineup):
+        prime_lineup_players(self.context, lineup)
+        return super().to_representation(lineup)
+
 
 class TournamentListing(serializers.ModelSerializer):
     entries = serializers.SerializerMethodField()
@@ -1154,14 +1159,18 @@ class TournamentGame(serializers.Serializer):
     lineup_2 = serializers.SerializerMethodField()
     results = serializers.SerializerMethodField()
 
+    def to_representation(self, obj):
+        prime_lineup_players(self.context, obj.lineup_1, obj.lineup_2)
+        return super().to_representation(obj)
+
     def get_id(self, obj):
         return obj.id
 
     def get_lineup_1(self, obj):
-        return TournamentLineupModelSerializer(obj.lineup_1).data
+        return TournamentLineupModelSerializer(obj.lineup_1, context=self.context).data
 
     def get_lineup_2(self, obj):
-        return TournamentLineupModelSerializer(obj.lineup_2).data
+        return TournamentLineupModelSerializer(obj.lineup_2, context=self.context).data
 
     @swagger_serializer_method(serializer_or_field=simulator.serializers.Result())
     def get_results(self, obj):
@@ -1213,7 +1222,21 @@ class TournamentEntrySerializer(serializers.Serializer):
     lineup = TournamentLineupSerializer()
 
 
+class PlayerGameListingList(serializers.ListSerializer):
+    def to_representation(self, data):
+        # The box scores of a page of games are loaded with a single query
+        rows = list(data)
+        box_scores = simulator.models.BoxScore.objects.in_bulk(
+            [row["box_score_id"] for row in rows if row["box_score_id"] is not None]
+        )
+        for row in rows:
+            row["box_score"] = box_scores.get(row["box_score_id"])
+        return super().to_representation(rows)
+
+
 class PlayerGameListing(serializers.Serializer):
+    """Renders the rows of game.listings.player_game_listings"""
+
     id = serializers.IntegerField()
     status = serializers.SerializerMethodField()
     played_at = serializers.SerializerMethodField()
@@ -1224,78 +1247,50 @@ class PlayerGameListing(serializers.Serializer):
     type = serializers.SerializerMethodField()
 
     class Meta:
-        model = game.models.Game
-        fields = [
-            "played_at",
-        ]
+        list_serializer_class = PlayerGameListingList
 
-    def get_type(self, obj):
-        return obj.contest.kind
+    def get_type(self, row):
+        return row["kind"]
 
     @swagger_serializer_method(
         serializer_or_field=serializers.ChoiceField(choices=game.models.Contest.Status)
     )
-    def get_status(self, obj):
-        return obj.contest.status
+    def get_status(self, row):
+        return row["status"]
 
     @swagger_serializer_method(serializer_or_field=serializers.DateTimeField())
-    def get_played_at(self, obj):
-        return obj.contest.played_at
+    def get_played_at(self, row):
+        return row["played_at"]
 
     @swagger_serializer_method(serializer_or_field=GameResultListing())
-    def get_results(self, obj):
-        return game_results_summary(obj)
-
-    def _get_player_lineup_location(self, game, token_id):
-        for lineup_index, lineup in enumerate([game.lineup_1, game.lineup_2]):
-            for player_index, player in enumerate(
-                [
-                    lineup.player_1,
-                    lineup.player_2,
-                    lineup.player_3,
-                    lineup.player_4,
-                    lineup.player_5,
-                ]
-            ):
-                if player.simulated.token == token_id:
-                    return lineup_index + 1, player_index + 1
+    def get_results(self, row):
+        return game.listings.results_summary(row)
 
     @swagger_serializer_method(serializer_or_field=BoxScoreListing())
-    def get_box_score(self, obj):
-        if obj.simulation and obj.simulation.result:
-            lineup_number, player_number = self._get_player_lineup_location(
-                obj, self.context["token_id"]
-            )
-
-            results = obj.simulation.result
-            player_box_score = getattr(
-                results, f"lineup_{lineup_number}_player_{player_number}_box_score"
-            )
-            return BoxScoreListing(instance=player_box_score).data
+    def get_box_score(self, row):
+        if row["box_score"] is not None:
+            return BoxScoreListing(instance=row["box_score"]).data
         return {}
 
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
-    def get_player_lineup_number(self, obj):
-        lineup_number, _ = self._get_player_lineup_location(
-            obj, self.context["token_id"]
-        )
-        return lineup_number
+    def get_player_lineup_number(self, row):
+        return row["player_lineup_number"]
 
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
-    def get_player_slot_number(self, obj):
-        _, player_number = self._get_player_lineup_location(
-            obj, self.context["token_id"]
-        )
-        return player_number
+    def get_player_slot_number(self, row):
+        return row["player_slot_number"]
 
 
-class GameListing(serializers.ModelSerializer):
+class GameListing(serializers.Serializer):
+    """Renders the rows of game.listings.game_listings"""
+
+    id = serializers.IntegerField()
     prize_pool = serializers.DecimalField(max_digits=20, decimal_places=10)
     number_enrolled_lineup = serializers.SerializerMethodField()
-    number_enrolled_reservation = serializers.SerializerMethodField()
+    number_enrolled_reservation = serializers.IntegerField()
     max_enrollable = serializers.SerializerMethodField()
     is_current_user_enrolled_with_lineup = serializers.SerializerMethodField()
-    is_current_user_enrolled_with_reservation = serializers.SerializerMethodField()
+    is_current_user_enrolled_with_reservation = serializers.BooleanField()
     status = serializers.SerializerMethodField()
     results = serializers.SerializerMethodField()
     played_at = serializers.SerializerMethodField()
@@ -1303,7 +1298,6 @@ class GameListing(serializers.ModelSerializer):
     tokens_required = serializers.SerializerMethodField()
 
     class Meta:
-        model = game.models.Game
         fields = [
             "id",
             "number_enrolled_lineup",
@@ -1324,24 +1318,22 @@ class GameListing(serializers.ModelSerializer):
         return self.context["request"].user
 
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
-    def get_tokens_required(self, obj):
-        return obj.contest.tokens_required
+    def get_tokens_required(self, row):
+        return row["tokens_required"]
 
     @swagger_serializer_method(serializer_or_field=GameResultListing())
-    def get_results(self, obj):
-        return game_results_summary(obj)
+    def get_results(self, row):
+        return game.listings.results_summary(row)
 
     @swagger_serializer_method(serializer_or_field=serializers.BooleanField())
-    def get_revealed(self, obj):
+    def get_revealed(self, row):
         # If the participants of the gaming are viewing their game,
         # return the value of that flag.
-        if obj.lineup_1:
-            if obj.lineup_1.team.owner == self.user:
-                return obj.revealed_to_user_1
+        if row["lineup_1_id"] and row["lineup_1_owner_id"] == self.user.id:
+            return row["revealed_to_user_1"]
 
-        if obj.lineup_2:
-            if obj.lineup_2.team.owner == self.user:
-                return obj.revealed_to_user_2
+        if row["lineup_2_id"] and row["lineup_2_owner_id"] == self.user.id:
+            return row["revealed_to_user_2"]
 
         # If the user is not a participant in the game OR an unauthenticated user,
         # always reveal.
@@ -1350,52 +1342,34 @@ class GameListing(serializers.ModelSerializer):
     @swagger_serializer_method(
         serializer_or_field=serializers.ChoiceField(choices=game.models.Contest.Status)
     )
-    def get_status(self, obj):
-        return obj.contest.status
-
-    @swagger_serializer_method(serializer_or_field=serializers.BooleanField())
-    def get_is_current_user_enrolled_with_lineup(self, obj):
-        enrolled_lineups = [
-            lineup for lineup in [obj.lineup_1, obj.lineup_2] if lineup is not None
-        ]
-
-        for lineup in enrolled_lineups:
-            if lineup.team.owner_id == self.user.id:
-                return True
-        return False
+    def get_status(self, row):
+        return row["status"]
 
     @swagger_serializer_method(serializer_or_field=serializers.BooleanField())
-    def get_is_current_user_enrolled_with_reservation(self, game):
-        for reservation in game.reservations.filter(
-            expires_at__gte=timezone.now(), deleted=False, game=game
-        ):
-            if reservation.team.owner_id == self.user.id:
-                return True
-
-        return False
+    def get_is_current_user_enrolled_with_lineup(self, row):
+        return self.user.id is not None and self.user.id in (
+            row["lineup_1_owner_id"],
+            row["lineup_2_owner_id"],
+        )
 
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
-    def get_max_enrollable(self, obj):
+    def get_max_enrollable(self, row):
         # TODO this will change when we have different types of competitions.
         return 2
 
     @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
-    def get_number_enrolled_lineup(self, game):
-        enrolled_lineups = [
-            lineup for lineup in [game.lineup_1, game.lineup_2] if lineup is not None
-        ]
-
-        return len(enrolled_lineups)
-
-    @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
-    def get_number_enrolled_reservation(self, game):
-        return game.reservations.filter(
-            expires_at__gte=timezone.now(), deleted=False, game=game
-        ).count()
+    def get_number_enrolled_lineup(self, row):
+        return len(
+            [
+                lineup_id
+                for lineup_id in (row["lineup_1_id"], row["lineup_2_id"])
+                if lineup_id is not None
+            ]
+        )
 
     @swagger_serializer_method(serializer_or_field=serializers.DateTimeField())
-    def get_played_at(self, obj):
-        return obj.contest.played_at
+    def get_played_at(self, row):
+        return row["played_at"]
 
 
 class GameStatus(serializers.Serializer):
@@ -1432,6 +1406,7 @@ class Game(serializers.ModelSerializer, FlattenMixin):
         return self.context["request"].user
 
     def to_representation(self, obj):
+        prime_lineup_players(self.context, obj.lineup_1, obj.lineup_2)
         return super().flatten(super().to_representation(obj))
 
     @swagger_serializer_method(serializer_or_field=Reservation(many=True))
@@ -1471,7 +1446,9 @@ class Game(serializers.ModelSerializer, FlattenMixin):
     def get_results(self, obj):
         if obj.simulation is None:
             return None
-        return simulator.serializers.Result(obj.simulation.result).data
+        return simulator.serializers.Result(
+            game.listings.load_box_scores(obj.simulation.result)
+        ).data
 
     def _can_reveal_all_fields(self, status):
         return status in [
@@ -1503,7 +1480,7 @@ class Game(serializers.ModelSerializer, FlattenMixin):
         if self._can_reveal_all_fields(
             game_status
         ) or self._requester_owns_current_lineup(lineup):
-            return Lineup(lineup).data
+            return Lineup(lineup, context=self.context).data
 
         return None
 
@@ -1655,6 +1632,13 @@ class TournamentSeriesDetail(serializers.Serializer):
     lineup_2 = serializers.SerializerMethodField()
     games = serializers.SerializerMethodField()
 
+    def to_representation(self, series):
+        prime_lineup_players(
+            self.context,
+            *(entry.lineup for entry in (series.entry_1, series.entry_2) if entry),
+        )
+        return super().to_representation(series)
+
     def get_series_games(self, series):
         request_user = game.utils.get_request_user(self.context["request"])
         return game.utils.get_series_games(request_user, series)
@@ -1682,13 +1666,17 @@ class TournamentSeriesDetail(serializers.Serializer):
     @swagger_serializer_method(serializer_or_field=TournamentLineupModelSerializer())
     def get_lineup_1(self, series):
         if self.get_series_games(series):
-            return TournamentLineupModelSerializer(series.entry_1.lineup).data
+            return TournamentLineupModelSerializer(
+                series.entry_1.lineup, context=self.context
+            ).data
         return None
 
     @swagger_serializer_method(serializer_or_field=TournamentLineupModelSerializer())
     def get_lineup_2(self, series):
         if self.get_series_games(series):
-            return TournamentLineupModelSerializer(series.entry_2.lineup).data
+            return TournamentLineupModelSerializer(
+                series.entry_2.lineup, context=self.context
+            ).data
         return None
 
     @swagger_serializer_method(
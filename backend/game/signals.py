@@ -2,11 +2,17 @@ import logging
 import random
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 import accounts.models
+import game.game_cache
+import game.leaderboard
+import game.leaderboard_cache
 import game.models
+import game.participation
 import game.players
 import simulator.models
 from game.mappers import map_simulator_status_to_game_status
@@ -78,9 +84,29 @@ def _find_available_off_chain_player():
     return random.choice(players) if players else None
 
 
+@receiver(post_save, sender=game.models.Game)
+def handle_game_saved(sender, **kwargs):
+    # Cached responses of a game must not outlive a change of its visibility
+    game_id = kwargs["instance"].id
+    transaction.on_commit(lambda: game.game_cache.invalidate(game_id))
+
+
 @receiver(game_simulation_status_updated)
 def handle_game_simulation_status_updated(sender, **kwargs):
     game_obj = game.models.Game.objects.get(simulation__uuid=kwargs["simulation_uuid"])
     game_obj.contest.status = map_simulator_status_to_game_status(kwargs["status"])
     game_obj.contest.played_at = timezone.now()
     game_obj.contest.save()
+
+    if game_obj.contest.status == game.models.Contest.Status.COMPLETE:
+        # Never let the leaderboard hold up the results of a game
+        try:
+            game.leaderboard.record_games([game_obj.id])
+        except Exception as e:
+            LOGGER.exception("Error while recording game on leaderboard: %s" % e)
+        try:
+            game.participation.record_games([game_obj.id])
+        except Exception as e:
+            LOGGER.exception("Error while recording game participations: %s" % e)
+        # The records of the players of the game changed as well
+        game.leaderboard_cache.invalidate(game.leaderboard_cache.PLAYER)
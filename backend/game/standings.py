@@ -0,0 +1,118 @@
+"""Tournament standings.
+
+An entry places in a tournament by the round it is knocked out in: the winner of
+the final is first, its loser second, the losers of the semifinals share third,
+those of the quarterfinals fifth and so on. When a series finishes, its winner
+and loser are recorded on it and the place of its loser, and of its winner if it
+was the final, on their TournamentEntry.
+
+Placement is then read from the entries of a tournament with one query on their
+(tournament, place) index, see TournamentEntryManager.for_tournament_in_placement_order,
+rather than computed from the results of every game of the tournament. rebuild()
+records the standings of tournaments from their finished series again.
+"""
+import pgbulk
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+import game.models
+import game.utils
+import simulator.models
+
+
+def with_game_counts(series):
+    """Annotates series with the number of their games that were started,
+    finished and won by entry_1"""
+    return series.annotate(
+        games_started=Count("games"),
+        games_finished=Count(
+            "games",
+            filter=Q(
+                games__simulation__status=simulator.models.Simulation.Status.FINISHED
+            ),
+        ),
+        entry_1_wins=Count(
+            "games",
+            filter=Q(
+                games__simulation__result__lineup_1_score__gt=F(
+                    "games__simulation__result__lineup_2_score"
+                )
+            ),
+        ),
+    )
+
+
+def winner_id(series):
+    """The id of the entry that won the most finished games of a series with
+    game counts"""
+    entry_2_wins = series.games_finished - series.entry_1_wins
+
+    if series.entry_1_wins > entry_2_wins:
+        return series.entry_1_id
+    else:
+        return series.entry_2_id
+
+
+def loser_place(tournament_size, stage):
+    """The place of the entries knocked out in the round of a stage"""
+    return tournament_size // 2 ** (stage + 1) + 1
+
+
+@transaction.atomic
+def finish_series(my_series):
+    """Finishes series with game counts and their round and tournament loaded,
+    recording their winners and losers and the places of the entries they knock
+    out"""
+    now = timezone.now()
+    placed_entries = []
+    for series in my_series:
+        series.winner_id = winner_id(series)
+        if series.winner_id == series.entry_1_id:
+            series.loser_id = series.entry_2_id
+        else:
+            series.loser_id = series.entry_1_id
+        series.status = game.models.Series.Status.FINISHED
+        series.updated_at = now
+
+        tournament_size = series.round.tournament.size
+        placed_entries.append(
+            game.models.TournamentEntry(
+                id=series.loser_id,
+                place=loser_place(tournament_size, series.round.stage),
+                updated_at=now,
+            )
+        )
+        if series.round.stage == game.utils.calculate_round_count(tournament_size) - 1:
+            placed_entries.append(
+                game.models.TournamentEntry(
+                    id=series.winner_id, place=1, updated_at=now
+                )
+            )
+
+    pgbulk.update(
+        game.models.Series, my_series, ["winner", "loser", "status", "updated_at"]
+    )
+    pgbulk.update(game.models.TournamentEntry, placed_entries, ["place", "updated_at"])
+
+
+@transaction.atomic
+def rebuild(tournament_ids=None):
+    """Records the standings of the given tournaments, or of every tournament,
+    from their finished series again. Returns the number of series"""
+    my_series = game.models.Series.objects.filter(
+        status=game.models.Series.Status.FINISHED
+    )
+    entries = game.models.TournamentEntry.objects.exclude(place=None)
+    if tournament_ids is not None:
+        my_series = my_series.filter(round__tournament__in=tournament_ids)
+        entries = entries.filter(tournament__in=tournament_ids)
+
+    entries.update(place=None, updated_at=timezone.now())
+    my_series = list(
+        with_game_counts(my_series.select_related("round__tournament")).filter(
+            games_finished__gt=0
+        )
+    )
+    finish_series(my_series)
+    return len(my_series)
@@ -30,6 +30,12 @@ def top_up_open_games_to_limit():
     call_command("top_up_open_games_to_limit")
 
 
+@swoops.celery.app.task()
+def refresh_leaderboard_cache():
+    LOGGER.info("Refreshing stale leaderboard payloads...")
+    call_command("refresh_leaderboard_cache")
+
+
 @swoops.celery.app.task()
 def update_tournament_series():
     LOGGER.info("Update Tournament Series...")
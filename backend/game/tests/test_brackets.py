@@ -0,0 +1,86 @@
+import pytest
+
+import game.brackets
+import game.models
+from conftest import build_tournament, build_user_and_team
+
+
+@pytest.mark.parametrize(
+    "size, orders",
+    [
+        (2, [1]),
+        (4, [1, 2]),
+        (8, [1, 3, 4, 2]),
+        (16, [1, 5, 7, 3, 4, 8, 6, 2]),
+    ],
+)
+def test_series_orders(size, orders):
+    assert game.brackets.series_orders(size) == orders
+
+
+@pytest.mark.parametrize("size", [32, 1024])
+def test_seed_order_meets_the_best_entries_last(size):
+    seeds = game.brackets.seed_order(size)
+    assert sorted(seeds) == list(range(1, size + 1))
+
+    # Every block of a bracket has the best seeds of its round, e.g. 1, 2, 3 and
+    # 4 are in different quarters
+    block = size
+    while block > 1:
+        blocks = [
+            seeds[start : start + block]  # noqa: E203
+            for start in range(0, size, block)
+        ]
+        assert sorted(min(my_block) for my_block in blocks) == list(
+            range(1, len(blocks) + 1)
+        )
+        block //= 2
+
+
+def test_seed_order_of_other_sizes():
+    with pytest.raises(ValueError, match="Bracket size 12 is not a power of two."):
+        game.brackets.seed_order(12)
+
+
+@pytest.mark.django_db
+def test_build_and_matchup_in_bulk(django_assert_num_queries):
+    _, tournament = build_tournament("Swoops Bowl", size=16)
+    _, team = build_user_and_team()
+    game.models.TournamentEntry.objects.bulk_create(
+        [
+            game.models.TournamentEntry(tournament=tournament, team=team, rank=rank)
+            for rank in range(16, 0, -1)
+        ]
+    )
+
+    with django_assert_num_queries(2):
+        rounds = game.brackets.build_tournament_structure(tournament)
+
+    assert [my_round.stage for my_round in rounds] == [0, 1, 2, 3]
+    assert [my_round.status for my_round in rounds] == [
+        game.models.Round.Status.STARTED,
+        *[game.models.Round.Status.NOT_STARTED] * 3,
+    ]
+    assert [
+        game.models.Series.objects.filter(round=my_round).count() for my_round in rounds
+    ] == [8, 4, 2, 1]
+
+    with django_assert_num_queries(4):
+        game.brackets.matchup_tournament_entries(tournament)
+
+    ranks = [
+        (series.entry_1.rank, series.entry_2.rank)
+        for series in game.models.Series.objects.filter(round=rounds[0])
+        .select_related("entry_1", "entry_2")
+        .order_by("order")
+    ]
+    assert ranks == [
+        (1, 16),
+        (8, 9),
+        (4, 13),
+        (5, 12),
+        (2, 15),
+        (7, 10),
+        (3, 14),
+        (6, 11),
+    ]
@@ -1,9 +1,12 @@
 # Verifies that management commands can run
+import io
+
 import ddf
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
 
+import game.models
 from conftest import (
     build_player,
     build_player_with_ownership,
@@ -17,7 +20,13 @@ from conftest import (
 def test_sync_game_players(mocker):
     patched_sync = mocker.patch("game.players.sync", autospec=True)
     call_command("sync_game_players")
-    patched_sync.assert_called_once_with()
+    patched_sync.assert_called_once_with(full=False)
+
+
+def test_sync_game_players_full(mocker):
+    patched_sync = mocker.patch("game.players.sync", autospec=True)
+    call_command("sync_game_players", "--full")
+    patched_sync.assert_called_once_with(full=True)
 
 
 @pytest.mark.django_db
@@ -89,3 +98,33 @@ def test_tournament_entry_player_ownership(client_user, mocker):
     )
 
     mock_notify_not_owned_player.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_benchmark_game_listings():
+    out = io.StringIO()
+    call_command("benchmark_game_listings", "--games=2", "--runs=1", stdout=out)
+
+    assert "PLAYER GAMES FROM VALUES ::" in out.getvalue()
+    assert "GAMES FROM INSTANCES ::" in out.getvalue()
+    assert not game.models.Game.objects.exists()
+
+
+@pytest.mark.django_db
+def test_benchmark_tournament_brackets():
+    out = io.StringIO()
+    call_command("benchmark_tournament_brackets", "--sizes", "4", "8", stdout=out)
+
+    assert "PER ROW :: 8 ENTRIES IN" in out.getvalue()
+    assert "BULK :: 8 ENTRIES IN" in out.getvalue()
+    assert not game.models.Tournament.objects.exists()
+
+
+def test_benchmark_matchmaking():
+    out = io.StringIO()
+    call_command(
+        "benchmark_matchmaking", "--teams=50", "--arrival-minutes=5", stdout=out
+    )
+
+    assert "FIRST 12 :: 50 TEAMS, 48 PAIRED" in out.getvalue()
+    assert "DRAIN :: 50 TEAMS, 50 PAIRED" in out.getvalue()
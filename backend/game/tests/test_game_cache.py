@@ -0,0 +1,143 @@
+import pytest
+from django import urls
+from django.core.cache import cache
+
+import game.game_cache
+import game.models
+import game.views
+import simulator.models
+import simulator.play_by_play
+from conftest import (
+    build_game,
+    build_lineup,
+    build_player_with_ownership,
+    build_results,
+    build_team,
+    build_user_and_team,
+    token_id_generator,
+)
+
+
+@pytest.fixture(autouse=True)
+def use_locmem_cache_backend(settings, monkeypatch):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+    cache.clear()
+    # Throttles keep their history in the cache too
+    monkeypatch.setattr(game.views.GameDetail, "throttle_classes", ())
+
+
+def lineup(team):
+    return build_lineup(
+        team,
+        [build_player_with_ownership(next(token_id_generator), team) for _ in range(5)],
+    )
+
+
+def completed_game(team, other_team):
+    game_obj = build_game(lineup1=lineup(team), lineup2=lineup(other_team))
+    build_results(game_obj)
+    return game_obj
+
+
+@pytest.mark.django_db
+def test_game_detail_of_completed_game_is_cached(client, django_assert_num_queries):
+    _, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, other_team)
+    url = urls.reverse("api:game:game-detail", kwargs={"id": game_obj.id})
+
+    resp = client.get(url)
+    assert resp.status_code == 200
+    assert resp["Cache-Control"] == "private, max-age=86400"
+
+    with django_assert_num_queries(0):
+        cached = client.get(url)
+    assert cached.json() == resp.json()
+    assert cached["ETag"] == resp["ETag"]
+
+    not_modified = client.get(url, HTTP_IF_NONE_MATCH=resp["ETag"])
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+@pytest.mark.django_db
+def test_game_detail_is_not_served_from_cache_to_participants(
+    client, authed_client, client_user
+):
+    team = build_team(client_user)
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, other_team)
+    game.models.Game.objects.filter(id=game_obj.id).update(revealed_to_user_1=False)
+    url = urls.reverse("api:game:game-detail", kwargs={"id": game_obj.id})
+
+    client.logout()
+    assert client.get(url).json()["reveal"] is True
+
+    client.force_login(client_user)
+    resp = client.get(url)
+    assert resp.json()["reveal"] is False
+    assert resp["Cache-Control"] == "private, no-cache"
+
+
+@pytest.mark.django_db
+def test_game_detail_of_open_game_is_not_cached(client):
+    _, team = build_user_and_team()
+    game_obj = build_game(lineup1=lineup(team))
+    url = urls.reverse("api:game:game-detail", kwargs={"id": game_obj.id})
+
+    resp = client.get(url)
+
+    assert resp.status_code == 200
+    assert "ETag" not in resp
+    assert game.game_cache.lookup(game_obj.id, game.game_cache.DETAIL)[1] is None
+
+
+@pytest.mark.django_db
+def test_play_by_play_is_cached_until_the_game_is_simulated_again(
+    client, django_assert_num_queries
+):
+    _, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, other_team)
+    events = [{"quarter": quarter} for quarter in (1, 2, 2, 3)]
+    simulator.play_by_play.save(
+        simulator.models.PlayByPlay(simulation=game_obj.simulation), events
+    )
+    url = urls.reverse("api:game:game-play-by-play", kwargs={"id": game_obj.id})
+
+    resp = client.get(url, {"quarter": 2})
+    assert resp.json()["feed"] == events[1:3]
+    assert resp["Cache-Control"] == "public, max-age=86400"
+
+    with django_assert_num_queries(0):
+        assert client.get(url, {"quarter": 2}).json()["feed"] == events[1:3]
+    assert client.get(url).json()["feed"] == events
+
+    simulator.models.PlayByPlay.objects.all().delete()
+    simulator.play_by_play.save(
+        simulator.models.PlayByPlay(simulation=game_obj.simulation), events[:2]
+    )
+    game.game_cache.invalidate(game_obj.id)
+
+    assert client.get(url).json()["feed"] == events[:2]
+
+
+@pytest.mark.django_db
+def test_hidden_game_is_not_served_from_the_cache(
+    client, django_capture_on_commit_callbacks
+):
+    _, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, other_team)
+    url = urls.reverse("api:game:game-detail", kwargs={"id": game_obj.id})
+    assert client.get(url).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        game_obj.visibility = game.models.Game.Visibility.HIDDEN
+        game_obj.save()
+
+    assert client.get(url).status_code == 404
@@ -0,0 +1,275 @@
+import datetime as dt
+import json
+import uuid
+
+import ddf
+import pytest
+
+import game.leaderboard
+import game.models
+import simulator.model_views
+import simulator.models
+
+# A Tuesday of the first week of the season, in the afternoon
+FIRST_WEEK = dt.datetime(2023, 8, 22, 14, tzinfo=game.leaderboard.LOCAL_TIMEZONE)
+TOURNAMENT_META = json.dumps(
+    {"payout_breakdown_usd": [100], "max_games_per_round": [2]}
+)
+
+
+def played_game(
+    team_1,
+    team_2,
+    score_1,
+    score_2,
+    played_at=FIRST_WEEK,
+    kind=game.models.Contest.Kind.HEAD_TO_HEAD,
+    contest=None,
+    visibility=game.models.Game.Visibility.PUBLIC,
+    player_pts=10,
+):
+    """A completed game whose box scores give every player player_pts points"""
+    box_scores = {
+        f"lineup_{side}_player_{slot}_box_score": ddf.G(
+            "simulator.BoxScore", pts=player_pts
+        )
+        for side in (1, 2)
+        for slot in range(1, 6)
+    }
+    result = ddf.G(
+        "simulator.Result",
+        lineup_1_score=score_1,
+        lineup_2_score=score_2,
+        lineup_1_box_score=ddf.G("simulator.BoxScore", pts=score_1, blk=2),
+        lineup_2_box_score=ddf.G("simulator.BoxScore", pts=score_2, blk=2),
+        **box_scores,
+    )
+    simulation = ddf.G(
+        "simulator.Simulation",
+        uuid=uuid.uuid4(),
+        result=result,
+        lineup_1_uuids=[team_1.player_uuids[i] for i in range(5)],
+        lineup_2_uuids=[team_2.player_uuids[i] for i in range(5)],
+    )
+    simulator.models.Simulation.objects.filter(id=simulation.id).update(
+        created_at=played_at
+    )
+    return ddf.G(
+        "game.Game",
+        contest=contest
+        or ddf.G(
+            "game.Contest",
+            kind=kind,
+            status=game.models.Contest.Status.COMPLETE,
+        ),
+        simulation=simulation,
+        visibility=visibility,
+        lineup_1=ddf.G("game.Lineup", team=team_1),
+        lineup_2=ddf.G("game.Lineup", team=team_2),
+    )
+
+
+def team():
+    team = ddf.G("game.Team")
+    team.player_uuids = [uuid.uuid4() for _ in range(5)]
+    return team
+
+
+@pytest.mark.django_db
+def test_season_weeks():
+    weeks = list(game.leaderboard.season_weeks())
+
+    assert len(weeks) == 11
+    assert weeks[0] == (1, dt.date(2023, 8, 21), dt.date(2023, 8, 27))
+    assert weeks[-1] == (11, dt.date(2023, 10, 30), dt.date(2023, 11, 5))
+    assert game.leaderboard.week_of(dt.date(2023, 8, 27)) == 1
+    assert game.leaderboard.week_of(dt.date(2023, 8, 28)) == 2
+
+
+@pytest.mark.django_db
+def test_tournament_sp():
+    def tournament(name, tokens_required):
+        return ddf.G(
+            "game.Tournament",
+            name=name,
+            contest=ddf.G("game.Contest", tokens_required=tokens_required),
+            meta=TOURNAMENT_META,
+        )
+
+    assert game.leaderboard.tournament_sp(tournament("Weekly", 1), 1) == 125
+    assert game.leaderboard.tournament_sp(tournament("Weekly", 3), 3) == 150
+    assert game.leaderboard.tournament_sp(tournament("Weekly", 5), 9) == 80
+    assert game.leaderboard.tournament_sp(tournament("Weekly", 5), 65) == 0
+    assert game.leaderboard.tournament_sp(tournament("SOA Cup", 5), 2) == 800
+    assert game.leaderboard.tournament_sp(tournament("All-Star Game", 5), 1) == 0
+    assert game.leaderboard.tournament_sp(tournament("Free", None), 1) == 0
+
+
+@pytest.mark.django_db
+def test_record_games():
+    team_1 = team()
+    team_2 = team()
+    games = [
+        played_game(team_1, team_2, 100, 90, FIRST_WEEK + dt.timedelta(minutes=i))
+        for i in range(5)
+    ]
+    games.append(
+        played_game(team_1, team_2, 80, 90, FIRST_WEEK + dt.timedelta(minutes=10))
+    )
+
+    game.leaderboard.record_games([g.id for g in games])
+
+    week_1 = game.models.TeamLeaderboardWeek.objects.get(team=team_1, week=1)
+    assert (week_1.wins, week_1.losses, week_1.entries) == (5, 1, 6)
+    assert week_1.challenge == "team_games"
+    assert week_1.challenge_progress == 6
+    assert week_1.daily_sp == game.leaderboard.DAILY_SP
+    assert week_1.weekly_sp == 0
+    assert week_1.challenge_sp == 0
+
+    leaderboard_1 = game.models.TeamLeaderboard.objects.get(team=team_1)
+    assert (leaderboard_1.wins, leaderboard_1.losses) == (5, 1)
+    assert leaderboard_1.streak == "L1"
+    assert (leaderboard_1.l10_wins, leaderboard_1.l10_losses) == (5, 1)
+    assert leaderboard_1.total_sp == game.leaderboard.DAILY_SP
+
+    leaderboard_2 = game.models.TeamLeaderboard.objects.get(team=team_2)
+    assert leaderboard_2.streak == "W1"
+    assert leaderboard_2.total_sp == game.leaderboard.DAILY_SP
+
+    ranked = list(game.models.TeamLeaderboard.objects.ranked())
+    assert [row.team_id for row in ranked] == [team_1.id, team_2.id]
+    assert ranked[0].win_percentage == pytest.approx(500 / 6)
+    assert ranked[0].diff == pytest.approx(40 / 6)
+
+
+@pytest.mark.django_db
+def test_record_games_player_challenge():
+    team_1 = team()
+    team_2 = team()
+    # Week 2 rewards a player scoring 1000 points over the week
+    game_1 = played_game(
+        team_1, team_2, 100, 90, FIRST_WEEK + dt.timedelta(weeks=1), player_pts=600
+    )
+    game_2 = played_game(
+        team_1, team_2, 100, 90, FIRST_WEEK + dt.timedelta(weeks=1), player_pts=500
+    )
+
+    game.leaderboard.record_games([game_1.id])
+    week_2 = game.models.TeamLeaderboardWeek.objects.get(team=team_1, week=2)
+    assert week_2.challenge == "player_points"
+    assert week_2.challenge_progress == 600
+    assert week_2.challenge_sp == 0
+
+    game.leaderboard.record_games([game_2.id])
+    week_2 = game.models.TeamLeaderboardWeek.objects.get(team=team_1, week=2)
+    assert week_2.challenge_progress == 1100
+    assert week_2.challenge_sp == game.leaderboard.CHALLENGE_SP
+
+
+@pytest.mark.django_db
+def test_record_games_removes_hidden_games():
+    team_1 = team()
+    team_2 = team()
+    game_1 = played_game(team_1, team_2, 100, 90)
+    game_2 = played_game(team_1, team_2, 100, 90)
+    game.leaderboard.record_games([game_1.id, game_2.id])
+
+    game.models.Game.objects.filter(id=game_2.id).update(
+        visibility=game.models.Game.Visibility.STAFF
+    )
+    game.leaderboard.record_games([game_2.id])
+
+    leaderboard = game.models.TeamLeaderboard.objects.get(team=team_1)
+    assert (leaderboard.wins, leaderboard.played) == (1, 1)
+    assert not game.models.TeamLeaderboardGame.objects.filter(game=game_2).exists()
+
+
+@pytest.mark.django_db
+def test_record_games_ignores_games_outside_the_season():
+    team_1 = team()
+    team_2 = team()
+    game_1 = played_game(team_1, team_2, 100, 90, FIRST_WEEK - dt.timedelta(weeks=1))
+
+    game.leaderboard.record_games([game_1.id])
+
+    assert not game.models.TeamLeaderboard.objects.exists()
+
+
+@pytest.mark.django_db
+def test_record_games_tournament_sp():
+    teams = [team() for _ in range(3)]
+    contest = ddf.G(
+        "game.Contest",
+        kind=game.models.Contest.Kind.TOURNAMENT,
+        status=game.models.Contest.Status.COMPLETE,
+        tokens_required=1,
+    )
+    ddf.G("game.Tournament", name="Weekly", contest=contest, meta=TOURNAMENT_META)
+    games = [
+        played_game(teams[0], teams[1], 100, 90, contest=contest),
+        played_game(teams[0], teams[2], 100, 90, contest=contest),
+        played_game(teams[1], teams[2], 100, 90, contest=contest),
+    ]
+
+    game.leaderboard.record_games([g.id for g in games])
+
+    assert list(
+        game.models.TeamLeaderboardTournament.objects.order_by("rank").values_list(
+            "team_id", "rank", "sp"
+        )
+    ) == [(teams[0].id, 1, 125), (teams[1].id, 2, 100), (teams[2].id, 3, 75)]
+    assert game.models.TeamLeaderboard.objects.get(team=teams[0]).tournament_sp == 125
+
+
+@pytest.mark.django_db
+def test_rebuild_matches_recorded_games():
+    team_1 = team()
+    team_2 = team()
+    games = [
+        played_game(
+            team_1,
+            team_2,
+            100 - i,
+            90 + i,
+            FIRST_WEEK + dt.timedelta(days=i),
+            kind=game.models.Contest.Kind.HEAD_TO_HEAD_MATCH_MAKE,
+        )
+        for i in range(20)
+    ]
+    for g in games:
+        game.leaderboard.record_games([g.id])
+
+    def snapshot():
+        return list(
+            game.models.TeamLeaderboard.objects.order_by("team_id").values(
+                "team_id",
+                "wins",
+                "losses",
+                "streak",
+                "l10_wins",
+                "total_sp",
+            )
+        ), list(
+            game.models.TeamLeaderboardWeek.objects.order_by("team_id", "week").values(
+                "team_id", "week", "wins", "mm_entries", "challenge_progress"
+            )
+        )
+
+    recorded = snapshot()
+    game.leaderboard.rebuild()
+
+    assert snapshot() == recorded
+    assert recorded[0][0]["streak"] == "L15"
+
+
+@pytest.mark.django_db
+def test_current_season_team_sp_view():
+    team_1 = team()
+    team_2 = team()
+    game.leaderboard.record_games([played_game(team_1, team_2, 100, 90).id])
+
+    sp = simulator.model_views.CurrentSeasonTeamSPView.objects.get(team_id=team_1.id)
+
+    assert (sp.wins, sp.losses) == (1, 0)
+    assert sp.rotating_team_blocks == 0
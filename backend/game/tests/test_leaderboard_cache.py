@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import ddf
+import pytest
+from django import urls
+from django.core.cache import cache
+from django.core.management import call_command
+
+import game.leaderboard_cache
+import simulator.utils
+
+
+@pytest.fixture(autouse=True)
+def use_locmem_cache_backend(settings):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+    cache.clear()
+
+
+def player(wins):
+    return ddf.G(
+        "game.Player",
+        wins=wins,
+        losses=0,
+        simulated=ddf.F(token=1, g=wins, position_1="G"),
+    )
+
+
+@pytest.mark.django_db
+def test_get_serves_cached_payload_until_refreshed(authed_client):
+    leaderboard_player = player(wins=1)
+    url = urls.reverse("api:game:player-leaderboard")
+
+    # Built on the first request when nothing is cached
+    assert authed_client.get(url).json()[0]["wins"] == 1
+
+    leaderboard_player.wins = 2
+    leaderboard_player.save()
+    game.leaderboard_cache.invalidate(game.leaderboard_cache.PLAYER)
+
+    # Stale until the payload is rebuilt
+    assert authed_client.get(url).json()[0]["wins"] == 1
+    assert game.leaderboard_cache.refresh() == [
+        game.leaderboard_cache.TEAM,
+        game.leaderboard_cache.PLAYER,
+    ]
+    assert authed_client.get(url).json()[0]["wins"] == 2
+
+    # Nothing changed since
+    assert game.leaderboard_cache.refresh() == []
+
+
+@pytest.mark.django_db
+def test_filtered_player_leaderboard_is_not_cached(authed_client):
+    leaderboard_player = player(wins=1)
+    url = urls.reverse("api:game:player-leaderboard")
+    authed_client.get(url)
+
+    leaderboard_player.wins = 2
+    leaderboard_player.save()
+
+    resp = authed_client.get(url, {"positions": "G"})
+    assert resp.json()[0]["wins"] == 2
+
+
+@pytest.mark.django_db
+def test_invalidate_without_cached_version():
+    assert game.leaderboard_cache.version(game.leaderboard_cache.TEAM) == 0
+
+    game.leaderboard_cache.invalidate()
+    game.leaderboard_cache.invalidate(game.leaderboard_cache.TEAM)
+
+    assert game.leaderboard_cache.version(game.leaderboard_cache.TEAM) == 2
+    assert game.leaderboard_cache.version(game.leaderboard_cache.PLAYER) == 1
+
+
+@pytest.mark.django_db
+def test_refresh_leaderboard_cache_command():
+    call_command("refresh_leaderboard_cache")
+
+    assert game.leaderboard_cache.refresh() == []
+
+    call_command("refresh_leaderboard_cache", "--force")
+
+
+@pytest.mark.django_db
+def test_player_stats_updates_invalidate_player_leaderboard(
+    django_capture_on_commit_callbacks,
+):
+    leaderboard_player = player(wins=1)
+    simulator_client = MagicMock()
+    simulator_client.retrieve_player_stats.return_value = {
+        "results": [{"player_uuid": str(leaderboard_player.simulated.uuid), "g": 2}]
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        simulator.utils.update_simulator_player_stats(
+            simulator_client, [str(leaderboard_player.simulated.uuid)]
+        )
+
+    assert game.leaderboard_cache.version(game.leaderboard_cache.PLAYER) == 1
+    assert game.leaderboard_cache.version(game.leaderboard_cache.TEAM) == 0
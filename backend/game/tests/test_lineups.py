@@ -0,0 +1,106 @@
+import pytest
+from rest_framework.exceptions import ValidationError
+
+import game.lineups
+import game.models
+from conftest import (
+    build_game,
+    build_game_reservation,
+    build_lineup,
+    build_player,
+    build_user_and_team,
+)
+
+
+def payload(players):
+    return {f"player_{slot}": player.id for slot, player in enumerate(players, 1)}
+
+
+@pytest.mark.django_db
+def test_load_team_counts_open_games_in_one_query(settings, django_assert_num_queries):
+    settings.OPEN_GAME_ENTRY_CAP = 3
+    user, team = build_user_and_team()
+    lineup = build_lineup(team)
+    game_obj = build_game()
+    reservation = build_game_reservation(game_obj, team)
+    build_game(lineup1=lineup)
+    build_game(lineup2=lineup)
+    # Not open
+    build_game(status=game.models.Contest.Status.COMPLETE, lineup1=lineup)
+    game.models.HeadToHeadMatchMakeQueue.objects.create(
+        lineup=lineup, team=team, score=0.5, max_tokens_allowed=5
+    )
+
+    with django_assert_num_queries(1):
+        loaded = game.lineups.load_team(user.id, game_obj=game_obj)
+        assert loaded.owner == user
+
+    assert loaded.open_game_count == 3
+    assert loaded.reservation_expires_at == reservation.expires_at
+    with pytest.raises(ValidationError, match="open game cap per team of 3"):
+        game.lineups.validate_open_game_cap(loaded)
+
+    settings.OPEN_GAME_ENTRY_CAP = 4
+    game.lineups.validate_open_game_cap(loaded)
+    assert game.lineups.load_team(user.id).open_game_count == 3
+
+
+@pytest.mark.django_db
+def test_load_team_without_team():
+    user, team = build_user_and_team()
+    team.delete()
+
+    with pytest.raises(ValidationError, match="Team not found."):
+        game.lineups.load_team(user.id)
+
+
+@pytest.mark.django_db
+def test_load_players_in_one_query(django_assert_num_queries):
+    _, team = build_user_and_team()
+    players = [build_player(-token) for token in range(1, 6)]
+    players[0].team = team
+    players[0].save()
+    players.reverse()
+
+    with django_assert_num_queries(1):
+        loaded = game.lineups.load_players(payload(players))
+        assert [player.simulated.token for player in loaded] == [-5, -4, -3, -2, -1]
+
+    assert game.lineups.count_owned_players(team, loaded) == 1
+    assert game.lineups.is_pass_token_gate_requirement(1, team, loaded)
+    assert game.lineups.is_pass_token_gate_requirement(None, team, loaded)
+    assert not game.lineups.is_pass_token_gate_requirement(
+        1, team, loaded + loaded[-1:]
+    )
+
+    players[0].delete()
+    with pytest.raises(ValidationError, match=f"Player {players[0].id} not found."):
+        game.lineups.load_players(payload(players))
+
+
+@pytest.mark.django_db
+def test_validate_game_entry(django_assert_num_queries):
+    _, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    lineup = build_lineup(team)
+    game_obj = build_game(lineup1=lineup)
+    game_obj = game.models.Game.objects.select_related(
+        "lineup_1__team",
+        *[f"lineup_1__player_{slot}__simulated" for slot in range(1, 6)],
+    ).get(id=game_obj.id)
+
+    with django_assert_num_queries(0):
+        game.lineups.validate_game_entry(game_obj, other_team, [0])
+
+        with pytest.raises(ValidationError, match="cannot submit lineup to itself"):
+            game.lineups.validate_game_entry(game_obj, team, [0])
+
+        with pytest.raises(
+            ValidationError,
+            match=f"Player {lineup.player_3.simulated.token} cannot be submitted",
+        ):
+            game.lineups.validate_game_entry(game_obj, other_team, [lineup.player_3.id])
+
+    game_obj.lineup_2 = build_lineup(other_team)
+    with pytest.raises(ValidationError, match="Game lineup is completely filled."):
+        game.lineups.validate_game_entry(game_obj, other_team, [0])
@@ -0,0 +1,107 @@
+import pytest
+from django import urls
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import game.listings
+import game.models
+import simulator.serializers
+from conftest import (
+    build_game,
+    build_lineup,
+    build_player_with_ownership,
+    build_results,
+    build_team,
+    build_user_and_team,
+    token_id_generator,
+)
+
+
+def players(team):
+    return [
+        build_player_with_ownership(next(token_id_generator), team) for _ in range(5)
+    ]
+
+
+def completed_game(team, team_players, other_team, other_players):
+    game_obj = build_game(
+        lineup1=build_lineup(team, team_players),
+        lineup2=build_lineup(other_team, other_players),
+    )
+    build_results(game_obj)
+    return game_obj
+
+
+@pytest.mark.django_db
+def test_player_game_listing_queries_do_not_grow_with_games(authed_client):
+    _, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    team_players, other_players = players(team), players(other_team)
+    token = other_players[3].simulated.token
+    url = urls.reverse("api:game:player-games", kwargs={"token_id": token})
+
+    completed_game(team, team_players, other_team, other_players)
+    with CaptureQueriesContext(connection) as one_game:
+        resp = authed_client.get(url)
+    box_score = resp.json()[0]["box_score"]
+    assert box_score["points"] is not None
+
+    for _ in range(3):
+        completed_game(team, team_players, other_team, other_players)
+    with CaptureQueriesContext(connection) as four_games:
+        resp = authed_client.get(url)
+
+    assert len(resp.json()) == 4
+    assert len(four_games) == len(one_game)
+
+
+@pytest.mark.django_db
+def test_game_listing_for_anonymous_user(client):
+    user, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, players(team), other_team, players(other_team))
+    game.models.Game.objects.filter(id=game_obj.id).update(revealed_to_user_1=False)
+
+    resp = client.get(
+        urls.reverse("api:game:game"),
+        {"status": game.models.Contest.Status.COMPLETE},
+    )
+
+    (listing,) = resp.json()["results"]
+    assert listing["revealed"] is True
+    assert listing["is_current_user_enrolled_with_lineup"] is False
+    assert listing["is_current_user_enrolled_with_reservation"] is False
+    assert listing["results"]["lineup_1_team_name"] == team.name
+
+
+@pytest.mark.django_db
+def test_game_listing_revealed_to_participant(authed_client, client_user):
+    team = build_team(client_user)
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, players(team), other_team, players(other_team))
+    game.models.Game.objects.filter(id=game_obj.id).update(revealed_to_user_1=False)
+
+    resp = authed_client.get(
+        urls.reverse("api:game:game"),
+        {"status": game.models.Contest.Status.COMPLETE},
+    )
+
+    assert resp.json()["results"][0]["revealed"] is False
+
+
+@pytest.mark.django_db
+def test_load_box_scores(django_assert_num_queries):
+    _, team = build_user_and_team()
+    _, other_team = build_user_and_team()
+    game_obj = completed_game(team, players(team), other_team, players(other_team))
+    result = game.models.Game.objects.select_related("simulation__result").get(
+        id=game_obj.id
+    )
+
+    with django_assert_num_queries(1):
+        data = simulator.serializers.Result(
+            game.listings.load_box_scores(result.simulation.result)
+        ).data
+
+    assert data["lineup_2_player_4_box_score"]["pts"] is not None
+    assert game.listings.load_box_scores(None) is None
@@ -0,0 +1,111 @@
+import types
+import uuid
+
+import pytest
+from django.utils import timezone
+
+import game.matchmaking
+import game.models
+import game.processing
+import simulator.models
+from conftest import build_lineup, build_user_and_team
+from simulator.client import Client
+
+
+def entry(entry_id, score, waited, now, team_id=None):
+    return types.SimpleNamespace(
+        id=entry_id,
+        team_id=team_id or entry_id,
+        score=score,
+        created_at=now - timezone.timedelta(seconds=waited),
+    )
+
+
+def test_pair():
+    now = timezone.now()
+    longest_waiting = entry(1, 0.5, 120, now)
+    closest = entry(2, 0.56, 0, now)
+    further = entry(3, 0.42, 0, now)
+    same_team = entry(4, 0.5, 60, now, team_id=1)
+    alone = entry(5, 0.9, 0, now)
+
+    pairs = game.matchmaking.pair(
+        [alone, same_team, further, closest, longest_waiting],
+        now,
+        min_window=0.05,
+        growth=0.001,
+    )
+
+    # The window of the longest waiting team has widened to 0.17, the others
+    # are only 0.05 wide
+    assert pairs == [(longest_waiting, closest)]
+
+    # The second entry of the paired team is paired in a later run
+    later = now + timezone.timedelta(seconds=400)
+    assert game.matchmaking.pair(
+        [alone, same_team, further], later, min_window=0.05, growth=0.001
+    ) == [(same_team, further)]
+    # A team far from every other is paired once a window reaches it
+    later = now + timezone.timedelta(seconds=500)
+    assert game.matchmaking.pair(
+        [alone, further], later, min_window=0.05, growth=0.001
+    ) == [(further, alone)]
+
+
+@pytest.mark.django_db
+def test_process_h2h_match_make_queue(settings, mocker):
+    settings.SIMULATOR_CLIENT = "simulator.client.Client"
+    entries = {}
+    for name, score in (
+        ("close_1", 0.30),
+        ("close_2", 0.32),
+        ("failing_1", 0.60),
+        ("failing_2", 0.61),
+        ("far", 0.95),
+    ):
+        _, team = build_user_and_team()
+        entries[name] = game.models.HeadToHeadMatchMakeQueue.objects.create(
+            lineup=build_lineup(team), team=team, score=score, max_tokens_allowed=5
+        )
+    # A second entry of a paired team waits for the next run
+    entries["close_1_again"] = game.models.HeadToHeadMatchMakeQueue.objects.create(
+        lineup=entries["close_1"].lineup,
+        team=entries["close_1"].team,
+        score=0.30,
+        max_tokens_allowed=5,
+    )
+    failing_players = [
+        getattr(entries["failing_1"].lineup, f"player_{slot_number}").simulated.uuid
+        for slot_number in range(1, 6)
+    ]
+
+    def create_game(*, lineup_1_players, lineup_2_players, is_published):
+        if failing_players in (lineup_1_players, lineup_2_players):
+            raise Exception("Simulator error")
+        return {"uuid": uuid.uuid4()}
+
+    mocker.patch.object(Client, "create_game", side_effect=create_game)
+
+    game.processing.process_h2h_match_make_queue()
+
+    for my_entry in entries.values():
+        my_entry.refresh_from_db()
+    assert entries["close_1"].paired_with == entries["close_2"].team
+    assert entries["close_2"].paired_with == entries["close_1"].team
+    assert entries["close_1"].game == entries["close_2"].game
+    assert entries["close_1"].sent_to_simulator_at is not None
+    my_game = entries["close_1"].game
+    assert {my_game.lineup_1, my_game.lineup_2} == {
+        entries["close_1"].lineup,
+        entries["close_2"].lineup,
+    }
+    assert my_game.contest.kind == game.models.Contest.Kind.HEAD_TO_HEAD_MATCH_MAKE
+    assert my_game.simulation.status == simulator.models.Simulation.Status.PENDING
+    for name in ("failing_1", "failing_2", "far", "close_1_again"):
+        assert entries[name].sent_to_simulator_at is None
+        assert entries[name].game is None
+
+    # The failed game is removed
+    assert game.models.Game.objects.count() == 1
+    assert game.models.Contest.objects.count() == 1
+    assert simulator.models.Simulation.objects.count() == 1
@@ -0,0 +1,151 @@
+import datetime as dt
+
+import pytest
+from django import urls
+from django.utils import timezone
+from rest_framework.pagination import PageNumberPagination
+
+import game.models
+import game.pagination
+import game.participation
+from conftest import (
+    build_game,
+    build_lineup,
+    build_player_with_ownership,
+    build_results,
+    build_team,
+    build_user_and_team,
+    token_id_generator,
+)
+
+
+def played_games(team, other_team, players, count, played_at):
+    other_players = [
+        build_player_with_ownership(next(token_id_generator), other_team)
+        for _ in range(5)
+    ]
+    games = []
+    for _ in range(count):
+        game_obj = build_game(
+            lineup1=build_lineup(team, players),
+            lineup2=build_lineup(other_team, other_players),
+        )
+        build_results(game_obj)
+        game_obj.contest.played_at = played_at
+        game_obj.contest.save()
+        game.participation.record_games([game_obj.id])
+        games.append(game_obj)
+    return games
+
+
+@pytest.fixture
+def page_size(monkeypatch):
+    monkeypatch.setattr(PageNumberPagination, "page_size", 2)
+    monkeypatch.setattr(game.pagination.GameHistoryPagination, "page_size", 2)
+
+
+def pages(client, url, params):
+    """The ids of the games on each keyset page of an endpoint, following next
+    links"""
+    resp = client.get(url, params | {"paginate": "cursor"})
+    pages = []
+    while True:
+        assert resp.status_code == 200
+        assert set(resp.json()) == {"next", "results"}
+        pages.append([row["id"] for row in resp.json()["results"]])
+        if not resp.json()["next"]:
+            return pages
+        resp = client.get(resp.json()["next"])
+
+
+@pytest.mark.django_db
+def test_team_game_history_pages_by_played_at_and_id(
+    authed_client, client_user, page_size
+):
+    team = build_team(client_user)
+    _, other_team = build_user_and_team()
+    players = [
+        build_player_with_ownership(next(token_id_generator), team) for _ in range(5)
+    ]
+    now = timezone.now()
+    # Games sharing a played_at are ordered by id
+    older = played_games(team, other_team, players, 3, now - dt.timedelta(days=1))
+    newer = played_games(team, other_team, players, 2, now)
+    url = urls.reverse("api:game:game")
+    params = {"team": team.id, "status": game.models.Contest.Status.COMPLETE}
+
+    assert pages(authed_client, url, params) == [
+        [newer[1].id, newer[0].id],
+        [older[2].id, older[1].id],
+        [older[0].id],
+    ]
+
+
+@pytest.mark.django_db
+def test_team_game_history_pages_by_page_number(authed_client, client_user, page_size):
+    # The frontend pages a team's games by page number
+    team = build_team(client_user)
+    _, other_team = build_user_and_team()
+    players = [
+        build_player_with_ownership(next(token_id_generator), team) for _ in range(5)
+    ]
+    games = played_games(team, other_team, players, 3, timezone.now())
+    url = urls.reverse("api:game:game")
+    params = {"team": team.id, "status": game.models.Contest.Status.COMPLETE}
+
+    first_page = authed_client.get(url, params).json()
+    second_page = authed_client.get(url, params | {"page": 2}).json()
+
+    assert first_page["count"] == 3
+    assert [r["id"] for r in first_page["results"]] == [games[2].id, games[1].id]
+    assert [r["id"] for r in second_page["results"]] == [games[0].id]
+
+
+@pytest.mark.django_db
+def test_player_game_history_pages(authed_client, client_user, page_size):
+    team = build_team(client_user)
+    _, other_team = build_user_and_team()
+    players = [
+        build_player_with_ownership(next(token_id_generator), team) for _ in range(5)
+    ]
+    games = played_games(team, other_team, players, 3, timezone.now())
+    url = urls.reverse(
+        "api:game:player-games", kwargs={"token_id": players[0].simulated.token}
+    )
+
+    assert pages(authed_client, url, {}) == [[games[2].id, games[1].id], [games[0].id]]
+
+
+@pytest.mark.django_db
+def test_player_game_history_lists(authed_client, client_user, page_size):
+    # The frontend expects a list of all a player's games
+    team = build_team(client_user)
+    _, other_team = build_user_and_team()
+    players = [
+        build_player_with_ownership(next(token_id_generator), team) for _ in range(5)
+    ]
+    games = played_games(team, other_team, players, 3, timezone.now())
+    url = urls.reverse(
+        "api:game:player-games", kwargs={"token_id": players[0].simulated.token}
+    )
+
+    resp = authed_client.get(url)
+
+    assert [r["id"] for r in resp.json()] == [games[2].id, games[1].id, games[0].id]
+
+
+@pytest.mark.django_db
+def test_invalid_cursor(authed_client, client_user):
+    team = build_team(client_user)
+    url = urls.reverse("api:game:game")
+
+    resp = authed_client.get(
+        url,
+        {
+            "team": team.id,
+            "status": game.models.Contest.Status.COMPLETE,
+            "cursor": "nonsense",
+        },
+    )
+
+    assert resp.status_code == 404
@@ -0,0 +1,93 @@
+import pytest
+from django.core.management import call_command
+
+import game.models
+import game.participation
+from conftest import (
+    build_game,
+    build_lineup,
+    build_player_with_ownership,
+    build_results,
+    build_user_and_team,
+    token_id_generator,
+)
+
+
+def lineup():
+    _, team = build_user_and_team()
+    players = [
+        build_player_with_ownership(next(token_id_generator), team) for _ in range(5)
+    ]
+    return build_lineup(team, players), players
+
+
+@pytest.mark.django_db
+def test_record_games():
+    lineup_1, players_1 = lineup()
+    lineup_2, players_2 = lineup()
+    game_obj = build_game(lineup1=lineup_1, lineup2=lineup_2)
+
+    game.participation.record_games([game_obj.id])
+    # Not completed yet
+    assert not game.models.GameParticipation.objects.exists()
+
+    build_results(game_obj)
+
+    participation = game.models.GameParticipation.objects.get(
+        token=players_2[3].simulated.token
+    )
+    assert participation.game == game_obj
+    assert participation.team == lineup_2.team
+    assert (participation.side, participation.slot) == (2, 4)
+    assert participation.won is False
+    assert participation.visibility == game.models.Game.Visibility.PUBLIC
+    assert game.models.GameParticipation.objects.count() == 10
+
+    assert game.models.GameParticipation.objects.record(
+        players_1[0].simulated.token
+    ) == {"wins": 1, "losses": 0}
+
+
+@pytest.mark.django_db
+def test_record_games_follows_visibility():
+    lineup_1, players_1 = lineup()
+    lineup_2, _ = lineup()
+    game_obj = build_game(lineup1=lineup_1, lineup2=lineup_2)
+    build_results(game_obj)
+    token = players_1[0].simulated.token
+
+    game.models.Game.objects.filter(id=game_obj.id).update(
+        visibility=game.models.Game.Visibility.STAFF
+    )
+    game.participation.record_games([game_obj.id])
+
+    assert not game.models.Game.objects.games_by_player(token).exists()
+    assert game.models.GameParticipation.objects.record(token) == {
+        "wins": 0,
+        "losses": 0,
+    }
+
+
+@pytest.mark.django_db
+def test_games_by_player():
+    lineup_1, players_1 = lineup()
+    lineup_2, _ = lineup()
+    game_obj = build_game(lineup1=lineup_1, lineup2=lineup_2)
+    build_results(game_obj)
+
+    games = list(game.models.Game.objects.games_by_player(players_1[2].simulated.token))
+
+    assert games == [game_obj]
+    assert (games[0].player_lineup_number, games[0].player_slot_number) == (1, 3)
+
+
+@pytest.mark.django_db
+def test_rebuild_game_participations():
+    lineup_1, _ = lineup()
+    lineup_2, _ = lineup()
+    build_results(build_game(lineup1=lineup_1, lineup2=lineup_2))
+    game.models.GameParticipation.objects.all().delete()
+
+    call_command("rebuild_game_participations")
+
+    assert game.models.GameParticipation.objects.count() == 10
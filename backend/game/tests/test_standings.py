@@ -0,0 +1,64 @@
+import pytest
+
+import game.models
+import game.standings
+import game.tasks
+from conftest import build_full_tournament_bracket
+
+
+def placement(tournament):
+    entries = game.models.TournamentEntry.objects.for_tournament_in_placement_order(
+        tournament.id
+    )
+    return [(entry.place, entry.seed) for entry in entries]
+
+
+@pytest.mark.django_db
+def test_standings_of_a_finished_bracket(django_assert_num_queries):
+    # The second entry of every series wins it
+    tournament = build_full_tournament_bracket(
+        "Swoops Bowl", tournament_size=8, max_rounds_completed=3
+    )
+
+    with django_assert_num_queries(1):
+        assert placement(tournament) == [
+            (1, 8),
+            (2, 4),
+            (3, 2),
+            (3, 6),
+            (5, 1),
+            (5, 3),
+            (5, 5),
+            (5, 7),
+        ]
+
+    final = game.models.Series.objects.get(round__tournament=tournament, round__stage=2)
+    assert (final.winner.seed, final.loser.seed) == (8, 4)
+
+
+@pytest.mark.django_db
+def test_standings_are_recorded_as_series_finish(client_user):
+    tournament = build_full_tournament_bracket(
+        "Swoops Bowl",
+        tournament_size=4,
+        max_rounds_completed=2,
+        games_in_series=3,
+        meta={"payout_breakdown_usd": [100], "max_games_per_round": [3, 3]},
+    )
+    game.models.TournamentEntry.objects.update(place=None)
+    game.models.Series.objects.update(
+        status=game.models.Series.Status.STARTED, winner=None, loser=None
+    )
+    final = game.models.Series.objects.get(round__tournament=tournament, round__stage=1)
+    # The final has yet to be played
+    final.games.clear()
+
+    game.tasks.update_tournament_series()
+
+    assert placement(tournament) == [(3, 1), (3, 3)]
+    assert game.models.Series.objects.get(id=final.id).status == (
+        game.models.Series.Status.STARTED
+    )
+
+    assert game.standings.rebuild([tournament.id]) == 2
+    assert placement(tournament) == [(3, 1), (3, 3)]
@@ -1,12 +1,17 @@
+import json
+import uuid
 from datetime import timedelta
 from decimal import Decimal
 
 import ddf
 import pytest
+from django.db.models import Count
 from django.utils import timezone
 
+import game.brackets
 import game.models
 import game.tasks
+import game.utils
 import simulator.models
 from conftest import (
     build_full_tournament_bracket,
@@ -15,6 +20,7 @@ from conftest import (
     build_tournament,
     build_user_and_team,
 )
+from simulator.client import Client
 
 
 @pytest.mark.django_db
@@ -59,7 +65,7 @@ def test_update_tournament_two_of_three_series(client_user):
             "payout": 100,
             "meta": tournament_meta,
             "kind": game.models.Tournament.Kind.END_OF_SEASON,
-        }
+        },
     )
     my_round = ddf.G("game.Round", tournament=tournament, stage=0)
 
@@ -86,7 +92,7 @@ def test_update_tournament_two_of_three_series(client_user):
             "entry_1": entry_1,
             "entry_2": entry_2,
             "status": game.models.Series.Status.STARTED,
-        }
+        },
     )
 
     # No games have been added yet
@@ -173,7 +179,7 @@ def test_update_tournament_three_of_five_series(client_user):
             "payout": 100,
             "meta": tournament_meta,
             "kind": game.models.Tournament.Kind.END_OF_SEASON,
-        }
+        },
     )
     my_round = ddf.G("game.Round", tournament=tournament, stage=1)
 
@@ -200,7 +206,7 @@ def test_update_tournament_three_of_five_series(client_user):
             "entry_1": entry_1,
             "entry_2": entry_2,
             "status": game.models.Series.Status.STARTED,
-        }
+        },
     )
 
     # No games have been added yet
@@ -424,3 +430,116 @@ def test_finalize_in_season_tournament():
         ).count()
         == 0
     )
+
+
+@pytest.mark.django_db
+def test_update_tournament_series_in_bulk(client_user, django_assert_num_queries):
+    tournament = build_full_tournament_bracket(
+        "Swoops Bowl",
+        tournament_size=8,
+        max_rounds_completed=1,
+        games_in_series=3,
+        meta={"payout_breakdown_usd": [100], "max_games_per_round": [5, 5, 5]},
+    )
+    round_1 = game.models.Round.objects.get(tournament=tournament, stage=0)
+    game.models.Series.objects.filter(round=round_1).update(
+        status=game.models.Series.Status.STARTED
+    )
+
+    # The second entry won every game, so each series is decided after three.
+    # The series are read in one query and finished in a transaction with one
+    # for them and one for the places of their losers, within the mutex
+    with django_assert_num_queries(7):
+        game.tasks.update_tournament_series()
+
+    assert not game.models.Series.objects.filter(
+        status=game.models.Series.Status.STARTED
+    ).exists()
+
+    tournament.meta = json.dumps(
+        {"payout_breakdown_usd": [100], "max_games_per_round": [7, 7, 7]}
+    )
+    tournament.save()
+    game.models.Series.objects.filter(round=round_1).update(
+        status=game.models.Series.Status.STARTED
+    )
+    for entry in game.models.TournamentEntry.objects.filter(tournament=tournament):
+        entry.lineup = build_lineup(entry.team)
+        entry.save()
+
+    game.tasks.update_tournament_series()
+
+    for series in game.models.Series.objects.filter(round=round_1):
+        assert series.status == game.models.Series.Status.STARTED
+        assert series.games.count() == 4
+        assert series.games.filter(simulation__isnull=False).count() == 4
+        assert series.games.latest("id").lineup_1 == series.entry_1.lineup
+
+
+@pytest.mark.django_db
+def test_run_tournament_round_concurrently(settings, mocker):
+    settings.SIMULATOR_CLIENT = "simulator.client.Client"
+    _, tournament = build_tournament("Swoops Bowl", size=8)
+    game.brackets.build_tournament_structure(tournament)
+    for rank in range(1, 9):
+        _, team = build_user_and_team()
+        ddf.G(
+            "game.TournamentEntry",
+            tournament=tournament,
+            team=team,
+            lineup=build_lineup(team),
+            rank=rank,
+        )
+    game.brackets.matchup_tournament_entries(tournament)
+    round_1 = game.models.Round.objects.get(tournament=tournament, stage=0)
+    failing_series = game.models.Series.objects.get(round=round_1, order=2)
+    failing_players = [
+        getattr(failing_series.entry_1.lineup, f"player_{slot_number}").simulated.uuid
+        for slot_number in range(1, 6)
+    ]
+
+    def create_game(*, lineup_1_players, lineup_2_players, is_published):
+        if lineup_1_players == failing_players:
+            raise Exception("Simulator error")
+        return {"uuid": uuid.uuid4()}
+
+    mocker.patch.object(Client, "create_game", side_effect=create_game)
+
+    game.utils.run_tournament_simulations(tournament)
+
+    series_by_order = {
+        series.order: series
+        for series in game.models.Series.objects.filter(round=round_1).annotate(
+            game_count=Count("games")
+        )
+    }
+    assert {
+        order: (series.status, series.game_count)
+        for order, series in series_by_order.items()
+    } == {
+        1: (game.models.Series.Status.STARTED, 1),
+        2: (game.models.Series.Status.ERRORED, 0),
+        3: (game.models.Series.Status.STARTED, 1),
+        4: (game.models.Series.Status.STARTED, 1),
+    }
+    assert (
+        simulator.models.Simulation.objects.filter(
+            status=simulator.models.Simulation.Status.PENDING
+        ).count()
+        == 3
+    )
+    assert game.models.Round.objects.get(id=round_1.id).status == (
+        game.models.Round.Status.SIMULATING_GAMES
+    )
+
+    # The errored series is given a new game on its next update
+    mocker.patch.object(
+        Client, "create_game", side_effect=lambda **kwargs: {"uuid": uuid.uuid4()}
+    )
+    game.tasks.update_tournament_series()
+
+    failing_series.refresh_from_db()
+    assert failing_series.status == game.models.Series.Status.STARTED
+    assert failing_series.games.get().simulation.status == (
+        simulator.models.Simulation.Status.PENDING
+    )
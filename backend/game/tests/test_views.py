@@ -7,6 +7,8 @@ import pytest
 from django import urls
 from django.conf import settings
 from django.core.exceptions import ValidationError as ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 import game.models
@@ -15,6 +17,7 @@ import game.views
 import moderation.models
 import moderation.service
 import simulator.models
+import simulator.play_by_play
 from conftest import (
     NetworkException,
     build_full_tournament_bracket,
@@ -48,6 +51,23 @@ def test_player_list(authed_client):
     assert len(resp.json()["results"]) == 1
 
 
+@pytest.mark.django_db
+def test_player_list_batches_stats(authed_client):
+    build_player(1)
+    with CaptureQueriesContext(connection) as one_player:
+        resp = authed_client.get(urls.reverse("api:game:player-list"))
+    assert len(resp.json()["results"]) == 1
+
+    for token in range(2, 6):
+        build_player(token)
+    with CaptureQueriesContext(connection) as five_players:
+        resp = authed_client.get(urls.reverse("api:game:player-list"))
+    assert len(resp.json()["results"]) == 5
+
+    # Stats are read once per view regardless of the number of players
+    assert len(five_players) == len(one_player)
+
+
 @pytest.mark.django_db
 def test_team_detail(authed_client, client_user):
     """
@@ -140,6 +160,30 @@ def test_game_detail_no_lineup_details_when_caller_not_involed_in_game(authed_cl
     assert resp.json()["lineup_2"] is None
 
 
+@pytest.mark.django_db
+def test_game_play_by_play_windows(authed_client):
+    game_obj = build_game()
+    simulation = ddf.G("simulator.Simulation")
+    game.models.Game.objects.filter(id=game_obj.id).update(simulation=simulation)
+    events = [{"quarter": quarter, "clock": "9:00"} for quarter in (1, 1, 2, 2, 3)]
+    simulator.play_by_play.save(
+        simulator.models.PlayByPlay(simulation=simulation), events
+    )
+    url = urls.reverse("api:game:game-play-by-play", kwargs={"id": game_obj.id})
+
+    resp = authed_client.get(url)
+    assert resp.json() == {"feed": events, "count": 5}
+
+    resp = authed_client.get(url, {"quarter": 2})
+    assert resp.json()["feed"] == events[2:4]
+
+    resp = authed_client.get(url, {"offset": 1, "limit": 2})
+    assert resp.json()["feed"] == events[1:3]
+
+    resp = authed_client.get(url, {"limit": 0})
+    assert resp.status_code == 400
+
+
 @pytest.mark.django_db
 def test_game_detail_all_details_when_game_is_in_the_right_status(
     authed_client, client_user, mocker
@@ -1651,10 +1695,11 @@ def test_game_player_list(authed_client, client_user):
         content_type="application/json",
     )
 
-    # a player on player1's roster only shows up in the 2 games they played in
+    # a player on player1's roster only shows up in the 2 games they played in,
+    # most recent first
     assert len(resp.json()) == 2
-    assert resp.json()[0]["id"] == one_vs_two.id
-    assert resp.json()[1]["id"] == one_vs_three.id
+    assert resp.json()[0]["id"] == one_vs_three.id
+    assert resp.json()[1]["id"] == one_vs_two.id
 
     resp = authed_client.get(
         urls.reverse(
@@ -2808,10 +2853,13 @@ def test_in_season_tournament_entry(authed_client, client_user):
     client_team = build_team(client_user)
 
     # submit lineup to tournament that doesn't meet token gate requirement
-    player_token = 545
     players = [
-        build_player_with_ownership(player_token, client_team, position1=guard),
-        build_player_with_ownership(player_token + 1, client_team, position1=guard),
+        build_player_with_ownership(
+            next(token_id_generator), client_team, position1=guard
+        ),
+        build_player_with_ownership(
+            next(token_id_generator), client_team, position1=guard
+        ),
     ] + build_free_agents([forward, forward, center])
     resp = authed_client.post(
         urls.reverse(
@@ -2889,7 +2937,7 @@ def test_player_progression_stats(authed_client):
 @pytest.mark.django_db
 def test_send_gm_notification_result(authed_client, client_user, mocker):
     mock_send_mail = mocker.patch("comm.email.SendGridAPIClient")
-    mock_send_magic_bell = mocker.patch("comm.notification.requests.post")
+    mock_send_magic_bell = mocker.patch("comm.notification.utils.http.post")
 
     # test email doesn't exit
     resp = authed_client.post(
@@ -2,28 +2,135 @@ import logging
 import math
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
+import game.game_cache
+import game.leaderboard
 import game.models
+import game.participation
+import simulator.aggregates
 import simulator.models
+import simulator.processing
 from utils.db import execute_sql_statement
 
 LOGGER = logging.getLogger(__name__)
 
 
-def create_game_for_tournament(series):
-    my_game = game.models.Game.objects.create(
-        **{
-            "contest": series.round.tournament.contest,
-            "lineup_1": series.entry_1.lineup,
-            "lineup_2": series.entry_2.lineup,
-            "revealed_to_user_1": series.entry_1.team.owner.reveal_games_by_default,
-            "revealed_to_user_2": series.entry_2.team.owner.reveal_games_by_default,
-            "visibility": game.models.Game.Visibility.HIDDEN,
-        }
+def _lineup_uuids(lineup):
+    return [
+        getattr(lineup, f"player_{slot_number}").simulated.uuid
+        for slot_number in range(1, 6)
+    ]
+
+
+def bulk_create_games(my_games):
+    """Saves new games, and the simulations of those with both lineups as in
+    Game.save, with a statement per table. The players of their lineups need
+    their simulated players loaded. Returns the games"""
+    simulated = [
+        my_game for my_game in my_games if my_game.lineup_1 and my_game.lineup_2
+    ]
+    simulations = simulator.models.Simulation.objects.bulk_create(
+        [
+            simulator.models.Simulation(
+                lineup_1_uuids=_lineup_uuids(my_game.lineup_1),
+                lineup_2_uuids=_lineup_uuids(my_game.lineup_2),
+            )
+            for my_game in simulated
+        ]
+    )
+    for my_game, simulation in zip(simulated, simulations):
+        my_game.simulation = simulation
+    return game.models.Game.objects.bulk_create(my_games)
+
+
+def create_games_in_simulator(my_games):
+    """Creates saved games with simulations in the simulator concurrently.
+    Returns the games the simulator failed to create"""
+    simulations = []
+    for my_game in my_games:
+        if my_game.simulation is not None:
+            # Saves the simulator from looking the game up again
+            my_game.simulation.game = my_game
+            simulations.append(my_game.simulation)
+    failed_simulations = simulator.processing.create_games_concurrently(simulations)
+    return [simulation.game for simulation in failed_simulations]
+
+
+def delete_games(my_games):
+    """Deletes games that were never played, and their simulations"""
+    game.models.Series.games.through.objects.filter(game__in=my_games).delete()
+    game.models.GamePlayer.objects.filter(game__in=my_games).delete()
+    game.models.Game.objects.filter(
+        id__in=[my_game.id for my_game in my_games]
+    ).delete()
+    simulator.models.Simulation.objects.filter(
+        id__in=[my_game.simulation_id for my_game in my_games]
+    ).delete()
+
+
+def create_games_for_tournament(series_ids):
+    """Adds a game to each of the given series and starts them, with a
+    statement per table. Returns the games created.
+
+    The games are then created in the simulator concurrently. A game that the
+    simulator fails to create is removed again and its series marked as errored,
+    so that update_tournament_series gives it a new game."""
+    my_series = list(
+        game.models.Series.objects.select_related(
+            "round__tournament__contest",
+            *[
+                f"entry_{entry_number}__{path}"
+                for entry_number in (1, 2)
+                for path in [
+                    "team__owner",
+                    *[
+                        f"lineup__player_{slot_number}__simulated"
+                        for slot_number in range(1, 6)
+                    ],
+                ]
+            ],
+        ).filter(id__in=series_ids)
     )
-    series.games.add(my_game)
+    with transaction.atomic():
+        my_games = bulk_create_games(
+            [
+                game.models.Game(
+                    contest=series.round.tournament.contest,
+                    lineup_1=series.entry_1.lineup,
+                    lineup_2=series.entry_2.lineup,
+                    revealed_to_user_1=(
+                        series.entry_1.team.owner.reveal_games_by_default
+                    ),
+                    revealed_to_user_2=(
+                        series.entry_2.team.owner.reveal_games_by_default
+                    ),
+                    visibility=game.models.Game.Visibility.HIDDEN,
+                )
+                for series in my_series
+            ]
+        )
+        game.models.Series.games.through.objects.bulk_create(
+            [
+                game.models.Series.games.through(series=series, game=my_game)
+                for series, my_game in zip(my_series, my_games)
+            ]
+        )
+        game.models.Series.objects.filter(
+            id__in=[series.id for series in my_series]
+        ).update(status=game.models.Series.Status.STARTED, updated_at=timezone.now())
+
+    failed = create_games_in_simulator(my_games)
+    if failed:
+        with transaction.atomic():
+            game.models.Series.objects.filter(games__in=failed).update(
+                status=game.models.Series.Status.ERRORED, updated_at=timezone.now()
+            )
+            delete_games(failed)
+
+    return [my_game for my_game in my_games if my_game not in failed]
 
 
 def calculate_series_count(tournament_size, stage):
@@ -51,31 +158,6 @@ def get_request_user(request):
         return None
 
 
-def count_number_of_players_owned_by_team_lineup(team, lineup):
-    players_owned_by_team = 0
-
-    for i in range(5):
-        if game.models.Player.objects.filter(
-            id=lineup[f"player_{i + 1}"], team=team
-        ).exists():
-            players_owned_by_team += 1
-
-    return players_owned_by_team
-
-
-# This check passes:
-#  - if max_tokens_allowed is None, meaning that this game has no token gating
-#  - or the number of players in lineup matches <= max_tokens_allowed
-def is_pass_token_gate_requirement(max_tokens_allowed, team, lineup):
-    count_of_players_owned_by_team = count_number_of_players_owned_by_team_lineup(
-        team, lineup
-    )
-
-    return (
-        not max_tokens_allowed or count_of_players_owned_by_team <= max_tokens_allowed
-    )
-
-
 def random_assign_tournament_seeding(tournament):
     seed = 1
     for index, tournament_entry in enumerate(
@@ -102,91 +184,6 @@ def is_tournament_entries_filled(tournament):
     )
 
 
-def _get_series_order(size, bracket_index):
-    # This lookup table is used to properly order an unordered series.
-    # It matches the bracket index to the series order number.
-    # key: tournament size
-    # list index: bracket_index
-    # value: series order number
-    series_order = {
-        4: [1, 2],
-        8: [1, 3, 4, 2],
-        16: [1, 5, 7, 3, 4, 8, 6, 2],
-        32: [1, 9, 13, 5, 8, 16, 12, 4, 3, 11, 15, 7, 6, 14, 10, 2],
-        64: [
-            1,
-            17,
-            25,
-            9,
-            16,
-            32,
-            24,
-            8,
-            6,
-            22,
-            30,
-            14,
-            12,
-            28,
-            20,
-            4,
-            3,
-            19,
-            27,
-            11,
-            13,
-            29,
-            21,
-            5,
-            7,
-            23,
-            31,
-            15,
-            10,
-            26,
-            18,
-            2,
-        ],
-    }
-
-    return series_order[size][bracket_index]
-
-
-def matchup_tournament_entries(tournament):
-    try:
-        current_round = game.models.Round.objects.get(
-            **{"status": game.models.Round.Status.STARTED, "tournament": tournament}
-        )
-    except game.models.Round.DoesNotExist:
-        tournament.contest.status = game.models.Contest.Status.ERROR
-        tournament.contest.save()
-
-        LOGGER.exception(
-            f"Error retrieving current round within tournament {tournament.id}",
-        )
-        return
-
-    tournament_entries = game.models.TournamentEntry.objects.filter(
-        tournament=tournament
-    ).order_by("rank")
-    tournament_entries_count = tournament_entries.count()
-
-    for bracket_index, my_series in enumerate(
-        game.models.Series.objects.filter(round=current_round).order_by("created_at")
-    ):
-        # entry_1 and entry_2 are selected from the first and last entry
-        # within the next iteration the second and second to last entry
-        # and so on .... until the center is met
-        entry_1 = tournament_entries[bracket_index]  # first entry
-        entry_2 = tournament_entries[
-            tournament_entries_count - 1 - bracket_index
-        ]  # last entry
-        my_series.entry_1 = entry_1
-        my_series.entry_2 = entry_2
-        my_series.order = _get_series_order(tournament.size, bracket_index)
-        my_series.save()
-
-
 def run_tournament_simulations(tournament):
     try:
         current_round = game.models.Round.objects.get(
@@ -202,18 +199,16 @@ def run_tournament_simulations(tournament):
         return None
 
     #  run round have series with all the lineups submitted
-    for series in game.models.Series.objects.filter(
-        Q(round=current_round)
-        & ~Q(entry_1__lineup=None)
-        & ~Q(entry_2__lineup=None)
-        & Q(games=None)
-    ):
-        # Add the first game to series so the worker
-        # can continue with rest of the games
-        game.utils.create_game_for_tournament(series)
-
-        series.status = game.models.Series.Status.STARTED
-        series.save()
+    # Add the first game to series so the worker
+    # can continue with rest of the games
+    game.utils.create_games_for_tournament(
+        game.models.Series.objects.filter(
+            Q(round=current_round)
+            & ~Q(entry_1__lineup=None)
+            & ~Q(entry_2__lineup=None)
+            & Q(games=None)
+        ).values_list("id", flat=True)
+    )
 
     current_round.status = game.models.Round.Status.SIMULATING_GAMES
     current_round.save()
@@ -222,7 +217,16 @@ def run_tournament_simulations(tournament):
 
 
 def public_publish_series(series):
-    series.games.update(visibility=game.models.Game.Visibility.PUBLIC)
+    with simulator.aggregates.recount(
+        series.games.values_list("simulation__uuid", flat=True)
+    ):
+        series.games.update(visibility=game.models.Game.Visibility.PUBLIC)
+    game_ids = list(series.games.values_list("id", flat=True))
+    transaction.on_commit(
+        lambda: [game.game_cache.invalidate(game_id) for game_id in game_ids]
+    )
+    game.leaderboard.record_games(series.games.values_list("id", flat=True))
+    game.participation.record_games(series.games.values_list("id", flat=True))
     simulator_client = simulator.client.get()
     my_games = series.games.select_related("simulation")
     simulator_client.publish_games(
@@ -286,28 +290,6 @@ def get_l50_win_percentage_for_team(team):
     return wins / (wins + losses)
 
 
-def build_tournament_structure(tournament):
-    round_count = calculate_round_count(tournament.size)
-
-    for stage in range(round_count):
-        my_round = game.models.Round()
-        my_round.tournament = tournament
-        my_round.stage = stage
-        if my_round.stage == 0:  # set the first round default as started
-            my_round.status = game.models.Round.Status.STARTED
-
-        my_round.save()
-
-        # create all series games for rounds
-        series_count = game.utils.calculate_series_count(
-            tournament.size, my_round.stage
-        )
-        for _ in range(series_count):
-            series = game.models.Series()
-            series.round = my_round
-            series.save()
-
-
 def finalize_tournament(tournament):
     is_all_tournament_series_games_complete = (
         game.models.Series.objects.filter(round__tournament=tournament)
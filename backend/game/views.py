@@ -8,27 +8,33 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import BadRequest, PermissionDenied
 from django.db.models import F, Q
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
-from django.utils.decorators import method_decorator
 from django.utils.log import DEFAULT_LOGGING
-from django.views.decorators.cache import cache_page
 from django_pglocks import advisory_lock
 from drf_yasg.utils import no_body, swagger_auto_schema
 from rest_framework import generics, permissions, response, serializers, status
 from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 import accounts.permissions
 import comm.handlers
 import game.filters
+import game.game_cache
+import game.leaderboard_cache
+import game.lineups
+import game.listings
 import game.models
+import game.pagination
 import game.permissions
 import game.serializers
 import game.throttling
 import moderation.models
 import moderation.tasks
 import simulator.models
+import simulator.play_by_play
 from moderation.service import ModerationService
 from utils.db import load_data_from_sql
 
@@ -183,7 +189,36 @@ class GameDetail(GameAPIMixin, generics.RetrieveAPIView):
 
             return Response(modified_game_data)
 
-        return super().get(request, *args, **kwargs)
+        key, cached = game.game_cache.lookup(game_id, game.game_cache.DETAIL)
+        if cached is not None and request.user.id not in cached.participant_ids:
+            return game.game_cache.respond(
+                request, cached, max_age=settings.COMPLETED_GAME_CACHE_TIMEOUT
+            )
+
+        game_obj = self.get_object()
+        data = self.get_serializer(game_obj).data
+        if game_obj.contest.status != game.models.Contest.Status.COMPLETE:
+            return Response(data)
+
+        participant_ids = {
+            lineup.team.owner_id
+            for lineup in (game_obj.lineup_1, game_obj.lineup_2)
+            if lineup is not None
+        }
+        cached = game.game_cache.response_of(
+            JSONRenderer().render(data), participant_ids
+        )
+        # Participants are told whether they revealed the game
+        if (
+            request.user.id in participant_ids
+            or game_obj.visibility != game.models.Game.Visibility.PUBLIC
+        ):
+            return game.game_cache.respond(request, cached)
+
+        game.game_cache.store(key, cached)
+        return game.game_cache.respond(
+            request, cached, max_age=settings.COMPLETED_GAME_CACHE_TIMEOUT
+        )
 
 
 class PlayerGameList(generics.ListAPIView):
@@ -195,7 +230,13 @@ class PlayerGameList(generics.ListAPIView):
         return super().get_serializer_context() | {"token_id": self.kwargs["token_id"]}
 
     def get_queryset(self):
-        return game.models.Game.objects.games_by_player(self.kwargs["token_id"])
+        # A player's games are listed whole unless keyset pages are asked for
+        if game.pagination.GameHistoryPagination.is_requested(self.request):
+            self.pagination_class = game.pagination.GameHistoryPagination
+
+        return game.listings.player_game_listings(
+            game.models.Game.objects.games_by_player(self.kwargs["token_id"])
+        )
 
     # NOTE: This swagger_auto_schema is incorrect as it doesn't take pagination into
     # account. The response appears to be an array of `PlayerGameListing` objects, but
@@ -258,7 +299,18 @@ class GameList(generics.ListAPIView):
         ):
             return game.models.Game.objects.none()
 
-        return game.models.Game.objects.get_games(**query_params)
+        # A team's completed games are its game history, which can grow without
+        # bound, so it can be paged by keyset rather than by offset
+        if (
+            query_params.get("team")
+            and query_params.get("status") == game.models.Contest.Status.COMPLETE
+            and game.pagination.GameHistoryPagination.is_requested(self.request)
+        ):
+            self.pagination_class = game.pagination.GameHistoryPagination
+
+        return game.listings.game_listings(
+            game.models.Game.objects.get_games(**query_params), self.request.user
+        )
 
     @swagger_auto_schema(query_serializer=game.serializers.GameQuerySerializer)
     def get(self, request, *args, **kwargs):
@@ -303,11 +355,52 @@ class GamePlayByPlay(generics.RetrieveAPIView):
     lookup_url_kwarg = "id"
 
     serializer_class = game.serializers.GamePlayByPlay
-    queryset = simulator.models.PlayByPlay.objects.all()
+    queryset = simulator.models.PlayByPlay.objects.select_related(
+        "simulation__game__contest"
+    )
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    @swagger_auto_schema(
+        query_serializer=game.serializers.GamePlayByPlayQueryParamSerializer,
+        responses={200: game.serializers.GamePlayByPlay},
+    )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        query_serializer = game.serializers.GamePlayByPlayQueryParamSerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+        window = query_serializer.validated_data
+
+        key, cached = game.game_cache.lookup(
+            self.kwargs["id"],
+            game.game_cache.PLAY_BY_PLAY,
+            "&".join(f"{name}={value}" for name, value in sorted(window.items())),
+        )
+        if cached is not None:
+            return game.game_cache.respond(
+                request,
+                cached,
+                max_age=settings.COMPLETED_GAME_CACHE_TIMEOUT,
+                public=True,
+            )
+
+        play_by_play = self.get_object()
+        # The feed is sent as it is stored rather than decoded and rendered again
+        feed = simulator.play_by_play.read_json(play_by_play, **window)
+        count = simulator.play_by_play.count_events(play_by_play)
+        body = b'{"feed":%s,"count":%d}' % (feed, count)
+
+        game_obj = play_by_play.simulation.game
+        if (
+            game_obj.contest.status != game.models.Contest.Status.COMPLETE
+            or game_obj.visibility != game.models.Game.Visibility.PUBLIC
+        ):
+            return HttpResponse(body, content_type="application/json")
+
+        cached = game.game_cache.store(key, game.game_cache.response_of(body))
+        return game.game_cache.respond(
+            request, cached, max_age=settings.COMPLETED_GAME_CACHE_TIMEOUT, public=True
+        )
 
 
 class PlayerAPIMixin:
@@ -605,72 +698,6 @@ class GameReservation(GameAPIMixin, generics.CreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-def _validate_same_player_not_submitted_to_opposing_team(game, player_ids):
-    if not game.lineup_1 and not game.lineup_2:
-        return
-    elif game.lineup_1 and not game.lineup_2:
-        lineup = game.lineup_1
-    elif game.lineup_2 and not game.lineup_1:
-        lineup = game.lineup_2
-
-    for player in [
-        lineup.player_1,
-        lineup.player_2,
-        lineup.player_3,
-        lineup.player_4,
-        lineup.player_5,
-    ]:
-        if player.simulated.token >= 0 and player.id in player_ids:
-            raise ValidationError(
-                f"Player {player.simulated.token} cannot be submitted to opposing team."
-            )
-
-
-def _validate_team_is_not_already_part_of_game(game, team):
-    if (game.lineup_1 and team == game.lineup_1.team) or (
-        game.lineup_2 and team == game.lineup_2.team
-    ):
-        raise ValidationError(f"Team {team.id} cannot submit lineup to itself.")
-
-
-# We want to prevent users/teams from spam joining a bunch of
-# open (0/2) games. We do this by placing a cap on the maximum
-# number of games a user can join at a time.
-#
-# PART I
-# We count the number of games this team is the first entrant in.
-# We know they're the first entrant because the contest
-# status changes to "IN_PROGRESS" and the simulation object
-# is populated (and made non-null) when this happens.
-#
-# PART II
-# Additionally, we want to prevent a user from joining
-# a bunch of matchmake games. So compute this too.
-def _validate_team_has_not_exceeded_open_game_cap(team):
-    # This is how many h2h games this team is the first
-    # entrant in.
-    h2h_non_matchmake_count = game.models.Game.objects.filter(
-        Q(Q(lineup_1__team=team) | Q(lineup_2__team=team)),
-        contest__status=game.models.Contest.Status.OPEN,
-        simulation__isnull=True,
-        visibility=game.models.Game.Visibility.PUBLIC,
-    ).count()
-
-    # This is how many matchmake games this team is in
-    # and still waiting for an opponent
-    h2h_matchmake_count = game.models.HeadToHeadMatchMakeQueue.objects.filter(
-        team=team, sent_to_simulator_at=None
-    ).count()
-
-    if h2h_non_matchmake_count + h2h_matchmake_count >= int(
-        settings.OPEN_GAME_ENTRY_CAP
-    ):
-        raise ValidationError(
-            f"You have exceeded the open game cap per "
-            f"team of {settings.OPEN_GAME_ENTRY_CAP}"
-        )
-
-
 class GameEnrollment(GameAPIMixin, generics.CreateAPIView):
     lookup_field = "id"
     permission_classes = [
@@ -682,39 +709,26 @@ class GameEnrollment(GameAPIMixin, generics.CreateAPIView):
         # get game object
         game_obj = self.get_object()
 
-        try:
-            team = game.models.Team.objects.get(owner=request.user.id)
-        except game.models.Team.DoesNotExist:
-            raise serializers.ValidationError("Team not found.")
+        team = game.lineups.load_team(request.user.id, game_obj=game_obj)
 
-        try:
-            reservation = game.models.Reservation.objects.get(
-                team=team, game=game_obj, deleted=False
-            )
-        except game.models.Reservation.DoesNotExist:
+        if team.reservation_expires_at is None:
             raise ValidationError("Game has not been reserved by user.")
 
-        if reservation.has_expired:
+        if team.reservation_expires_at < timezone.now():
             raise ValidationError("Team Reservation has expired.")
 
-        if game_obj.lineup_1 and game_obj.lineup_2:
-            raise ValidationError("Game lineup is completely filled.")
+        game.lineups.validate_game_entry(game_obj, team, list(request.data.values()))
 
-        _validate_team_is_not_already_part_of_game(game_obj, team)
-
-        _validate_same_player_not_submitted_to_opposing_team(
-            game_obj, list(request.data.values())
-        )
-
-        _validate_team_has_not_exceeded_open_game_cap(team)
+        game.lineups.validate_open_game_cap(team)
 
         serializer = game.serializers.CreateLineup(
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
+        players = game.lineups.load_players(serializer.data)
 
-        if not game.utils.is_pass_token_gate_requirement(
-            game_obj.contest.tokens_required, team, serializer.data
+        if not game.lineups.is_pass_token_gate_requirement(
+            game_obj.contest.tokens_required, team, players
         ):
             raise ValidationError(
                 (
@@ -723,17 +737,16 @@ class GameEnrollment(GameAPIMixin, generics.CreateAPIView):
                 )
             )
 
-        user_lineup = serializer.create(serializer.data)
+        user_lineup = game.lineups.create_lineup(team, players)
 
-        user = get_user_model().objects.get(id=request.user.id)
         with advisory_lock(f"insert-lineup-to-game-{ game_obj.id }"):
             # add lineup to game
             if not game_obj.lineup_1:
                 game_obj.lineup_1 = user_lineup
-                game_obj.revealed_to_user_1 = user.reveal_games_by_default
+                game_obj.revealed_to_user_1 = team.owner.reveal_games_by_default
             elif not game_obj.lineup_2:
                 game_obj.lineup_2 = user_lineup
-                game_obj.revealed_to_user_2 = user.reveal_games_by_default
+                game_obj.revealed_to_user_2 = team.owner.reveal_games_by_default
             else:
                 # Game is actually reserved fully
                 raise ValidationError("Game lineup is completely filled.")
@@ -895,7 +908,9 @@ class TeamLeaderboard(generics.ListAPIView):
         return load_data_from_sql("game/sql/leaderboard_team_query.sql")
 
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        return response.Response(
+            game.leaderboard_cache.get(game.leaderboard_cache.TEAM)
+        )
 
 
 class PlayerLeaderboard(generics.ListAPIView):
@@ -909,10 +924,13 @@ class PlayerLeaderboard(generics.ListAPIView):
     filterset_class = game.filters.PlayerPositionFilter
     pagination_class = None
 
-    # Cache and expire every two minutes
-    @method_decorator(cache_page(60 * 2))
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # Only the unfiltered leaderboard is cached
+        if request.query_params:
+            return super().get(request, *args, **kwargs)
+        return response.Response(
+            game.leaderboard_cache.get(game.leaderboard_cache.PLAYER)
+        )
 
 
 class TournamentAPIMixin:
@@ -1152,41 +1170,21 @@ class TournamentTeamLineup(generics.RetrieveAPIView, generics.CreateAPIView):
                 "Tournament entry must be submitted before lineup cutoff date."
             )
 
-    def _validate_team_has_not_already_entered_lineup_into_tournament(
-        self, tournament, team
-    ):
-        if game.models.TournamentEntry.objects.filter(
-            ~Q(lineup=None),
-            tournament=tournament,
-            team=team,
-        ).exists():
-            raise ValidationError("Tournament entry lineup is completely filled.")
-
     def create(self, request, tournament_id):
-        tournament_obj = get_object_or_404(game.models.Tournament, id=tournament_id)
+        tournament_obj = get_object_or_404(
+            game.models.Tournament.objects.select_related("contest"), id=tournament_id
+        )
 
-        try:
-            team_obj = game.models.Team.objects.get(owner=request.user.id)
-        except game.models.Game.DoesNotExist:
-            raise serializers.ValidationError("Team not found.")
+        team_obj = game.lineups.load_team(request.user.id, tournament=tournament_obj)
 
         self._validate_tournament_submission_date(tournament_obj)
 
-        self._validate_team_has_not_already_entered_lineup_into_tournament(
-            tournament_obj, team_obj
-        )
+        if team_obj.has_tournament_lineup:
+            raise ValidationError("Tournament entry lineup is completely filled.")
 
         # team has played less than or equal tournaments
         if tournament_obj.kind == game.models.Tournament.Kind.PARTNER:
-            completed_games_count = game.models.Game.objects.filter(
-                Q(
-                    Q(
-                        lineup_1__team=team_obj,
-                    )
-                    | Q(lineup_2__team=team_obj)
-                ),
-                simulation__status=simulator.models.Simulation.Status.FINISHED,
-            ).count()
+            completed_games_count = team_obj.finished_game_count
 
             if completed_games_count >= settings.MAX_PARTNER_GAMES_ALLOWED:
                 raise BadRequest(
@@ -1204,9 +1202,10 @@ class TournamentTeamLineup(generics.RetrieveAPIView, generics.CreateAPIView):
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
+        players = game.lineups.load_players(serializer.data)
 
-        if not game.utils.is_pass_token_gate_requirement(
-            tournament_obj.contest.tokens_required, team_obj, serializer.data
+        if not game.lineups.is_pass_token_gate_requirement(
+            tournament_obj.contest.tokens_required, team_obj, players
         ):
             raise ValidationError(
                 (
@@ -1226,12 +1225,11 @@ class TournamentTeamLineup(generics.RetrieveAPIView, generics.CreateAPIView):
                         f"Tournament={tournament_obj.id} reservation doesn't exist."
                     )
 
-                user = get_user_model().objects.get(id=request.user.id)
                 if (
                     not game.models.TournamentEntry.objects.allowed_tournament_entry(  # noqa: E501
                         team_obj.id, tournament_obj.id
                     )
-                    and not user.is_staff
+                    and not team_obj.owner.is_staff
                 ):
                     raise BadRequest(
                         (
@@ -1241,7 +1239,7 @@ class TournamentTeamLineup(generics.RetrieveAPIView, generics.CreateAPIView):
                     )
 
             # create a touranemnt entry object or update existign wtih lineup
-            tournament_entry_lineup = serializer.create(serializer.data)
+            tournament_entry_lineup = game.lineups.create_lineup(team_obj, players)
 
             (
                 tournament_entry,
@@ -1351,16 +1349,13 @@ class HeadToHeadMatchMakeEnrollView(generics.CreateAPIView):
         responses={200: game.serializers.HeadToHeadMatchMakeEnrollSerializer}
     )
     def create(self, request, *args, **kwargs):
-        # Check if team exists
-        try:
-            team = game.models.Team.objects.get(owner=request.user.id)
-        except game.models.Team.DoesNotExist:
-            raise serializers.ValidationError("Team not found.")
+        # Check if team exists, and count the games it is waiting in
+        team = game.lineups.load_team(request.user.id)
 
         # Check that total of below >= the open game entry cap set in settings.py
         # * number of h2h non matchmake games this team is the first entrant in
         # * number of matchmake games where the team is still waiting to be matched
-        _validate_team_has_not_exceeded_open_game_cap(team)
+        game.lineups.validate_open_game_cap(team)
 
         # Check that payload serializes correctly (checks if players exist and if
         # max_tokens_allowed submitted, it is either 1, 3, or 5)
@@ -1368,6 +1363,7 @@ class HeadToHeadMatchMakeEnrollView(generics.CreateAPIView):
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
+        players = game.lineups.load_players(serializer.data["lineup"])
 
         # Hardcoded for now. Might be an input in future
         max_tokens_allowed = 5
@@ -1375,8 +1371,8 @@ class HeadToHeadMatchMakeEnrollView(generics.CreateAPIView):
         # Checks that max_tokens_allowed matches
         # number of swoopsters in lineup (and also checks that the
         # team owns that swoopster)
-        if not game.utils.is_pass_token_gate_requirement(
-            max_tokens_allowed, team, serializer.data["lineup"]
+        if not game.lineups.is_pass_token_gate_requirement(
+            max_tokens_allowed, team, players
         ):
             raise ValidationError(
                 (
@@ -1387,7 +1383,7 @@ class HeadToHeadMatchMakeEnrollView(generics.CreateAPIView):
 
         # This runs a check to see that the team owns any swoopsters
         # submitted and then creates the lineup in the db and returns it
-        lineup = serializer.create(serializer.data)
+        lineup = game.lineups.create_lineup(team, players)
 
         # Get the win percentage of the last 50 games for this user
         score = game.utils.calc_team_score_for_matchmaking(team)
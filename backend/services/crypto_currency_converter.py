@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-import requests
+import utils.http
 
 API_ETHERSCAN_ETH_PRICE_BASE_URL = (
     "https://api.etherscan.io/api?module=stats&action=ethprice"
@@ -8,14 +8,14 @@ API_ETHERSCAN_ETH_PRICE_BASE_URL = (
 
 
 def get_eth_to_usd_conversion_factor():
-    resp = requests.get(API_ETHERSCAN_ETH_PRICE_BASE_URL)
+    resp = utils.http.get(API_ETHERSCAN_ETH_PRICE_BASE_URL)
 
     resp.raise_for_status()
     return Decimal(resp.json()["result"]["ethusd"])
 
 
 def get_usd_to_eth_conversion_factor():
-    resp = requests.get(API_ETHERSCAN_ETH_PRICE_BASE_URL)
+    resp = utils.http.get(API_ETHERSCAN_ETH_PRICE_BASE_URL)
     resp.raise_for_status()
 
     return round(Decimal(1) / Decimal(resp.json()["result"]["ethusd"]), 10)
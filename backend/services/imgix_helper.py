@@ -1,8 +1,9 @@
 import json
 
-import requests
 from django.conf import settings
 
+import utils.http
+
 API_ENDPOINT_BASE_URL = "https://api.imgix.com"
 
 
@@ -19,7 +20,7 @@ def purge_file(key):
         }
     }
 
-    requests.post(
+    utils.http.post(
         url=f"{API_ENDPOINT_BASE_URL}/api/v1/purge",
         headers=headers,
         data=json.dumps(payload),
@@ -1,9 +1,10 @@
 from io import BytesIO
 
-import requests
 from django.conf import settings
 from django.utils.module_loading import import_string
 
+import utils.http
+
 
 def get(bucket_name, aws_access_key_id, aws_secret_access_key):
     """Gets the swoops factory client"""
@@ -19,7 +20,7 @@ class SwoopsFactoryClient:
     def _post(self, endpoint, data={}):
         url = "https://%s/%s" % (self._host, endpoint)
 
-        response = requests.post(url, json=data)
+        response = utils.http.post(url, json=data)
 
         return response
 
@@ -2,7 +2,7 @@ from services.swoops_factory_client import SwoopsFactoryClient
 
 
 def test_generate_front_face_card(mocker):
-    mock_requests = mocker.patch("services.swoops_factory_client.requests.post")
+    mock_requests = mocker.patch("services.swoops_factory_client.utils.http.post")
     mock_requests.return_value.content = bytes("TEST123", "utf-8")
 
     sf = SwoopsFactoryClient(host="swoops-factory.vercel.app")
@@ -54,7 +54,7 @@ def test_generate_front_face_card(mocker):
 
 
 def test_generate_backface_card(mocker):
-    mock_requests = mocker.patch("services.swoops_factory_client.requests.post")
+    mock_requests = mocker.patch("services.swoops_factory_client.utils.http.post")
     mock_requests.return_value.content = bytes("TEST123", "utf-8")
 
     kwargs = {
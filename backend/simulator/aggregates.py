@@ -0,0 +1,164 @@
+"""Incremental player and team stats aggregates.
+
+PlayerStatsAggregate and TeamStatsAggregate hold running counts and sums of the
+game stats of public games per scope and token tier, and for each stat the
+number of games it was recorded in, since game stats are nullable. Rather than
+recomputing the stats over all of history, the games written by
+insert_player_game_stats_entries / insert_team_game_stats_entries are added to
+(or subtracted from) the affected rows with a single upsert per table. Averages
+and percentages are derived on read by view_player_stats and view_team_stats.
+
+rebuild() recomputes the aggregates from scratch and is meant for repairs.
+"""
+import contextlib
+import datetime as dt
+
+from django.db import connection, transaction
+
+import simulator.models
+
+# Games simulated from this date count towards the current season
+CURRENT_SEASON_STARTED_AT = dt.datetime(2023, 8, 21, 17, tzinfo=dt.timezone.utc)
+# Contest token requirements that get their own token tier, besides tier 0
+# which counts games of any contest
+TOKEN_TIERS = [1, 3, 5]
+
+STATS = [
+    "fg",
+    "ft",
+    "pf",
+    "ast",
+    "blk",
+    "drb",
+    "fga",
+    "fta",
+    "orb",
+    "pts",
+    "stl",
+    "tov",
+    "trb",
+    "two_p",
+    "two_pa",
+    "three_p",
+    "three_pa",
+]
+
+# Aggregate model -> (game stats model, column of the aggregated entity)
+SOURCES = {
+    simulator.models.PlayerStatsAggregate: (
+        simulator.models.PlayerGameStats,
+        "player_id",
+    ),
+    simulator.models.TeamStatsAggregate: (simulator.models.TeamGameStats, "team_id"),
+}
+
+UPSERT_SQL = """
+INSERT INTO {aggregate_table} AS agg (
+    {entity}, scope, token_tier, count, wins, losses, {stats}, {stat_counts},
+    updated_at
+)
+SELECT gs.{entity},
+       scope.scope,
+       tier.token_tier,
+       %(sign)s * COUNT(*),
+       %(sign)s * COUNT(*) FILTER (WHERE gs.won),
+       %(sign)s * COUNT(*) FILTER (WHERE NOT gs.won),
+       {sums},
+       {counts},
+       NOW()
+FROM {stats_table} gs
+         JOIN simulator_simulation s ON gs.simulation_id = s.uuid
+         JOIN game_game g ON s.id = g.simulation_id
+         LEFT JOIN game_contest gc ON gc.id = g.contest_id
+         CROSS JOIN LATERAL (
+             VALUES ('all_time'),
+                    (CASE
+                         WHEN s.created_at >= %(season_started_at)s
+                             THEN 'current_season'
+                         END)
+         ) AS scope (scope)
+         CROSS JOIN LATERAL (
+             VALUES (0),
+                    (CASE
+                         WHEN gc.tokens_required = ANY(%(token_tiers)s)
+                             THEN gc.tokens_required
+                         END)
+         ) AS tier (token_tier)
+WHERE g.visibility = 'PUBLIC'
+  AND scope.scope IS NOT NULL
+  AND tier.token_tier IS NOT NULL
+  {where}
+GROUP BY gs.{entity}, scope.scope, tier.token_tier
+ON CONFLICT ({entity}, scope, token_tier) DO UPDATE
+SET count = agg.count + EXCLUDED.count,
+    wins = agg.wins + EXCLUDED.wins,
+    losses = agg.losses + EXCLUDED.losses,
+    {increments},
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+def _upsert(aggregate, sign, simulation_uuids=None):
+    stats_model, entity = SOURCES[aggregate]
+    where = "AND gs.simulation_id = ANY(%(simulation_uuids)s::uuid[])"
+    sql = UPSERT_SQL.format(
+        aggregate_table=aggregate._meta.db_table,
+        stats_table=stats_model._meta.db_table,
+        entity=entity,
+        stats=", ".join(STATS),
+        stat_counts=", ".join(f"{stat}_count" for stat in STATS),
+        sums=",\n       ".join(
+            f"%(sign)s * COALESCE(SUM(gs.{stat}), 0)" for stat in STATS
+        ),
+        counts=",\n       ".join(f"%(sign)s * COUNT(gs.{stat})" for stat in STATS),
+        increments=",\n    ".join(
+            f"{column} = agg.{column} + EXCLUDED.{column}"
+            for stat in STATS
+            for column in (stat, f"{stat}_count")
+        ),
+        where=where if simulation_uuids is not None else "",
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql,
+            {
+                "sign": sign,
+                "season_started_at": CURRENT_SEASON_STARTED_AT,
+                "token_tiers": TOKEN_TIERS,
+                "simulation_uuids": [str(uuid) for uuid in simulation_uuids or []],
+            },
+        )
+
+
+def add_games(aggregate, simulation_uuids):
+    """Adds the stats written for the given simulations to an aggregate"""
+    _upsert(aggregate, 1, simulation_uuids)
+
+
+def subtract_games(aggregate, simulation_uuids):
+    """Subtracts the stats written for the given simulations from an aggregate.
+    Must run before the stats are deleted"""
+    _upsert(aggregate, -1, simulation_uuids)
+
+
+@contextlib.contextmanager
+def recount(simulation_uuids):
+    """
+    Keeps the aggregates in sync when the games of the given simulations are
+    changed in a way that affects their stats, e.g. their visibility
+    """
+    simulation_uuids = [uuid for uuid in simulation_uuids if uuid is not None]
+    with transaction.atomic():
+        for aggregate in SOURCES:
+            subtract_games(aggregate, simulation_uuids)
+        yield
+        for aggregate in SOURCES:
+            add_games(aggregate, simulation_uuids)
+
+
+@transaction.atomic
+def rebuild():
+    """Recomputes every aggregate from all of the game stats"""
+    for aggregate in SOURCES:
+        aggregate.objects.all().delete()
+        _upsert(aggregate, 1)
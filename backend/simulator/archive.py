@@ -0,0 +1,86 @@
+"""Local archive of the result payloads of simulations.
+
+The result payload of a simulation is archived once, when its game is
+finalized, as a ResultArchive row keyed by the simulation's uuid that holds the
+zlib compressed JSON of the payload and its content hash. Game stats and
+anything else derived from a result can then be rebuilt from the archive rather
+than downloaded from the simulator again.
+
+The play-by-play of a payload is not archived, since it is already stored
+compressed in PlayByPlayChunks; load_many reads it back from there on request.
+Archiving a payload again only writes it if its content hash changed.
+"""
+import hashlib
+import json
+import uuid
+import zlib
+
+import pgbulk
+
+import simulator.models
+import simulator.play_by_play
+
+# Keys of a payload that are stored elsewhere
+EXCLUDED = ["pbp"]
+
+
+def _dumps(payload):
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+
+
+def build(simulation_uuid, payload):
+    """The ResultArchive of the result payload of a simulation"""
+    data = _dumps({key: payload[key] for key in payload if key not in EXCLUDED})
+    return simulator.models.ResultArchive(
+        simulation_id=simulation_uuid,
+        content_hash=hashlib.sha256(data).hexdigest(),
+        data=zlib.compress(data, 9),
+    )
+
+
+def save_many(payloads):
+    """Archives many result payloads, (simulation uuid, payload) pairs, with a
+    single statement. Returns the archives written"""
+    archives = {
+        simulation_uuid: build(simulation_uuid, payload)
+        for simulation_uuid, payload in payloads
+    }
+    if not archives:
+        return []
+
+    # Archives whose content hash is unchanged are left untouched
+    return pgbulk.upsert(
+        simulator.models.ResultArchive,
+        list(archives.values()),
+        ["simulation"],
+        ["content_hash", "data"],
+        returning=["simulation_id"],
+        ignore_duplicate_updates=True,
+    )
+
+
+def load_many(simulation_uuids, play_by_play=False):
+    """Simulation uuid -> archived result payload of the given simulations that
+    have one, with their play-by-play feed under "pbp" if play_by_play"""
+    payloads = {
+        simulation_uuid: json.loads(zlib.decompress(data))
+        for simulation_uuid, data in simulator.models.ResultArchive.objects.filter(
+            simulation__in=simulation_uuids
+        ).values_list("simulation_id", "data")
+    }
+    if play_by_play and payloads:
+        for feed in simulator.models.PlayByPlay.objects.filter(
+            simulation__uuid__in=payloads
+        ).select_related("simulation"):
+            payloads[feed.simulation.uuid]["pbp"] = simulator.play_by_play.read_events(
+                feed
+            )
+    return payloads
+
+
+def load(simulation_uuid, play_by_play=False):
+    """The archived result payload of a simulation, None if it has none"""
+    simulation_uuid = uuid.UUID(str(simulation_uuid))
+    return load_many([simulation_uuid], play_by_play).get(simulation_uuid)
@@ -0,0 +1,203 @@
+"""Backfill of the player and team game stats of finished simulations.
+
+Simulations that are missing game stats are processed in pages of
+BACKFILL_BATCH_SIZE, newest first. The stats of a simulation are rebuilt from
+its archived result payload, see simulator.archive, or else from the box scores
+stored with its result, and only the others are downloaded from the simulator,
+in batches fetched by a pool of workers, and archived. Each
+page is written in a transaction of its own with a statement per table, so the
+stats written are the checkpoint of the backfill: when it is interrupted, running
+it again resumes with the simulations that are still missing stats.
+"""
+import logging
+
+from django.conf import settings
+from django.db import models
+
+import simulator.archive
+import simulator.client
+import simulator.ingestion
+import simulator.models
+import simulator.processing
+
+LOGGER = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 100
+
+# Game stats model -> the number of rows of a simulation that has its stats
+EXPECTED_ROWS = {
+    simulator.models.PlayerGameStats: 10,
+    simulator.models.TeamGameStats: 2,
+}
+
+# The box scores of a result, in the order of the slots of a lineup
+BOX_SCORES = {
+    lineup_number: [
+        f"lineup_{lineup_number}_player_{slot_number}_box_score"
+        for slot_number in range(1, 6)
+    ]
+    for lineup_number in (1, 2)
+}
+
+# What game stats are built from
+RELATED = [
+    "game__lineup_1",
+    "game__lineup_2",
+    *[
+        f"result__{field}"
+        for field in [
+            "lineup_1_box_score",
+            "lineup_2_box_score",
+            *BOX_SCORES[1],
+            *BOX_SCORES[2],
+        ]
+    ],
+]
+
+
+def missing_stats(model, since=None):
+    """The finished simulations without all of their game stats of model"""
+    complete = (
+        model.objects.filter(simulation_id=models.OuterRef("uuid"))
+        .values("simulation_id")
+        .annotate(simulation_id_count=models.Count("simulation_id"))
+        .filter(simulation_id_count=EXPECTED_ROWS[model])
+        .values("simulation_id")
+    )
+    simulations = simulator.models.Simulation.objects.filter(
+        status=simulator.models.Simulation.Status.FINISHED
+    ).exclude(uuid__in=models.Subquery(complete))
+    if since is not None:
+        simulations = simulations.filter(created_at__gte=since)
+    return simulations.order_by("-created_at", "-id")
+
+
+def _box_score_row(box_score):
+    return {stat: getattr(box_score, stat) for stat in simulator.ingestion.GAME_STATS}
+
+
+def stored_payload(simulation):
+    """Rebuilds the parts of the result payload of a simulation that game stats
+    are built from out of the box scores stored with its result"""
+    players = {}
+    totals = []
+    combined_boxscore = []
+    for team, lineup_number in simulator.ingestion.LINEUPS.items():
+        box_score = getattr(simulation.result, f"lineup_{lineup_number}_box_score")
+        totals.append(_box_score_row(box_score) | {"Team": team})
+        lineup_uuids = getattr(simulation, f"lineup_{lineup_number}_uuids")
+        for field, player_uuid in zip(BOX_SCORES[lineup_number], lineup_uuids):
+            players[str(player_uuid)] = {"uuid": str(player_uuid)}
+            combined_boxscore.append(
+                _box_score_row(getattr(simulation.result, field))
+                | {"Team": team, "canonical": str(player_uuid)}
+            )
+    return {
+        "players": players,
+        "totals": totals,
+        "combined_boxscore": combined_boxscore,
+    }
+
+
+def _payloads(simulator_client, simulations, concurrency):
+    """The (simulation, result payload) pairs of simulations, reusing the
+    archived payloads and stored box scores of simulations where possible, and
+    the number of payloads downloaded"""
+    archived = simulator.archive.load_many(
+        [simulation.uuid for simulation in simulations]
+    )
+    games = []
+    downloaded = []
+    for simulation in simulations:
+        if simulation.uuid in archived:
+            games.append((simulation, archived[simulation.uuid]))
+        elif simulation.result_id is not None:
+            games.append((simulation, stored_payload(simulation)))
+        else:
+            downloaded.append(simulation)
+
+    payloads = []
+    for simulation, future in simulator.processing.retrieve_concurrently(
+        simulator_client.retrieve_games,
+        downloaded,
+        concurrency=concurrency,
+        deadline=None,
+        batch_size=settings.SIMULATOR_POLL_GAME_BATCH_SIZE,
+    ):
+        try:
+            payload = future.result()[str(simulation.uuid)]["result"]
+        except Exception:
+            LOGGER.exception("Error downloading simulation %s", simulation.uuid)
+        else:
+            payloads.append((simulation.uuid, payload))
+            games.append((simulation, payload))
+    # So that backfilling the other game stats doesn't download them again
+    simulator.archive.save_many(payloads)
+    return games, len(payloads)
+
+
+def _write(model, games):
+    """Writes the game stats of a page, one game at a time if that fails so that
+    a bad game doesn't fail the others. Returns the number of games written."""
+    try:
+        simulator.ingestion.replace_game_stats(model, games)
+        return len(games)
+    except Exception:
+        LOGGER.exception("Error writing %s games together", len(games))
+
+    written = 0
+    for simulation, payload in games:
+        try:
+            simulator.ingestion.replace_game_stats(model, [(simulation, payload)])
+            written += 1
+        except Exception:
+            LOGGER.exception(
+                "Error writing %s of simulation %s",
+                model._meta.verbose_name,
+                simulation.uuid,
+            )
+    return written
+
+
+def backfill_game_stats(
+    model,
+    since=None,
+    limit=None,
+    batch_size=BACKFILL_BATCH_SIZE,
+    concurrency=None,
+    progress=None,
+):
+    """Writes the game stats of model of the finished simulations that are
+    missing them, created since the given datetime and at most limit of them.
+    progress is called with the number of simulations processed, written and
+    downloaded so far and the number to process after each page.
+    Returns the number of simulations whose stats were written."""
+    simulator_client = simulator.client.get()
+    concurrency = concurrency or settings.SIMULATOR_POLL_CONCURRENCY
+    simulation_ids = list(
+        missing_stats(model, since).values_list("id", flat=True)[:limit]
+    )
+
+    processed = written = downloaded = 0
+    for page_start in range(0, len(simulation_ids), batch_size):
+        page_ids = simulation_ids[page_start : page_start + batch_size]  # noqa: E203
+        simulations = simulator.models.Simulation.objects.filter(
+            id__in=page_ids
+        ).select_related(*RELATED)
+        games, page_downloaded = _payloads(simulator_client, simulations, concurrency)
+
+        processed += len(page_ids)
+        downloaded += page_downloaded
+        written += _write(model, games)
+        LOGGER.info(
+            "Backfilled %s of %s/%s simulations, %s written, %s downloaded",
+            model._meta.verbose_name,
+            processed,
+            len(simulation_ids),
+            written,
+            downloaded,
+        )
+        if progress is not None:
+            progress(processed, written, downloaded, len(simulation_ids))
+
+    return written
@@ -1,15 +1,18 @@
 import abc
 import json
 import pathlib
+import urllib.parse
 from uuid import uuid4
 
 import ddf
-import requests
 from django.conf import settings
 from django.core.cache import caches
 from django.forms.models import model_to_dict
 from django.utils.module_loading import import_string
 
+import simulator.archive
+import utils.http
+
 API = settings.SIMULATOR_API_ROOT
 
 
@@ -20,7 +23,7 @@ def get():
 
 class BaseClient(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def players(self):
+    def players(self, updated_since=None):
         pass
 
     @abc.abstractmethod
@@ -31,6 +34,14 @@ class BaseClient(metaclass=abc.ABCMeta):
     def retrieve_game(self, uuid):
         pass
 
+    @abc.abstractmethod
+    def retrieve_games(self, uuids):
+        pass
+
+    @abc.abstractmethod
+    def retrieve_game_statuses(self, uuids):
+        pass
+
     @abc.abstractmethod
     def retrieve_player_stats(self, uuids):
         pass
@@ -45,26 +56,27 @@ class BaseClient(metaclass=abc.ABCMeta):
 
 
 class Client(BaseClient):
-    def players(self):
+    def players(self, updated_since=None):
         """
-        Return all player data
+        Yield all player data. Pages are fetched lazily as the generator is
+        consumed so that callers can process one page at a time.
+
+        When updated_since is given, the simulator is asked for the players
+        updated after it only.
         """
-        results = []
-        player_api = f"{API}/api/swoops/player?page_size=1000"
+        params = {"page_size": 1000}
+        if updated_since:
+            params["updated_since"] = updated_since.isoformat()
+        player_api = f"{API}/api/swoops/player?{urllib.parse.urlencode(params)}"
 
-        while True:
-            resp = requests.get(player_api)
+        while player_api:
+            resp = utils.http.get(player_api)
             resp.raise_for_status()
 
             resp_json = resp.json()
-            results.extend(resp_json["results"])
+            yield from resp_json["results"]
 
-            if resp_json["next"]:
-                player_api = resp_json["next"]
-            else:
-                break
-
-        return results
+            player_api = resp_json["next"]
 
     def create_game(self, *, lineup_1_players, lineup_2_players, is_published):
         game_data = {
@@ -80,24 +92,42 @@ class Client(BaseClient):
             "challenged_player_five": str(lineup_2_players[4]),
             "is_published": is_published,
         }
-        resp = requests.post(f"{API}/api/swoops/simulate-game", json=game_data)
+        resp = utils.http.post(f"{API}/api/swoops/simulate-game", json=game_data)
         resp.raise_for_status()
 
         return resp.json()
 
     def retrieve_game(self, uuid):
-        resp = requests.get(f"{API}/api/swoops/game", params={"uuid": str(uuid)})
+        resp = utils.http.get(f"{API}/api/swoops/game", params={"uuid": str(uuid)})
+        resp.raise_for_status()
+        return resp.json()
+
+    def retrieve_games(self, uuids):
+        """
+        Return the full payload of several games in one request
+        """
+        params = {"uuids": ",".join(str(uuid) for uuid in uuids)}
+        resp = utils.http.get(f"{API}/api/swoops/games", params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    def retrieve_game_statuses(self, uuids):
+        """
+        Return only the uuid and status of several games in one request
+        """
+        params = {"uuids": ",".join(str(uuid) for uuid in uuids)}
+        resp = utils.http.get(f"{API}/api/swoops/games/status", params=params)
         resp.raise_for_status()
         return resp.json()
 
     def retrieve_player_stats(self, uuids=[]):
         params = {"player_uuids": ",".join(uuids)}
-        resp = requests.get(f"{API}/api/swoops/player-stats/v2", params=params)
+        resp = utils.http.get(f"{API}/api/swoops/player-stats/v2", params=params)
         resp.raise_for_status()
         return resp.json()
 
     def update_player_name(self, token, full_name):
-        resp = requests.post(
+        resp = utils.http.post(
             f"{API}/api/swoops/update-player-name",
             json={"token": token, "full_name": full_name},
         )
@@ -105,7 +135,7 @@ class Client(BaseClient):
         return resp.json()
 
     def update_player_token(self, canonical, updated_token):
-        resp = requests.post(
+        resp = utils.http.post(
             f"{API}/api/swoops/update-player-token",
             json={"canonical": canonical, "new_token": updated_token},
         )
@@ -113,7 +143,7 @@ class Client(BaseClient):
         return resp.json()
 
     def publish_games(self, game_uuids):
-        resp = requests.post(
+        resp = utils.http.post(
             f"{API}/api/swoops/publish-games",
             data={"game_uuids": game_uuids},
         )
@@ -140,7 +170,7 @@ class MockClient(BaseClient):
         "f29e0d67-f16d-441c-a2f7-7ac2b0cc6403",
     ]
 
-    def players(self):
+    def players(self, updated_since=None):
         fake_player = [
             {
                 "uuid": "090bf6c9-f7b7-448f-8753-c484387e83c7",
@@ -268,6 +298,18 @@ class MockClient(BaseClient):
             },
         }
 
+    def retrieve_games(self, uuids):
+        return {
+            "results": [
+                self.retrieve_game(uuid) | {"uuid": str(uuid)} for uuid in uuids
+            ]
+        }
+
+    def retrieve_game_statuses(self, uuids):
+        return {
+            "results": [{"uuid": str(uuid), "status": "FINISHED"} for uuid in uuids]
+        }
+
     def retrieve_player_stats(self, uuids=[]):
         return {
             "player_uuids": ["090bf6c9-f7b7-448f-8753-c484387e83c7"],
@@ -356,7 +398,7 @@ class MockIntegrationClient(BaseClient):
                 self.PLAY_BY_PLAY = json.loads(f.read())
         return self.PLAY_BY_PLAY
 
-    def players(self):
+    def players(self, updated_since=None):
         total_supply = 100
         fake_players = [
             self.build_player(
@@ -479,6 +521,11 @@ class MockIntegrationClient(BaseClient):
         return {"uuid": game_uuid}
 
     def retrieve_game(self, uuid):
+        # Games that were already finalized are not simulated again
+        archived = simulator.archive.load(uuid, play_by_play=True)
+        if archived is not None:
+            return {"uuid": uuid, "status": "FINISHED", "result": archived}
+
         cache = caches["default"]
 
         lineups = cache.get(uuid)
@@ -576,6 +623,15 @@ class MockIntegrationClient(BaseClient):
         cache.delete(uuid)
         return result
 
+    def retrieve_games(self, uuids):
+        return {"results": [self.retrieve_game(uuid) for uuid in uuids]}
+
+    def retrieve_game_statuses(self, uuids):
+        # games are simulated as soon as they are retrieved
+        return {
+            "results": [{"uuid": str(uuid), "status": "FINISHED"} for uuid in uuids]
+        }
+
     def retrieve_player_stats(self, uuids):
         player_aggregate_stats_boxscores = ddf.N(
             "simulator.HistoricalPlayerStats",
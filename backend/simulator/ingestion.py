@@ -0,0 +1,270 @@
+"""Batched ingestion of the results of finished simulations.
+
+parse() reads the result payload of a simulation once into the rows it writes,
+its box scores and result, so that bad payloads are caught before anything is
+written. ingest() then finalizes any number of parsed games together, writing
+the box scores, results, simulations, play-by-play, archived payloads, player
+and team game stats and team records of all of them with one statement per
+table.
+"""
+import collections
+import functools
+import logging
+
+import pgbulk
+from django.db import transaction
+from django.db.models import Case, F, Value, When, prefetch_related_objects
+from django.utils import timezone
+
+import game.game_cache
+import game.models
+import simulator.aggregates
+import simulator.archive
+import simulator.models
+import simulator.play_by_play
+import simulator.utils
+
+LOGGER = logging.getLogger(__name__)
+
+# Team of a box score in the payload -> lineup number
+LINEUPS = {"Challengers": 1, "Challenged": 2}
+
+# Player box scores of the payload per lineup number
+PLAYER_BOX_SCORES = {1: "challengers_boxscore", 2: "challenged_boxscore"}
+
+GAME_STATS = [
+    *simulator.aggregates.STATS,
+    "fg_pct",
+    "ft_pct",
+    "two_p_pct",
+    "three_p_pct",
+]
+
+ParsedGame = collections.namedtuple(
+    "ParsedGame", ["simulation", "payload", "box_scores", "result", "events"]
+)
+
+
+@functools.cache
+def _box_score_fields():
+    return frozenset(field.name for field in simulator.models.BoxScore._meta.fields)
+
+
+def _box_score(row):
+    fields = _box_score_fields()
+    return simulator.models.BoxScore(
+        **{key: value for key, value in row.items() if key in fields}
+    )
+
+
+def _player_uuids(payload):
+    """Canonical name of a player in the payload -> uuid"""
+    return {
+        canonical: player["uuid"] for canonical, player in payload["players"].items()
+    }
+
+
+def _wins(payload):
+    """Team of the payload -> whether it won"""
+    points = {row["Team"]: row["pts"] for row in payload["totals"]}
+    return {
+        team: points[team] > points[other_team]
+        for team, other_team in zip(LINEUPS, reversed(LINEUPS))
+    }
+
+
+def parse(simulation, payload):
+    """Builds the box scores and result of the result payload of a simulation"""
+    totals = [row for row in payload["totals"] if row["Team"] in LINEUPS]
+    assert sorted(row["Team"] for row in totals) == sorted(LINEUPS)
+    box_scores = {
+        (LINEUPS[row["Team"]], "box_score"): _box_score(row) for row in totals
+    }
+
+    uuids = _player_uuids(payload)
+    for lineup_number, key in PLAYER_BOX_SCORES.items():
+        rows = {uuids[row["canonical"]]: row for row in payload[key]}
+        assert len(rows) == 5
+        lineup_uuids = getattr(simulation, f"lineup_{lineup_number}_uuids")
+        for slot_number, player_uuid in enumerate(lineup_uuids, 1):
+            box_scores[lineup_number, f"player_{slot_number}_box_score"] = _box_score(
+                rows[str(player_uuid)]
+            )
+
+    result = simulator.models.Result(
+        lineup_1_score=box_scores[1, "box_score"].pts,
+        lineup_2_score=box_scores[2, "box_score"].pts,
+        **{
+            f"lineup_{lineup_number}_{field}": box_score
+            for (lineup_number, field), box_score in box_scores.items()
+        },
+    )
+    return ParsedGame(
+        simulation,
+        payload,
+        list(box_scores.values()),
+        result,
+        simulator.play_by_play.map_events(payload.get("pbp")),
+    )
+
+
+def player_game_stats(simulation, payload):
+    """The PlayerGameStats of the result payload of a simulation"""
+    uuids = _player_uuids(payload)
+    wins = _wins(payload)
+    return [
+        simulator.models.PlayerGameStats(
+            player_id=uuids[row["canonical"]],
+            simulation_id=simulation.uuid,
+            won=wins[row["Team"]],
+            **{stat: row[stat] for stat in GAME_STATS},
+        )
+        for row in payload["combined_boxscore"]
+    ]
+
+
+def team_game_stats(simulation, payload):
+    """The TeamGameStats of the result payload of a simulation"""
+    lineups = {1: simulation.game.lineup_1, 2: simulation.game.lineup_2}
+    wins = _wins(payload)
+    return [
+        simulator.models.TeamGameStats(
+            team_id=lineups[LINEUPS[row["Team"]]].team_id,
+            simulation_id=simulation.uuid,
+            won=wins[row["Team"]],
+            **{stat: row[stat] for stat in GAME_STATS},
+        )
+        for row in payload["totals"]
+    ]
+
+
+# Game stats model -> (aggregate model, builder of its rows)
+GAME_STATS_MODELS = {
+    simulator.models.PlayerGameStats: (
+        simulator.models.PlayerStatsAggregate,
+        player_game_stats,
+    ),
+    simulator.models.TeamGameStats: (
+        simulator.models.TeamStatsAggregate,
+        team_game_stats,
+    ),
+}
+
+
+@transaction.atomic
+def replace_game_stats(model, games):
+    """Replaces the game stats of model, and their aggregates, of the given
+    (simulation, result payload) pairs, e.g. when games are simulated again"""
+    aggregate, build = GAME_STATS_MODELS[model]
+    simulation_uuids = [simulation.uuid for simulation, _ in games]
+    simulator.aggregates.subtract_games(aggregate, simulation_uuids)
+    model.objects.filter(simulation__in=simulation_uuids).delete()
+    model.objects.bulk_create(
+        [row for simulation, payload in games for row in build(simulation, payload)]
+    )
+    simulator.aggregates.add_games(aggregate, simulation_uuids)
+
+
+def _update_team_records(parsed_games):
+    """Counts the wins and losses of the teams of head to head games"""
+    records = collections.defaultdict(lambda: [0, 0])
+    for parsed in parsed_games:
+        contest_game = parsed.simulation.game
+        if contest_game.contest.kind != game.models.Contest.Kind.HEAD_TO_HEAD:
+            continue
+        team_ids = [contest_game.lineup_1.team_id, contest_game.lineup_2.team_id]
+        if parsed.result.lineup_1_score <= parsed.result.lineup_2_score:
+            team_ids.reverse()
+        records[team_ids[0]][0] += 1
+        records[team_ids[1]][1] += 1
+
+    if records:
+        game.models.Team.objects.filter(id__in=records).update(
+            **{
+                column: F(column)
+                + Case(
+                    *[
+                        When(id=team_id, then=Value(record[index]))
+                        for team_id, record in records.items()
+                    ],
+                    default=Value(0),
+                )
+                for index, column in enumerate(["wins", "losses"])
+            }
+        )
+
+
+@transaction.atomic
+def _write(simulator_client, parsed_games):
+    simulator.models.BoxScore.objects.bulk_create(
+        [box_score for parsed in parsed_games for box_score in parsed.box_scores]
+    )
+    simulator.models.Result.objects.bulk_create(
+        [parsed.result for parsed in parsed_games]
+    )
+    updated_at = timezone.now()
+    pgbulk.update(
+        simulator.models.Simulation,
+        [
+            simulator.models.Simulation(
+                id=parsed.simulation.id,
+                status=simulator.models.Simulation.Status.FINISHED,
+                result=parsed.result,
+                updated_at=updated_at,
+            )
+            for parsed in parsed_games
+        ],
+        ["status", "result", "updated_at"],
+    )
+
+    simulator.utils.update_simulator_player_stats(
+        simulator_client,
+        player_uuids=[
+            str(player_uuid)
+            for parsed in parsed_games
+            for player_uuid in parsed.simulation.lineup_1_uuids
+            + parsed.simulation.lineup_2_uuids
+        ],
+    )
+
+    _update_team_records(parsed_games)
+
+    simulator.play_by_play.save_many(
+        [
+            (simulator.models.PlayByPlay(simulation=parsed.simulation), parsed.events)
+            for parsed in parsed_games
+        ]
+    )
+    simulator.archive.save_many(
+        [(parsed.simulation.uuid, parsed.payload) for parsed in parsed_games]
+    )
+
+    # Games that are simulated again must not be served from the cache
+    game_ids = [parsed.simulation.game.id for parsed in parsed_games]
+    transaction.on_commit(
+        lambda: [game.game_cache.invalidate(game_id) for game_id in game_ids]
+    )
+
+    games = [(parsed.simulation, parsed.payload) for parsed in parsed_games]
+    for model in GAME_STATS_MODELS:
+        try:
+            replace_game_stats(model, games)
+        except Exception:
+            LOGGER.exception(
+                "Error updating %s of simulations %s",
+                model._meta.verbose_name,
+                [simulation.uuid for simulation, _ in games],
+            )
+
+
+def ingest(simulator_client, parsed_games):
+    """Finalizes the games of the simulations of parsed games together"""
+    simulations = [parsed.simulation for parsed in parsed_games]
+    prefetch_related_objects(
+        simulations, "game__contest", "game__lineup_1", "game__lineup_2"
+    )
+    _write(simulator_client, parsed_games)
+
+    for parsed in parsed_games:
+        parsed.simulation.result = parsed.result
+        parsed.simulation.status = simulator.models.Simulation.Status.FINISHED
@@ -0,0 +1,81 @@
+"""Request scoped batch loading of player stats.
+
+Serializing a player reads a row from each player stats view. Rather than
+querying the views once per player, serializers prime a PlayerStatsLoader with
+every player they are about to render. The first read then loads the stats of
+all primed players, for every scope and token tier, with a single
+``player_id IN (...)`` query on view_player_stats.
+"""
+import collections
+
+import simulator.model_views
+import simulator.models
+
+CONTEXT_KEY = "player_stats_loader"
+
+
+class PlayerStatsLoader:
+    ALL_TIME = simulator.model_views.PlayerStatsScope.ALL_TIME
+    CURRENT_SEASON = simulator.model_views.PlayerStatsScope.CURRENT_SEASON
+
+    # Names of the stats read by serializers -> (scope, token tier)
+    VIEWS = {
+        "all_time": (ALL_TIME, 0),
+        "all_time_one_token": (ALL_TIME, 1),
+        "all_time_three_tokens": (ALL_TIME, 3),
+        "all_time_five_tokens": (ALL_TIME, 5),
+        "current_season": (CURRENT_SEASON, 0),
+        "current_season_one_token": (CURRENT_SEASON, 1),
+        "current_season_three_tokens": (CURRENT_SEASON, 3),
+        "current_season_five_tokens": (CURRENT_SEASON, 5),
+    }
+
+    def __init__(self):
+        # Simulated player uuid -> token of the players waiting to be loaded
+        self._pending = {}
+        self._loaded = set()
+        # (scope, token tier, simulated player uuid) -> view_player_stats row
+        self._stats = {}
+        self._historical_stats = collections.defaultdict(list)
+
+    @classmethod
+    def for_context(cls, context):
+        """Returns the loader shared by all serializers of a serializer context"""
+        return context.setdefault(CONTEXT_KEY, cls())
+
+    def prime(self, players):
+        """Queues game players to be loaded with the next batch"""
+        for player in players:
+            if player is not None and player.simulated_id not in self._loaded:
+                self._pending[player.simulated_id] = player.simulated.token
+
+    def stats(self, view, player):
+        """Returns the row of the given view for a game player or None"""
+        self._load(player)
+        return self._stats.get((*self.VIEWS[view], player.simulated_id))
+
+    def historical_stats(self, player):
+        """Returns the HistoricalPlayerStats of a game player"""
+        self._load(player)
+        return self._historical_stats[player.simulated.token]
+
+    def _load(self, player):
+        if player.simulated_id in self._loaded:
+            return
+
+        self.prime([player])
+        player_ids = list(self._pending)
+        tokens = [token for token in self._pending.values() if token is not None]
+
+        for row in simulator.model_views.PlayerStatsView.objects.filter(
+            player_id__in=player_ids
+        ):
+            self._stats[(row.scope, row.token_tier, row.player_id)] = row
+
+        for row in simulator.models.HistoricalPlayerStats.objects.filter(
+            player_token__in=tokens
+        ):
+            self._historical_stats[row.player_token].append(row)
+
+        self._loaded.update(player_ids)
+        self._pending = {}
@@ -0,0 +1,101 @@
+import time
+import types
+import uuid
+
+from django.core.management.base import BaseCommand
+
+import simulator.client
+import simulator.processing
+
+
+class LatencyMockClient(simulator.client.MockClient):
+    """A MockClient that waits before answering to mimic a network round trip"""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def retrieve_games(self, uuids):
+        time.sleep(self.latency)
+        return super().retrieve_games(uuids)
+
+    def retrieve_game_statuses(self, uuids):
+        time.sleep(self.latency)
+        return super().retrieve_game_statuses(uuids)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how many simulations per second a single update_games run can"
+        " poll and download from the simulator at different concurrency levels."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--simulations",
+            type=int,
+            default=500,
+            help="The number of pending simulations to drain",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.05,
+            help="The simulated round trip time of a single request in seconds",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 4, 8, 16],
+            help="The concurrency levels to benchmark",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="The number of full game payloads fetched per request",
+        )
+        parser.add_argument(
+            "--deadline",
+            type=int,
+            default=50,
+            help="The time budget of a run in seconds",
+        )
+
+    def handle(self, *args, **options):
+        simulator_client = LatencyMockClient(options["latency"])
+        simulations = [
+            types.SimpleNamespace(uuid=uuid.uuid4())
+            for _ in range(options["simulations"])
+        ]
+
+        for concurrency in options["concurrency"]:
+            start_time = time.monotonic()
+            drained = 0
+            deadline = start_time + options["deadline"]
+            finished = []
+            for simulation, future in simulator.processing.retrieve_concurrently(
+                simulator_client.retrieve_game_statuses,
+                simulations,
+                concurrency=concurrency,
+                deadline=deadline,
+                batch_size=100,
+            ):
+                if future.result()[str(simulation.uuid)]["status"] == "FINISHED":
+                    finished.append(simulation)
+
+            for simulation, future in simulator.processing.retrieve_concurrently(
+                simulator_client.retrieve_games,
+                finished,
+                concurrency=concurrency,
+                deadline=deadline,
+                batch_size=options["batch_size"],
+            ):
+                future.result()[str(simulation.uuid)]
+                drained += 1
+            elapsed = time.monotonic() - start_time
+
+            self.stdout.write(
+                "CONCURRENCY %s :: DRAINED %s/%s IN %.2fs (%.1f SIMULATIONS/SEC)"
+                % (concurrency, drained, len(simulations), elapsed, drained / elapsed)
+            )
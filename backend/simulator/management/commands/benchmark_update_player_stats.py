@@ -0,0 +1,120 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+import game.models
+import simulator.client
+import simulator.models
+import simulator.utils
+
+
+class SyntheticStatsClient(simulator.client.MockClient):
+    """A MockClient that returns the same stats line for every requested player"""
+
+    def retrieve_player_stats(self, uuids=[]):
+        (stats,) = super().retrieve_player_stats()["results"]
+        return {
+            "player_uuids": uuids,
+            "results": [stats | {"player_uuid": uuid} for uuid in uuids],
+        }
+
+
+def update_player_stats_per_player(simulator_client, player_uuids):
+    """The previous implementation of update_simulator_player_stats, which ran two
+    UPDATE statements for every player"""
+    simulator_player_fields = {
+        field.name for field in simulator.models.Player._meta.fields
+    }
+    game_player_fields = {field.name for field in game.models.Player._meta.fields}
+
+    result = simulator_client.retrieve_player_stats(uuids=player_uuids)
+    for player_stats in result["results"]:
+        game.models.Player.objects.filter(
+            simulated__uuid=player_stats["player_uuid"]
+        ).update(
+            **{
+                key: player_stats[key]
+                for key in player_stats
+                if key in game_player_fields
+            },
+        )
+        simulator.models.Player.objects.filter(uuid=player_stats["player_uuid"]).update(
+            **{
+                key: player_stats[key]
+                for key in player_stats
+                if key in simulator_player_fields
+            },
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the wall time and number of queries it takes to write simulator"
+        " player stats with the per player and bulk update paths. Synthetic players"
+        " are created in a transaction that is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--players",
+            type=int,
+            default=10_000,
+            help="The number of synthetic players to update",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="The number of players requested from the simulator at once",
+        )
+
+    def run(self, name, update, player_uuids, chunk_size):
+        simulator_client = SyntheticStatsClient()
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        start_time = time.monotonic()
+        with connection.execute_wrapper(count_queries):
+            for chunk_start in range(0, len(player_uuids), chunk_size):
+                chunk_end = chunk_start + chunk_size
+                update(simulator_client, player_uuids[chunk_start:chunk_end])
+        elapsed = time.monotonic() - start_time
+
+        self.stdout.write(
+            "%s :: %s PLAYERS IN %.2fs WITH %s QUERIES"
+            % (name, len(player_uuids), elapsed, queries)
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        simulated_players = simulator.models.Player.objects.bulk_create(
+            [
+                simulator.models.Player(uuid=uuid.uuid4(), age=25, star_rating=3)
+                for _ in range(options["players"])
+            ]
+        )
+        game.models.Player.objects.bulk_create(
+            [game.models.Player(simulated=player) for player in simulated_players]
+        )
+        player_uuids = [str(player.uuid) for player in simulated_players]
+
+        self.run(
+            "PER PLAYER",
+            update_player_stats_per_player,
+            player_uuids,
+            options["chunk_size"],
+        )
+        self.run(
+            "BULK",
+            simulator.utils.update_simulator_player_stats,
+            player_uuids,
+            options["chunk_size"],
+        )
+
+        transaction.set_rollback(True)
@@ -1,10 +1,76 @@
+import datetime as dt
+import time
+
 from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+import simulator.backfill
+import simulator.models
 
-import simulator.processing
+
+def since(value):
+    """An ISO date or datetime, in the current time zone unless it has one"""
+    since = dt.datetime.fromisoformat(value)
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
 
 
 class Command(BaseCommand):
-    help = "Build player game stats"
+    help = (
+        "Backfill the player game stats of finished simulations that are missing"
+        " them. Interrupted backfills resume where they stopped when run again"
+    )
+    model = simulator.models.PlayerGameStats
+    name = "BUILD PLAYER GAME STATS"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=since,
+            default=None,
+            help="Only simulations created since this ISO date or datetime",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="The maximum number of simulations to backfill",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=simulator.backfill.BACKFILL_BATCH_SIZE,
+            help="The number of simulations written at once",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="The number of concurrent requests to the simulator",
+        )
+
+    def progress(self, processed, written, downloaded, total):
+        self.stdout.write(
+            "%s/%s SIMULATIONS, %s WRITTEN, %s DOWNLOADED"
+            % (processed, total, written, downloaded)
+        )
 
     def handle(self, *args, **options):
-        simulator.processing.build_player_game_stats()
+        start_time = time.time()
+        self.stdout.write("%s :: STARTED %s" % (self.name, start_time))
+
+        written = simulator.backfill.backfill_game_stats(
+            self.model,
+            since=options["since"],
+            limit=options["limit"],
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            progress=self.progress,
+        )
+
+        end_time = time.time()
+        self.stdout.write(
+            "%s :: FINISHED %s, %s SIMULATIONS" % (self.name, end_time, written)
+        )
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
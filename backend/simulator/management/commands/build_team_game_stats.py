@@ -1,10 +1,11 @@
-from django.core.management.base import BaseCommand
+import simulator.models
+from simulator.management.commands import build_player_game_stats
 
-import simulator.processing
 
-
-class Command(BaseCommand):
-    help = "Build team game stats"
-
-    def handle(self, *args, **options):
-        simulator.processing.build_team_game_stats()
+class Command(build_player_game_stats.Command):
+    help = (
+        "Backfill the team game stats of finished simulations that are missing"
+        " them. Interrupted backfills resume where they stopped when run again"
+    )
+    model = simulator.models.TeamGameStats
+    name = "BUILD TEAM GAME STATS"
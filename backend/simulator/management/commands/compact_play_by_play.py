@@ -0,0 +1,49 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+import simulator.models
+import simulator.play_by_play
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the play-by-play feeds of games played before feeds were stored in"
+        " chunks from their JSON feed into compressed chunks"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="The maximum number of feeds to compact",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of feeds loaded at once",
+        )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        self.stdout.write("COMPACT PLAY BY PLAY :: STARTED %s" % start_time)
+
+        queryset = simulator.models.PlayByPlay.objects.filter(
+            event_count__isnull=True, feed__isnull=False
+        ).order_by("id")
+        if options["limit"] is not None:
+            queryset = queryset[: options["limit"]]
+
+        compacted = 0
+        for play_by_play in queryset.iterator(chunk_size=options["batch_size"]):
+            simulator.play_by_play.save(play_by_play, json.loads(play_by_play.feed))
+            compacted += 1
+
+        end_time = time.time()
+        self.stdout.write(
+            "COMPACT PLAY BY PLAY :: FINISHED %s, %s FEEDS" % (end_time, compacted)
+        )
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+import simulator.aggregates
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the player and team stats aggregates from all of the game stats."
+        " The aggregates are otherwise kept up to date as game stats are written,"
+        " so this is only needed to repair them"
+    )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        self.stdout.write("REBUILD STATS AGGREGATES :: STARTED %s" % start_time)
+
+        simulator.aggregates.rebuild()
+
+        end_time = time.time()
+        self.stdout.write("REBUILD STATS AGGREGATES :: FINISHED %s" % end_time)
+        self.stdout.write("TIME ELAPSED %s" % (end_time - start_time))
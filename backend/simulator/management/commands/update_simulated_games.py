@@ -6,5 +6,19 @@ import simulator.processing
 class Command(BaseCommand):
     help = "Update game status from the simulator."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="The number of results to fetch from the simulator at once",
+        )
+        parser.add_argument(
+            "--deadline",
+            type=int,
+            help="The number of seconds after which remaining games are deferred",
+        )
+
     def handle(self, *args, **options):
-        simulator.processing.update_games()
+        simulator.processing.update_games(
+            concurrency=options["concurrency"], deadline=options["deadline"]
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.5 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0033_alltimeplayerstatsviewfivetokens_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Hash of the simulator data last synced for this player",
+                max_length=64,
+            ),
+        ),
+    ]
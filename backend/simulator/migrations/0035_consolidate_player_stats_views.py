@@ -0,0 +1,108 @@
+# Generated by Django 4.0.5 on 2026-10-18 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0034_player_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerStatsView",
+            fields=[
+                ("player_id", models.UUIDField(primary_key=True, serialize=False)),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[
+                            ("all_time", "All Time"),
+                            ("current_season", "Current Season"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("token_tier", models.IntegerField()),
+                ("count", models.IntegerField()),
+                ("wins", models.IntegerField()),
+                ("losses", models.IntegerField()),
+                ("fg", models.FloatField()),
+                ("ft", models.FloatField()),
+                ("fpg", models.FloatField()),
+                ("apg", models.FloatField()),
+                ("bpg", models.FloatField()),
+                ("drpg", models.FloatField()),
+                ("fga", models.FloatField()),
+                ("fta", models.FloatField()),
+                ("orpg", models.FloatField()),
+                ("ppg", models.FloatField()),
+                ("spg", models.FloatField()),
+                ("tpg", models.FloatField()),
+                ("rpg", models.FloatField()),
+                ("two_p", models.FloatField()),
+                ("two_pa", models.FloatField()),
+                ("three_p", models.FloatField()),
+                ("three_pa", models.FloatField()),
+                ("fg_total", models.FloatField()),
+                ("ft_total", models.FloatField()),
+                ("fpg_total", models.FloatField()),
+                ("apg_total", models.FloatField()),
+                ("bpg_total", models.FloatField()),
+                ("drpg_total", models.FloatField()),
+                ("fga_total", models.FloatField()),
+                ("fta_total", models.FloatField()),
+                ("orpg_total", models.FloatField()),
+                ("ppg_total", models.FloatField()),
+                ("spg_total", models.FloatField()),
+                ("tpg_total", models.FloatField()),
+                ("rpg_total", models.FloatField()),
+                ("two_p_total", models.FloatField()),
+                ("two_pa_total", models.FloatField()),
+                ("three_p_total", models.FloatField()),
+                ("three_pa_total", models.FloatField()),
+                ("fg_pct", models.FloatField(null=True)),
+                ("ft_pct", models.FloatField(null=True)),
+                ("two_p_pct", models.FloatField(null=True)),
+                ("three_p_pct", models.FloatField(null=True)),
+                ("ts_pct", models.FloatField(null=True)),
+            ],
+            options={
+                "db_table": "view_player_stats",
+                "managed": False,
+            },
+        ),
+        migrations.AlterModelTable(
+            name="alltimeplayerstatsview",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="alltimeplayerstatsviewfivetokens",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="alltimeplayerstatsviewonetoken",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="alltimeplayerstatsviewthreetokens",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="currentseasonplayerstatsview",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="currentseasonplayerstatsviewfivetokens",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="currentseasonplayerstatsviewonetoken",
+            table="view_player_stats",
+        ),
+        migrations.AlterModelTable(
+            name="currentseasonplayerstatsviewthreetokens",
+            table="view_player_stats",
+        ),
+    ]
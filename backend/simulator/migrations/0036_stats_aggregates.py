@@ -0,0 +1,245 @@
+# Generated by Django 4.0.5 on 2026-10-18 16:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0055_alter_tournament_kind"),
+        ("simulator", "0035_consolidate_player_stats_views"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamStatsAggregate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[
+                            ("all_time", "All Time"),
+                            ("current_season", "Current Season"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "token_tier",
+                    models.IntegerField(help_text="0 for games of any contest"),
+                ),
+                ("count", models.IntegerField(default=0)),
+                ("wins", models.IntegerField(default=0)),
+                ("losses", models.IntegerField(default=0)),
+                (
+                    "fg",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "ft",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "pf",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "ast",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "blk",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "drb",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "fga",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "fta",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "orb",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "pts",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "stl",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "tov",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "trb",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "two_p",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "two_pa",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "three_p",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "three_pa",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats_aggregates",
+                        to="game.team",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="PlayerStatsAggregate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[
+                            ("all_time", "All Time"),
+                            ("current_season", "Current Season"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "token_tier",
+                    models.IntegerField(help_text="0 for games of any contest"),
+                ),
+                ("count", models.IntegerField(default=0)),
+                ("wins", models.IntegerField(default=0)),
+                ("losses", models.IntegerField(default=0)),
+                (
+                    "fg",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "ft",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "pf",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "ast",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "blk",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "drb",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "fga",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "fta",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "orb",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "pts",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "stl",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "tov",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "trb",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "two_p",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "two_pa",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "three_p",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                (
+                    "three_pa",
+                    models.DecimalField(decimal_places=10, default=0, max_digits=30),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats_aggregates",
+                        to="simulator.player",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="teamstatsaggregate",
+            constraint=models.UniqueConstraint(
+                fields=("team", "scope", "token_tier"),
+                name="unique_team_stats_aggregate",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="playerstatsaggregate",
+            constraint=models.UniqueConstraint(
+                fields=("player", "scope", "token_tier"),
+                name="unique_player_stats_aggregate",
+            ),
+        ),
+    ]
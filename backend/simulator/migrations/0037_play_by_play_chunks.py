@@ -0,0 +1,56 @@
+# Generated by Django 4.0.5 on 2026-10-18 16:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0036_stats_aggregates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playbyplay",
+            name="event_count",
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.CreateModel(
+            name="PlayByPlayChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start",
+                    models.PositiveIntegerField(
+                        help_text="The offset of the first event of the chunk in the feed."
+                    ),
+                ),
+                ("count", models.PositiveSmallIntegerField()),
+                ("quarter", models.SmallIntegerField(null=True)),
+                ("data", models.BinaryField()),
+                (
+                    "play_by_play",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        to="simulator.playbyplay",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="playbyplaychunk",
+            constraint=models.UniqueConstraint(
+                fields=("play_by_play", "start"), name="unique_play_by_play_chunk"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.0.5 on 2026-10-18 17:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0037_play_by_play_chunks"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResultArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(
+                        help_text="SHA-256 of the JSON of the payload", max_length=64
+                    ),
+                ),
+                ("data", models.BinaryField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "simulation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="result_archive",
+                        to="simulator.simulation",
+                        to_field="uuid",
+                    ),
+                ),
+            ],
+        ),
+    ]
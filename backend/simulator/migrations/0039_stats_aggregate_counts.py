@@ -0,0 +1,269 @@
+# Generated by Django 4.0.5 on 2026-10-18 18:36
+
+from django.db import migrations, models
+
+STATS = [
+    "fg",
+    "ft",
+    "pf",
+    "ast",
+    "blk",
+    "drb",
+    "fga",
+    "fta",
+    "orb",
+    "pts",
+    "stl",
+    "tov",
+    "trb",
+    "two_p",
+    "two_pa",
+    "three_p",
+    "three_pa",
+]
+
+# Counts the games each stat was recorded in per aggregate row, grouped as in
+# simulator.aggregates.UPSERT_SQL
+BACKFILL_SQL = """
+UPDATE {aggregate_table} agg
+SET {assignments}
+FROM (
+    SELECT gs.{entity},
+           scope.scope,
+           tier.token_tier,
+           {counts}
+    FROM {stats_table} gs
+             JOIN simulator_simulation s ON gs.simulation_id = s.uuid
+             JOIN game_game g ON s.id = g.simulation_id
+             LEFT JOIN game_contest gc ON gc.id = g.contest_id
+             CROSS JOIN LATERAL (
+                 VALUES ('all_time'),
+                        (CASE
+                             WHEN s.created_at >= '2023-08-21 17:00:00+00'
+                                 THEN 'current_season'
+                             END)
+             ) AS scope (scope)
+             CROSS JOIN LATERAL (
+                 VALUES (0),
+                        (CASE
+                             WHEN gc.tokens_required IN (1, 3, 5)
+                                 THEN gc.tokens_required
+                             END)
+             ) AS tier (token_tier)
+    WHERE g.visibility = 'PUBLIC'
+      AND scope.scope IS NOT NULL
+      AND tier.token_tier IS NOT NULL
+    GROUP BY gs.{entity}, scope.scope, tier.token_tier
+) AS counts
+WHERE agg.{entity} = counts.{entity}
+  AND agg.scope = counts.scope
+  AND agg.token_tier = counts.token_tier
+"""
+
+
+def backfill_sql(aggregate_table, stats_table, entity):
+    return BACKFILL_SQL.format(
+        aggregate_table=aggregate_table,
+        stats_table=stats_table,
+        entity=entity,
+        assignments=",\n    ".join(
+            f"{stat}_count = counts.{stat}_count" for stat in STATS
+        ),
+        counts=",\n           ".join(
+            f"COUNT(gs.{stat}) AS {stat}_count" for stat in STATS
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simulator", "0038_result_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="ast_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="blk_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="drb_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="fg_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="fga_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="ft_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="fta_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="orb_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="pf_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="pts_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="stl_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="three_p_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="three_pa_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="tov_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="trb_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="two_p_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="playerstatsaggregate",
+            name="two_pa_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="ast_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="blk_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="drb_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="fg_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="fga_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="ft_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="fta_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="orb_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="pf_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="pts_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="stl_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="three_p_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="three_pa_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="tov_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="trb_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="two_p_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="teamstatsaggregate",
+            name="two_pa_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            backfill_sql(
+                "simulator_playerstatsaggregate",
+                "simulator_playergamestats",
+                "player_id",
+            ),
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            backfill_sql(
+                "simulator_teamstatsaggregate", "simulator_teamgamestats", "team_id"
+            ),
+            migrations.RunSQL.noop,
+        ),
+    ]
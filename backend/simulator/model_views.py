@@ -3,9 +3,15 @@ from django.db import models
 
 import simulator.models
 
+PlayerStatsScope = simulator.models.StatsScope
 
-class AllTimePlayerStatsViewMixin(models.Model):
+
+class PlayerStatsViewMixin(models.Model):
+    # player_id is only unique per scope and token tier
     player_id = models.UUIDField(primary_key=True)
+    scope = models.CharField(max_length=16, choices=PlayerStatsScope.choices)
+    # 0 for games of any contest
+    token_tier = models.IntegerField()
     count = models.IntegerField()
     wins = models.IntegerField()
     losses = models.IntegerField()
@@ -53,104 +59,108 @@ class AllTimePlayerStatsViewMixin(models.Model):
         abstract = True
 
 
+class PlayerStatsView(PlayerStatsViewMixin):
+    """Player stats of every scope and token tier"""
+
+    class Meta:
+        managed = False
+        db_table = "view_player_stats"
+
+
+class ScopedPlayerStatsManager(models.Manager):
+    """Restricts view_player_stats to the scope and token tier of the model"""
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .filter(scope=self.model.SCOPE, token_tier=self.model.TOKEN_TIER)
+        )
+
+
+class AllTimePlayerStatsViewMixin(PlayerStatsViewMixin):
+    SCOPE = PlayerStatsScope.ALL_TIME
+
+    objects = ScopedPlayerStatsManager()
+
+    class Meta:
+        abstract = True
+
+
 class AllTimePlayerStatsView(AllTimePlayerStatsViewMixin):
+    TOKEN_TIER = 0
+
     class Meta:
         managed = False
-        db_table = "view_all_time_player_stats"
+        db_table = "view_player_stats"
 
 
 class AllTimePlayerStatsViewOneToken(AllTimePlayerStatsViewMixin):
+    TOKEN_TIER = 1
+
     class Meta:
         managed = False
-        db_table = "view_all_time_player_stats_1_token"
+        db_table = "view_player_stats"
 
 
 class AllTimePlayerStatsViewThreeTokens(AllTimePlayerStatsViewMixin):
+    TOKEN_TIER = 3
+
     class Meta:
         managed = False
-        db_table = "view_all_time_player_stats_3_tokens"
+        db_table = "view_player_stats"
 
 
 class AllTimePlayerStatsViewFiveTokens(AllTimePlayerStatsViewMixin):
+    TOKEN_TIER = 5
+
     class Meta:
         managed = False
-        db_table = "view_all_time_player_stats_5_tokens"
+        db_table = "view_player_stats"
 
 
-class CurrentSeasonPlayerStatsViewMixin(models.Model):
-    player_id = models.UUIDField(primary_key=True)
-    count = models.IntegerField()
-    wins = models.IntegerField()
-    losses = models.IntegerField()
-    fg = models.FloatField()
-    ft = models.FloatField()
-    fpg = models.FloatField()
-    apg = models.FloatField()
-    bpg = models.FloatField()
-    drpg = models.FloatField()
-    fga = models.FloatField()
-    fta = models.FloatField()
-    orpg = models.FloatField()
-    ppg = models.FloatField()
-    spg = models.FloatField()
-    tpg = models.FloatField()
-    rpg = models.FloatField()
-    two_p = models.FloatField()
-    two_pa = models.FloatField()
-    three_p = models.FloatField()
-    three_pa = models.FloatField()
-    fg_total = models.FloatField()
-    ft_total = models.FloatField()
-    fpg_total = models.FloatField()
-    apg_total = models.FloatField()
-    bpg_total = models.FloatField()
-    drpg_total = models.FloatField()
-    fga_total = models.FloatField()
-    fta_total = models.FloatField()
-    orpg_total = models.FloatField()
-    ppg_total = models.FloatField()
-    spg_total = models.FloatField()
-    tpg_total = models.FloatField()
-    rpg_total = models.FloatField()
-    two_p_total = models.FloatField()
-    two_pa_total = models.FloatField()
-    three_p_total = models.FloatField()
-    three_pa_total = models.FloatField()
-    fg_pct = models.FloatField(null=True)
-    ft_pct = models.FloatField(null=True)
-    two_p_pct = models.FloatField(null=True)
-    three_p_pct = models.FloatField(null=True)
-    ts_pct = models.FloatField(null=True)
+class CurrentSeasonPlayerStatsViewMixin(PlayerStatsViewMixin):
+    SCOPE = PlayerStatsScope.CURRENT_SEASON
+
+    objects = ScopedPlayerStatsManager()
 
     class Meta:
         abstract = True
 
 
 class CurrentSeasonPlayerStatsView(CurrentSeasonPlayerStatsViewMixin):
+    TOKEN_TIER = 0
+
     class Meta:
         managed = False
-        db_table = "view_current_season_player_stats"
+        db_table = "view_player_stats"
 
 
 class CurrentSeasonPlayerStatsViewOneToken(CurrentSeasonPlayerStatsViewMixin):
+    TOKEN_TIER = 1
+
     class Meta:
         managed = False
-        db_table = "view_current_season_player_stats_1_token"
+        db_table = "view_player_stats"
 
 
 class CurrentSeasonPlayerStatsViewThreeTokens(CurrentSeasonPlayerStatsViewMixin):
+    TOKEN_TIER = 3
+
     class Meta:
         managed = False
-        db_table = "view_current_season_player_stats_3_tokens"
+        db_table = "view_player_stats"
 
 
 class CurrentSeasonPlayerStatsViewFiveTokens(CurrentSeasonPlayerStatsViewMixin):
+    TOKEN_TIER = 5
+
     class Meta:
         managed = False
-        db_table = "view_current_season_player_stats_5_tokens"
+        db_table = "view_player_stats"
 
 
-class PlayerStatsViewManager(models.Manager):
+class PlayerStatsViewManager(ScopedPlayerStatsManager):
     def by_player_uuid(self, player_id):
         try:
             return self.get(player_id=player_id)
@@ -182,6 +182,12 @@ class Player(models.Model):
     canonical = models.CharField(max_length=128, blank=True, default="")
     age = models.IntegerField()
     star_rating = models.IntegerField()
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Hash of the simulator data last synced for this player",
+    )
 
     # stats
     g = models.DecimalField(
@@ -500,7 +506,47 @@ class PlayByPlay(models.Model):
     simulation = models.OneToOneField(
         Simulation, on_delete=models.PROTECT, related_name="play_by_play"
     )
+    # Feeds are stored in chunks, see simulator.play_by_play. The JSON feed
+    # is only set for games played before chunks existed, until they are
+    # compacted.
     feed = models.TextField(null=True)
+    event_count = models.PositiveIntegerField(null=True)
+
+
+class PlayByPlayChunk(models.Model):
+    play_by_play = models.ForeignKey(
+        PlayByPlay, on_delete=models.CASCADE, related_name="chunks"
+    )
+    start = models.PositiveIntegerField(
+        help_text="The offset of the first event of the chunk in the feed."
+    )
+    count = models.PositiveSmallIntegerField()
+    quarter = models.SmallIntegerField(null=True)
+    data = models.BinaryField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["play_by_play", "start"], name="unique_play_by_play_chunk"
+            )
+        ]
+
+
+class ResultArchive(models.Model):
+    # The result payload of a simulation as the simulator returned it, without
+    # its play-by-play, which is stored in PlayByPlayChunks. See
+    # simulator.archive.
+    simulation = models.OneToOneField(
+        Simulation,
+        to_field="uuid",
+        on_delete=models.PROTECT,
+        related_name="result_archive",
+    )
+    content_hash = models.CharField(
+        max_length=64, help_text="SHA-256 of the JSON of the payload"
+    )
+    data = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
 
 
 class BaseGameStats(models.Model):
@@ -677,3 +723,93 @@ class HistoricalPlayerStats(models.Model):
 
     class Meta:
         unique_together = ("season", "player")
+
+
+class StatsScope(models.TextChoices):
+    ALL_TIME = "all_time"
+    CURRENT_SEASON = "current_season"
+
+
+class BaseStatsAggregate(models.Model):
+    """
+    Running counts and sums of the game stats of public games per scope and
+    token tier. Rows are incremented as game stats are written (see
+    simulator.aggregates) and averages are derived on read by the stats views.
+    """
+
+    scope = models.CharField(max_length=16, choices=StatsScope.choices)
+    token_tier = models.IntegerField(help_text="0 for games of any contest")
+    count = models.IntegerField(default=0)
+    wins = models.IntegerField(default=0)
+    losses = models.IntegerField(default=0)
+    fg = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    ft = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    pf = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    ast = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    blk = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    drb = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    fga = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    fta = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    orb = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    pts = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    stl = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    tov = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    trb = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    two_p = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    two_pa = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    three_p = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    three_pa = models.DecimalField(max_digits=30, decimal_places=10, default=0)
+    # Game stats are nullable, so averages divide by the number of games each
+    # stat was recorded in
+    fg_count = models.IntegerField(default=0)
+    ft_count = models.IntegerField(default=0)
+    pf_count = models.IntegerField(default=0)
+    ast_count = models.IntegerField(default=0)
+    blk_count = models.IntegerField(default=0)
+    drb_count = models.IntegerField(default=0)
+    fga_count = models.IntegerField(default=0)
+    fta_count = models.IntegerField(default=0)
+    orb_count = models.IntegerField(default=0)
+    pts_count = models.IntegerField(default=0)
+    stl_count = models.IntegerField(default=0)
+    tov_count = models.IntegerField(default=0)
+    trb_count = models.IntegerField(default=0)
+    two_p_count = models.IntegerField(default=0)
+    two_pa_count = models.IntegerField(default=0)
+    three_p_count = models.IntegerField(default=0)
+    three_pa_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class PlayerStatsAggregate(BaseStatsAggregate):
+    player = models.ForeignKey(
+        "simulator.Player",
+        to_field="uuid",
+        on_delete=models.CASCADE,
+        related_name="stats_aggregates",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player", "scope", "token_tier"],
+                name="unique_player_stats_aggregate",
+            )
+        ]
+
+
+class TeamStatsAggregate(BaseStatsAggregate):
+    team = models.ForeignKey(
+        "game.Team", on_delete=models.CASCADE, related_name="stats_aggregates"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "scope", "token_tier"],
+                name="unique_team_stats_aggregate",
+            )
+        ]
@@ -0,0 +1,142 @@
+"""Compact storage of play-by-play feeds.
+
+A feed is stored as PlayByPlayChunk rows of up to CHUNK_SIZE consecutive events
+of the same quarter. A chunk holds the zlib compressed JSON of its events, which
+compresses to a seventh or so of the JSON feed: the keys of every event and the
+aliases the feed adds to the simulator's keys repeat throughout a chunk.
+
+Responses are assembled from the JSON of the chunks as it is stored, so serving
+a feed doesn't decode and re-encode its events, and a window of a feed, a
+quarter or a range of offsets, only fetches and decompresses the chunks that
+overlap it. Feeds saved before chunks existed are read from PlayByPlay.feed.
+"""
+import json
+import zlib
+
+import pgbulk
+from django.db import transaction
+from django.db.models import F
+
+import simulator.models
+
+CHUNK_SIZE = 100
+
+# Key added to every event -> simulator key it copies
+ALIASES = {"possession": "Possession", "detail": "pbp_string"}
+
+
+def map_events(play_by_play):
+    """Adds the aliases of the simulator keys to the events of a feed"""
+    events = [dict(event) for event in play_by_play or []]
+    for event in events:
+        for alias, key in ALIASES.items():
+            event[alias] = event.get(key)
+    return events
+
+
+def _dumps(events):
+    return json.dumps(events, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def build_chunks(events):
+    """Splits the events of a feed into PlayByPlayChunks, at most CHUNK_SIZE long
+    and never spanning quarters"""
+    chunks = []
+    start = 0
+    while start < len(events):
+        quarter = events[start].get("quarter")
+        end = start + 1
+        while (
+            end < len(events)
+            and end - start < CHUNK_SIZE
+            and events[end].get("quarter") == quarter
+        ):
+            end += 1
+        chunks.append(
+            simulator.models.PlayByPlayChunk(
+                start=start,
+                count=end - start,
+                quarter=quarter if isinstance(quarter, int) else None,
+                data=zlib.compress(_dumps(events[start:end]), 9),
+            )
+        )
+        start = end
+    return chunks
+
+
+def save(play_by_play, events):
+    """Stores the events of a feed in the chunks of play_by_play"""
+    save_many([(play_by_play, events)])
+    return play_by_play
+
+
+@transaction.atomic
+def save_many(feeds):
+    """Stores the events of many feeds, (play_by_play, events) pairs, with a
+    statement per table"""
+    for play_by_play, events in feeds:
+        play_by_play.feed = None
+        play_by_play.event_count = len(events)
+    saved = [play_by_play for play_by_play, _ in feeds if play_by_play.pk]
+    if saved:
+        pgbulk.update(simulator.models.PlayByPlay, saved, ["feed", "event_count"])
+        simulator.models.PlayByPlayChunk.objects.filter(play_by_play__in=saved).delete()
+    simulator.models.PlayByPlay.objects.bulk_create(
+        [play_by_play for play_by_play, _ in feeds if not play_by_play.pk]
+    )
+
+    chunks = []
+    for play_by_play, events in feeds:
+        for chunk in build_chunks(events):
+            chunk.play_by_play = play_by_play
+            chunks.append(chunk)
+    simulator.models.PlayByPlayChunk.objects.bulk_create(chunks)
+
+
+def read_json(play_by_play, quarter=None, offset=0, limit=None):
+    """Returns the JSON array of the events of a feed from offset on, at most
+    limit of them, and only those of the given quarter if one is given"""
+    stop = None if limit is None else offset + limit
+    if play_by_play.event_count is None:
+        feed = json.loads(play_by_play.feed or "[]")
+        return _dumps(
+            [
+                event
+                for event in feed[offset:stop]
+                if quarter is None or event.get("quarter") == quarter
+            ]
+        )
+
+    chunks = (
+        play_by_play.chunks.alias(end=F("start") + F("count"))
+        .filter(end__gt=offset)
+        .order_by("start")
+    )
+    if stop is not None:
+        chunks = chunks.filter(start__lt=stop)
+    if quarter is not None:
+        chunks = chunks.filter(quarter=quarter)
+
+    fragments = []
+    for chunk in chunks:
+        data = zlib.decompress(chunk.data)
+        first = max(offset - chunk.start, 0)
+        last = None if stop is None else stop - chunk.start
+        if first > 0 or (last is not None and last < chunk.count):
+            # Only the chunks at the edges of a window are decoded, to cut them
+            data = _dumps(json.loads(data)[first:last])
+        # The events of the chunk without the brackets of its array
+        fragments.append(data[1:-1])
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def read_events(play_by_play, quarter=None, offset=0, limit=None):
+    """The events of a feed, see read_json"""
+    return json.loads(read_json(play_by_play, quarter, offset, limit))
+
+
+def count_events(play_by_play):
+    """The number of events of a feed"""
+    if play_by_play.event_count is None:
+        return len(json.loads(play_by_play.feed or "[]"))
+    return play_by_play.event_count
@@ -1,17 +1,26 @@
+import concurrent.futures
 import datetime as dt
+import hashlib
 import json
 import logging
+import time
 import traceback
 
 import pgbulk
 from django.conf import settings
-from django.db import models, transaction
+from django.db import models
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 import comm.handlers
+import game.game_cache
+import game.leaderboard_cache
 import game.models
+import simulator.backfill
 import simulator.client
+import simulator.ingestion
 import simulator.models
+import simulator.play_by_play
 import simulator.utils
 import utils.db
 from signals.signals import game_simulation_status_updated
@@ -19,50 +28,135 @@ from signals.signals import game_simulation_status_updated
 LOGGER = logging.getLogger(__name__)
 
 
+SYNC_PLAYERS_BATCH_SIZE = 1000
+SYNC_PLAYERS_CURSOR_OVERLAP = dt.timedelta(minutes=10)
+
+
+def _map_player(player, player_fields):
+    """Maps the simulator data of a player to simulator.Player field values"""
+    return {
+        **player["attributes"],
+        **player["visual_attributes"],
+        **{field: player[field] for field in player_fields if field in player},
+        **{
+            "top_attribute_{}".format(index): top_attribute
+            for index, top_attribute in enumerate(player["top_attributes"], start=1)
+        },
+        **{
+            "position_{}".format(index): position
+            for index, position in enumerate(player["positions"], start=1)
+        },
+        "full_name": player["full_name"],
+    }
+
+
+def _content_hash(mapped_player):
+    return hashlib.sha256(
+        json.dumps(mapped_player, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _upsert_changed_players(mapped_players):
+    """Upserts the players whose content hash differs from the stored one.
+
+    Only the fields sent by the simulator are updated so that data maintained
+    locally (e.g. stats and prior tokens) is left alone.
+
+    Returns:
+        int: the number of players written
+    """
+    for mapped_player in mapped_players:
+        mapped_player["content_hash"] = _content_hash(mapped_player)
+
+    stored_hashes = {
+        str(uuid): content_hash
+        for uuid, content_hash in simulator.models.Player.objects.filter(
+            uuid__in=[mapped_player["uuid"] for mapped_player in mapped_players]
+        ).values_list("uuid", "content_hash")
+    }
+    changed = [
+        mapped_player
+        for mapped_player in mapped_players
+        if stored_hashes.get(str(mapped_player["uuid"]))
+        != mapped_player["content_hash"]
+    ]
+    if changed:
+        update_fields = sorted(
+            {field for mapped_player in changed for field in mapped_player} - {"uuid"}
+        )
+        pgbulk.upsert(
+            simulator.models.Player,
+            [simulator.models.Player(**mapped_player) for mapped_player in changed],
+            ["uuid"],
+            update_fields,
+        )
+
+    return len(changed)
+
+
 @utils.db.mutex
-def sync_players(download=False):
-    """Syncs all players to the database.
+def sync_players(download=False, full=False):
+    """Syncs players to the database.
+
+    Players are streamed from the simulator and upserted in batches. Players
+    whose data has not changed since the last sync are skipped.
+
+    By default the sync is incremental: only players updated in the simulator
+    since the latest updated_at already synced are fetched. The cursor is
+    moved back by SYNC_PLAYERS_CURSOR_OVERLAP to pick up updates committed out
+    of order; those are cheap since unchanged players are skipped by hash.
 
-    TODO: When the simulator maintains an "updated_at" column, we can
-    more intellegently sync only plyers that have changed. For now
-    we sync all
+    Args:
+        full (bool): fetch every player instead. Needed when players may have
+            been missed, e.g. after widening the accessible token range.
     """
 
     simulator_client = simulator.client.get()
     player_fields = {field.name for field in simulator.models.Player._meta.fields}
 
-    player_data = simulator_client.players()
-    players = []
-    for player in player_data:
+    updated_since = None
+    if not full:
+        cursor = simulator.models.Player.objects.aggregate(
+            cursor=models.Max("updated_at")
+        )["cursor"]
+        if cursor:
+            updated_since = cursor - SYNC_PLAYERS_CURSOR_OVERLAP
+
+    synced = written = 0
+    batch = []
+    for player in simulator_client.players(updated_since=updated_since):
+        if (
+            updated_since
+            and player.get("updated_at")
+            and parse_datetime(player["updated_at"]) <= updated_since
+        ):
+            # In case the simulator does not filter on updated_since
+            continue
+
         if (
             player["token"] >= settings.PLAYER_MIN_TOKEN_ID_ACCESSIBLE
             and player["token"] <= settings.PLAYER_MAX_TOKEN_ID_ACCESSIBLE
         ):
-            mapped_player = simulator.models.Player(
-                **{
-                    **player["attributes"],
-                    **player["visual_attributes"],
-                    **{
-                        field: player[field]
-                        for field in player_fields
-                        if field in player
-                    },  # noqa: E501
-                    **{
-                        "top_attribute_{}".format(index): top_attribute
-                        for index, top_attribute in enumerate(
-                            player["top_attributes"], start=1
-                        )
-                    },
-                    **{
-                        "position_{}".format(index): position
-                        for index, position in enumerate(player["positions"], start=1)
-                    },
-                    "full_name": player["full_name"],
-                }
-            )
-            players.append(mapped_player)
+            batch.append(_map_player(player, player_fields))
+
+        if len(batch) >= SYNC_PLAYERS_BATCH_SIZE:
+            synced += len(batch)
+            written += _upsert_changed_players(batch)
+            batch = []
 
-            pgbulk.upsert(simulator.models.Player, players, ["uuid"])
+    if batch:
+        synced += len(batch)
+        written += _upsert_changed_players(batch)
+
+    if written:
+        game.leaderboard_cache.invalidate(game.leaderboard_cache.PLAYER)
+
+    LOGGER.info(
+        "Synced %s players updated since %s, %s changed",
+        synced,
+        updated_since or "the beginning",
+        written,
+    )
 
 
 @utils.db.mutex
@@ -83,149 +177,151 @@ def create_games(simulation):
     simulation.save(update_fields=["uuid", "status", "updated_at"])
 
 
-def _box_score_obj(box_score):
-    box_score_fields = {field.name for field in simulator.models.BoxScore._meta.fields}
-    return simulator.models.BoxScore(
-        **{key: box_score[key] for key in box_score if key in box_score_fields}
+def _create_game(simulator_client, simulation):
+    return simulator_client.create_game(
+        lineup_1_players=simulation.lineup_1_uuids,
+        lineup_2_players=simulation.lineup_2_uuids,
+        is_published=simulation.game.visibility == game.models.Game.Visibility.PUBLIC,
     )
 
 
-def _map_play_by_play(play_by_play):
-    transformed_play_by_play = play_by_play[:]
-    for play in transformed_play_by_play:
-        play["possession"] = play.get("Possession")
-        play["detail"] = play.get("pbp_string")
+def create_games_concurrently(simulations, concurrency=None):
+    """Create the games of many simulations in the simulator
 
-    return json.dumps(play_by_play)
+    The simulator creates one game per request, so up to ``concurrency``
+    requests, by default SIMULATOR_CREATE_CONCURRENCY, are in flight at a time
+    and the simulations created are saved with a single statement. Simulations
+    need their game loaded. Returns the simulations the simulator failed to
+    create, whose errors are logged.
+    """
+    concurrency = concurrency or settings.SIMULATOR_CREATE_CONCURRENCY
+    simulator_client = simulator.client.get()
+    created = []
+    failed = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(_create_game, simulator_client, simulation)
+            for simulation in simulations
+        ]
+        for simulation, future in zip(simulations, futures):
+            try:
+                simulation.uuid = future.result()["uuid"]
+            except Exception:
+                LOGGER.exception(
+                    "Error creating the game of simulation %s", simulation.id
+                )
+                failed.append(simulation)
+            else:
+                simulation.status = simulator.models.Simulation.Status.PENDING
+                simulation.updated_at = timezone.now()
+                created.append(simulation)
+
+    pgbulk.update(
+        simulator.models.Simulation, created, ["uuid", "status", "updated_at"]
+    )
+    return failed
 
 
-@transaction.atomic
 def finalize_game(simulator_client, simulation_obj, game_results_payload):
-    # insert challengers boxscore results
-    lineup_1_box_scores = [
-        _box_score_obj(box_score)
-        for box_score in game_results_payload["totals"]
-        if box_score["Team"] == "Challengers"
-    ]
-    assert len(lineup_1_box_scores) == 1
-    simulator.models.BoxScore.objects.bulk_create(lineup_1_box_scores)
+    simulator.ingestion.ingest(
+        simulator_client,
+        [simulator.ingestion.parse(simulation_obj, game_results_payload)],
+    )
+
+
+def _retrieve_by_uuid(fetch, simulations):
+    response = fetch([simulation.uuid for simulation in simulations])
+    return {str(entry["uuid"]): entry for entry in response["results"]}
 
-    # insert individual challengers player boxscore results
-    lineup_1_player_box_scores = {
-        game_results_payload["players"][box_score["canonical"]]["uuid"]: _box_score_obj(
-            box_score
-        )
-        for box_score in game_results_payload["challengers_boxscore"]
-    }
 
-    assert len(lineup_1_player_box_scores) == 5
-    simulator.models.BoxScore.objects.bulk_create(lineup_1_player_box_scores.values())
+def retrieve_concurrently(fetch, simulations, *, concurrency, deadline, batch_size):
+    """Fetch simulator data for simulations in batches using a bounded thread pool
 
-    # insert challenged boxscore results
-    lineup_2_box_scores = [
-        _box_score_obj(box_score)
-        for box_score in game_results_payload["totals"]
-        if box_score["Team"] == "Challenged"
+    ``fetch`` is a batch client method such as ``retrieve_games``. Yields
+    ``(simulation, future)`` pairs in order as each batch completes so the caller
+    can process simulations serially on its own thread (and DB connection).
+    ``future.result()`` maps simulation uuid strings to the simulator's entries.
+    Iteration stops at ``deadline``, a ``time.monotonic()`` timestamp or None to
+    wait for every batch, and any batches that have not started are cancelled.
+    """
+    batches = [
+        simulations[x : x + batch_size]  # noqa: E203
+        for x in range(0, len(simulations), batch_size)
     ]
-    assert len(lineup_2_box_scores) == 1
-    simulator.models.BoxScore.objects.bulk_create(lineup_2_box_scores)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+    futures = [executor.submit(_retrieve_by_uuid, fetch, batch) for batch in batches]
 
-    # insert individual challenged player boxscore results
-    lineup_2_player_box_scores = {
-        game_results_payload["players"][box_score["canonical"]]["uuid"]: _box_score_obj(
-            box_score
-        )
-        for box_score in game_results_payload["challenged_boxscore"]
-    }
-    assert len(lineup_2_player_box_scores) == 5
-    simulator.models.BoxScore.objects.bulk_create(lineup_2_player_box_scores.values())
-
-    # create results object and link to simulation object
-    simulation_obj.result = simulator.models.Result.objects.create(
-        lineup_1_score=lineup_1_box_scores[0].pts,
-        lineup_2_score=lineup_2_box_scores[0].pts,
-        lineup_1_box_score=lineup_1_box_scores[0],
-        lineup_1_player_1_box_score=lineup_1_player_box_scores[
-            str(simulation_obj.lineup_1_uuids[0])
-        ],
-        lineup_1_player_2_box_score=lineup_1_player_box_scores[
-            str(simulation_obj.lineup_1_uuids[1])
-        ],
-        lineup_1_player_3_box_score=lineup_1_player_box_scores[
-            str(simulation_obj.lineup_1_uuids[2])
-        ],
-        lineup_1_player_4_box_score=lineup_1_player_box_scores[
-            str(simulation_obj.lineup_1_uuids[3])
-        ],
-        lineup_1_player_5_box_score=lineup_1_player_box_scores[
-            str(simulation_obj.lineup_1_uuids[4])
-        ],
-        lineup_2_box_score=lineup_2_box_scores[0],
-        lineup_2_player_1_box_score=lineup_2_player_box_scores[
-            str(simulation_obj.lineup_2_uuids[0])
-        ],
-        lineup_2_player_2_box_score=lineup_2_player_box_scores[
-            str(simulation_obj.lineup_2_uuids[1])
-        ],
-        lineup_2_player_3_box_score=lineup_2_player_box_scores[
-            str(simulation_obj.lineup_2_uuids[2])
-        ],
-        lineup_2_player_4_box_score=lineup_2_player_box_scores[
-            str(simulation_obj.lineup_2_uuids[3])
-        ],
-        lineup_2_player_5_box_score=lineup_2_player_box_scores[
-            str(simulation_obj.lineup_2_uuids[4])
-        ],
-    )
+    try:
+        num_yielded = 0
+        for batch, future in zip(batches, futures):
+            done, _ = concurrent.futures.wait(
+                [future],
+                timeout=None
+                if deadline is None
+                else max(deadline - time.monotonic(), 0),
+            )
+            if not done:
+                LOGGER.warning(
+                    "Deadline reached, deferring %s simulations to the next run",
+                    len(simulations) - num_yielded,
+                )
+                break
 
-    simulation_obj.status = simulator.models.Simulation.Status.FINISHED
-    simulation_obj.save(update_fields=["status", "result", "updated_at"])
+            for simulation in batch:
+                yield simulation, future
+            num_yielded += len(batch)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    simulator.utils.update_simulator_player_stats(
-        simulator_client,
-        player_uuids=[str(uuid) for uuid in simulation_obj.lineup_1_uuids]
-        + [str(uuid) for uuid in simulation_obj.lineup_2_uuids],
-    )
 
-    if simulation_obj.game.contest.kind == game.models.Contest.Kind.HEAD_TO_HEAD:
-        simulator.utils.update_team_stats(simulation_obj)
+def _record_simulation_error(simulation_obj, max_retry):
+    LOGGER.exception(
+        "Error updating simulation %s %s",
+        simulation_obj.id,
+        simulation_obj.uuid,
+    )
+    simulation_obj.num_retries += 1
+    simulation_obj.status = simulator.models.Simulation.Status.ERRORED
+    if simulation_obj.num_retries >= max_retry:
+        simulation_obj.status = simulator.models.Simulation.Status.TERMINAL_ERROR
 
-    simulator.models.PlayByPlay(
-        simulation=simulation_obj,
-        feed=_map_play_by_play(game_results_payload.get("pbp")),
-    ).save()
+    simulation_obj.next_retry_at = timezone.now() + dt.timedelta(
+        minutes=(5 * simulation_obj.num_retries)
+    )
+    simulation_obj.error_msg = traceback.format_exc()
+    simulation_obj.save(
+        update_fields=[
+            "status",
+            "updated_at",
+            "num_retries",
+            "next_retry_at",
+            "error_msg",
+        ]
+    )
 
-    try:
-        simulator.utils.insert_player_game_stats_entries(
-            simulation_obj, game_results_payload
-        )
-    except Exception:
-        LOGGER.exception(
-            "Error updating player game stats %s %s",
-            simulation_obj.id,
-            simulation_obj.uuid,
-        )
 
-    try:
-        simulator.utils.insert_team_game_stats_entries(
-            simulation_obj, game_results_payload
-        )
-    except Exception:
-        LOGGER.exception(
-            "Error updating team game stats %s %s",
-            simulation_obj.id,
-            simulation_obj.uuid,
-        )
+def _send_simulation_status_updated(simulation_obj):
+    game_simulation_status_updated.send(
+        "update_games",
+        simulation_uuid=simulation_obj.uuid,
+        status=simulation_obj.status,
+    )
 
 
 @utils.db.mutex
-def update_games():
+def update_games(concurrency=None, deadline=None):
     """Fetch pending game results from the simulator
 
-    Note - this doesn't hit the simulator service yet. We will handle error checking
-    once the simulator service is integrated.
+    Statuses are polled in batches and full game payloads are only downloaded
+    for simulations that have finished. Both are fetched with up to
+    ``concurrency`` requests in flight while downloaded games are finalized in
+    batches of SIMULATOR_POLL_GAME_BATCH_SIZE (see simulator/ingestion.py).
+    A run stops after ``deadline`` seconds, leaving the remaining simulations for
+    the next run. Both default to the SIMULATOR_POLL_* settings.
     """
     MAX_RETRY = 5
+    concurrency = concurrency or settings.SIMULATOR_POLL_CONCURRENCY
+    deadline = time.monotonic() + (deadline or settings.SIMULATOR_POLL_DEADLINE_SECONDS)
     simulator_client = simulator.client.get()
     unfinished_or_errored = simulator.models.Simulation.objects.filter(
         models.Q(
@@ -247,40 +343,30 @@ def update_games():
         "FINISHED": simulator.models.Simulation.Status.FINISHED,
     }
 
-    for simulation_obj in unfinished_or_errored:
+    finished = []
+    statuses = retrieve_concurrently(
+        simulator_client.retrieve_game_statuses,
+        list(unfinished_or_errored),
+        concurrency=concurrency,
+        deadline=deadline,
+        batch_size=settings.SIMULATOR_POLL_STATUS_BATCH_SIZE,
+    )
+    for simulation_obj, future in statuses:
         try:
-            result = simulator_client.retrieve_game(simulation_obj.uuid)
+            result = future.result()[str(simulation_obj.uuid)]
             status = status_map.get(result["status"])
 
-            if status != simulation_obj.status:
+            if status == simulator.models.Simulation.Status.FINISHED:
+                # Finalized below, once the full payload is downloaded
+                finished.append(simulation_obj)
+                continue
+            elif status != simulation_obj.status:
                 if status in (
                     simulator.models.Simulation.Status.PENDING,
                     simulator.models.Simulation.Status.STARTED,
                 ):
                     simulation_obj.status = status
                     simulation_obj.save(update_fields=["updated_at", "status"])
-                elif status == simulator.models.Simulation.Status.FINISHED:
-                    finalize_game(simulator_client, simulation_obj, result["result"])
-
-                    # Important to only communicate games
-                    # that are not visible. Be extra careful about
-                    # situations where we pre-simulate (eg tournaments)
-                    if (
-                        simulation_obj.game.contest.kind
-                        == game.models.Contest.Kind.HEAD_TO_HEAD_MATCH_MAKE
-                        or simulation_obj.game.contest.kind
-                        == game.models.Contest.Kind.HEAD_TO_HEAD
-                    ):
-                        # Purposely swallowing this exception
-                        # else it will get caught below and mess up the
-                        # status of the game when it shouldn't
-                        try:
-                            comm.handlers.game_complete_handler(simulation_obj.game)
-                        except Exception:
-                            LOGGER.exception(
-                                "Error with game_complete_handler",
-                            )
-
                 else:
                     raise AssertionError(
                         f"Unsupported status \"{result['status']}\" returned"
@@ -291,37 +377,79 @@ def update_games():
                 simulation_obj.save(update_fields=["updated_at", "status"])
 
         except Exception:
-            LOGGER.exception(
-                "Error updating simulation %s %s",
-                simulation_obj.id,
-                simulation_obj.uuid,
+            _record_simulation_error(simulation_obj, MAX_RETRY)
+
+        _send_simulation_status_updated(simulation_obj)
+
+    games = retrieve_concurrently(
+        simulator_client.retrieve_games,
+        finished,
+        concurrency=concurrency,
+        deadline=deadline,
+        batch_size=settings.SIMULATOR_POLL_GAME_BATCH_SIZE,
+    )
+    parsed_games = []
+    for simulation_obj, future in games:
+        try:
+            result = future.result()[str(simulation_obj.uuid)]
+            parsed_games.append(
+                simulator.ingestion.parse(simulation_obj, result["result"])
             )
-            simulation_obj.num_retries += 1
-            simulation_obj.status = simulator.models.Simulation.Status.ERRORED
-            if simulation_obj.num_retries >= MAX_RETRY:
-                simulation_obj.status = (
-                    simulator.models.Simulation.Status.TERMINAL_ERROR
+        except Exception:
+            _record_simulation_error(simulation_obj, MAX_RETRY)
+            _send_simulation_status_updated(simulation_obj)
+
+        if len(parsed_games) >= settings.SIMULATOR_POLL_GAME_BATCH_SIZE:
+            _finalize_games(simulator_client, parsed_games, MAX_RETRY)
+            parsed_games = []
+    _finalize_games(simulator_client, parsed_games, MAX_RETRY)
+
+
+def _finalize_games(simulator_client, parsed_games, max_retry):
+    """Finalizes parsed games together, or one at a time if that fails so that a
+    bad game doesn't fail the others"""
+    if not parsed_games:
+        return
+
+    try:
+        simulator.ingestion.ingest(simulator_client, parsed_games)
+        finalized = parsed_games
+    except Exception:
+        LOGGER.exception("Error finalizing %s games together", len(parsed_games))
+        finalized = []
+        for parsed in parsed_games:
+            try:
+                # Parsed again as the rows of the batch were not written
+                simulator.ingestion.ingest(
+                    simulator_client,
+                    [simulator.ingestion.parse(parsed.simulation, parsed.payload)],
+                )
+                finalized.append(parsed)
+            except Exception:
+                _record_simulation_error(parsed.simulation, max_retry)
+
+    for parsed in finalized:
+        simulation_obj = parsed.simulation
+        # Important to only communicate games
+        # that are not visible. Be extra careful about
+        # situations where we pre-simulate (eg tournaments)
+        if (
+            simulation_obj.game.contest.kind
+            == game.models.Contest.Kind.HEAD_TO_HEAD_MATCH_MAKE
+            or simulation_obj.game.contest.kind == game.models.Contest.Kind.HEAD_TO_HEAD
+        ):
+            # Purposely swallowing this exception
+            # else it would mess up the status of the game
+            # when it shouldn't
+            try:
+                comm.handlers.game_complete_handler(simulation_obj.game)
+            except Exception:
+                LOGGER.exception(
+                    "Error with game_complete_handler",
                 )
 
-            simulation_obj.next_retry_at = timezone.now() + dt.timedelta(
-                minutes=(5 * simulation_obj.num_retries)
-            )
-            simulation_obj.error_msg = traceback.format_exc()
-            simulation_obj.save(
-                update_fields=[
-                    "status",
-                    "updated_at",
-                    "num_retries",
-                    "next_retry_at",
-                    "error_msg",
-                ]
-            )
-        finally:
-            game_simulation_status_updated.send(
-                "update_games",
-                simulation_uuid=simulation_obj.uuid,
-                status=simulation_obj.status,
-            )
+    for parsed in parsed_games:
+        _send_simulation_status_updated(parsed.simulation)
 
 
 def sum_aggregate_box_score(aggregates, box_score):
@@ -353,48 +481,15 @@ def calculate_players_stats():
         )
 
 
-def build_player_game_stats():
-    simulator_client = simulator.client.get()
-    subquery = (
-        simulator.models.PlayerGameStats.objects.filter(
-            simulation_id=models.OuterRef("uuid")
-        )
-        .values("simulation_id")
-        .annotate(simulation_id_count=models.Count("simulation_id"))
-        .filter(simulation_id_count=10)
-        .values("simulation_id")
-    )
-    simulations = (
-        simulator.models.Simulation.objects.filter(
-            status=simulator.models.Simulation.Status.FINISHED
-        )
-        .exclude(uuid__in=models.Subquery(subquery))
-        .order_by("-created_at")
+def build_player_game_stats(**kwargs):
+    """Backfills missing player game stats, see simulator/backfill.py"""
+    return simulator.backfill.backfill_game_stats(
+        simulator.models.PlayerGameStats, **kwargs
     )
-    for simulation in simulations:
-        game = simulator_client.retrieve_game(uuid=simulation.uuid)
-        simulator.utils.insert_player_game_stats_entries(simulation, game["result"])
 
 
-def build_team_game_stats():
-    simulator_client = simulator.client.get()
-    subquery = (
-        simulator.models.TeamGameStats.objects.filter(
-            simulation_id=models.OuterRef("uuid")
-        )
-        .values("simulation_id")
-        .annotate(simulation_id_count=models.Count("simulation_id"))
-        .filter(simulation_id_count=2)
-        .values("simulation_id")
-    )
-    simulations = (
-        simulator.models.Simulation.objects.filter(
-            status=simulator.models.Simulation.Status.FINISHED
-        )
-        .exclude(uuid__in=models.Subquery(subquery))
-        .select_related("game__lineup_1__team", "game__lineup_2__team")
-        .order_by("-created_at")
+def build_team_game_stats(**kwargs):
+    """Backfills missing team game stats, see simulator/backfill.py"""
+    return simulator.backfill.backfill_game_stats(
+        simulator.models.TeamGameStats, **kwargs
     )
-    for simulation in simulations:
-        game = simulator_client.retrieve_game(uuid=simulation.uuid)
-        simulator.utils.insert_team_game_stats_entries(simulation, game["result"])
@@ -32,69 +32,3 @@ def validate_player_agg_stats():
 def calc_players_stats():
     LOGGER.info("calculate player stats...")
     call_command("calc_players_stats")
-
-
-@swoops.celery.app.task()
-def refresh_view_current_season_player_stats():
-    LOGGER.info("Refreshing view_current_season_player_stats...")
-    call_command("refresh_view_current_season_player_stats")
-
-
-@swoops.celery.app.task()
-def refresh_view_all_time_player_stats():
-    LOGGER.info("Refreshing view_all_time_player_stats...")
-    call_command("refresh_view_all_time_player_stats")
-
-
-@swoops.celery.app.task()
-def refresh_view_all_time_team_stats():
-    LOGGER.info("Refreshing view_all_time_team_stats...")
-    call_command("refresh_view_all_time_team_stats")
-
-
-@swoops.celery.app.task()
-def refresh_view_current_season_player_stats_1_token():
-    LOGGER.info("Refreshing view_current_season_player_stats...")
-    call_command("refresh_view_current_season_player_stats_1_token")
-
-
-@swoops.celery.app.task()
-def refresh_view_all_time_player_stats_1_token():
-    LOGGER.info("Refreshing view_all_time_player_stats...")
-    call_command("refresh_view_all_time_player_stats_1_token")
-
-
-@swoops.celery.app.task()
-def refresh_view_current_season_player_stats_3_tokens():
-    LOGGER.info("Refreshing view_current_season_player_stats...")
-    call_command("refresh_view_current_season_player_stats_3_tokens")
-
-
-@swoops.celery.app.task()
-def refresh_view_all_time_player_stats_3_tokens():
-    LOGGER.info("Refreshing view_all_time_player_stats...")
-    call_command("refresh_view_all_time_player_stats_3_tokens")
-
-
-@swoops.celery.app.task()
-def refresh_view_current_season_player_stats_5_tokens():
-    LOGGER.info("Refreshing view_current_season_player_stats...")
-    call_command("refresh_view_current_season_player_stats_5_tokens")
-
-
-@swoops.celery.app.task()
-def refresh_view_all_time_player_stats_5_tokens():
-    LOGGER.info("Refreshing view_all_time_player_stats...")
-    call_command("refresh_view_all_time_player_stats_5_tokens")
-
-
-@swoops.celery.app.task()
-def refresh_view_current_season_team_leaderboard():
-    LOGGER.info("Refreshing refresh_view_current_season_team_leaderboard...")
-    call_command("refresh_view_current_season_team_leaderboard")
-
-
-@swoops.celery.app.task()
-def refresh_view_current_season_team_sp():
-    LOGGER.info("Refreshing refresh_view_current_season_team_sp...")
-    call_command("refresh_view_current_season_team_sp")
@@ -0,0 +1,191 @@
+import datetime as dt
+import uuid
+
+import ddf
+import pytest
+from django.db import connection
+
+import game.models
+import simulator.aggregates
+import simulator.model_views
+import simulator.models
+import simulator.utils
+
+STATS_LINE = {
+    "fg": 4,
+    "ft": 2,
+    "pf": 1,
+    "ast": 3,
+    "blk": 1,
+    "drb": 2,
+    "fga": 8,
+    "fta": 2,
+    "orb": 1,
+    "stl": 1,
+    "tov": 2,
+    "trb": 3,
+    "two_p": 3,
+    "fg_pct": 0.5,
+    "ft_pct": 1,
+    "two_pa": 5,
+    "three_p": 1,
+    "three_pa": 3,
+    "two_p_pct": 0.6,
+    "three_p_pct": 0.33,
+}
+
+
+def game_result(player_1, player_2, pts_1, pts_2):
+    """A simulator game result with one player per team"""
+    return {
+        "players": {
+            "player_1": {"uuid": str(player_1.uuid)},
+            "player_2": {"uuid": str(player_2.uuid)},
+        },
+        "combined_boxscore": [
+            STATS_LINE | {"canonical": "player_1", "Team": "Challengers", "pts": pts_1},
+            STATS_LINE | {"canonical": "player_2", "Team": "Challenged", "pts": pts_2},
+        ],
+        "totals": [
+            STATS_LINE | {"Team": "Challengers", "pts": pts_1},
+            STATS_LINE | {"Team": "Challenged", "pts": pts_2},
+        ],
+    }
+
+
+def simulated_game(tokens_required=None, **kwargs):
+    simulation = ddf.G("simulator.Simulation", uuid=uuid.uuid4())
+    return ddf.G(
+        "game.Game",
+        contest=ddf.G(
+            "game.Contest",
+            kind=game.models.Contest.Kind.HEAD_TO_HEAD,
+            tokens_required=tokens_required,
+        ),
+        simulation=simulation,
+        lineup_1=ddf.G("game.Lineup", team=ddf.G("game.Team")),
+        lineup_2=ddf.G("game.Lineup", team=ddf.G("game.Team")),
+        **kwargs,
+    )
+
+
+def player_stats(player, scope="all_time", token_tier=0):
+    return simulator.model_views.PlayerStatsView.objects.filter(
+        player_id=player.uuid, scope=scope, token_tier=token_tier
+    ).first()
+
+
+@pytest.mark.django_db
+def test_insert_game_stats_entries_updates_aggregates():
+    player_1 = ddf.G("simulator.Player")
+    player_2 = ddf.G("simulator.Player")
+    game_1 = simulated_game(tokens_required=3)
+    game_2 = simulated_game()
+
+    for my_game, pts in [(game_1, (10, 20)), (game_2, (30, 20))]:
+        result = game_result(player_1, player_2, *pts)
+        simulator.utils.insert_player_game_stats_entries(my_game.simulation, result)
+        simulator.utils.insert_team_game_stats_entries(my_game.simulation, result)
+
+    stats = player_stats(player_1)
+    assert (stats.count, stats.wins, stats.losses) == (2, 1, 1)
+    assert stats.ppg == 20
+    assert stats.ppg_total == 40
+    assert stats.fg_pct == 0.5
+    stats = player_stats(player_1, token_tier=3)
+    assert (stats.count, stats.wins, stats.losses) == (1, 0, 1)
+    assert player_stats(player_1, scope="current_season").count == 2
+    assert player_stats(player_1, token_tier=1) is None
+
+    team_stats = simulator.models.TeamStatsAggregate.objects.get(
+        team=game_1.lineup_1.team, scope="all_time", token_tier=0
+    )
+    assert (team_stats.count, team_stats.wins, team_stats.pts) == (1, 0, 10)
+
+    # Simulating a game again replaces its stats
+    simulator.utils.insert_player_game_stats_entries(
+        game_1.simulation, game_result(player_1, player_2, 30, 20)
+    )
+    stats = player_stats(player_1)
+    assert (stats.count, stats.wins, stats.losses) == (2, 2, 0)
+    assert stats.ppg_total == 60
+
+    # The incremental aggregates match a rebuild from scratch
+    aggregates = list(
+        simulator.models.PlayerStatsAggregate.objects.order_by(
+            "player", "scope", "token_tier"
+        ).values("player", "scope", "token_tier", "count", "wins", "pts")
+    )
+    simulator.aggregates.rebuild()
+    assert aggregates == list(
+        simulator.models.PlayerStatsAggregate.objects.order_by(
+            "player", "scope", "token_tier"
+        ).values("player", "scope", "token_tier", "count", "wins", "pts")
+    )
+
+
+@pytest.mark.django_db
+def test_aggregates_skip_games_that_are_not_public():
+    player_1 = ddf.G("simulator.Player")
+    player_2 = ddf.G("simulator.Player")
+    my_game = simulated_game(visibility=game.models.Game.Visibility.STAFF)
+    simulator.models.Simulation.objects.filter(id=my_game.simulation.id).update(
+        created_at=dt.datetime(2023, 1, 1, tzinfo=dt.timezone.utc)
+    )
+
+    simulator.utils.insert_player_game_stats_entries(
+        my_game.simulation, game_result(player_1, player_2, 30, 20)
+    )
+    assert player_stats(player_1) is None
+
+    games = game.models.Game.objects.filter(id=my_game.id)
+    with simulator.aggregates.recount(games.values_list("simulation__uuid", flat=True)):
+        games.update(visibility=game.models.Game.Visibility.PUBLIC)
+
+    stats = player_stats(player_1)
+    assert (stats.count, stats.wins) == (1, 1)
+    # Games of last season only count towards all time stats
+    assert player_stats(player_1, scope="current_season") is None
+
+
+@pytest.mark.django_db
+def test_averages_skip_null_stats():
+    player_1 = ddf.G("simulator.Player")
+    player_2 = ddf.G("simulator.Player")
+
+    my_games = []
+    for pts, blk in [(10, None), (20, 3)]:
+        result = game_result(player_1, player_2, pts, 0)
+        for line in result["combined_boxscore"] + result["totals"]:
+            line["blk"] = blk
+        my_game = simulated_game()
+        my_games.append(my_game)
+        simulator.utils.insert_player_game_stats_entries(my_game.simulation, result)
+        simulator.utils.insert_team_game_stats_entries(my_game.simulation, result)
+
+    stats = player_stats(player_1)
+    assert stats.count == 2
+    assert stats.ppg == 15
+    # As AVG does, the game without blocks is left out of the average
+    assert stats.bpg == 3
+    assert stats.bpg_total == 3
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT ppg, bpg FROM view_team_stats"
+            " WHERE team_id = %s AND scope = 'all_time' AND token_tier = 0",
+            [my_games[0].lineup_1.team_id],
+        )
+        assert cursor.fetchone() == (10, None)
+
+    aggregates = list(
+        simulator.models.PlayerStatsAggregate.objects.order_by(
+            "player", "scope", "token_tier"
+        ).values("player", "scope", "token_tier", "blk", "blk_count", "pts_count")
+    )
+    simulator.aggregates.rebuild()
+    assert aggregates == list(
+        simulator.models.PlayerStatsAggregate.objects.order_by(
+            "player", "scope", "token_tier"
+        ).values("player", "scope", "token_tier", "blk", "blk_count", "pts_count")
+    )
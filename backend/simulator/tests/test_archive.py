@@ -0,0 +1,116 @@
+import uuid
+
+import pytest
+
+import simulator.archive
+import simulator.backfill
+import simulator.client
+import simulator.ingestion
+import simulator.models
+import simulator.play_by_play
+from conftest import build_game, build_game_result, build_lineup, build_user_and_team
+from simulator.client import Client
+
+
+@pytest.fixture(autouse=True)
+def use_real_client(settings, mocker):
+    settings.SIMULATOR_CLIENT = "simulator.client.Client"
+    mocker.patch.object(
+        Client, "create_game", side_effect=lambda **kwargs: {"uuid": uuid.uuid4()}
+    )
+    mocker.patch.object(Client, "retrieve_player_stats", return_value={"results": []})
+
+
+def simulation():
+    _, team_1 = build_user_and_team()
+    _, team_2 = build_user_and_team()
+    return build_game(
+        lineup1=build_lineup(team_1), lineup2=build_lineup(team_2)
+    ).simulation
+
+
+@pytest.mark.django_db
+def test_save_many_only_writes_changed_payloads(django_assert_num_queries):
+    simulation_obj = simulation()
+    payload = build_game_result(simulation_obj, 90, 80)
+
+    written = simulator.archive.save_many([(simulation_obj.uuid, payload)])
+    assert [row.simulation_id for row in written] == [simulation_obj.uuid]
+    archive = simulator.models.ResultArchive.objects.get()
+    assert len(archive.data) < len(simulator.archive._dumps(payload))
+    assert simulator.archive.load(simulation_obj.uuid) == {
+        key: value for key, value in payload.items() if key != "pbp"
+    }
+
+    # The unchanged payload is not written again
+    with django_assert_num_queries(1):
+        assert simulator.archive.save_many([(simulation_obj.uuid, payload)]) == []
+    assert simulator.models.ResultArchive.objects.get().content_hash == (
+        archive.content_hash
+    )
+
+    payload["totals"][0]["pts"] = 100
+    assert len(simulator.archive.save_many([(str(simulation_obj.uuid), payload)])) == 1
+    assert simulator.models.ResultArchive.objects.get().content_hash != (
+        archive.content_hash
+    )
+    assert simulator.archive.load(str(simulation_obj.uuid))["totals"][0]["pts"] == 100
+    assert simulator.archive.load(uuid.uuid4()) is None
+
+
+@pytest.mark.django_db
+def test_ingest_archives_payloads_with_their_play_by_play():
+    simulation_obj = simulation()
+    payload = build_game_result(simulation_obj, 90, 80)
+
+    simulator.ingestion.ingest(
+        Client(), [simulator.ingestion.parse(simulation_obj, payload)]
+    )
+
+    archived = simulator.archive.load(simulation_obj.uuid, play_by_play=True)
+    assert archived["pbp"] == simulator.play_by_play.map_events(payload["pbp"])
+    assert (
+        simulator.ingestion.parse(simulation_obj, archived).result.lineup_1_score == 90
+    )
+
+    # The mock simulator serves the game it already simulated
+    assert (
+        simulator.client.MockIntegrationClient().retrieve_game(simulation_obj.uuid)[
+            "result"
+        ]
+        == archived
+    )
+
+
+@pytest.mark.django_db
+def test_backfill_reads_archived_and_archives_downloaded_payloads(mocker):
+    archived, downloaded = simulation(), simulation()
+    simulator.models.Simulation.objects.filter(
+        id__in=[archived.id, downloaded.id]
+    ).update(status=simulator.models.Simulation.Status.FINISHED)
+    simulator.archive.save_many([(archived.uuid, build_game_result(archived, 90, 80))])
+    retrieve_games = mocker.patch.object(
+        Client,
+        "retrieve_games",
+        side_effect=lambda uuids: {
+            "results": [
+                {
+                    "uuid": str(downloaded.uuid),
+                    "result": build_game_result(downloaded, 70, 80),
+                }
+            ]
+        },
+    )
+
+    assert simulator.backfill.backfill_game_stats(simulator.models.PlayerGameStats) == 2
+    assert simulator.backfill.backfill_game_stats(simulator.models.TeamGameStats) == 2
+
+    (call,) = retrieve_games.call_args_list
+    assert call.args[0] == [downloaded.uuid]
+    assert simulator.models.ResultArchive.objects.count() == 2
+    assert (
+        simulator.models.TeamGameStats.objects.get(
+            simulation=downloaded.uuid, won=True
+        ).pts
+        == 80
+    )
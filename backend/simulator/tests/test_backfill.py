@@ -0,0 +1,111 @@
+import datetime as dt
+import uuid
+
+import pytest
+from django.utils import timezone
+
+import simulator.backfill
+import simulator.ingestion
+import simulator.models
+from conftest import build_game, build_game_result, build_lineup, build_user_and_team
+from simulator.client import Client
+
+
+@pytest.fixture(autouse=True)
+def use_real_client(settings, mocker):
+    settings.SIMULATOR_CLIENT = "simulator.client.Client"
+    mocker.patch.object(
+        Client, "create_game", side_effect=lambda **kwargs: {"uuid": uuid.uuid4()}
+    )
+    mocker.patch.object(Client, "retrieve_player_stats", return_value={"results": []})
+
+
+def finished_simulations(count, finalized=True):
+    _, team_1 = build_user_and_team()
+    _, team_2 = build_user_and_team()
+    lineup_1 = build_lineup(team_1)
+    lineup_2 = build_lineup(team_2)
+    simulations = [
+        build_game(lineup1=lineup_1, lineup2=lineup_2).simulation for _ in range(count)
+    ]
+    if finalized:
+        simulator.ingestion.ingest(
+            Client(),
+            [
+                simulator.ingestion.parse(
+                    simulation, build_game_result(simulation, 90, 80)
+                )
+                for simulation in simulations
+            ],
+        )
+        simulator.models.PlayerGameStats.objects.all().delete()
+        simulator.models.TeamGameStats.objects.all().delete()
+    else:
+        simulator.models.Simulation.objects.filter(
+            id__in=[simulation.id for simulation in simulations]
+        ).update(status=simulator.models.Simulation.Status.FINISHED)
+    return simulations
+
+
+@pytest.mark.django_db
+def test_backfill_game_stats_from_stored_box_scores(mocker):
+    retrieve_games = mocker.patch.object(Client, "retrieve_games")
+    simulations = finished_simulations(3)
+
+    written = simulator.backfill.backfill_game_stats(
+        simulator.models.PlayerGameStats, batch_size=2
+    )
+
+    assert written == 3
+    assert not retrieve_games.called
+    player_stats = simulator.models.PlayerGameStats.objects.filter(
+        simulation=simulations[0].uuid
+    )
+    assert player_stats.count() == 10
+    assert player_stats.get(player=simulations[0].lineup_1_uuids[0]).won
+    assert player_stats.get(player=simulations[0].lineup_2_uuids[4]).pts == 16
+
+    # Resumes with the simulations still missing stats
+    assert not simulator.backfill.backfill_game_stats(simulator.models.PlayerGameStats)
+    assert simulator.backfill.backfill_game_stats(simulator.models.TeamGameStats) == 3
+    assert simulator.models.TeamGameStats.objects.filter(won=True).count() == 3
+
+
+@pytest.mark.django_db
+def test_backfill_game_stats_downloads_missing_results(mocker):
+    simulations = finished_simulations(3, finalized=False)
+    payloads = {
+        str(simulation.uuid): build_game_result(simulation, 70, 80)
+        for simulation in simulations
+    }
+    retrieve_games = mocker.patch.object(
+        Client,
+        "retrieve_games",
+        side_effect=lambda uuids: {
+            "results": [
+                {"uuid": str(uuid), "result": payloads[str(uuid)]} for uuid in uuids
+            ]
+        },
+    )
+    simulator.models.Simulation.objects.filter(id=simulations[0].id).update(
+        created_at=timezone.now() - dt.timedelta(days=2)
+    )
+    progress = mocker.Mock()
+
+    written = simulator.backfill.backfill_game_stats(
+        simulator.models.TeamGameStats,
+        since=timezone.now() - dt.timedelta(days=1),
+        limit=1,
+        progress=progress,
+    )
+
+    assert written == 1
+    (call,) = retrieve_games.call_args_list
+    assert call.args[0] == [simulations[2].uuid]
+    progress.assert_called_once_with(1, 1, 1, 1)
+    assert (
+        simulator.models.TeamGameStats.objects.get(
+            simulation=simulations[2].uuid, won=True
+        ).pts
+        == 80
+    )
@@ -1,10 +1,19 @@
 # Verifies that management commands can run
 
 
+import datetime as dt
+import io
+import json
+import uuid
+
 import ddf
 import pytest
 from django.core.management import call_command
 
+import game.models
+import simulator.backfill
+import simulator.model_views
+import simulator.models
 from simulator.client import Client
 
 
@@ -16,7 +25,10 @@ def use_real_client(settings):
 def test_update_simulated_games(mocker):
     patched_update = mocker.patch("simulator.processing.update_games", autospec=True)
     call_command("update_simulated_games")
-    patched_update.assert_called_once_with()
+    patched_update.assert_called_once_with(concurrency=None, deadline=None)
+
+    call_command("update_simulated_games", "--concurrency=4", "--deadline=10")
+    patched_update.assert_called_with(concurrency=4, deadline=10)
 
 
 @pytest.mark.django_db
@@ -63,3 +75,135 @@ def test_check_all_players_exist_within_sim(mocker, settings):
 def test_validate_player_agg_stats(mocker, settings):
 
     call_command("validate_player_agg_stats")
+
+
+@pytest.mark.django_db
+def test_benchmark_update_games():
+    out = io.StringIO()
+    call_command(
+        "benchmark_update_games",
+        "--simulations=4",
+        "--latency=0",
+        "--concurrency",
+        "1",
+        "2",
+        stdout=out,
+    )
+    assert "CONCURRENCY 1 :: DRAINED 4/4" in out.getvalue()
+    assert "CONCURRENCY 2 :: DRAINED 4/4" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_benchmark_update_player_stats():
+    out = io.StringIO()
+    call_command(
+        "benchmark_update_player_stats", "--players=5", "--chunk-size=2", stdout=out
+    )
+    assert "PER PLAYER :: 5 PLAYERS IN" in out.getvalue()
+    assert "BULK :: 5 PLAYERS IN" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rebuild_stats_aggregates():
+    player = ddf.G("simulator.Player")
+
+    def play(tokens_required, won, created_at=None):
+        simulation = ddf.G("simulator.Simulation", uuid=uuid.uuid4())
+        if created_at:
+            simulator.models.Simulation.objects.filter(id=simulation.id).update(
+                created_at=created_at
+            )
+        game.models.Game.objects.create(
+            contest=game.models.Contest.objects.create(
+                kind=game.models.Contest.Kind.HEAD_TO_HEAD,
+                status=game.models.Contest.Status.COMPLETE,
+                tokens_required=tokens_required,
+            ),
+            simulation=simulation,
+        )
+        ddf.G(
+            "simulator.PlayerGameStats", simulation=simulation, player=player, won=won
+        )
+
+    play(tokens_required=3, won=True)
+    play(tokens_required=1, won=False)
+    play(
+        tokens_required=None,
+        won=True,
+        created_at=dt.datetime(2023, 1, 1, tzinfo=dt.timezone.utc),
+    )
+
+    call_command("rebuild_stats_aggregates", stdout=io.StringIO())
+
+    def record(model_view):
+        stats = model_view.objects.by_player_uuid(player.uuid)
+        return (stats.wins, stats.losses) if stats else None
+
+    assert record(simulator.model_views.AllTimePlayerStatsViewProxy) == (2, 1)
+    assert record(simulator.model_views.AllTimePlayerStatsViewProxyOneToken) == (0, 1)
+    assert record(simulator.model_views.AllTimePlayerStatsViewProxyThreeTokens) == (
+        1,
+        0,
+    )
+    assert record(simulator.model_views.AllTimePlayerStatsViewProxyFiveTokens) is None
+    assert record(simulator.model_views.CurrentSeasonPlayerStatsViewProxy) == (1, 1)
+    assert record(simulator.model_views.CurrentSeasonPlayerStatsViewProxyOneToken) == (
+        0,
+        1,
+    )
+    assert record(
+        simulator.model_views.CurrentSeasonPlayerStatsViewProxyThreeTokens
+    ) == (1, 0)
+    assert (
+        record(simulator.model_views.CurrentSeasonPlayerStatsViewProxyFiveTokens)
+        is None
+    )
+
+
+@pytest.mark.django_db
+def test_compact_play_by_play():
+    events = [{"quarter": 1, "detail": "Start of Period"}, {"quarter": 2}]
+    play_by_play = simulator.models.PlayByPlay.objects.create(
+        simulation=ddf.G("simulator.Simulation"), feed=json.dumps(events)
+    )
+
+    call_command("compact_play_by_play", "--limit=10")
+
+    play_by_play.refresh_from_db()
+    assert play_by_play.feed is None
+    assert play_by_play.event_count == 2
+    assert play_by_play.chunks.count() == 2
+
+
+@pytest.mark.django_db
+def test_build_game_stats(mocker):
+    backfill = mocker.patch(
+        "simulator.backfill.backfill_game_stats", autospec=True, return_value=0
+    )
+
+    call_command("build_player_game_stats", stdout=io.StringIO())
+    backfill.assert_called_with(
+        simulator.models.PlayerGameStats,
+        since=None,
+        limit=None,
+        batch_size=simulator.backfill.BACKFILL_BATCH_SIZE,
+        concurrency=None,
+        progress=mocker.ANY,
+    )
+
+    call_command(
+        "build_team_game_stats",
+        "--since=2023-01-01",
+        "--limit=5",
+        "--batch-size=2",
+        "--concurrency=4",
+        stdout=io.StringIO(),
+    )
+    backfill.assert_called_with(
+        simulator.models.TeamGameStats,
+        since=dt.datetime(2023, 1, 1, tzinfo=dt.timezone.utc),
+        limit=5,
+        batch_size=2,
+        concurrency=4,
+        progress=mocker.ANY,
+    )
@@ -0,0 +1,86 @@
+import functools
+import json
+import zlib
+
+import ddf
+import pytest
+
+import simulator.client
+import simulator.models
+import simulator.play_by_play
+
+
+def feed():
+    with open(
+        simulator.client.MockIntegrationClient.EXAMPLE_PLAY_BY_PLAY, encoding="utf-8"
+    ) as f:
+        return simulator.play_by_play.map_events(json.load(f))
+
+
+def test_map_events():
+    (event,) = simulator.play_by_play.map_events(
+        [{"Possession": 3, "pbp_string": "Made Two"}]
+    )
+
+    assert event == {
+        "Possession": 3,
+        "pbp_string": "Made Two",
+        "possession": 3,
+        "detail": "Made Two",
+    }
+
+
+def test_build_chunks(monkeypatch):
+    monkeypatch.setattr(simulator.play_by_play, "CHUNK_SIZE", 20)
+    events = feed()
+
+    chunks = simulator.play_by_play.build_chunks(events)
+
+    assert sum(chunk.count for chunk in chunks) == len(events)
+    for chunk in chunks:
+        chunk_events = json.loads(zlib.decompress(chunk.data))
+        assert chunk.count == len(chunk_events) <= 20
+        assert chunk_events == events[chunk.start :][: chunk.count]  # noqa: E203
+        assert {event["quarter"] for event in chunk_events} == {chunk.quarter}
+    assert sum(len(chunk.data) for chunk in chunks) < len(json.dumps(events)) / 4
+
+
+@pytest.mark.django_db
+def test_read_events(django_assert_num_queries):
+    events = feed()
+    play_by_play = simulator.play_by_play.save(
+        simulator.models.PlayByPlay(simulation=ddf.G("simulator.Simulation")), events
+    )
+    read_events = functools.partial(simulator.play_by_play.read_events, play_by_play)
+
+    assert play_by_play.feed is None
+    assert simulator.play_by_play.count_events(play_by_play) == len(events)
+    assert read_events() == events
+    assert read_events(quarter=2) == [
+        event for event in events if event["quarter"] == 2
+    ]
+    # Windows within a chunk, across chunks and past the end of the feed
+    assert read_events(offset=10, limit=5) == events[10:15]
+    assert read_events(offset=80, limit=100) == events[80:180]
+    assert read_events(offset=300, limit=100) == events[300:]
+    assert read_events(offset=len(events)) == []
+    assert read_events(quarter=2, limit=100) == [
+        event for event in events[:100] if event["quarter"] == 2
+    ]
+
+    with django_assert_num_queries(1):
+        simulator.play_by_play.read_json(play_by_play, quarter=4)
+
+
+@pytest.mark.django_db
+def test_read_events_of_json_feed():
+    events = feed()
+    play_by_play = simulator.models.PlayByPlay.objects.create(
+        simulation=ddf.G("simulator.Simulation"), feed=json.dumps(events)
+    )
+
+    assert simulator.play_by_play.count_events(play_by_play) == len(events)
+    assert simulator.play_by_play.read_events(play_by_play) == events
+    assert simulator.play_by_play.read_events(
+        play_by_play, quarter=3, offset=100, limit=100
+    ) == [event for event in events[100:200] if event["quarter"] == 3]
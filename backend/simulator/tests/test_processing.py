@@ -1,4 +1,5 @@
 import datetime as dt
+import threading
 import uuid
 from decimal import Decimal
 
@@ -11,7 +12,7 @@ from django.utils import timezone
 import game.models
 import simulator.models
 import simulator.processing
-from conftest import build_user_and_team
+from conftest import build_game, build_game_result, build_lineup, build_user_and_team
 from simulator.client import Client
 
 
@@ -20,6 +21,24 @@ def use_real_client(settings):
     settings.SIMULATOR_CLIENT = "simulator.client.Client"
 
 
+def game_statuses(status):
+    """Builds a fake Client.retrieve_game_statuses returning status for every game"""
+
+    def retrieve_game_statuses(uuids):
+        return {"results": [{"uuid": str(uuid), "status": status} for uuid in uuids]}
+
+    return retrieve_game_statuses
+
+
+def games(payload):
+    """Builds a fake Client.retrieve_games returning payload for every game"""
+
+    def retrieve_games(uuids):
+        return {"results": [payload | {"uuid": str(uuid)} for uuid in uuids]}
+
+    return retrieve_games
+
+
 @pytest.mark.django_db
 def test_update_games(mocker, settings):
     lineup_1_uuids = [uuid.uuid4() for i in range(5)]
@@ -42,862 +61,867 @@ def test_update_games(mocker, settings):
             ),
         )
 
-    patched_retrieve_game = mocker.patch.object(
+    mocker.patch.object(
+        Client, "retrieve_game_statuses", side_effect=game_statuses("FINISHED")
+    )
+    patched_retrieve_games = mocker.patch.object(
         Client,
-        "retrieve_game",
-        return_value={
-            "uuid": "07ef093e-79f1-47e4-9caa-2cfbf0fdd37d",
-            "status": "FINISHED",
-            "result": {
-                "pbp": [
-                    {
-                        "quarter": 1,
-                        "gameclock": "10:00",
-                        "Possession": 1,
-                        "pbp_string": "Start of Period",
-                        "time_remaining": 600.0,
-                        "challenged_score": 0,
-                        "challenger_score": 0,
-                    },
-                    {
-                        "quarter": 1,
-                        "gameclock": "9:44",
-                        "Possession": 1,
-                        "pbp_string": "Made Two by Derrick Rose from 7 feet",
-                        "time_remaining": 583.948619319,
-                        "challenged_score": 0,
-                        "challenger_score": 2,
-                    },
-                    {
-                        "quarter": 1,
-                        "gameclock": "9:44",
-                        "Possession": 1,
-                        "pbp_string": "Assisted by John Collins",
-                        "time_remaining": 583.948619319,
-                        "challenged_score": 0,
-                        "challenger_score": 2,
-                    },
-                ],
-                "totals": [
-                    {
-                        "fg": 21.0,
-                        "ft": 3.0,
-                        "pf": 9.0,
-                        "ast": 11.0,
-                        "blk": 1.0,
-                        "drb": 23.0,
-                        "fga": 52.0,
-                        "fta": 5.0,
-                        "orb": 6.0,
-                        "pts": 51.0,
-                        "stl": 4.0,
-                        "tov": 4.0,
-                        "trb": 29.0,
-                        "Team": "Challengers",
-                        "two_p": 15.0,
-                        "fg_pct": 0.4,
-                        "ft_pct": 0.6,
-                        "two_pa": 35.0,
-                        "three_p": 6.0,
-                        "three_pa": 17.0,
-                        "two_p_pct": 0.43,
-                        "three_p_pct": 0.35,
-                    },
-                    {
-                        "fg": 23.0,
-                        "ft": 7.0,
-                        "pf": 12.0,
-                        "ast": 10.0,
-                        "blk": 2.0,
-                        "drb": 20.0,
-                        "fga": 54.0,
-                        "fta": 9.0,
-                        "orb": 3.0,
-                        "pts": 59.0,
-                        "stl": 2.0,
-                        "tov": 7.0,
-                        "trb": 23.0,
-                        "Team": "Challenged",
-                        "two_p": 17.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": 0.78,
-                        "two_pa": 36.0,
-                        "three_p": 6.0,
-                        "three_pa": 18.0,
-                        "two_p_pct": 0.47,
-                        "three_p_pct": 0.33,
-                    },
-                ],
-                "players": {
-                    "swoopster-0": {
-                        "g": 1,
-                        "fg": 3.0,
-                        "ft": None,
-                        "apg": 2.0,
-                        "bpg": None,
-                        "fga": 10.0,
-                        "fpg": 1.0,
-                        "fta": None,
-                        "ppg": 7.0,
-                        "rpg": 6.0,
-                        "spg": 1.0,
-                        "tpg": None,
-                        "drpg": 6.0,
-                        "orpg": None,
-                        "uuid": str(lineup_1_uuids[0]),
-                        "wins": 0,
-                        "two_p": 2.0,
-                        "fg_pct": 0.3,
-                        "ft_pct": None,
-                        "losses": 1,
-                        "two_pa": 7.0,
-                        "three_p": 1.0,
-                        "three_pa": 3.0,
-                        "two_p_pct": 0.29,
-                        "three_p_pct": 0.33,
-                    },
-                    "swoopster-1": {
-                        "g": 1,
-                        "fg": 3.0,
-                        "ft": 2.0,
-                        "apg": 1.0,
-                        "bpg": None,
-                        "fga": 9.0,
-                        "fpg": 2.0,
-                        "fta": 2.0,
-                        "ppg": 8.0,
-                        "rpg": 5.0,
-                        "spg": 3.0,
-                        "tpg": None,
-                        "drpg": 4.0,
-                        "orpg": 1.0,
-                        "uuid": str(lineup_1_uuids[1]),
-                        "wins": 0,
-                        "two_p": 3.0,
-                        "fg_pct": 0.33,
-                        "ft_pct": 1.0,
-                        "losses": 1,
-                        "two_pa": 7.0,
-                        "three_p": None,
-                        "three_pa": 2.0,
-                        "two_p_pct": 0.43,
-                        "three_p_pct": None,
-                    },
-                    "swoopster-2": {
-                        "g": 1,
-                        "fg": 6.0,
-                        "ft": None,
-                        "apg": 3.0,
-                        "bpg": 1.0,
-                        "fga": 14.0,
-                        "fpg": 1.0,
-                        "fta": 1.0,
-                        "ppg": 14.0,
-                        "rpg": 5.0,
-                        "spg": None,
-                        "tpg": None,
-                        "drpg": 4.0,
-                        "orpg": 1.0,
-                        "uuid": str(lineup_1_uuids[2]),
-                        "wins": 0,
-                        "two_p": 4.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": None,
-                        "losses": 1,
-                        "two_pa": 8.0,
-                        "three_p": 2.0,
-                        "three_pa": 6.0,
-                        "two_p_pct": 0.5,
-                        "three_p_pct": 0.33,
-                    },
-                    "swoopster-3": {
-                        "g": 1,
-                        "fg": 4.0,
-                        "ft": 1.0,
-                        "apg": 4.0,
-                        "bpg": None,
-                        "fga": 9.0,
-                        "fpg": 2.0,
-                        "fta": 2.0,
-                        "ppg": 9.0,
-                        "rpg": 8.0,
-                        "spg": None,
-                        "tpg": 1.0,
-                        "drpg": 6.0,
-                        "orpg": 2.0,
-                        "uuid": str(lineup_1_uuids[3]),
-                        "wins": 0,
-                        "two_p": 4.0,
-                        "fg_pct": 0.44,
-                        "ft_pct": 0.5,
-                        "losses": 1,
-                        "two_pa": 7.0,
-                        "three_p": None,
-                        "three_pa": 2.0,
-                        "two_p_pct": 0.57,
-                        "three_p_pct": None,
-                    },
-                    "swoopster-4": {
-                        "g": 1,
-                        "fg": 5.0,
-                        "ft": None,
-                        "apg": 1.0,
-                        "bpg": None,
-                        "fga": 10.0,
-                        "fpg": 3.0,
-                        "fta": None,
-                        "ppg": 13.0,
-                        "rpg": 5.0,
-                        "spg": None,
-                        "tpg": 3.0,
-                        "drpg": 3.0,
-                        "orpg": 2.0,
-                        "uuid": str(lineup_1_uuids[4]),
-                        "wins": 0,
-                        "two_p": 2.0,
-                        "fg_pct": 0.5,
-                        "ft_pct": None,
-                        "losses": 1,
-                        "two_pa": 6.0,
-                        "three_p": 3.0,
-                        "three_pa": 4.0,
-                        "two_p_pct": 0.33,
-                        "three_p_pct": 0.75,
-                    },
-                    "swoopster-5": {
-                        "g": 1,
-                        "fg": 3.0,
-                        "ft": 4.0,
-                        "apg": 1.0,
-                        "bpg": None,
-                        "fga": 7.0,
-                        "fpg": 1.0,
-                        "fta": 4.0,
-                        "ppg": 10.0,
-                        "rpg": 2.0,
-                        "spg": None,
-                        "tpg": None,
-                        "drpg": 2.0,
-                        "orpg": None,
-                        "uuid": str(lineup_2_uuids[0]),
-                        "wins": 1,
-                        "two_p": 3.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": 1.0,
-                        "losses": 0,
-                        "two_pa": 5.0,
-                        "three_p": None,
-                        "three_pa": 2.0,
-                        "two_p_pct": 0.6,
-                        "three_p_pct": None,
-                    },
-                    "swoopster-6": {
-                        "g": 1,
-                        "fg": 7.0,
-                        "ft": None,
-                        "apg": 1.0,
-                        "bpg": 1.0,
-                        "fga": 14.0,
-                        "fpg": 1.0,
-                        "fta": None,
-                        "ppg": 15.0,
-                        "rpg": 5.0,
-                        "spg": None,
-                        "tpg": None,
-                        "drpg": 4.0,
-                        "orpg": 1.0,
-                        "uuid": str(lineup_2_uuids[1]),
-                        "wins": 1,
-                        "two_p": 6.0,
-                        "fg_pct": 0.5,
-                        "ft_pct": None,
-                        "losses": 0,
-                        "two_pa": 11.0,
-                        "three_p": 1.0,
-                        "three_pa": 3.0,
-                        "two_p_pct": 0.55,
-                        "three_p_pct": 0.33,
-                    },
-                    "swoopster-7": {
-                        "g": 1,
-                        "fg": 3.0,
-                        "ft": None,
-                        "apg": 2.0,
-                        "bpg": None,
-                        "fga": 11.0,
-                        "fpg": 2.0,
-                        "fta": None,
-                        "ppg": 9.0,
-                        "rpg": 4.0,
-                        "spg": 1.0,
-                        "tpg": 1.0,
-                        "drpg": 3.0,
-                        "orpg": 1.0,
-                        "uuid": str(lineup_2_uuids[2]),
-                        "wins": 1,
-                        "two_p": None,
-                        "fg_pct": 0.27,
-                        "ft_pct": None,
-                        "losses": 0,
-                        "two_pa": 4.0,
-                        "three_p": 3.0,
-                        "three_pa": 7.0,
-                        "two_p_pct": None,
-                        "three_p_pct": 0.43,
-                    },
-                    "swoopster-8": {
-                        "g": 1,
-                        "fg": 6.0,
-                        "ft": None,
-                        "apg": 4.0,
-                        "bpg": 1.0,
-                        "fga": 11.0,
-                        "fpg": 4.0,
-                        "fta": 1.0,
-                        "ppg": 14.0,
-                        "rpg": 7.0,
-                        "spg": None,
-                        "tpg": 4.0,
-                        "drpg": 7.0,
-                        "orpg": None,
-                        "uuid": str(lineup_2_uuids[3]),
-                        "wins": 1,
-                        "two_p": 4.0,
-                        "fg_pct": 0.55,
-                        "ft_pct": None,
-                        "losses": 0,
-                        "two_pa": 7.0,
-                        "three_p": 2.0,
-                        "three_pa": 4.0,
-                        "two_p_pct": 0.57,
-                        "three_p_pct": 0.5,
-                    },
-                    "swoopster-9": {
-                        "g": 1,
-                        "fg": 4.0,
-                        "ft": 3.0,
-                        "apg": 2.0,
-                        "bpg": None,
-                        "fga": 11.0,
-                        "fpg": 4.0,
-                        "fta": 4.0,
-                        "ppg": 11.0,
-                        "rpg": 5.0,
-                        "spg": 1.0,
-                        "tpg": 2.0,
-                        "drpg": 4.0,
-                        "orpg": 1.0,
-                        "uuid": str(lineup_2_uuids[4]),
-                        "wins": 1,
-                        "two_p": 4.0,
-                        "fg_pct": 0.36,
-                        "ft_pct": 0.75,
-                        "losses": 0,
-                        "two_pa": 9.0,
-                        "three_p": None,
-                        "three_pa": 2.0,
-                        "two_p_pct": 0.44,
-                        "three_p_pct": None,
+        "retrieve_games",
+        side_effect=games(
+            {
+                "uuid": "07ef093e-79f1-47e4-9caa-2cfbf0fdd37d",
+                "status": "FINISHED",
+                "result": {
+                    "pbp": [
+                        {
+                            "quarter": 1,
+                            "gameclock": "10:00",
+                            "Possession": 1,
+                            "pbp_string": "Start of Period",
+                            "time_remaining": 600.0,
+                            "challenged_score": 0,
+                            "challenger_score": 0,
+                        },
+                        {
+                            "quarter": 1,
+                            "gameclock": "9:44",
+                            "Possession": 1,
+                            "pbp_string": "Made Two by Derrick Rose from 7 feet",
+                            "time_remaining": 583.948619319,
+                            "challenged_score": 0,
+                            "challenger_score": 2,
+                        },
+                        {
+                            "quarter": 1,
+                            "gameclock": "9:44",
+                            "Possession": 1,
+                            "pbp_string": "Assisted by John Collins",
+                            "time_remaining": 583.948619319,
+                            "challenged_score": 0,
+                            "challenger_score": 2,
+                        },
+                    ],
+                    "totals": [
+                        {
+                            "fg": 21.0,
+                            "ft": 3.0,
+                            "pf": 9.0,
+                            "ast": 11.0,
+                            "blk": 1.0,
+                            "drb": 23.0,
+                            "fga": 52.0,
+                            "fta": 5.0,
+                            "orb": 6.0,
+                            "pts": 51.0,
+                            "stl": 4.0,
+                            "tov": 4.0,
+                            "trb": 29.0,
+                            "Team": "Challengers",
+                            "two_p": 15.0,
+                            "fg_pct": 0.4,
+                            "ft_pct": 0.6,
+                            "two_pa": 35.0,
+                            "three_p": 6.0,
+                            "three_pa": 17.0,
+                            "two_p_pct": 0.43,
+                            "three_p_pct": 0.35,
+                        },
+                        {
+                            "fg": 23.0,
+                            "ft": 7.0,
+                            "pf": 12.0,
+                            "ast": 10.0,
+                            "blk": 2.0,
+                            "drb": 20.0,
+                            "fga": 54.0,
+                            "fta": 9.0,
+                            "orb": 3.0,
+                            "pts": 59.0,
+                            "stl": 2.0,
+                            "tov": 7.0,
+                            "trb": 23.0,
+                            "Team": "Challenged",
+                            "two_p": 17.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": 0.78,
+                            "two_pa": 36.0,
+                            "three_p": 6.0,
+                            "three_pa": 18.0,
+                            "two_p_pct": 0.47,
+                            "three_p_pct": 0.33,
+                        },
+                    ],
+                    "players": {
+                        "swoopster-0": {
+                            "g": 1,
+                            "fg": 3.0,
+                            "ft": None,
+                            "apg": 2.0,
+                            "bpg": None,
+                            "fga": 10.0,
+                            "fpg": 1.0,
+                            "fta": None,
+                            "ppg": 7.0,
+                            "rpg": 6.0,
+                            "spg": 1.0,
+                            "tpg": None,
+                            "drpg": 6.0,
+                            "orpg": None,
+                            "uuid": str(lineup_1_uuids[0]),
+                            "wins": 0,
+                            "two_p": 2.0,
+                            "fg_pct": 0.3,
+                            "ft_pct": None,
+                            "losses": 1,
+                            "two_pa": 7.0,
+                            "three_p": 1.0,
+                            "three_pa": 3.0,
+                            "two_p_pct": 0.29,
+                            "three_p_pct": 0.33,
+                        },
+                        "swoopster-1": {
+                            "g": 1,
+                            "fg": 3.0,
+                            "ft": 2.0,
+                            "apg": 1.0,
+                            "bpg": None,
+                            "fga": 9.0,
+                            "fpg": 2.0,
+                            "fta": 2.0,
+                            "ppg": 8.0,
+                            "rpg": 5.0,
+                            "spg": 3.0,
+                            "tpg": None,
+                            "drpg": 4.0,
+                            "orpg": 1.0,
+                            "uuid": str(lineup_1_uuids[1]),
+                            "wins": 0,
+                            "two_p": 3.0,
+                            "fg_pct": 0.33,
+                            "ft_pct": 1.0,
+                            "losses": 1,
+                            "two_pa": 7.0,
+                            "three_p": None,
+                            "three_pa": 2.0,
+                            "two_p_pct": 0.43,
+                            "three_p_pct": None,
+                        },
+                        "swoopster-2": {
+                            "g": 1,
+                            "fg": 6.0,
+                            "ft": None,
+                            "apg": 3.0,
+                            "bpg": 1.0,
+                            "fga": 14.0,
+                            "fpg": 1.0,
+                            "fta": 1.0,
+                            "ppg": 14.0,
+                            "rpg": 5.0,
+                            "spg": None,
+                            "tpg": None,
+                            "drpg": 4.0,
+                            "orpg": 1.0,
+                            "uuid": str(lineup_1_uuids[2]),
+                            "wins": 0,
+                            "two_p": 4.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": None,
+                            "losses": 1,
+                            "two_pa": 8.0,
+                            "three_p": 2.0,
+                            "three_pa": 6.0,
+                            "two_p_pct": 0.5,
+                            "three_p_pct": 0.33,
+                        },
+                        "swoopster-3": {
+                            "g": 1,
+                            "fg": 4.0,
+                            "ft": 1.0,
+                            "apg": 4.0,
+                            "bpg": None,
+                            "fga": 9.0,
+                            "fpg": 2.0,
+                            "fta": 2.0,
+                            "ppg": 9.0,
+                            "rpg": 8.0,
+                            "spg": None,
+                            "tpg": 1.0,
+                            "drpg": 6.0,
+                            "orpg": 2.0,
+                            "uuid": str(lineup_1_uuids[3]),
+                            "wins": 0,
+                            "two_p": 4.0,
+                            "fg_pct": 0.44,
+                            "ft_pct": 0.5,
+                            "losses": 1,
+                            "two_pa": 7.0,
+                            "three_p": None,
+                            "three_pa": 2.0,
+                            "two_p_pct": 0.57,
+                            "three_p_pct": None,
+                        },
+                        "swoopster-4": {
+                            "g": 1,
+                            "fg": 5.0,
+                            "ft": None,
+                            "apg": 1.0,
+                            "bpg": None,
+                            "fga": 10.0,
+                            "fpg": 3.0,
+                            "fta": None,
+                            "ppg": 13.0,
+                            "rpg": 5.0,
+                            "spg": None,
+                            "tpg": 3.0,
+                            "drpg": 3.0,
+                            "orpg": 2.0,
+                            "uuid": str(lineup_1_uuids[4]),
+                            "wins": 0,
+                            "two_p": 2.0,
+                            "fg_pct": 0.5,
+                            "ft_pct": None,
+                            "losses": 1,
+                            "two_pa": 6.0,
+                            "three_p": 3.0,
+                            "three_pa": 4.0,
+                            "two_p_pct": 0.33,
+                            "three_p_pct": 0.75,
+                        },
+                        "swoopster-5": {
+                            "g": 1,
+                            "fg": 3.0,
+                            "ft": 4.0,
+                            "apg": 1.0,
+                            "bpg": None,
+                            "fga": 7.0,
+                            "fpg": 1.0,
+                            "fta": 4.0,
+                            "ppg": 10.0,
+                            "rpg": 2.0,
+                            "spg": None,
+                            "tpg": None,
+                            "drpg": 2.0,
+                            "orpg": None,
+                            "uuid": str(lineup_2_uuids[0]),
+                            "wins": 1,
+                            "two_p": 3.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": 1.0,
+                            "losses": 0,
+                            "two_pa": 5.0,
+                            "three_p": None,
+                            "three_pa": 2.0,
+                            "two_p_pct": 0.6,
+                            "three_p_pct": None,
+                        },
+                        "swoopster-6": {
+                            "g": 1,
+                            "fg": 7.0,
+                            "ft": None,
+                            "apg": 1.0,
+                            "bpg": 1.0,
+                            "fga": 14.0,
+                            "fpg": 1.0,
+                            "fta": None,
+                            "ppg": 15.0,
+                            "rpg": 5.0,
+                            "spg": None,
+                            "tpg": None,
+                            "drpg": 4.0,
+                            "orpg": 1.0,
+                            "uuid": str(lineup_2_uuids[1]),
+                            "wins": 1,
+                            "two_p": 6.0,
+                            "fg_pct": 0.5,
+                            "ft_pct": None,
+                            "losses": 0,
+                            "two_pa": 11.0,
+                            "three_p": 1.0,
+                            "three_pa": 3.0,
+                            "two_p_pct": 0.55,
+                            "three_p_pct": 0.33,
+                        },
+                        "swoopster-7": {
+                            "g": 1,
+                            "fg": 3.0,
+                            "ft": None,
+                            "apg": 2.0,
+                            "bpg": None,
+                            "fga": 11.0,
+                            "fpg": 2.0,
+                            "fta": None,
+                            "ppg": 9.0,
+                            "rpg": 4.0,
+                            "spg": 1.0,
+                            "tpg": 1.0,
+                            "drpg": 3.0,
+                            "orpg": 1.0,
+                            "uuid": str(lineup_2_uuids[2]),
+                            "wins": 1,
+                            "two_p": None,
+                            "fg_pct": 0.27,
+                            "ft_pct": None,
+                            "losses": 0,
+                            "two_pa": 4.0,
+                            "three_p": 3.0,
+                            "three_pa": 7.0,
+                            "two_p_pct": None,
+                            "three_p_pct": 0.43,
+                        },
+                        "swoopster-8": {
+                            "g": 1,
+                            "fg": 6.0,
+                            "ft": None,
+                            "apg": 4.0,
+                            "bpg": 1.0,
+                            "fga": 11.0,
+                            "fpg": 4.0,
+                            "fta": 1.0,
+                            "ppg": 14.0,
+                            "rpg": 7.0,
+                            "spg": None,
+                            "tpg": 4.0,
+                            "drpg": 7.0,
+                            "orpg": None,
+                            "uuid": str(lineup_2_uuids[3]),
+                            "wins": 1,
+                            "two_p": 4.0,
+                            "fg_pct": 0.55,
+                            "ft_pct": None,
+                            "losses": 0,
+                            "two_pa": 7.0,
+                            "three_p": 2.0,
+                            "three_pa": 4.0,
+                            "two_p_pct": 0.57,
+                            "three_p_pct": 0.5,
+                        },
+                        "swoopster-9": {
+                            "g": 1,
+                            "fg": 4.0,
+                            "ft": 3.0,
+                            "apg": 2.0,
+                            "bpg": None,
+                            "fga": 11.0,
+                            "fpg": 4.0,
+                            "fta": 4.0,
+                            "ppg": 11.0,
+                            "rpg": 5.0,
+                            "spg": 1.0,
+                            "tpg": 2.0,
+                            "drpg": 4.0,
+                            "orpg": 1.0,
+                            "uuid": str(lineup_2_uuids[4]),
+                            "wins": 1,
+                            "two_p": 4.0,
+                            "fg_pct": 0.36,
+                            "ft_pct": 0.75,
+                            "losses": 0,
+                            "two_pa": 9.0,
+                            "three_p": None,
+                            "three_pa": 2.0,
+                            "two_p_pct": 0.44,
+                            "three_p_pct": None,
+                        },
                     },
+                    "combined_boxscore": [
+                        {
+                            "fg": 3.0,
+                            "ft": 0.0,
+                            "pf": 1.0,
+                            "ast": 2.0,
+                            "blk": 0.0,
+                            "drb": 6.0,
+                            "fga": 10.0,
+                            "fta": 0.0,
+                            "orb": 0.0,
+                            "pts": 7.0,
+                            "stl": 1.0,
+                            "tov": 0.0,
+                            "trb": 6.0,
+                            "Team": "Challengers",
+                            "two_p": 2.0,
+                            "fg_pct": 0.3,
+                            "ft_pct": 0.0,
+                            "two_pa": 7.0,
+                            "three_p": 1.0,
+                            "three_pa": 3.0,
+                            "canonical": "swoopster-0",
+                            "two_p_pct": 0.29,
+                            "three_p_pct": 0.33,
+                        },
+                        {
+                            "fg": 3.0,
+                            "ft": 2.0,
+                            "pf": 2.0,
+                            "ast": 1.0,
+                            "blk": 0.0,
+                            "drb": 4.0,
+                            "fga": 9.0,
+                            "fta": 2.0,
+                            "orb": 1.0,
+                            "pts": 8.0,
+                            "stl": 3.0,
+                            "tov": 0.0,
+                            "trb": 5.0,
+                            "Team": "Challengers",
+                            "two_p": 3.0,
+                            "fg_pct": 0.33,
+                            "ft_pct": 1.0,
+                            "two_pa": 7.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-1",
+                            "two_p_pct": 0.43,
+                            "three_p_pct": 0.0,
+                        },
+                        {
+                            "fg": 6.0,
+                            "ft": 0.0,
+                            "pf": 1.0,
+                            "ast": 3.0,
+                            "blk": 1.0,
+                            "drb": 4.0,
+                            "fga": 14.0,
+                            "fta": 1.0,
+                            "orb": 1.0,
+                            "pts": 14.0,
+                            "stl": 0.0,
+                            "tov": 0.0,
+                            "trb": 5.0,
+                            "Team": "Challengers",
+                            "two_p": 4.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": 0.0,
+                            "two_pa": 8.0,
+                            "three_p": 2.0,
+                            "three_pa": 6.0,
+                            "canonical": "swoopster-2",
+                            "two_p_pct": 0.5,
+                            "three_p_pct": 0.33,
+                        },
+                        {
+                            "fg": 4.0,
+                            "ft": 1.0,
+                            "pf": 2.0,
+                            "ast": 4.0,
+                            "blk": 0.0,
+                            "drb": 6.0,
+                            "fga": 9.0,
+                            "fta": 2.0,
+                            "orb": 2.0,
+                            "pts": 9.0,
+                            "stl": 0.0,
+                            "tov": 1.0,
+                            "trb": 8.0,
+                            "Team": "Challengers",
+                            "two_p": 4.0,
+                            "fg_pct": 0.44,
+                            "ft_pct": 0.5,
+                            "two_pa": 7.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-3",
+                            "two_p_pct": 0.57,
+                            "three_p_pct": 0.0,
+                        },
+                        {
+                            "fg": 5.0,
+                            "ft": 0.0,
+                            "pf": 3.0,
+                            "ast": 1.0,
+                            "blk": 0.0,
+                            "drb": 3.0,
+                            "fga": 10.0,
+                            "fta": 0.0,
+                            "orb": 2.0,
+                            "pts": 13.0,
+                            "stl": 0.0,
+                            "tov": 3.0,
+                            "trb": 5.0,
+                            "Team": "Challengers",
+                            "two_p": 2.0,
+                            "fg_pct": 0.5,
+                            "ft_pct": 0.0,
+                            "two_pa": 6.0,
+                            "three_p": 3.0,
+                            "three_pa": 4.0,
+                            "canonical": "swoopster-4",
+                            "two_p_pct": 0.33,
+                            "three_p_pct": 0.75,
+                        },
+                        {
+                            "fg": 3.0,
+                            "ft": 4.0,
+                            "pf": 1.0,
+                            "ast": 1.0,
+                            "blk": 0.0,
+                            "drb": 2.0,
+                            "fga": 7.0,
+                            "fta": 4.0,
+                            "orb": 0.0,
+                            "pts": 10.0,
+                            "stl": 0.0,
+                            "tov": 0.0,
+                            "trb": 2.0,
+                            "Team": "Challenged",
+                            "two_p": 3.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": 1.0,
+                            "two_pa": 5.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-5",
+                            "two_p_pct": 0.6,
+                            "three_p_pct": 0.0,
+                        },
+                        {
+                            "fg": 7.0,
+                            "ft": 0.0,
+                            "pf": 1.0,
+                            "ast": 1.0,
+                            "blk": 1.0,
+                            "drb": 4.0,
+                            "fga": 14.0,
+                            "fta": 0.0,
+                            "orb": 1.0,
+                            "pts": 15.0,
+                            "stl": 0.0,
+                            "tov": 0.0,
+                            "trb": 5.0,
+                            "Team": "Challenged",
+                            "two_p": 6.0,
+                            "fg_pct": 0.5,
+                            "ft_pct": 0.0,
+                            "two_pa": 11.0,
+                            "three_p": 1.0,
+                            "three_pa": 3.0,
+                            "canonical": "swoopster-6",
+                            "two_p_pct": 0.55,
+                            "three_p_pct": 0.33,
+                        },
+                        {
+                            "fg": 3.0,
+                            "ft": 0.0,
+                            "pf": 2.0,
+                            "ast": 2.0,
+                            "blk": 0.0,
+                            "drb": 3.0,
+                            "fga": 11.0,
+                            "fta": 0.0,
+                            "orb": 1.0,
+                            "pts": 9.0,
+                            "stl": 1.0,
+                            "tov": 1.0,
+                            "trb": 4.0,
+                            "Team": "Challenged",
+                            "two_p": 0.0,
+                            "fg_pct": 0.27,
+                            "ft_pct": 0.0,
+                            "two_pa": 4.0,
+                            "three_p": 3.0,
+                            "three_pa": 7.0,
+                            "canonical": "swoopster-7",
+                            "two_p_pct": 0.0,
+                            "three_p_pct": 0.43,
+                        },
+                        {
+                            "fg": 6.0,
+                            "ft": 0.0,
+                            "pf": 4.0,
+                            "ast": 4.0,
+                            "blk": 1.0,
+                            "drb": 7.0,
+                            "fga": 11.0,
+                            "fta": 1.0,
+                            "orb": 0.0,
+                            "pts": 14.0,
+                            "stl": 0.0,
+                            "tov": 4.0,
+                            "trb": 7.0,
+                            "Team": "Challenged",
+                            "two_p": 4.0,
+                            "fg_pct": 0.55,
+                            "ft_pct": 0.0,
+                            "two_pa": 7.0,
+                            "three_p": 2.0,
+                            "three_pa": 4.0,
+                            "canonical": "swoopster-8",
+                            "two_p_pct": 0.57,
+                            "three_p_pct": 0.5,
+                        },
+                        {
+                            "fg": 4.0,
+                            "ft": 3.0,
+                            "pf": 4.0,
+                            "ast": 2.0,
+                            "blk": 0.0,
+                            "drb": 4.0,
+                            "fga": 11.0,
+                            "fta": 4.0,
+                            "orb": 1.0,
+                            "pts": 11.0,
+                            "stl": 1.0,
+                            "tov": 2.0,
+                            "trb": 5.0,
+                            "Team": "Challenged",
+                            "two_p": 4.0,
+                            "fg_pct": 0.36,
+                            "ft_pct": 0.75,
+                            "two_pa": 9.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-9",
+                            "two_p_pct": 0.44,
+                            "three_p_pct": 0.0,
+                        },
+                    ],
+                    "challenged_boxscore": [
+                        {
+                            "fg": 3.0,
+                            "ft": 4.0,
+                            "pf": 1.0,
+                            "ast": 1.0,
+                            "blk": 0.0,
+                            "drb": 2.0,
+                            "fga": 7.0,
+                            "fta": 4.0,
+                            "orb": 0.0,
+                            "pts": 10.0,
+                            "stl": 0.0,
+                            "tov": 0.0,
+                            "trb": 2.0,
+                            "two_p": 3.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": 1.0,
+                            "two_pa": 5.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-5",
+                            "two_p_pct": 0.6,
+                            "three_p_pct": 0.0,
+                        },
+                        {
+                            "fg": 7.0,
+                            "ft": 0.0,
+                            "pf": 1.0,
+                            "ast": 1.0,
+                            "blk": 1.0,
+                            "drb": 4.0,
+                            "fga": 14.0,
+                            "fta": 0.0,
+                            "orb": 1.0,
+                            "pts": 15.0,
+                            "stl": 0.0,
+                            "tov": 0.0,
+                            "trb": 5.0,
+                            "two_p": 6.0,
+                            "fg_pct": 0.5,
+                            "ft_pct": 0.0,
+                            "two_pa": 11.0,
+                            "three_p": 1.0,
+                            "three_pa": 3.0,
+                            "canonical": "swoopster-6",
+                            "two_p_pct": 0.55,
+                            "three_p_pct": 0.33,
+                        },
+                        {
+                            "fg": 3.0,
+                            "ft": 0.0,
+                            "pf": 2.0,
+                            "ast": 2.0,
+                            "blk": 0.0,
+                            "drb": 3.0,
+                            "fga": 11.0,
+                            "fta": 0.0,
+                            "orb": 1.0,
+                            "pts": 9.0,
+                            "stl": 1.0,
+                            "tov": 1.0,
+                            "trb": 4.0,
+                            "two_p": 0.0,
+                            "fg_pct": 0.27,
+                            "ft_pct": 0.0,
+                            "two_pa": 4.0,
+                            "three_p": 3.0,
+                            "three_pa": 7.0,
+                            "canonical": "swoopster-7",
+                            "two_p_pct": 0.0,
+                            "three_p_pct": 0.43,
+                        },
+                        {
+                            "fg": 6.0,
+                            "ft": 0.0,
+                            "pf": 4.0,
+                            "ast": 4.0,
+                            "blk": 1.0,
+                            "drb": 7.0,
+                            "fga": 11.0,
+                            "fta": 1.0,
+                            "orb": 0.0,
+                            "pts": 14.0,
+                            "stl": 0.0,
+                            "tov": 4.0,
+                            "trb": 7.0,
+                            "two_p": 4.0,
+                            "fg_pct": 0.55,
+                            "ft_pct": 0.0,
+                            "two_pa": 7.0,
+                            "three_p": 2.0,
+                            "three_pa": 4.0,
+                            "canonical": "swoopster-8",
+                            "two_p_pct": 0.57,
+                            "three_p_pct": 0.5,
+                        },
+                        {
+                            "fg": 4.0,
+                            "ft": 3.0,
+                            "pf": 4.0,
+                            "ast": 2.0,
+                            "blk": 0.0,
+                            "drb": 4.0,
+                            "fga": 11.0,
+                            "fta": 4.0,
+                            "orb": 1.0,
+                            "pts": 11.0,
+                            "stl": 1.0,
+                            "tov": 2.0,
+                            "trb": 5.0,
+                            "two_p": 4.0,
+                            "fg_pct": 0.36,
+                            "ft_pct": 0.75,
+                            "two_pa": 9.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-9",
+                            "two_p_pct": 0.44,
+                            "three_p_pct": 0.0,
+                        },
+                    ],
+                    "challengers_boxscore": [
+                        {
+                            "fg": 3.0,
+                            "ft": 0.0,
+                            "pf": 1.0,
+                            "ast": 2.0,
+                            "blk": 0.0,
+                            "drb": 6.0,
+                            "fga": 10.0,
+                            "fta": 0.0,
+                            "orb": 0.0,
+                            "pts": 7.0,
+                            "stl": 1.0,
+                            "tov": 0.0,
+                            "trb": 6.0,
+                            "two_p": 2.0,
+                            "fg_pct": 0.3,
+                            "ft_pct": 0.0,
+                            "two_pa": 7.0,
+                            "three_p": 1.0,
+                            "three_pa": 3.0,
+                            "canonical": "swoopster-0",
+                            "two_p_pct": 0.29,
+                            "three_p_pct": 0.33,
+                        },
+                        {
+                            "fg": 3.0,
+                            "ft": 2.0,
+                            "pf": 2.0,
+                            "ast": 1.0,
+                            "blk": 0.0,
+                            "drb": 4.0,
+                            "fga": 9.0,
+                            "fta": 2.0,
+                            "orb": 1.0,
+                            "pts": 8.0,
+                            "stl": 3.0,
+                            "tov": 0.0,
+                            "trb": 5.0,
+                            "two_p": 3.0,
+                            "fg_pct": 0.33,
+                            "ft_pct": 1.0,
+                            "two_pa": 7.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-1",
+                            "two_p_pct": 0.43,
+                            "three_p_pct": 0.0,
+                        },
+                        {
+                            "fg": 6.0,
+                            "ft": 0.0,
+                            "pf": 1.0,
+                            "ast": 3.0,
+                            "blk": 1.0,
+                            "drb": 4.0,
+                            "fga": 14.0,
+                            "fta": 1.0,
+                            "orb": 1.0,
+                            "pts": 14.0,
+                            "stl": 0.0,
+                            "tov": 0.0,
+                            "trb": 5.0,
+                            "two_p": 4.0,
+                            "fg_pct": 0.43,
+                            "ft_pct": 0.0,
+                            "two_pa": 8.0,
+                            "three_p": 2.0,
+                            "three_pa": 6.0,
+                            "canonical": "swoopster-2",
+                            "two_p_pct": 0.5,
+                            "three_p_pct": 0.33,
+                        },
+                        {
+                            "fg": 4.0,
+                            "ft": 1.0,
+                            "pf": 2.0,
+                            "ast": 4.0,
+                            "blk": 0.0,
+                            "drb": 6.0,
+                            "fga": 9.0,
+                            "fta": 2.0,
+                            "orb": 2.0,
+                            "pts": 9.0,
+                            "stl": 0.0,
+                            "tov": 1.0,
+                            "trb": 8.0,
+                            "two_p": 4.0,
+                            "fg_pct": 0.44,
+                            "ft_pct": 0.5,
+                            "two_pa": 7.0,
+                            "three_p": 0.0,
+                            "three_pa": 2.0,
+                            "canonical": "swoopster-3",
+                            "two_p_pct": 0.57,
+                            "three_p_pct": 0.0,
+                        },
+                        {
+                            "fg": 5.0,
+                            "ft": 0.0,
+                            "pf": 3.0,
+                            "ast": 1.0,
+                            "blk": 0.0,
+                            "drb": 3.0,
+                            "fga": 10.0,
+                            "fta": 0.0,
+                            "orb": 2.0,
+                            "pts": 13.0,
+                            "stl": 0.0,
+                            "tov": 3.0,
+                            "trb": 5.0,
+                            "two_p": 2.0,
+                            "fg_pct": 0.5,
+                            "ft_pct": 0.0,
+                            "two_pa": 6.0,
+                            "three_p": 3.0,
+                            "three_pa": 4.0,
+                            "canonical": "swoopster-4",
+                            "two_p_pct": 0.33,
+                            "three_p_pct": 0.75,
+                        },
+                    ],
                 },
-                "combined_boxscore": [
-                    {
-                        "fg": 3.0,
-                        "ft": 0.0,
-                        "pf": 1.0,
-                        "ast": 2.0,
-                        "blk": 0.0,
-                        "drb": 6.0,
-                        "fga": 10.0,
-                        "fta": 0.0,
-                        "orb": 0.0,
-                        "pts": 7.0,
-                        "stl": 1.0,
-                        "tov": 0.0,
-                        "trb": 6.0,
-                        "Team": "Challengers",
-                        "two_p": 2.0,
-                        "fg_pct": 0.3,
-                        "ft_pct": 0.0,
-                        "two_pa": 7.0,
-                        "three_p": 1.0,
-                        "three_pa": 3.0,
-                        "canonical": "swoopster-0",
-                        "two_p_pct": 0.29,
-                        "three_p_pct": 0.33,
-                    },
-                    {
-                        "fg": 3.0,
-                        "ft": 2.0,
-                        "pf": 2.0,
-                        "ast": 1.0,
-                        "blk": 0.0,
-                        "drb": 4.0,
-                        "fga": 9.0,
-                        "fta": 2.0,
-                        "orb": 1.0,
-                        "pts": 8.0,
-                        "stl": 3.0,
-                        "tov": 0.0,
-                        "trb": 5.0,
-                        "Team": "Challengers",
-                        "two_p": 3.0,
-                        "fg_pct": 0.33,
-                        "ft_pct": 1.0,
-                        "two_pa": 7.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-1",
-                        "two_p_pct": 0.43,
-                        "three_p_pct": 0.0,
-                    },
-                    {
-                        "fg": 6.0,
-                        "ft": 0.0,
-                        "pf": 1.0,
-                        "ast": 3.0,
-                        "blk": 1.0,
-                        "drb": 4.0,
-                        "fga": 14.0,
-                        "fta": 1.0,
-                        "orb": 1.0,
-                        "pts": 14.0,
-                        "stl": 0.0,
-                        "tov": 0.0,
-                        "trb": 5.0,
-                        "Team": "Challengers",
-                        "two_p": 4.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": 0.0,
-                        "two_pa": 8.0,
-                        "three_p": 2.0,
-                        "three_pa": 6.0,
-                        "canonical": "swoopster-2",
-                        "two_p_pct": 0.5,
-                        "three_p_pct": 0.33,
-                    },
-                    {
-                        "fg": 4.0,
-                        "ft": 1.0,
-                        "pf": 2.0,
-                        "ast": 4.0,
-                        "blk": 0.0,
-                        "drb": 6.0,
-                        "fga": 9.0,
-                        "fta": 2.0,
-                        "orb": 2.0,
-                        "pts": 9.0,
-                        "stl": 0.0,
-                        "tov": 1.0,
-                        "trb": 8.0,
-                        "Team": "Challengers",
-                        "two_p": 4.0,
-                        "fg_pct": 0.44,
-                        "ft_pct": 0.5,
-                        "two_pa": 7.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-3",
-                        "two_p_pct": 0.57,
-                        "three_p_pct": 0.0,
-                    },
-                    {
-                        "fg": 5.0,
-                        "ft": 0.0,
-                        "pf": 3.0,
-                        "ast": 1.0,
-                        "blk": 0.0,
-                        "drb": 3.0,
-                        "fga": 10.0,
-                        "fta": 0.0,
-                        "orb": 2.0,
-                        "pts": 13.0,
-                        "stl": 0.0,
-                        "tov": 3.0,
-                        "trb": 5.0,
-                        "Team": "Challengers",
-                        "two_p": 2.0,
-                        "fg_pct": 0.5,
-                        "ft_pct": 0.0,
-                        "two_pa": 6.0,
-                        "three_p": 3.0,
-                        "three_pa": 4.0,
-                        "canonical": "swoopster-4",
-                        "two_p_pct": 0.33,
-                        "three_p_pct": 0.75,
-                    },
-                    {
-                        "fg": 3.0,
-                        "ft": 4.0,
-                        "pf": 1.0,
-                        "ast": 1.0,
-                        "blk": 0.0,
-                        "drb": 2.0,
-                        "fga": 7.0,
-                        "fta": 4.0,
-                        "orb": 0.0,
-                        "pts": 10.0,
-                        "stl": 0.0,
-                        "tov": 0.0,
-                        "trb": 2.0,
-                        "Team": "Challenged",
-                        "two_p": 3.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": 1.0,
-                        "two_pa": 5.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-5",
-                        "two_p_pct": 0.6,
-                        "three_p_pct": 0.0,
-                    },
-                    {
-                        "fg": 7.0,
-                        "ft": 0.0,
-                        "pf": 1.0,
-                        "ast": 1.0,
-                        "blk": 1.0,
-                        "drb": 4.0,
-                        "fga": 14.0,
-                        "fta": 0.0,
-                        "orb": 1.0,
-                        "pts": 15.0,
-                        "stl": 0.0,
-                        "tov": 0.0,
-                        "trb": 5.0,
-                        "Team": "Challenged",
-                        "two_p": 6.0,
-                        "fg_pct": 0.5,
-                        "ft_pct": 0.0,
-                        "two_pa": 11.0,
-                        "three_p": 1.0,
-                        "three_pa": 3.0,
-                        "canonical": "swoopster-6",
-                        "two_p_pct": 0.55,
-                        "three_p_pct": 0.33,
-                    },
-                    {
-                        "fg": 3.0,
-                        "ft": 0.0,
-                        "pf": 2.0,
-                        "ast": 2.0,
-                        "blk": 0.0,
-                        "drb": 3.0,
-                        "fga": 11.0,
-                        "fta": 0.0,
-                        "orb": 1.0,
-                        "pts": 9.0,
-                        "stl": 1.0,
-                        "tov": 1.0,
-                        "trb": 4.0,
-                        "Team": "Challenged",
-                        "two_p": 0.0,
-                        "fg_pct": 0.27,
-                        "ft_pct": 0.0,
-                        "two_pa": 4.0,
-                        "three_p": 3.0,
-                        "three_pa": 7.0,
-                        "canonical": "swoopster-7",
-                        "two_p_pct": 0.0,
-                        "three_p_pct": 0.43,
-                    },
-                    {
-                        "fg": 6.0,
-                        "ft": 0.0,
-                        "pf": 4.0,
-                        "ast": 4.0,
-                        "blk": 1.0,
-                        "drb": 7.0,
-                        "fga": 11.0,
-                        "fta": 1.0,
-                        "orb": 0.0,
-                        "pts": 14.0,
-                        "stl": 0.0,
-                        "tov": 4.0,
-                        "trb": 7.0,
-                        "Team": "Challenged",
-                        "two_p": 4.0,
-                        "fg_pct": 0.55,
-                        "ft_pct": 0.0,
-                        "two_pa": 7.0,
-                        "three_p": 2.0,
-                        "three_pa": 4.0,
-                        "canonical": "swoopster-8",
-                        "two_p_pct": 0.57,
-                        "three_p_pct": 0.5,
-                    },
-                    {
-                        "fg": 4.0,
-                        "ft": 3.0,
-                        "pf": 4.0,
-                        "ast": 2.0,
-                        "blk": 0.0,
-                        "drb": 4.0,
-                        "fga": 11.0,
-                        "fta": 4.0,
-                        "orb": 1.0,
-                        "pts": 11.0,
-                        "stl": 1.0,
-                        "tov": 2.0,
-                        "trb": 5.0,
-                        "Team": "Challenged",
-                        "two_p": 4.0,
-                        "fg_pct": 0.36,
-                        "ft_pct": 0.75,
-                        "two_pa": 9.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-9",
-                        "two_p_pct": 0.44,
-                        "three_p_pct": 0.0,
-                    },
-                ],
-                "challenged_boxscore": [
-                    {
-                        "fg": 3.0,
-                        "ft": 4.0,
-                        "pf": 1.0,
-                        "ast": 1.0,
-                        "blk": 0.0,
-                        "drb": 2.0,
-                        "fga": 7.0,
-                        "fta": 4.0,
-                        "orb": 0.0,
-                        "pts": 10.0,
-                        "stl": 0.0,
-                        "tov": 0.0,
-                        "trb": 2.0,
-                        "two_p": 3.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": 1.0,
-                        "two_pa": 5.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-5",
-                        "two_p_pct": 0.6,
-                        "three_p_pct": 0.0,
-                    },
-                    {
-                        "fg": 7.0,
-                        "ft": 0.0,
-                        "pf": 1.0,
-                        "ast": 1.0,
-                        "blk": 1.0,
-                        "drb": 4.0,
-                        "fga": 14.0,
-                        "fta": 0.0,
-                        "orb": 1.0,
-                        "pts": 15.0,
-                        "stl": 0.0,
-                        "tov": 0.0,
-                        "trb": 5.0,
-                        "two_p": 6.0,
-                        "fg_pct": 0.5,
-                        "ft_pct": 0.0,
-                        "two_pa": 11.0,
-                        "three_p": 1.0,
-                        "three_pa": 3.0,
-                        "canonical": "swoopster-6",
-                        "two_p_pct": 0.55,
-                        "three_p_pct": 0.33,
-                    },
-                    {
-                        "fg": 3.0,
-                        "ft": 0.0,
-                        "pf": 2.0,
-                        "ast": 2.0,
-                        "blk": 0.0,
-                        "drb": 3.0,
-                        "fga": 11.0,
-                        "fta": 0.0,
-                        "orb": 1.0,
-                        "pts": 9.0,
-                        "stl": 1.0,
-                        "tov": 1.0,
-                        "trb": 4.0,
-                        "two_p": 0.0,
-                        "fg_pct": 0.27,
-                        "ft_pct": 0.0,
-                        "two_pa": 4.0,
-                        "three_p": 3.0,
-                        "three_pa": 7.0,
-                        "canonical": "swoopster-7",
-                        "two_p_pct": 0.0,
-                        "three_p_pct": 0.43,
-                    },
-                    {
-                        "fg": 6.0,
-                        "ft": 0.0,
-                        "pf": 4.0,
-                        "ast": 4.0,
-                        "blk": 1.0,
-                        "drb": 7.0,
-                        "fga": 11.0,
-                        "fta": 1.0,
-                        "orb": 0.0,
-                        "pts": 14.0,
-                        "stl": 0.0,
-                        "tov": 4.0,
-                        "trb": 7.0,
-                        "two_p": 4.0,
-                        "fg_pct": 0.55,
-                        "ft_pct": 0.0,
-                        "two_pa": 7.0,
-                        "three_p": 2.0,
-                        "three_pa": 4.0,
-                        "canonical": "swoopster-8",
-                        "two_p_pct": 0.57,
-                        "three_p_pct": 0.5,
-                    },
-                    {
-                        "fg": 4.0,
-                        "ft": 3.0,
-                        "pf": 4.0,
-                        "ast": 2.0,
-                        "blk": 0.0,
-                        "drb": 4.0,
-                        "fga": 11.0,
-                        "fta": 4.0,
-                        "orb": 1.0,
-                        "pts": 11.0,
-                        "stl": 1.0,
-                        "tov": 2.0,
-                        "trb": 5.0,
-                        "two_p": 4.0,
-                        "fg_pct": 0.36,
-                        "ft_pct": 0.75,
-                        "two_pa": 9.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-9",
-                        "two_p_pct": 0.44,
-                        "three_p_pct": 0.0,
-                    },
-                ],
-                "challengers_boxscore": [
-                    {
-                        "fg": 3.0,
-                        "ft": 0.0,
-                        "pf": 1.0,
-                        "ast": 2.0,
-                        "blk": 0.0,
-                        "drb": 6.0,
-                        "fga": 10.0,
-                        "fta": 0.0,
-                        "orb": 0.0,
-                        "pts": 7.0,
-                        "stl": 1.0,
-                        "tov": 0.0,
-                        "trb": 6.0,
-                        "two_p": 2.0,
-                        "fg_pct": 0.3,
-                        "ft_pct": 0.0,
-                        "two_pa": 7.0,
-                        "three_p": 1.0,
-                        "three_pa": 3.0,
-                        "canonical": "swoopster-0",
-                        "two_p_pct": 0.29,
-                        "three_p_pct": 0.33,
-                    },
-                    {
-                        "fg": 3.0,
-                        "ft": 2.0,
-                        "pf": 2.0,
-                        "ast": 1.0,
-                        "blk": 0.0,
-                        "drb": 4.0,
-                        "fga": 9.0,
-                        "fta": 2.0,
-                        "orb": 1.0,
-                        "pts": 8.0,
-                        "stl": 3.0,
-                        "tov": 0.0,
-                        "trb": 5.0,
-                        "two_p": 3.0,
-                        "fg_pct": 0.33,
-                        "ft_pct": 1.0,
-                        "two_pa": 7.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-1",
-                        "two_p_pct": 0.43,
-                        "three_p_pct": 0.0,
-                    },
-                    {
-                        "fg": 6.0,
-                        "ft": 0.0,
-                        "pf": 1.0,
-                        "ast": 3.0,
-                        "blk": 1.0,
-                        "drb": 4.0,
-                        "fga": 14.0,
-                        "fta": 1.0,
-                        "orb": 1.0,
-                        "pts": 14.0,
-                        "stl": 0.0,
-                        "tov": 0.0,
-                        "trb": 5.0,
-                        "two_p": 4.0,
-                        "fg_pct": 0.43,
-                        "ft_pct": 0.0,
-                        "two_pa": 8.0,
-                        "three_p": 2.0,
-                        "three_pa": 6.0,
-                        "canonical": "swoopster-2",
-                        "two_p_pct": 0.5,
-                        "three_p_pct": 0.33,
-                    },
-                    {
-                        "fg": 4.0,
-                        "ft": 1.0,
-                        "pf": 2.0,
-                        "ast": 4.0,
-                        "blk": 0.0,
-                        "drb": 6.0,
-                        "fga": 9.0,
-                        "fta": 2.0,
-                        "orb": 2.0,
-                        "pts": 9.0,
-                        "stl": 0.0,
-                        "tov": 1.0,
-                        "trb": 8.0,
-                        "two_p": 4.0,
-                        "fg_pct": 0.44,
-                        "ft_pct": 0.5,
-                        "two_pa": 7.0,
-                        "three_p": 0.0,
-                        "three_pa": 2.0,
-                        "canonical": "swoopster-3",
-                        "two_p_pct": 0.57,
-                        "three_p_pct": 0.0,
-                    },
-                    {
-                        "fg": 5.0,
-                        "ft": 0.0,
-                        "pf": 3.0,
-                        "ast": 1.0,
-                        "blk": 0.0,
-                        "drb": 3.0,
-                        "fga": 10.0,
-                        "fta": 0.0,
-                        "orb": 2.0,
-                        "pts": 13.0,
-                        "stl": 0.0,
-                        "tov": 3.0,
-                        "trb": 5.0,
-                        "two_p": 2.0,
-                        "fg_pct": 0.5,
-                        "ft_pct": 0.0,
-                        "two_pa": 6.0,
-                        "three_p": 3.0,
-                        "three_pa": 4.0,
-                        "canonical": "swoopster-4",
-                        "two_p_pct": 0.33,
-                        "three_p_pct": 0.75,
-                    },
-                ],
-            },
-        },
+            }
+        ),
     )
 
     retrieve_player_stats = mocker.patch.object(
@@ -955,7 +979,7 @@ def test_update_games(mocker, settings):
 
     call_command("update_simulated_games")
 
-    assert len(patched_retrieve_game.call_args_list) == 1
+    assert len(patched_retrieve_games.call_args_list) == 1
     assert (
         simulator.models.Simulation.objects.filter(
             status=simulator.models.Simulation.Status.FINISHED
@@ -967,7 +991,7 @@ def test_update_games(mocker, settings):
 
     # No other changes should happen
     call_command("update_simulated_games")
-    assert len(patched_retrieve_game.call_args_list) == 1
+    assert len(patched_retrieve_games.call_args_list) == 1
     assert (
         simulator.models.Simulation.objects.filter(
             status=simulator.models.Simulation.Status.FINISHED
@@ -992,8 +1016,8 @@ def test_update_games(mocker, settings):
     assert simulation_obj.result.lineup_2_player_4_box_score.pts == 14
     assert simulation_obj.result.lineup_2_player_5_box_score.pts == 11
     assert simulation_obj.result.lineup_2_box_score.pts == 59
-    assert simulation_obj.play_by_play.feed is not None
-    assert simulation_obj.play_by_play.feed != ""
+    assert simulation_obj.play_by_play.event_count > 0
+    assert simulation_obj.play_by_play.chunks.exists()
     # test wins losses were updated
     assert simulation_obj.game.lineup_1.team.wins == 0
     assert simulation_obj.game.lineup_1.team.losses == 1
@@ -1045,8 +1069,8 @@ def test_update_games(mocker, settings):
 @pytest.mark.django_db
 def test_update_games_error(mocker):
     mocker.patch("simulator.processing.game_simulation_status_updated")
-    patched_retrieve_game = mocker.patch.object(
-        Client, "retrieve_game", side_effect=Exception("Unexpected exception!")
+    patched_retrieve_game_statuses = mocker.patch.object(
+        Client, "retrieve_game_statuses", side_effect=Exception("Unexpected exception!")
     )
     ddf.G(
         "simulator.Simulation",
@@ -1054,8 +1078,9 @@ def test_update_games_error(mocker):
         status=simulator.models.Simulation.Status.PENDING,
     )
 
+    # All five statuses are polled in a single batch request
     call_command("update_simulated_games")
-    assert len(patched_retrieve_game.call_args_list) == 5
+    assert len(patched_retrieve_game_statuses.call_args_list) == 1
     assert simulator.models.Simulation.objects.count() == 5
     assert (
         simulator.models.Simulation.objects.filter(
@@ -1066,82 +1091,170 @@ def test_update_games_error(mocker):
 
     # No other changes should happen since we haven't waited long enough for next retry
     call_command("update_simulated_games")
-    assert len(patched_retrieve_game.call_args_list) == 5
+    assert len(patched_retrieve_game_statuses.call_args_list) == 1
     assert simulator.models.Simulation.objects.count() == 5
 
     # Fast forward to the future and we will retry 4 more times
     with freezegun.freeze_time(timezone.now() + dt.timedelta(minutes=10)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 10
+        assert len(patched_retrieve_game_statuses.call_args_list) == 2
         assert simulator.models.Simulation.objects.count() == 5
 
     with freezegun.freeze_time(timezone.now() + dt.timedelta(minutes=25)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 15
+        assert len(patched_retrieve_game_statuses.call_args_list) == 3
         assert simulator.models.Simulation.objects.count() == 5
 
     with freezegun.freeze_time(timezone.now() + dt.timedelta(minutes=45)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 20
+        assert len(patched_retrieve_game_statuses.call_args_list) == 4
         assert simulator.models.Simulation.objects.count() == 5
 
     with freezegun.freeze_time(timezone.now() + dt.timedelta(minutes=70)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 25
+        assert len(patched_retrieve_game_statuses.call_args_list) == 5
         assert simulator.models.Simulation.objects.count() == 5
 
     # We are done retrying
     with freezegun.freeze_time(timezone.now() + dt.timedelta(minutes=100)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 25
+        assert len(patched_retrieve_game_statuses.call_args_list) == 5
         assert simulator.models.Simulation.objects.count() == 5
 
 
 @pytest.mark.django_db
 def test_update_games_timeout(mocker):
     mocker.patch("simulator.processing.game_simulation_status_updated")
-    patched_retrieve_game = mocker.patch.object(
+    patched_retrieve_game_statuses = mocker.patch.object(
         Client,
-        "retrieve_game",
-        return_value={
-            "status": simulator.models.Simulation.Status.STARTED,
-        },
+        "retrieve_game_statuses",
+        side_effect=game_statuses(simulator.models.Simulation.Status.STARTED),
     )
+    patched_retrieve_games = mocker.patch.object(Client, "retrieve_games")
     sim = ddf.G(
         "simulator.Simulation",
         status=simulator.models.Simulation.Status.PENDING,
     )
 
     call_command("update_simulated_games")
-    assert len(patched_retrieve_game.call_args_list) == 1
+    assert len(patched_retrieve_game_statuses.call_args_list) == 1
     sim.refresh_from_db()
     assert sim.status == simulator.models.Simulation.Status.STARTED
 
     with freezegun.freeze_time(timezone.now() + dt.timedelta(minutes=10)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 2
+        assert len(patched_retrieve_game_statuses.call_args_list) == 2
         sim.refresh_from_db()
         assert sim.status == simulator.models.Simulation.Status.STARTED
 
     # Time out simulations after 8 hours
     with freezegun.freeze_time(timezone.now() + dt.timedelta(days=1)):
         call_command("update_simulated_games")
-        assert len(patched_retrieve_game.call_args_list) == 3
+        assert len(patched_retrieve_game_statuses.call_args_list) == 3
         sim.refresh_from_db()
         assert sim.status == simulator.models.Simulation.Status.TIMED_OUT
 
     # The simulation should no longer be touched
     call_command("update_simulated_games")
-    assert len(patched_retrieve_game.call_args_list) == 3
+    assert len(patched_retrieve_game_statuses.call_args_list) == 3
     sim.refresh_from_db()
     assert sim.status == simulator.models.Simulation.Status.TIMED_OUT
 
+    # Full payloads are never downloaded for unfinished games
+    assert not patched_retrieve_games.called
+
+
+@pytest.mark.django_db
+def test_update_games_concurrently(mocker, settings):
+    settings.SIMULATOR_POLL_STATUS_BATCH_SIZE = 2
+    mocker.patch("simulator.processing.game_simulation_status_updated")
+    patched_retrieve_game_statuses = mocker.patch.object(
+        Client,
+        "retrieve_game_statuses",
+        side_effect=game_statuses(simulator.models.Simulation.Status.STARTED),
+    )
+    ddf.G(
+        "simulator.Simulation",
+        n=6,
+        status=simulator.models.Simulation.Status.PENDING,
+    )
+
+    simulator.processing.update_games(concurrency=3)
+    assert len(patched_retrieve_game_statuses.call_args_list) == 3
+    assert (
+        simulator.models.Simulation.objects.filter(
+            status=simulator.models.Simulation.Status.STARTED
+        ).count()
+        == 6
+    )
+
+
+@pytest.mark.django_db
+def test_update_games_missing_from_batch(mocker):
+    mocker.patch("simulator.processing.game_simulation_status_updated")
+    sims = [
+        ddf.G(
+            "simulator.Simulation",
+            uuid=uuid.uuid4(),
+            status=simulator.models.Simulation.Status.PENDING,
+        )
+        for _ in range(2)
+    ]
+    mocker.patch.object(
+        Client,
+        "retrieve_game_statuses",
+        return_value={"results": [{"uuid": str(sims[0].uuid), "status": "STARTED"}]},
+    )
+
+    simulator.processing.update_games()
+
+    # Only the simulation the simulator left out of the response errors
+    sims[0].refresh_from_db()
+    assert sims[0].status == simulator.models.Simulation.Status.STARTED
+    sims[1].refresh_from_db()
+    assert sims[1].status == simulator.models.Simulation.Status.ERRORED
+
+
+@pytest.mark.django_db
+def test_update_games_deadline(mocker):
+    mocker.patch("simulator.processing.game_simulation_status_updated")
+    released = threading.Event()
+    retrieve_started_game_statuses = game_statuses(
+        simulator.models.Simulation.Status.STARTED
+    )
+
+    def slow_retrieve_game_statuses(uuids):
+        released.wait(timeout=5)
+        return retrieve_started_game_statuses(uuids)
+
+    mocker.patch.object(
+        Client, "retrieve_game_statuses", side_effect=slow_retrieve_game_statuses
+    )
+    ddf.G(
+        "simulator.Simulation",
+        n=2,
+        status=simulator.models.Simulation.Status.PENDING,
+    )
+
+    try:
+        simulator.processing.update_games(concurrency=1, deadline=1)
+    finally:
+        released.set()
+
+    # Nothing finished before the deadline, so every simulation is deferred
+    assert (
+        simulator.models.Simulation.objects.filter(
+            status=simulator.models.Simulation.Status.PENDING
+        ).count()
+        == 2
+    )
+
 
 @pytest.mark.django_db
 def test_game_errors_to_terminal_failure(mocker):
     mocker.patch("simulator.processing.game_simulation_status_updated")
-    patched_retrieve_game = mocker.patch.object(
-        Client, "retrieve_game", side_effect=Exception("Unexpected exception!")
+    patched_retrieve_game_statuses = mocker.patch.object(
+        Client, "retrieve_game_statuses", side_effect=Exception("Unexpected exception!")
     )
 
     sim = ddf.G(
@@ -1151,7 +1264,7 @@ def test_game_errors_to_terminal_failure(mocker):
     )
 
     call_command("update_simulated_games")
-    assert len(patched_retrieve_game.call_args_list) == 1
+    assert len(patched_retrieve_game_statuses.call_args_list) == 1
     sim.refresh_from_db()
     assert sim.status == simulator.models.Simulation.Status.TERMINAL_ERROR
 
@@ -1472,3 +1585,275 @@ def test_sync_players(mocker, settings):
 
     assert len(patched_retrieve_players.call_args_list) == 1
     assert simulator.models.Player.objects.all().count() == 1
+
+
+def simulator_player(token, **kwargs):
+    """The minimal simulator data of a player"""
+    return {
+        "uuid": str(uuid.uuid5(uuid.NAMESPACE_OID, str(token))),
+        "token": token,
+        "full_name": f"TEST-{token}",
+        "canonical": f"test-{token}",
+        "positions": ["F"],
+        "age": 3.0,
+        "star_rating": 1.0,
+        "attributes": {"three_pt_rating": 50},
+        "visual_attributes": {"hair": "blue"},
+        "top_attributes": ["three_pt_rating"],
+    } | kwargs
+
+
+@pytest.mark.django_db
+def test_sync_players_in_batches(mocker, settings):
+    settings.PLAYER_MIN_TOKEN_ID_ACCESSIBLE = 0
+    settings.PLAYER_MAX_TOKEN_ID_ACCESSIBLE = 10
+    mocker.patch.object(simulator.processing, "SYNC_PLAYERS_BATCH_SIZE", 2)
+    patched_upsert = mocker.patch(
+        "simulator.processing.pgbulk.upsert",
+        autospec=True,
+        side_effect=simulator.processing.pgbulk.upsert,
+    )
+    mocker.patch.object(
+        Client,
+        "players",
+        return_value=iter(simulator_player(token) for token in range(12)),
+    )
+
+    simulator.processing.sync_players()
+
+    # Token 11 is not accessible. Each batch is upserted once
+    assert [len(call.args[1]) for call in patched_upsert.call_args_list] == [
+        2,
+        2,
+        2,
+        2,
+        2,
+        1,
+    ]
+    assert simulator.models.Player.objects.count() == 11
+
+
+@pytest.mark.django_db
+def test_sync_players_skips_unchanged(mocker, settings):
+    settings.PLAYER_MIN_TOKEN_ID_ACCESSIBLE = 0
+    settings.PLAYER_MAX_TOKEN_ID_ACCESSIBLE = 10
+    patched_upsert = mocker.patch(
+        "simulator.processing.pgbulk.upsert",
+        autospec=True,
+        side_effect=simulator.processing.pgbulk.upsert,
+    )
+    patched_players = mocker.patch.object(Client, "players")
+
+    patched_players.return_value = [simulator_player(1), simulator_player(2)]
+    simulator.processing.sync_players()
+    assert len(patched_upsert.call_args_list) == 1
+
+    # Stats are maintained locally and are not overwritten by the sync
+    simulator.models.Player.objects.update(g=10, prior_tokens=[3])
+
+    # Nothing changed, so nothing is written
+    simulator.processing.sync_players()
+    assert len(patched_upsert.call_args_list) == 1
+
+    patched_players.return_value = [
+        simulator_player(1),
+        simulator_player(2, full_name="RENAMED", positions=["F", "C"]),
+    ]
+    simulator.processing.sync_players()
+    assert len(patched_upsert.call_args_list) == 2
+    assert [player.token for player in patched_upsert.call_args.args[1]] == [2]
+
+    player = simulator.models.Player.objects.get(token=2)
+    assert player.full_name == "RENAMED"
+    assert player.position_2 == "C"
+    assert player.g == Decimal(10)
+    assert player.prior_tokens == [3]
+
+
+@pytest.mark.django_db
+def test_sync_players_incremental(mocker, settings):
+    settings.PLAYER_MIN_TOKEN_ID_ACCESSIBLE = 0
+    settings.PLAYER_MAX_TOKEN_ID_ACCESSIBLE = 10
+    patched_players = mocker.patch.object(Client, "players")
+
+    patched_players.return_value = [
+        simulator_player(1, updated_at="2023-01-01T00:00:00Z"),
+        simulator_player(2, updated_at="2023-01-02T00:00:00Z"),
+    ]
+    simulator.processing.sync_players()
+    assert patched_players.call_args.kwargs == {"updated_since": None}
+
+    # Player 1 is older than the cursor and is skipped even if the simulator
+    # returns it
+    patched_players.return_value = [
+        simulator_player(1, full_name="STALE", updated_at="2023-01-01T00:00:00Z"),
+        simulator_player(2, full_name="NEW", updated_at="2023-01-03T00:00:00Z"),
+    ]
+    simulator.processing.sync_players()
+    assert patched_players.call_args.kwargs == {
+        "updated_since": dt.datetime(2023, 1, 2, tzinfo=dt.timezone.utc)
+        - simulator.processing.SYNC_PLAYERS_CURSOR_OVERLAP
+    }
+    assert simulator.models.Player.objects.get(token=1).full_name == "TEST-1"
+    assert simulator.models.Player.objects.get(token=2).full_name == "NEW"
+
+    # A full sync fetches and compares every player
+    simulator.processing.sync_players(full=True)
+    assert patched_players.call_args.kwargs == {"updated_since": None}
+    assert simulator.models.Player.objects.get(token=1).full_name == "STALE"
+
+
+@pytest.mark.django_db
+def test_update_games_finalizes_games_in_batches(mocker, settings):
+    settings.SIMULATOR_POLL_GAME_BATCH_SIZE = 3
+    mocker.patch("simulator.processing.game_simulation_status_updated")
+    mocker.patch("comm.handlers.game_complete_handler")
+    mocker.patch.object(
+        Client, "create_game", side_effect=lambda **kwargs: {"uuid": uuid.uuid4()}
+    )
+    mocker.patch.object(
+        Client, "retrieve_game_statuses", side_effect=game_statuses("FINISHED")
+    )
+    retrieve_player_stats = mocker.patch.object(
+        Client, "retrieve_player_stats", return_value={"results": []}
+    )
+    _, team_1 = build_user_and_team()
+    _, team_2 = build_user_and_team()
+    lineup_1 = build_lineup(team_1)
+    lineup_2 = build_lineup(team_2)
+    simulations = [
+        build_game(lineup1=lineup_1, lineup2=lineup_2).simulation for _ in range(4)
+    ]
+    payloads = {
+        str(simulations[0].uuid): build_game_result(simulations[0], 80, 70),
+        str(simulations[1].uuid): build_game_result(simulations[1], 90, 70),
+        str(simulations[2].uuid): build_game_result(simulations[2], 60, 70),
+        # A payload without box scores must not fail the other games
+        str(simulations[3].uuid): {"players": {}, "totals": []},
+    }
+    mocker.patch.object(
+        Client,
+        "retrieve_games",
+        side_effect=lambda uuids: {
+            "results": [
+                {"uuid": str(uuid), "result": payloads[str(uuid)]} for uuid in uuids
+            ]
+        },
+    )
+
+    simulator.processing.update_games()
+
+    for simulation in simulations:
+        simulation.refresh_from_db()
+    assert [simulation.status for simulation in simulations] == [
+        simulator.models.Simulation.Status.FINISHED
+    ] * 3 + [simulator.models.Simulation.Status.ERRORED]
+    assert simulations[1].result.lineup_1_score == 90
+    assert simulations[1].result.lineup_2_player_5_box_score.pts == 14
+    assert simulations[2].play_by_play.event_count == 1
+    assert simulator.models.BoxScore.objects.count() == 36
+    assert simulator.models.PlayerGameStats.objects.count() == 30
+    assert simulator.models.TeamGameStats.objects.filter(won=True).count() == 3
+
+    # The three games are finalized together
+    (call,) = retrieve_player_stats.call_args_list
+    assert len(call.kwargs["uuids"]) == 30
+
+    team_1.refresh_from_db()
+    team_2.refresh_from_db()
+    assert (team_1.wins, team_1.losses) == (2, 1)
+    assert (team_2.wins, team_2.losses) == (1, 2)
+
+
+@pytest.mark.django_db
+def test_update_games_finalizes_games_one_at_a_time_when_a_batch_fails(mocker):
+    mocker.patch("simulator.processing.game_simulation_status_updated")
+    mocker.patch.object(
+        Client, "create_game", side_effect=lambda **kwargs: {"uuid": uuid.uuid4()}
+    )
+    mocker.patch.object(
+        Client, "retrieve_game_statuses", side_effect=game_statuses("FINISHED")
+    )
+    mocker.patch.object(Client, "retrieve_player_stats", return_value={"results": []})
+    _, team_1 = build_user_and_team()
+    _, team_2 = build_user_and_team()
+    lineup_1 = build_lineup(team_1)
+    lineup_2 = build_lineup(team_2)
+    simulations = [
+        build_game(
+            game.models.Contest.Status.OPEN,
+            game.models.Contest.Kind.TOURNAMENT,
+            lineup1=lineup_1,
+            lineup2=lineup_2,
+        ).simulation
+        for _ in range(2)
+    ]
+    payloads = {
+        str(simulation.uuid): build_game_result(simulation, 80, 70)
+        for simulation in simulations
+    }
+    # Parsed, but can't be written
+    payloads[str(simulations[1].uuid)]["totals"][0]["pts"] = "eighty"
+    mocker.patch.object(
+        Client,
+        "retrieve_games",
+        side_effect=lambda uuids: {
+            "results": [
+                {"uuid": str(uuid), "result": payloads[str(uuid)]} for uuid in uuids
+            ]
+        },
+    )
+
+    simulator.processing.update_games()
+
+    for simulation in simulations:
+        simulation.refresh_from_db()
+    assert simulations[0].status == simulator.models.Simulation.Status.FINISHED
+    assert simulations[0].result.lineup_1_score == 80
+    assert simulations[1].status == simulator.models.Simulation.Status.ERRORED
+    assert simulations[1].result is None
+    assert simulator.models.BoxScore.objects.count() == 12
+
+
+@pytest.mark.django_db
+def test_create_games_concurrently(mocker, django_assert_num_queries):
+    mocker.patch.object(
+        Client, "create_game", side_effect=lambda **kwargs: {"uuid": uuid.uuid4()}
+    )
+    my_games = []
+    for _ in range(3):
+        _, team_1 = build_user_and_team()
+        _, team_2 = build_user_and_team()
+        my_games.append(
+            build_game(lineup1=build_lineup(team_1), lineup2=build_lineup(team_2))
+        )
+    simulator.models.Simulation.objects.update(
+        status=simulator.models.Simulation.Status.NOT_CREATED
+    )
+    simulations = list(
+        simulator.models.Simulation.objects.select_related("game").order_by("id")
+    )
+    failing_players = simulations[1].lineup_1_uuids
+
+    def create_game(*, lineup_1_players, lineup_2_players, is_published):
+        if lineup_1_players == failing_players:
+            raise Exception("Simulator error")
+        return {"uuid": uuid.uuid4()}
+
+    mocker.patch.object(Client, "create_game", side_effect=create_game)
+
+    with django_assert_num_queries(1):
+        failed = simulator.processing.create_games_concurrently(
+            simulations, concurrency=2
+        )
+
+    assert failed == [simulations[1]]
+    assert list(
+        simulator.models.Simulation.objects.order_by("id").values_list(
+            "status", flat=True
+        )
+    ) == [
+        simulator.models.Simulation.Status.PENDING,
+        simulator.models.Simulation.Status.NOT_CREATED,
+        simulator.models.Simulation.Status.PENDING,
+    ]
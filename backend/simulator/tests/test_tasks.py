@@ -6,6 +6,7 @@ import pytest
 
 import game.models
 import simulator.tasks
+import simulator.utils
 
 
 @pytest.mark.django_db
@@ -60,3 +61,61 @@ def test_calc_players_stats(mocker):
     assert simulated_player.three_pa == Decimal(str(6.33))
     assert simulated_player.two_p_pct == Decimal(str(0.49))
     assert simulated_player.three_p_pct == Decimal(str(0.409))
+
+
+@pytest.mark.django_db
+def test_calc_players_stats_bulk(django_assert_num_queries):
+    players = ddf.G("game.Player", n=5, simulated=ddf.F(age=3))
+    player_uuids = [str(player.simulated.uuid) for player in players]
+
+    simulator_client = MagicMock()
+    simulator_client.retrieve_player_stats.return_value = {
+        "results": [
+            {"player_uuid": player_uuid, "wins": i, "losses": 10 - i, "g": 10}
+            for i, player_uuid in enumerate(player_uuids)
+        ]
+    }
+
+    # One lookup of the game players and one UPDATE per table, regardless of the
+    # number of players
+    with django_assert_num_queries(3):
+        simulator.utils.update_simulator_player_stats(simulator_client, player_uuids)
+
+    for i, player in enumerate(players):
+        player.refresh_from_db()
+        player.simulated.refresh_from_db()
+        assert player.wins == i
+        assert player.losses == 10 - i
+        assert player.simulated.g == Decimal(10)
+
+
+@pytest.mark.django_db
+def test_calc_players_stats_with_missing_stats():
+    players = ddf.G(
+        "game.Player",
+        n=3,
+        wins=0,
+        losses=0,
+        simulated=ddf.F(age=3, g=1, ppg=Decimal(5)),
+    )
+    player_uuids = [str(player.simulated.uuid) for player in players]
+
+    simulator_client = MagicMock()
+    simulator_client.retrieve_player_stats.return_value = {
+        "results": [
+            {"player_uuid": player_uuids[0], "wins": 1, "g": 10, "ppg": 20},
+            # Missing stats of a player do not drop them for the others
+            {"player_uuid": player_uuids[1], "wins": 2, "g": 11},
+            {"player_uuid": player_uuids[2], "losses": 3, "ppg": 21},
+        ]
+    }
+
+    simulator.utils.update_simulator_player_stats(simulator_client, player_uuids)
+
+    for player in players:
+        player.refresh_from_db()
+        player.simulated.refresh_from_db()
+    assert [player.wins for player in players] == [1, 2, 0]
+    assert [player.losses for player in players] == [0, 0, 3]
+    assert [player.simulated.g for player in players] == [10, 11, 1]
+    assert [player.simulated.ppg for player in players] == [20, 5, 21]
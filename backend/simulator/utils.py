@@ -1,40 +1,75 @@
+import collections
+import uuid
+
+import pgbulk
+from django.db import transaction
+
+import game.leaderboard_cache
 import game.models
+import simulator.ingestion
 import simulator.models
 
 
-def update_simulator_player_stats(simulator_client, player_uuids):
-    # update and insert player simulated stats
-    simulator_player_fields = {
-        field.name for field in simulator.models.Player._meta.fields
-    }
+def _stat_fields(model, row):
+    """The fields of model that are present in a row of player stats"""
+    return tuple(
+        sorted(
+            field.name
+            for field in model._meta.fields
+            if not field.primary_key and not field.is_relation and field.name in row
+        )
+    )
 
-    game_player_fields = {field.name for field in game.models.Player._meta.fields}
 
+def _update_stats(model, stats_by_pk):
+    """Updates the stats of rows of model by their primary key, leaving the
+    fields missing from their stats as they are. Rows with the same fields are
+    updated with a single UPDATE ... FROM (VALUES ...) statement"""
+    objs_by_fields = collections.defaultdict(list)
+    for pk, row in stats_by_pk:
+        fields = _stat_fields(model, row)
+        objs_by_fields[fields].append(
+            model(pk=pk, **{field: row[field] for field in fields})
+        )
+
+    for fields, objs in objs_by_fields.items():
+        if fields:
+            pgbulk.update(model, objs, list(fields))
+
+
+def update_simulator_player_stats(simulator_client, player_uuids):
+    # update and insert player simulated stats
     result = simulator_client.retrieve_player_stats(
         uuids=player_uuids,
     )
+    rows = result["results"]
+    if not rows:
+        return
 
-    for player_stats in result["results"]:
-
-        # insert game player stats
+    # Game players are keyed by id, so look those up for the simulated uuids first.
+    game_player_ids = dict(
         game.models.Player.objects.filter(
-            simulated__uuid=player_stats["player_uuid"]
-        ).update(
-            **{
-                key: player_stats[key]
-                for key in player_stats
-                if key in game_player_fields
-            },
-        )
+            simulated_id__in=[row["player_uuid"] for row in rows]
+        ).values_list("simulated_id", "id")
+    )
 
-        # update simulator player stats
-        simulator.models.Player.objects.filter(uuid=player_stats["player_uuid"]).update(
-            **{
-                key: player_stats[key]
-                for key in player_stats
-                if key in simulator_player_fields
-            },
-        )
+    # insert game player stats
+    _update_stats(
+        game.models.Player,
+        [
+            (game_player_ids[uuid.UUID(str(row["player_uuid"]))], row)
+            for row in rows
+            if uuid.UUID(str(row["player_uuid"])) in game_player_ids
+        ],
+    )
+
+    # update simulator player stats
+    _update_stats(simulator.models.Player, [(row["player_uuid"], row) for row in rows])
+
+    # The player leaderboard is ordered by these stats
+    transaction.on_commit(
+        lambda: game.leaderboard_cache.invalidate(game.leaderboard_cache.PLAYER)
+    )
 
 
 def update_team_stats(simulation_obj):
@@ -59,95 +94,15 @@ def update_team_stats(simulation_obj):
         team_2.save()
 
 
-def is_winner(team, result):
-    other_team = {"Challengers": "Challenged", "Challenged": "Challengers"}
-    boxscore_by_team = {boxscore["Team"]: boxscore for boxscore in result["totals"]}
-    my_boxscore = boxscore_by_team[team]
-    other_boxscore = boxscore_by_team[other_team[team]]
-    return my_boxscore["pts"] > other_boxscore["pts"]
-
-
 def insert_player_game_stats_entries(simulation, result):
-    # Delete old entries if/when simulating a game again
-    simulator.models.PlayerGameStats.objects.filter(simulation=simulation.uuid).delete()
-    # Insert new entries
-    instances = []
-    for player_boxscore in result["combined_boxscore"]:
-        player_uuid = result["players"][player_boxscore["canonical"]]["uuid"]
-        player_team = player_boxscore["Team"]
-        won = is_winner(player_team, result)
-        my_entry = {
-            "player_id": player_uuid,
-            "simulation_id": simulation.uuid,
-            "won": won,
-            "fg": player_boxscore["fg"],
-            "ft": player_boxscore["ft"],
-            "pf": player_boxscore["pf"],
-            "ast": player_boxscore["ast"],
-            "blk": player_boxscore["blk"],
-            "drb": player_boxscore["drb"],
-            "fga": player_boxscore["fga"],
-            "fta": player_boxscore["fta"],
-            "orb": player_boxscore["orb"],
-            "pts": player_boxscore["pts"],
-            "stl": player_boxscore["stl"],
-            "tov": player_boxscore["tov"],
-            "trb": player_boxscore["trb"],
-            "two_p": player_boxscore["two_p"],
-            "fg_pct": player_boxscore["fg_pct"],
-            "ft_pct": player_boxscore["ft_pct"],
-            "two_pa": player_boxscore["two_pa"],
-            "three_p": player_boxscore["three_p"],
-            "three_pa": player_boxscore["three_pa"],
-            "two_p_pct": player_boxscore["two_p_pct"],
-            "three_p_pct": player_boxscore["three_p_pct"],
-        }
-        instance = simulator.models.PlayerGameStats(**my_entry)
-        instances.append(instance)
-    simulator.models.PlayerGameStats.objects.bulk_create(instances)
-
-
-def _get_team(team, simulation):
-    return {
-        "Challengers": simulation.game.lineup_1.team,
-        "Challenged": simulation.game.lineup_2.team,
-    }[team]
+    # Replaces old entries and their aggregated stats if/when simulating a game again
+    simulator.ingestion.replace_game_stats(
+        simulator.models.PlayerGameStats, [(simulation, result)]
+    )
 
 
 def insert_team_game_stats_entries(simulation, result):
-    # Delete old entries if/when simulating a game again
-    simulator.models.TeamGameStats.objects.filter(simulation=simulation.uuid).delete()
-    # Insert new entries
-    instances = []
-    for team_boxscore in result["totals"]:
-        team = team_boxscore["Team"]
-        won = is_winner(team, result)
-        my_entry = {
-            "team_id": _get_team(team, simulation).id,
-            "simulation_id": simulation.uuid,
-            "won": won,
-            "fg": team_boxscore["fg"],
-            "ft": team_boxscore["ft"],
-            "pf": team_boxscore["pf"],
-            "ast": team_boxscore["ast"],
-            "blk": team_boxscore["blk"],
-            "drb": team_boxscore["drb"],
-            "fga": team_boxscore["fga"],
-            "fta": team_boxscore["fta"],
-            "orb": team_boxscore["orb"],
-            "pts": team_boxscore["pts"],
-            "stl": team_boxscore["stl"],
-            "tov": team_boxscore["tov"],
-            "trb": team_boxscore["trb"],
-            "two_p": team_boxscore["two_p"],
-            "fg_pct": team_boxscore["fg_pct"],
-            "ft_pct": team_boxscore["ft_pct"],
-            "two_pa": team_boxscore["two_pa"],
-            "three_p": team_boxscore["three_p"],
-            "three_pa": team_boxscore["three_pa"],
-            "two_p_pct": team_boxscore["two_p_pct"],
-            "three_p_pct": team_boxscore["three_p_pct"],
-        }
-        instance = simulator.models.TeamGameStats(**my_entry)
-        instances.append(instance)
-    simulator.models.TeamGameStats.objects.bulk_create(instances)
+    # Replaces old entries and their aggregated stats if/when simulating a game again
+    simulator.ingestion.replace_game_stats(
+        simulator.models.TeamGameStats, [(simulation, result)]
+    )
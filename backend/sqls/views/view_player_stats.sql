@@ -0,0 +1,87 @@
+-- Replaced by view_player_stats
+DROP MATERIALIZED VIEW IF EXISTS
+    view_all_time_player_stats,
+    view_all_time_player_stats_1_token,
+    view_all_time_player_stats_3_tokens,
+    view_all_time_player_stats_5_tokens,
+    view_current_season_player_stats,
+    view_current_season_player_stats_1_token,
+    view_current_season_player_stats_3_tokens,
+    view_current_season_player_stats_5_tokens;
+
+-- Previously a materialized view
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM pg_matviews WHERE matviewname = 'view_player_stats') THEN
+        DROP MATERIALIZED VIEW view_player_stats;
+    END IF;
+END
+$$;
+
+-- Player stats per scope ('all_time' or 'current_season') and token tier (0 for
+-- games of any contest, otherwise the tokens required by the contest) derived
+-- from the running sums of simulator_playerstatsaggregate, which are kept up to date
+-- as game stats are written (see simulator.aggregates). Like AVG, averages skip
+-- the games a stat is NULL in
+CREATE OR REPLACE VIEW view_player_stats AS
+SELECT agg.player_id,
+       agg.scope,
+       agg.token_tier,
+       agg.count,
+       agg.wins,
+       agg.losses,
+       agg.fg / NULLIF(agg.fg_count, 0)             AS fg,
+       agg.ft / NULLIF(agg.ft_count, 0)             AS ft,
+       agg.pf / NULLIF(agg.pf_count, 0)             AS fpg,
+       agg.ast / NULLIF(agg.ast_count, 0)           AS apg,
+       agg.blk / NULLIF(agg.blk_count, 0)           AS bpg,
+       agg.drb / NULLIF(agg.drb_count, 0)           AS drpg,
+       agg.fga / NULLIF(agg.fga_count, 0)           AS fga,
+       agg.fta / NULLIF(agg.fta_count, 0)           AS fta,
+       agg.orb / NULLIF(agg.orb_count, 0)           AS orpg,
+       agg.pts / NULLIF(agg.pts_count, 0)           AS ppg,
+       agg.stl / NULLIF(agg.stl_count, 0)           AS spg,
+       agg.tov / NULLIF(agg.tov_count, 0)           AS tpg,
+       agg.trb / NULLIF(agg.trb_count, 0)           AS rpg,
+       agg.two_p / NULLIF(agg.two_p_count, 0)       AS two_p,
+       agg.two_pa / NULLIF(agg.two_pa_count, 0)     AS two_pa,
+       agg.three_p / NULLIF(agg.three_p_count, 0)   AS three_p,
+       agg.three_pa / NULLIF(agg.three_pa_count, 0) AS three_pa,
+       agg.fg                                       AS fg_total,
+       agg.ft                                       AS ft_total,
+       agg.pf                                       AS fpg_total,
+       agg.ast                                      AS apg_total,
+       agg.blk                                      AS bpg_total,
+       agg.drb                                      AS drpg_total,
+       agg.fga                                      AS fga_total,
+       agg.fta                                      AS fta_total,
+       agg.orb                                      AS orpg_total,
+       agg.pts                                      AS ppg_total,
+       agg.stl                                      AS spg_total,
+       agg.tov                                      AS tpg_total,
+       agg.trb                                      AS rpg_total,
+       agg.two_p                                    AS two_p_total,
+       agg.two_pa                                   AS two_pa_total,
+       agg.three_p                                  AS three_p_total,
+       agg.three_pa                                 AS three_pa_total,
+       agg.pts / NULLIF(
+         2 :: NUMERIC * ( agg.fga + 0.44 * agg.fta ), 0
+       )                                            AS ts_pct,
+       CASE
+           WHEN agg.fga > 0::NUMERIC THEN agg.fg / agg.fga
+           ELSE NULL::NUMERIC
+           END                                      AS fg_pct,
+       CASE
+           WHEN agg.fta > 0::NUMERIC THEN agg.ft / agg.fta
+           ELSE NULL::NUMERIC
+           END                                      AS ft_pct,
+       CASE
+           WHEN agg.two_pa > 0::NUMERIC THEN agg.two_p / agg.two_pa
+           ELSE NULL::NUMERIC
+           END                                      AS two_p_pct,
+       CASE
+           WHEN agg.three_pa > 0::NUMERIC THEN agg.three_p / agg.three_pa
+           ELSE NULL::NUMERIC
+           END                                      AS three_p_pct
+FROM simulator_playerstatsaggregate agg
+WHERE agg.count > 0;
@@ -261,42 +261,6 @@ class Common(Configuration):
             "task": "simulator.tasks.update_simulated_games",
             "schedule": dt.timedelta(minutes=1),
         },
-        "simulator.tasks.refresh_view_current_season_player_stats": {
-            "task": "simulator.tasks.refresh_view_current_season_player_stats",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_all_time_player_stats": {
-            "task": "simulator.tasks.refresh_view_all_time_player_stats",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_all_time_team_stats": {
-            "task": "simulator.tasks.refresh_view_all_time_team_stats",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_current_season_player_stats_1_token": {
-            "task": "simulator.tasks.refresh_view_current_season_player_stats_1_token",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_all_time_player_stats_1_token": {
-            "task": "simulator.tasks.refresh_view_all_time_player_stats_1_token",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_current_season_player_stats_3_tokens": {
-            "task": "simulator.tasks.refresh_view_current_season_player_stats_3_tokens",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_all_time_player_stats_3_tokens": {
-            "task": "simulator.tasks.refresh_view_all_time_player_stats_3_tokens",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_current_season_player_stats_5_tokens": {
-            "task": "simulator.tasks.refresh_view_current_season_player_stats_5_tokens",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_all_time_player_stats_5_tokens": {
-            "task": "simulator.tasks.refresh_view_all_time_player_stats_5_tokens",
-            "schedule": dt.timedelta(minutes=1),
-        },
         "game.tasks.update_tournament_series": {
             "task": "game.tasks.update_tournament_series",
             "schedule": dt.timedelta(seconds=10),
@@ -341,13 +305,9 @@ class Common(Configuration):
             "task": "game.tasks.process_h2h_match_make_queue",
             "schedule": dt.timedelta(minutes=1),
         },
-        "simulator.tasks.refresh_view_current_season_team_leaderboard": {
-            "task": "simulator.tasks.refresh_view_current_season_team_leaderboard",
-            "schedule": dt.timedelta(minutes=1),
-        },
-        "simulator.tasks.refresh_view_current_season_team_sp": {
-            "task": "simulator.tasks.refresh_view_current_season_team_sp",
-            "schedule": dt.timedelta(minutes=1),
+        "game.tasks.refresh_leaderboard_cache": {
+            "task": "game.tasks.refresh_leaderboard_cache",
+            "schedule": dt.timedelta(seconds=30),
         },
         "game.tasks.initiate_payouts": {
             "task": "game.tasks.initiate_payouts",
@@ -369,6 +329,18 @@ class Common(Configuration):
 
     MAX_PARTNER_GAMES_ALLOWED = values.IntegerValue(10.0, environ_prefix=None)
 
+    # How long, in seconds, the responses of completed games are cached, both on
+    # the server (see game/game_cache.py) and by clients. Game details embed the
+    # current stats of the players, so they are not cached forever.
+    COMPLETED_GAME_CACHE_TIMEOUT = values.IntegerValue(86400, environ_prefix=None)
+
+    # Outbound HTTP (see utils/http.py). Timeouts are in seconds and apply to every
+    # request made to the simulator and third party services.
+    HTTP_CONNECT_TIMEOUT = values.FloatValue(3.05, environ_prefix=None)
+    HTTP_READ_TIMEOUT = values.FloatValue(30.0, environ_prefix=None)
+    HTTP_MAX_RETRIES = values.IntegerValue(2, environ_prefix=None)
+    HTTP_POOL_MAXSIZE = values.IntegerValue(16, environ_prefix=None)
+
     @property
     def CACHES(self):
         return {
@@ -425,6 +397,18 @@ class Common(Configuration):
     SIMULATOR_API_ROOT = values.SecretValue(environ_prefix=None)
     # Use the mock client for now until we have a simulator running
     SIMULATOR_CLIENT = values.SecretValue(environ_prefix=None)
+    # The number of simulator results fetched concurrently by update_games and
+    # the time budget of a single update_games run. Simulations that are not
+    # reached before the deadline are picked up on the next run.
+    SIMULATOR_POLL_CONCURRENCY = values.IntegerValue(8, environ_prefix=None)
+    SIMULATOR_POLL_DEADLINE_SECONDS = values.IntegerValue(50, environ_prefix=None)
+    # The number of games per batch request. Full game payloads include the play
+    # by play so they are fetched in smaller batches than statuses.
+    SIMULATOR_POLL_STATUS_BATCH_SIZE = values.IntegerValue(100, environ_prefix=None)
+    SIMULATOR_POLL_GAME_BATCH_SIZE = values.IntegerValue(10, environ_prefix=None)
+    # The number of games created in the simulator concurrently when a round of a
+    # tournament starts. The simulator creates a single game per request.
+    SIMULATOR_CREATE_CONCURRENCY = values.IntegerValue(8, environ_prefix=None)
 
     # backend/eth
     WEB3_PROVIDER = values.SecretValue(environ_prefix=None)
@@ -1,10 +1,11 @@
 import time
 from datetime import datetime, timedelta
 
-import requests
 from pytz import timezone
 from requests.exceptions import RequestException
 
+import utils.http
+
 
 def round_if_not_null(decimal_number):
     return round(decimal_number) if decimal_number else None
@@ -22,7 +23,9 @@ def retry_request(
 
     while retries < max_retries:
         try:
-            response = requests.get(url, headers=headers, params=params)
+            # The transport does not retry, so that any failed request,
+            # including error statuses, is retried here as before
+            response = utils.http.get(url, headers=headers, params=params, retries=0)
             # Check if the request was successful
             response.raise_for_status()
             return response
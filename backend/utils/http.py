@@ -0,0 +1,122 @@
+"""Shared HTTP transport for outbound service clients.
+
+Requests made through this module reuse a pooled, keep-alive session per host,
+always have connect/read timeouts, retry transient failures with jittered
+exponential backoff and log their latency. Only the scheme, host and path of
+urls are logged.
+"""
+import logging
+import random
+import threading
+import time
+import urllib.parse
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+LOGGER = logging.getLogger(__name__)
+
+# Responses worth retrying. Anything else is returned to the caller as is.
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+# Only idempotent requests are retried unless the caller asks otherwise
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def session(url):
+    """Returns the pooled session for the host of url"""
+    parsed = urllib.parse.urlsplit(url)
+    host = f"{parsed.scheme}://{parsed.netloc}"
+
+    with _sessions_lock:
+        if host not in _sessions:
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=settings.HTTP_POOL_MAXSIZE
+            )
+            host_session = requests.Session()
+            host_session.mount(host, adapter)
+            _sessions[host] = host_session
+
+        return _sessions[host]
+
+
+def _log_url(url):
+    # Query strings can carry secrets, e.g. API keys, so only the scheme, host
+    # and path are logged
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+def _backoff(attempt, backoff_factor):
+    # "Full jitter" so that clients retrying at once do not hit the service in
+    # lockstep
+    return random.uniform(0, backoff_factor * (2**attempt))
+
+
+def request(method, url, *, timeout=None, retries=None, backoff_factor=0.5, **kwargs):
+    """Makes an HTTP request on the pooled session of the url's host
+
+    Args:
+        method (str): the HTTP method
+        url (str): the url to request
+        timeout (tuple): (connect, read) timeouts in seconds. Defaults to the
+            HTTP_CONNECT_TIMEOUT and HTTP_READ_TIMEOUT settings
+        retries (int): the number of times connection errors, timeouts and
+            RETRY_STATUS_CODES are retried. Defaults to HTTP_MAX_RETRIES for
+            idempotent methods and 0 otherwise
+        backoff_factor (float): the base of the exponential backoff in seconds
+        kwargs: passed through to requests
+
+    Returns:
+        requests.Response: the last response. Like requests, callers are
+        responsible for checking its status.
+    """
+    method = method.upper()
+    if timeout is None:
+        timeout = (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT)
+    if retries is None:
+        retries = settings.HTTP_MAX_RETRIES if method in IDEMPOTENT_METHODS else 0
+
+    host_session = session(url)
+    attempt = 0
+    while True:
+        start_time = time.monotonic()
+        try:
+            response = host_session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            LOGGER.warning(
+                "HTTP %s %s failed after %.0fms (attempt %s): %s",
+                method,
+                _log_url(url),
+                (time.monotonic() - start_time) * 1000,
+                attempt + 1,
+                exc,
+            )
+            if attempt >= retries:
+                raise
+        else:
+            LOGGER.info(
+                "HTTP %s %s %s in %.0fms (attempt %s)",
+                method,
+                _log_url(response.url),
+                response.status_code,
+                (time.monotonic() - start_time) * 1000,
+                attempt + 1,
+            )
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                return response
+
+        time.sleep(_backoff(attempt, backoff_factor))
+        attempt += 1
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
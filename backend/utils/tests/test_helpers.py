@@ -0,0 +1,22 @@
+import utils.helpers
+
+
+def test_retry_request_retries_error_statuses(requests_mock, mocker):
+    sleep = mocker.patch("utils.helpers.time.sleep")
+    requests_mock.get(
+        "https://example.com/api",
+        [{"status_code": 500}, {"status_code": 200, "json": {"ok": True}}],
+    )
+
+    resp = utils.helpers.retry_request("https://example.com/api")
+    assert resp.json() == {"ok": True}
+    assert requests_mock.call_count == 2
+    sleep.assert_called_once_with(2)
+
+
+def test_retry_request_gives_up_after_max_retries(requests_mock, mocker):
+    mocker.patch("utils.helpers.time.sleep")
+    requests_mock.get("https://example.com/api", status_code=500)
+
+    assert utils.helpers.retry_request("https://example.com/api") is None
+    assert requests_mock.call_count == 3
@@ -0,0 +1,77 @@
+import pytest
+import requests
+
+import utils.http
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(mocker):
+    mocker.patch("utils.http.time.sleep")
+
+
+def test_get_retries_transient_errors(requests_mock):
+    requests_mock.get(
+        "https://example.com/api",
+        [
+            {"status_code": 503},
+            {"exc": requests.ConnectionError},
+            {"status_code": 200, "json": {"ok": True}},
+        ],
+    )
+
+    resp = utils.http.get("https://example.com/api", retries=2)
+    assert resp.json() == {"ok": True}
+    assert requests_mock.call_count == 3
+
+
+def test_get_returns_last_response_when_retries_exhausted(requests_mock, settings):
+    settings.HTTP_MAX_RETRIES = 1
+    requests_mock.get("https://example.com/api", status_code=503)
+
+    resp = utils.http.get("https://example.com/api")
+    assert resp.status_code == 503
+    assert requests_mock.call_count == 2
+
+
+def test_get_does_not_retry_client_errors(requests_mock):
+    requests_mock.get("https://example.com/api", status_code=404)
+
+    resp = utils.http.get("https://example.com/api", retries=2)
+    assert resp.status_code == 404
+    assert requests_mock.call_count == 1
+
+
+def test_post_is_not_retried_by_default(requests_mock):
+    requests_mock.post("https://example.com/api", exc=requests.ConnectionError)
+
+    with pytest.raises(requests.ConnectionError):
+        utils.http.post("https://example.com/api", json={})
+    assert requests_mock.call_count == 1
+
+
+def test_default_timeouts(requests_mock, settings):
+    settings.HTTP_CONNECT_TIMEOUT = 1
+    settings.HTTP_READ_TIMEOUT = 2
+    requests_mock.get("https://example.com/api")
+
+    utils.http.get("https://example.com/api")
+    assert requests_mock.last_request.timeout == (1, 2)
+
+
+def test_sessions_are_pooled_per_host():
+    assert utils.http.session("https://example.com/a") is utils.http.session(
+        "https://example.com/b?c=d"
+    )
+    assert utils.http.session("https://example.com/a") is not utils.http.session(
+        "https://example.org/a"
+    )
+
+
+def test_query_strings_are_not_logged(requests_mock, caplog):
+    requests_mock.get("https://example.com/api", status_code=200)
+
+    with caplog.at_level("INFO", logger="utils.http"):
+        utils.http.get("https://example.com/api", params={"apikey": "secret"})
+
+    assert "https://example.com/api 200" in caplog.text
+    assert "secret" not in caplog.text